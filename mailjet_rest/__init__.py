@@ -1,12 +1,16 @@
 """Mailjet REST API Python Wrapper."""
 
+from typing import TYPE_CHECKING, Any
+
 from mailjet_rest.client import Client, Config
 from mailjet_rest.errors import (
     ActionDeniedError,
     ApiError,
     ApiRateLimitError,
     AuthorizationError,
+    CircuitOpenError,
     CriticalApiError,
+    DeadlineExceededError,
     DoesNotExistError,
     MailjetApiError,
     MailjetAuthError,
@@ -17,16 +21,23 @@ from mailjet_rest.errors import (
 from mailjet_rest.utils.version import get_version
 
 
+if TYPE_CHECKING:
+    from mailjet_rest.async_client import AsyncClient
+
+
 __version__: str = get_version()
 
 __all__ = [
     "ActionDeniedError",
     "ApiError",
     "ApiRateLimitError",
+    "AsyncClient",
     "AuthorizationError",
+    "CircuitOpenError",
     "Client",
     "Config",
     "CriticalApiError",
+    "DeadlineExceededError",
     "DoesNotExistError",
     "MailjetApiError",
     "MailjetAuthError",
@@ -35,3 +46,17 @@ __all__ = [
     "ValidationError",
     "get_version",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily expose the asyncio client so synchronous users never pay the httpx import cost.
+
+    Returns:
+        Any: The requested lazily imported attribute.
+    """
+    if name == "AsyncClient":
+        from mailjet_rest.async_client import AsyncClient  # ruff: ignore[import-outside-top-level]
+
+        return AsyncClient
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
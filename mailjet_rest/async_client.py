@@ -0,0 +1,887 @@
+"""Native asyncio client for the Mailjet API.
+
+This module mirrors :class:`mailjet_rest.client.Client` on top of ``httpx.AsyncClient``
+so a single event loop can keep thousands of requests in flight instead of burning a
+thread per call. Routing, guardrails, idempotency fingerprinting and error mapping are
+shared with the synchronous client.
+
+Requires the optional ``async`` extra: ``pip install "mailjet-rest[async]"``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import sys
+import time
+from collections import deque
+from functools import partial
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from urllib3.util.retry import RequestHistory
+
+from mailjet_rest.client import _BaseClient, logger
+from mailjet_rest.endpoint import _STREAM_READ_SIZE, Endpoint
+from mailjet_rest.errors import (
+    ApiError,
+    CriticalApiError,
+    MailjetApiError,
+    TimeoutError,  # ruff: ignore[builtin-import-shadowing]
+)
+from mailjet_rest.routes import resource_of
+from mailjet_rest.utils.coalesce import AsyncSingleFlight
+from mailjet_rest.utils.codec import IncrementalArrayDecoder
+from mailjet_rest.utils.guardrails import SecretAuth, SecureHTTPAdapter
+from mailjet_rest.utils.instrumentation import CallStats, timed
+from mailjet_rest.utils.pool import PoolConfig, WarmupReport
+from mailjet_rest.utils.tracing import recording_tracer, trace_attempt, trace_call
+
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None  # type: ignore[assignment]
+
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+    from types import TracebackType
+
+    from urllib3.util.retry import Retry
+
+    from mailjet_rest.config import Config
+    from mailjet_rest.pagination import AdaptivePageSizer, StreamCursor
+    from mailjet_rest.types import HttpMethod, PayloadType, TimeoutType
+    from mailjet_rest.utils.cache import CachedResponse, CacheKey
+    from mailjet_rest.utils.concurrency import AdaptiveConcurrencyLimiter
+    from mailjet_rest.utils.deadline import DeadlineBudget
+
+if sys.version_info >= (3, 11):
+    from typing import Self
+else:
+    from typing_extensions import Self
+
+
+__all__ = ["AsyncClient", "AsyncEndpoint"]
+
+
+class AsyncEndpoint(Endpoint):
+    """Awaitable counterpart of :class:`Endpoint` bound to an :class:`AsyncClient`.
+
+    URL resolution and header composition are inherited unchanged; only dispatch is asynchronous.
+    """
+
+    __slots__ = ()
+
+    client: AsyncClient  # type: ignore[assignment]
+
+    async def __call__(  # type: ignore[override]
+        self,
+        method: HttpMethod = "GET",
+        id: int | str | None = None,
+        data: PayloadType = None,
+        filters: dict[str, Any] | None = None,
+        action_id: int | str | None = None,
+        timeout: TimeoutType = None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Execute the specific HTTP method on the constructed endpoint.
+
+        Returns:
+            httpx.Response: The resulting HTTP response from the request execution.
+        """
+        return await self.client.api_call(
+            **self._prepare_call(method, id, data, filters, action_id, timeout, kwargs),
+        )
+
+    async def get(  # type: ignore[override]
+        self,
+        id: int | str | None = None,
+        filters: dict[str, Any] | None = None,
+        action_id: int | str | None = None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Perform a GET request.
+
+        Returns:
+            httpx.Response: The resulting HTTP response for the GET request.
+        """
+        return await self(method="GET", id=id, filters=filters, action_id=action_id, **kwargs)
+
+    async def _fetch_page(  # type: ignore[override]
+        self, id: int | str | None, filters: dict[str, Any], action_id: int | str | None, kwargs: dict[str, Any]
+    ) -> list[dict[str, Any]]:
+        """Fetch and decode a single page of a stream.
+
+        Returns:
+            list[dict[str, Any]]: The 'Data' items of the page.
+        """
+        response = await self.get(id=id, filters=filters, action_id=action_id, **kwargs)
+        return self.client.config.json_codec.loads(response.content).get("Data", [])
+
+    async def _limited_page(  # type: ignore[override]
+        self,
+        id: int | str | None,
+        filters: dict[str, Any],
+        action_id: int | str | None,
+        kwargs: dict[str, Any],
+        concurrency: AdaptiveConcurrencyLimiter | None = None,
+    ) -> list[dict[str, Any]]:
+        """Fetch a prefetched page, holding a slot of the adaptive concurrency limiter if any.
+
+        Returns:
+            list[dict[str, Any]]: The 'Data' items of the page.
+        """
+        if concurrency is None:
+            return await self._fetch_page(id, filters, action_id, kwargs)
+        async with concurrency.aslot():
+            return await self._fetch_page(id, filters, action_id, kwargs)
+
+    async def _sized_page(  # type: ignore[override]
+        self,
+        id: int | str | None,
+        filters: dict[str, Any],
+        action_id: int | str | None,
+        sizer: AdaptivePageSizer,
+        kwargs: dict[str, Any],
+    ) -> list[dict[str, Any]]:
+        """Fetch a single page and teach the sizer how long it took and how large it was.
+
+        Returns:
+            list[dict[str, Any]]: The 'Data' items of the page.
+        """
+        started = time.perf_counter()
+        response = await self.get(id=id, filters=filters, action_id=action_id, **kwargs)
+        body = response.content
+        data = self.client.config.json_codec.loads(body).get("Data", [])
+        sizer.observe(self.name, filters["Limit"], len(data), time.perf_counter() - started, len(body))
+        return data
+
+    async def _parse_page(  # type: ignore[override]
+        self, id: int | str | None, filters: dict[str, Any], action_id: int | str | None, kwargs: dict[str, Any]
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """Fetch a page with a streamed body and yield its 'Data' items as soon as each one is parsed.
+
+        Yields:
+            dict[str, Any]: The 'Data' items of the page, in page order.
+        """
+        response = await self.get(id=id, filters=filters, action_id=action_id, **{**kwargs, "stream": True})
+        decoder = IncrementalArrayDecoder()
+        try:
+            async for chunk in response.aiter_bytes(_STREAM_READ_SIZE):
+                for item in decoder.feed(chunk):
+                    yield item
+            for item in decoder.close():
+                yield item
+        finally:
+            await response.aclose()
+
+    async def _page_items(  # type: ignore[override]
+        self,
+        id: int | str | None,
+        filters: dict[str, Any],
+        action_id: int | str | None,
+        incremental: bool,
+        kwargs: dict[str, Any],
+        sizer: AdaptivePageSizer | None = None,
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """Read the next page of a sequential stream, fully or incrementally.
+
+        Yields:
+            dict[str, Any]: The 'Data' items of the page, in page order.
+        """
+        if incremental:
+            async for item in self._parse_page(id, filters, action_id, kwargs):
+                yield item
+        elif sizer is not None:
+            for item in await self._sized_page(id, filters, action_id, sizer, kwargs):
+                yield item
+        else:
+            for item in await self._fetch_page(id, filters, action_id, kwargs):
+                yield item
+
+    async def _serial_pages(  # type: ignore[override]
+        self,
+        id: int | str | None,
+        filters: dict[str, Any],
+        action_id: int | str | None,
+        kwargs: dict[str, Any],
+        incremental: bool = False,
+        sizer: AdaptivePageSizer | None = None,
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """Fetch pages one after another until a short page marks the end.
+
+        Yields:
+            dict[str, Any]: Individual resource objects, in offset order.
+        """
+        while True:
+            chunk_size, count = filters["Limit"], 0
+            async for item in self._page_items(id, filters, action_id, incremental, kwargs, sizer):
+                count += 1
+                yield item
+
+            # Break early if we've reached the absolute end
+            if count < chunk_size:
+                break
+
+            filters["Offset"] += chunk_size
+            if sizer is not None:
+                filters["Limit"] = sizer.limit_for(self.name, chunk_size)
+
+    async def _prefetch_pages(  # type: ignore[override]
+        self,
+        id: int | str | None,
+        filters: dict[str, Any],
+        action_id: int | str | None,
+        prefetch: int,
+        total: int,
+        kwargs: dict[str, Any],
+        concurrency: AdaptiveConcurrencyLimiter | None = None,
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """Keep up to 'prefetch' offset windows in flight on the event loop while yielding items in order.
+
+        Yields:
+            dict[str, Any]: Individual resource objects, in offset order.
+        """
+        chunk_size = filters["Limit"]
+        offsets = iter(range(filters["Offset"], total, chunk_size))
+        pending: deque[asyncio.Task[list[dict[str, Any]]]] = deque()
+        next_offset: int = filters["Offset"]
+
+        def schedule() -> None:
+            offset = next(offsets, None)
+            if offset is not None:
+                page_filters = {**filters, "Offset": offset}
+                page = self._limited_page(id, page_filters, action_id, kwargs, concurrency)
+                pending.append(asyncio.ensure_future(page))
+
+        for _ in range(prefetch):
+            schedule()
+        try:
+            while pending:
+                data = await pending.popleft()
+                schedule()
+                for item in data:
+                    yield item
+                if len(data) < chunk_size:
+                    return
+                next_offset += chunk_size
+        finally:
+            for task in pending:
+                task.cancel()
+
+        async for item in self._serial_pages(id, {**filters, "Offset": next_offset}, action_id, kwargs):
+            yield item
+
+    async def _cursor_pages(  # type: ignore[override]
+        self,
+        id: int | str | None,
+        filters: dict[str, Any],
+        action_id: int | str | None,
+        cursor: StreamCursor,
+        kwargs: dict[str, Any],
+        incremental: bool = False,
+        sizer: AdaptivePageSizer | None = None,
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """Fetch keyset pages bounded by the cursor, advancing it as items are consumed.
+
+        Yields:
+            dict[str, Any]: Individual resource objects, in ascending cursor order.
+        """
+        while True:
+            chunk_size, count, start = filters["Limit"], 0, cursor.after
+            page_filters = cursor.page_filters(filters)
+            async for item in self._page_items(id, page_filters, action_id, incremental, kwargs, sizer):
+                count += 1
+                if cursor.accepts(item):
+                    yield item
+                    cursor.after = item[cursor.field]
+
+            if count < chunk_size:
+                break
+            cursor.ensure_progress(start)
+            if sizer is not None:
+                filters["Limit"] = sizer.limit_for(self.name, chunk_size)
+
+    async def stream(  # type: ignore[override]
+        self,
+        id: int | str | None = None,
+        filters: dict[str, Any] | None = None,
+        action_id: int | str | None = None,
+        chunk_size: int = 1000,
+        prefetch: int = 0,
+        cursor: StreamCursor | None = None,
+        incremental: bool = False,
+        adaptive: bool = False,
+        concurrency: AdaptiveConcurrencyLimiter | None = None,
+        **kwargs: Any,
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """Automatically paginates over GET requests yielding resource dictionaries.
+
+        With a positive 'prefetch', a 'countOnly' request sizes the collection and up to
+        'prefetch' pages are fetched concurrently. A 'cursor' switches to resumable keyset pagination,
+        'incremental' yields items while each response body is still being received, and 'adaptive'
+        tunes the page size per resource from observed latency and response size. A 'concurrency'
+        limiter caps the prefetched pages in flight with an AIMD limit.
+
+        Yields:
+            dict[str, Any]: Individual resource objects from the paginated API response.
+        """
+        current_filters = self._init_stream_filters(filters, chunk_size)
+        self._validate_prefetch(prefetch, concurrency)
+        self._validate_sequential(prefetch, cursor, incremental)
+        self._validate_adaptive(adaptive, prefetch, incremental)
+
+        sizer = self.client.page_sizer if adaptive else None
+        if sizer is not None:
+            current_filters["Limit"] = sizer.limit_for(self.name, chunk_size)
+
+        pages = self._serial_pages(id, current_filters, action_id, kwargs, incremental, sizer)
+        if cursor is not None:
+            pages = self._cursor_pages(id, current_filters, action_id, cursor, kwargs, incremental, sizer)
+        elif prefetch:
+            count_filters = self._count_filters(current_filters)
+            count_response = await self.get(id=id, filters=count_filters, action_id=action_id, **kwargs)
+            total = self._parse_count(self.client.config.json_codec.loads(count_response.content))
+            if total is not None:
+                pages = self._prefetch_pages(id, current_filters, action_id, prefetch, total, kwargs, concurrency)
+
+        async for item in pages:
+            yield item
+
+    async def create(  # type: ignore[override]
+        self,
+        data: PayloadType = None,
+        id: int | str | None = None,
+        action_id: int | str | None = None,
+        ensure_ascii: bool | None = None,
+        data_encoding: str | None = None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Perform a POST request to create a resource.
+
+        Returns:
+            httpx.Response: The HTTP response containing the created entity representation.
+        """
+        return await self(
+            method="POST",
+            id=id,
+            data=data,
+            action_id=action_id,
+            ensure_ascii=ensure_ascii,
+            data_encoding=data_encoding,
+            **kwargs,
+        )
+
+    async def update(  # type: ignore[override]
+        self,
+        id: int | str,
+        data: PayloadType = None,
+        action_id: int | str | None = None,
+        ensure_ascii: bool | None = None,
+        data_encoding: str | None = None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Perform a PUT request to update a resource.
+
+        Returns:
+            httpx.Response: The HTTP response for the updated resource context.
+        """
+        return await self(
+            method="PUT",
+            id=id,
+            data=data,
+            action_id=action_id,
+            ensure_ascii=ensure_ascii,
+            data_encoding=data_encoding,
+            **kwargs,
+        )
+
+    async def delete(  # type: ignore[override]
+        self, id: int | str, action_id: int | str | None = None, **kwargs: Any
+    ) -> httpx.Response:
+        """Perform a DELETE request to remove a resource.
+
+        Returns:
+            httpx.Response: The HTTP response representing the deletion confirmation.
+        """
+        return await self(method="DELETE", id=id, action_id=action_id, **kwargs)
+
+
+class _PhaseTracer:
+    """httpcore 'trace' callback charging one attempt's connection and response phases to its call."""
+
+    _PHASES: ClassVar[dict[str, str]] = {
+        "connection.connect_tcp": "connect",
+        "connection.start_tls": "tls",
+        "http11.receive_response_headers": "server",
+        "http2.receive_response_headers": "server",
+    }
+
+    def __init__(self, stats: CallStats) -> None:
+        self.stats = stats
+        self.started: float | None = time.monotonic()
+        self._pending: dict[str, float] = {}
+
+    async def __call__(self, event_name: str, _info: dict[str, Any]) -> None:
+        """Record a phase boundary; the first event ends the wait for a pooled connection."""
+        now = time.monotonic()
+        if self.started is not None:
+            self.stats.add("pool_wait", now - self.started)
+            self.started = None
+        name, _, stage = event_name.rpartition(".")
+        phase = self._PHASES.get(name)
+        if phase is None:
+            return
+        if stage == "started":
+            self._pending[name] = now
+        elif name in self._pending:  # 'complete' or 'failed'
+            self.stats.add(phase, now - self._pending.pop(name))
+
+
+class AsyncClient(_BaseClient):
+    """The asyncio Mailjet API client.
+
+    Resolves endpoints from the same static routing registry as :class:`Client`
+    and enforces the same guardrails, but dispatches over a pooled ``httpx.AsyncClient``.
+    """
+
+    _ENDPOINT_CLASS = AsyncEndpoint
+
+    def __init__(
+        self,
+        auth: str | tuple[str, str] | None = None,
+        config: Config | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize the client with a hardened asyncio connection pool.
+
+        Args:
+            auth: A tuple containing the Mailjet API key and secret, or a Bearer token string.
+            config: An optional Config object for advanced behavior tuning.
+            **kwargs: Configuration values (e.g., version, timeout) applied directly to a new Config object.
+        """
+        if httpx is None:  # pragma: no cover
+            msg = "AsyncClient requires the optional 'httpx' dependency: pip install 'mailjet-rest[async]'"
+            raise ImportError(msg)
+
+        super().__init__(auth, config, **kwargs)
+
+        self.session = self._new_session()
+        self._flights = AsyncSingleFlight()
+
+    def _new_session(self) -> httpx.AsyncClient:
+        """Return an httpx session carrying the client's credentials, TLS context and pool limits."""
+        headers = {"User-Agent": self.config.user_agent}
+        if isinstance(self.auth, str):
+            headers["Authorization"] = f"Bearer {self.auth}"
+
+        return httpx.AsyncClient(
+            auth=self.auth if isinstance(self.auth, SecretAuth) else None,  # type: ignore[arg-type]
+            headers=headers,
+            verify=SecureHTTPAdapter._get_secure_ssl_context(),  # ruff: ignore[private-member-access]
+            limits=self._limits(self.config.pool or PoolConfig()),
+            follow_redirects=False,
+        )
+
+    def _reset_after_fork(self) -> None:
+        """Also replace the httpx session and in-flight request table inherited from the parent.
+
+        The inherited session is abandoned rather than closed: its sockets still belong to the parent.
+        """
+        super()._reset_after_fork()
+        self.session = self._new_session()
+        self._flights = AsyncSingleFlight()
+
+    async def __aenter__(self) -> Self:
+        """Enter the async context manager and return the client instance.
+
+        Returns:
+            Self: The client instance.
+        """
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Exit the async context manager and safely close the HTTP pool."""
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Secure resource teardown closing internal sockets."""
+        if getattr(self, "session", None) is not None:
+            self.session.headers.clear()
+            await self.session.aclose()
+
+    async def warmup(self, connections: int = 1) -> WarmupReport:
+        """Open and handshake pooled connections to the API host ahead of the first call.
+
+        httpx cannot connect without a request, so this sends 'connections' concurrent
+        'HEAD' probes to the API root; each leaves a handshaked keep-alive connection in
+        the pool. The probes' status codes are ignored.
+
+        Args:
+            connections (int): Connections to open, capped at the pool's 'maxsize'.
+
+        Returns:
+            WarmupReport: How many connections are warm and how long the warmup took.
+
+        Raises:
+            TimeoutError: If a probe times out.
+            CriticalApiError: If a connection or TLS handshake fails.
+        """
+        count = self._warmup_count(connections)
+        timeout = self._to_httpx_timeout(self.config.timeout)
+        started = time.monotonic()
+        try:
+            await asyncio.gather(*(self.session.head(self.config.api_url, timeout=timeout) for _ in range(count)))
+        except httpx.TimeoutException as e:
+            msg = f"Connection to Mailjet API timed out during warmup: {e}"
+            raise TimeoutError(msg) from e
+        except httpx.HTTPError as e:
+            msg = f"Connection to Mailjet API failed during warmup: {e}"
+            raise CriticalApiError(msg) from e
+
+        report = WarmupReport(connections=count, elapsed=time.monotonic() - started)
+        logger.debug("Warmed up %d connection(s) to %s in %.3fs", count, self.config.api_url, report.elapsed)
+        return report
+
+    @staticmethod
+    def _limits(pool: PoolConfig) -> httpx.Limits:
+        """Return the httpx pool limits matching the pool settings ('block' and 'shared' do not apply)."""
+        if pool.idle_timeout is None:
+            return httpx.Limits(max_connections=pool.maxsize, max_keepalive_connections=pool.maxsize)
+        return httpx.Limits(
+            max_connections=pool.maxsize, max_keepalive_connections=pool.maxsize, keepalive_expiry=pool.idle_timeout
+        )
+
+    @staticmethod
+    def _to_httpx_timeout(timeout: float | tuple[float, float] | None) -> httpx.Timeout:
+        """Translate a validated requests-style timeout into an httpx timeout.
+
+        Returns:
+            httpx.Timeout: The equivalent connect/read timeout configuration.
+        """
+        if isinstance(timeout, tuple):
+            return httpx.Timeout(timeout[1], connect=timeout[0])
+        return httpx.Timeout(timeout)
+
+    @staticmethod
+    def _to_httpx_kwargs(safe_kwargs: dict[str, Any]) -> dict[str, Any]:
+        """Translate the allow-listed requests kwargs into their httpx equivalents.
+
+        Returns:
+            dict[str, Any]: Per-request keyword arguments understood by httpx.
+        """
+        if "proxies" in safe_kwargs or "cert" in safe_kwargs:
+            msg = "AsyncClient does not support per-request 'proxies' or 'cert'; configure them on 'client.session'."
+            raise ValueError(msg)
+
+        httpx_kwargs: dict[str, Any] = {}
+        if "allow_redirects" in safe_kwargs:
+            httpx_kwargs["follow_redirects"] = safe_kwargs["allow_redirects"]
+        if "files" in safe_kwargs:
+            httpx_kwargs["files"] = safe_kwargs["files"]
+        return httpx_kwargs
+
+    @staticmethod
+    def _to_httpx_body(data: Any, content_type: str) -> dict[str, Any]:
+        """Select the httpx body argument matching the payload type.
+
+        Returns:
+            dict[str, Any]: A single-entry mapping of 'json', 'content' or 'data', or an empty mapping.
+        """
+        if isinstance(data, (dict, list)) and "application/json" in content_type:
+            return {"json": data}
+        if isinstance(data, (str, bytes)):
+            return {"content": data}
+        if data is not None:
+            return {"data": data}
+        return {}
+
+    @staticmethod
+    def _increment_retry(retry: Retry, method: str, url: str, status: int | None, error: Exception | None) -> Retry:
+        """Consume one attempt of the shared JitterRetry budget.
+
+        Returns:
+            Retry: The successor retry state carrying the updated history.
+        """
+        total = retry.total - 1 if isinstance(retry.total, int) else retry.total
+        history = (*retry.history, RequestHistory(method, url, error, status, None))
+        return retry.new(total=total, history=history)
+
+    async def _execute_request(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, Any],
+        data: Any,
+        params: dict[str, Any] | None,
+        timeout: Any,
+        budget: DeadlineBudget | None = None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Isolated HTTP execution applying the client's JitterRetry policy.
+
+        With a deadline 'budget', each attempt's timeout is clipped to the time left and a retry
+        only starts if its backoff and another attempt still fit.
+
+        Returns:
+            httpx.Response: The raw HTTP response directly from the network.
+        """
+        kwargs.pop("verify", None)
+
+        # Strip out headers with None values to let httpx auto-generate multipart boundaries
+        clean_headers = {k: v for k, v in headers.items() if v is not None}
+        request_kwargs = self._to_httpx_kwargs(kwargs)
+        request_kwargs.update(self._to_httpx_body(data, clean_headers.get("Content-Type", "")))
+        send_kwargs: dict[str, Any] = {"stream": bool(kwargs.get("stream"))}
+        if "follow_redirects" in request_kwargs:
+            send_kwargs["follow_redirects"] = request_kwargs.pop("follow_redirects")
+
+        retry: Retry = self._RETRY_STRATEGY
+        stats = CallStats.current()
+        while True:
+            if stats is not None:
+                stats.attempts += 1
+                request_kwargs["extensions"] = {"trace": _PhaseTracer(stats)}
+            try:
+                request = self.session.build_request(
+                    method,
+                    url,
+                    headers=clean_headers,
+                    params=params,
+                    timeout=self._to_httpx_timeout(timeout if budget is None else budget.clip(timeout)),
+                    **request_kwargs,
+                )
+                response = await self._send_attempt(request, send_kwargs)
+            except httpx.TransportError as e:
+                retry = self._increment_retry(retry, method, url, None, e)
+                if retry.is_exhausted():
+                    raise
+                retry_after = None
+            else:
+                self._observe_attempt(url, response, stats)
+                has_retry_after = "Retry-After" in response.headers
+                if not retry.is_retry(method, response.status_code, has_retry_after):
+                    return response
+                retry = self._increment_retry(retry, method, url, response.status_code, None)
+                if retry.is_exhausted():
+                    return response
+
+                retry_after = response.headers.get("Retry-After") if retry.respect_retry_after_header else None
+                await response.aclose()
+
+            await self._backoff(retry, budget, retry_after)
+
+    async def _send_attempt(self, request: httpx.Request, send_kwargs: dict[str, Any]) -> httpx.Response:
+        """Send one attempt, in a child span of the traced call running in this context, if any.
+
+        Returns:
+            httpx.Response: The attempt's response.
+        """
+        with trace_attempt(request.method, request.url.host, request.url.port) as attempt:
+            if attempt is None:
+                return await self.session.send(request, **send_kwargs)
+            request.headers.update(attempt.context)
+            response = await self.session.send(request, **send_kwargs)
+            attempt.record(response.status_code)
+            return response
+
+    def _observe_attempt(self, url: str, response: httpx.Response, stats: CallStats | None) -> None:
+        """Feed an attempt's response to the rate limiter and the instrumented call, if any."""
+        if stats is not None:
+            stats.statuses.append(response.status_code)
+        if self.rate_limiter is not None:
+            self.rate_limiter.observe(url, response.status_code, response.headers)
+
+    @staticmethod
+    async def _backoff(retry: Retry, budget: DeadlineBudget | None, retry_after: str | None) -> None:
+        """Sleep before the next attempt, honouring 'Retry-After' and the call's deadline."""
+        delay = retry.parse_retry_after(retry_after) if retry_after is not None else retry.get_backoff_time()
+        if budget is not None:
+            budget.end_attempt()
+            budget.reserve(delay, "retry backoff")
+        with timed("retry_backoff"):
+            await asyncio.sleep(delay)
+
+    async def _pace(self, url: str, budget: DeadlineBudget | None = None) -> None:
+        """Wait for the request's rate limit slot, if its endpoint group is paced."""
+        if self.rate_limiter is None:
+            return
+        delay = self.rate_limiter.reserve(url)
+        if delay > 0:
+            if budget is not None:
+                budget.reserve(delay, "rate limit wait")
+            await asyncio.sleep(delay)
+        self._record_phase("rate_limit")
+
+    @staticmethod
+    def _cached_response(entry: CachedResponse, url: str) -> httpx.Response:
+        """Materialize a fresh, caller-owned response from a cache entry.
+
+        Returns:
+            httpx.Response: A response equivalent to the one originally received.
+        """
+        return httpx.Response(
+            entry.status_code,
+            headers=entry.headers,
+            content=entry.content,
+            request=httpx.Request("GET", url),
+        )
+
+    def _raise_for_response(self, response: httpx.Response) -> None:
+        """Map an error response to the matching Mailjet domain exception."""
+        if response.status_code < 400:
+            return
+
+        json_loader = partial(self.config.json_codec.loads, response.content)
+        error = self._map_http_error(response.status_code, response.text, json_loader)
+        if error is not None:
+            raise error
+
+        msg = f"An unexpected Mailjet API network error occurred: {response.status_code} {response.reason_phrase}"
+        raise MailjetApiError(msg, response.status_code, response.text)
+
+    async def api_call(
+        self,
+        method: HttpMethod,
+        url: str,
+        filters: dict[str, Any] | None = None,
+        data: PayloadType = None,
+        headers: dict[str, str] | None = None,
+        timeout: TimeoutType = None,
+        deadline: float | None = None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Execute the authenticated API call with idempotency guards.
+
+        Args:
+            method (HttpMethod): The HTTP method.
+            url (str): The fully constructed API URL.
+            filters (dict[str, Any] | None, optional): Query parameters.
+            data (PayloadType, optional): Request payload.
+            headers (dict[str, str] | None, optional): Custom HTTP headers.
+            timeout (TimeoutType, optional): Request timeout.
+            deadline (float | None, optional): Total time budget of the call across retries, in seconds.
+                Overrides 'Config.deadline'.
+            **kwargs (Any): Additional allow-listed transport arguments (e.g. 'files').
+
+        Returns:
+            httpx.Response: The authenticated HTTP response from Mailjet.
+        """
+        tracer = recording_tracer(self._tracer)
+        if not self.hooks and tracer is None:
+            return await self._dispatch(method, url, filters, data, headers, timeout, deadline, **kwargs)
+        stats = self._call_stats(method, url, data)
+        with stats.activate(self.hooks), trace_call(tracer, stats, data):
+            response = await self._dispatch(method, url, filters, data, headers, timeout, deadline, **kwargs)
+            stats.record_response(response)
+            return response
+
+    async def _dispatch(
+        self,
+        method: HttpMethod,
+        url: str,
+        filters: dict[str, Any] | None,
+        data: PayloadType,
+        headers: dict[str, str] | None,
+        timeout: TimeoutType,
+        deadline: float | None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Validate, serve from cache or send an API call; the body of 'api_call'.
+
+        Returns:
+            httpx.Response: The authenticated HTTP response from Mailjet.
+        """
+        headers, req_timeout, safe_kwargs = self._validate_request(url, headers, timeout, kwargs)
+        budget = self._deadline_budget(deadline)
+        self._record_phase("validate")
+
+        # Idempotency Lock for mutations
+        if self._is_dry_run(method, url):
+            return httpx.Response(200)
+
+        cache_key, cached = self._cache_lookup(method, url, filters, headers, safe_kwargs)
+        if cached is not None:
+            if cached.is_fresh():
+                self._record_cache_hit()
+                return self._cached_response(cached, url)
+            headers = {**headers, **cached.validators()}
+        body = self._serialize_body(method, data, headers, self.config.json_codec)
+        self._record_body(body)
+
+        # Only the DEBUG success log shows the trace, so skip scanning the payload otherwise.
+        trace_suffix = self._extract_telemetry(data, headers)[0] if logger.isEnabledFor(logging.DEBUG) else ""
+
+        send = partial(
+            self._send, method, url, filters, body, headers, req_timeout, safe_kwargs, trace_suffix, cache_key, budget
+        )
+        if self.circuit_breaker is not None:
+            send = partial(self.circuit_breaker.acall, resource_of(url), send)
+        flight_key = self._flight_key(method, url, filters, headers, req_timeout, budget, safe_kwargs)
+        return await (send() if flight_key is None else self._flights.do(flight_key, send))
+
+    async def _send(
+        self,
+        method: HttpMethod,
+        url: str,
+        filters: dict[str, Any] | None,
+        body: Any,
+        headers: dict[str, str],
+        req_timeout: TimeoutType,
+        safe_kwargs: dict[str, Any],
+        trace_suffix: str,
+        cache_key: CacheKey | None,
+        budget: DeadlineBudget | None = None,
+    ) -> httpx.Response:
+        """Dispatch a validated request and map its outcome to a response or a domain exception.
+
+        Returns:
+            httpx.Response: The authenticated HTTP response from Mailjet.
+        """
+        await self._pace(url, budget)
+        try:
+            response = await self._execute_request(
+                method=method,
+                url=url,
+                headers=headers,
+                data=body,
+                params=self._clean_filters(filters),
+                timeout=req_timeout,
+                budget=budget,
+                **safe_kwargs,
+            )
+            self._record_phase("transfer")
+
+        except httpx.TimeoutException as e:
+            if budget is not None and budget.expired():
+                budget.end_attempt()
+                msg = "the last attempt ran out of time"
+                raise budget.exceeded(msg) from e
+            logger.exception("Timeout Error: %s %s", method, url)
+            msg = f"Request to Mailjet API timed out: {e}"
+            raise TimeoutError(msg) from e
+
+        except httpx.NetworkError as e:
+            msg = f"Connection to Mailjet API failed: {e}"
+            raise CriticalApiError(msg) from e
+
+        except httpx.HTTPError as e:
+            msg = f"An unexpected Mailjet API network error occurred: {e}"
+            raise ApiError(msg) from e
+
+        if response.status_code >= 400:
+            # Streamed bodies are only read on demand; error mapping needs the whole payload.
+            await response.aread()
+        self._raise_for_response(response)
+        if response.status_code in {200, 201, 204}:
+            self._log_request(method, url, response, trace_suffix)
+        revalidated = self._cache_update(
+            method, url, cache_key, response.status_code, response.headers, lambda: response.content
+        )
+        return response if revalidated is None else self._cached_response(revalidated, url)
@@ -0,0 +1,281 @@
+"""Bulk Send API v3.1 dispatch engine with per-message result mapping.
+
+This module splits arbitrarily large message streams into Send API v3.1 calls that
+respect Mailjet's per-call message and payload size limits, dispatches them
+concurrently over the client's pooled connections and maps every response
+'Messages[]' entry back to the input message that produced it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from mailjet_rest.builders import SendPayloadBuilder
+from mailjet_rest.errors import ApiError, MailjetApiError
+from mailjet_rest.utils.codec import STDLIB_CODEC
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from mailjet_rest.async_client import AsyncClient
+    from mailjet_rest.builders import MessageBuilder
+    from mailjet_rest.client import Client
+    from mailjet_rest.types import SendV31Message, SendV31Payload
+    from mailjet_rest.utils.codec import JsonCodec
+    from mailjet_rest.utils.concurrency import AdaptiveConcurrencyLimiter
+
+
+__all__ = ["BatchSender", "SendResult"]
+
+
+@dataclass(slots=True, frozen=True)
+class SendResult:
+    """Outcome of a single input message within a batched Send API v3.1 dispatch.
+
+    Attributes:
+        index (int): Position of the message in the input iterable.
+        status (str): 'success' or 'error', as reported by Mailjet or synthesized for transport failures.
+        message_ids (tuple[int, ...]): MessageID of every To, Cc and Bcc recipient.
+        errors (tuple[dict[str, Any], ...]): Error objects reported by Mailjet or synthesized locally.
+        custom_id (str): The CustomID echoed back by Mailjet, if any.
+    """
+
+    index: int
+    status: str
+    message_ids: tuple[int, ...] = ()
+    errors: tuple[dict[str, Any], ...] = ()
+    custom_id: str = ""
+
+    @property
+    def ok(self) -> bool:
+        """Whether Mailjet accepted the message.
+
+        Returns:
+            bool: True if the message status is 'success'.
+        """
+        return self.status == "success"
+
+    @property
+    def message_id(self) -> int | None:
+        """The MessageID of the first recipient, for single-recipient convenience.
+
+        Returns:
+            int | None: The first MessageID, or None if the message was not accepted.
+        """
+        return self.message_ids[0] if self.message_ids else None
+
+
+class BatchSender:
+    """Concurrent Send API v3.1 batching engine built on :class:`SendPayloadBuilder`.
+
+    Works with both :class:`~mailjet_rest.client.Client` (thread pool, via :meth:`send`)
+    and :class:`~mailjet_rest.async_client.AsyncClient` (event loop, via :meth:`asend`).
+    """
+
+    __slots__ = ("client", "concurrency", "max_bytes", "max_messages", "max_workers")
+
+    def __init__(
+        self,
+        client: Client | AsyncClient,
+        max_workers: int = 8,
+        max_messages: int = SendPayloadBuilder.MAX_MESSAGES_PER_CALL,
+        max_bytes: int = SendPayloadBuilder.MAX_PAYLOAD_BYTES,
+        concurrency: AdaptiveConcurrencyLimiter | None = None,
+    ) -> None:
+        """Initialize the engine.
+
+        Args:
+            client: A client configured for the Send API v3.1.
+            max_workers: Maximum number of Send API calls in flight at once.
+            max_messages: Maximum number of messages per Send API call.
+            max_bytes: Maximum serialized payload size per Send API call.
+            concurrency: Adapts the calls in flight (up to 'max_workers') to Mailjet's 429/503 and
+                latency feedback. Share one limiter between senders to give them a common budget.
+        """
+        if client.config.version != "v3.1":
+            msg = f"BatchSender requires a client configured with version='v3.1', got '{client.config.version}'."
+            raise ValueError(msg)
+        if max_workers <= 0:
+            msg = "BatchSender max_workers must be a strictly positive integer."
+            raise ValueError(msg)
+
+        self.client = client
+        self.max_workers = max_workers
+        self.max_messages = max_messages
+        self.max_bytes = max_bytes
+        self.concurrency = concurrency
+
+    def send(
+        self,
+        messages: Iterable[MessageBuilder | SendV31Message],
+        sandbox: bool = False,
+        globals_: dict[str, Any] | None = None,
+    ) -> list[SendResult]:
+        """Send every message through concurrent Send API v3.1 calls.
+
+        Args:
+            messages: Message builders or built message dictionaries, in any iterable.
+            sandbox: Enable SandboxMode on every call (no real dispatch).
+            globals_: Global properties applied to every call.
+
+        Returns:
+            list[SendResult]: Exactly one result per input message, in input order.
+        """
+        batches = self._plan(messages, sandbox, globals_)
+        if not batches:
+            return []
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(batches))) as pool:
+            chunks = list(pool.map(self._dispatch, batches))
+        return [result for chunk in chunks for result in chunk]
+
+    async def asend(
+        self,
+        messages: Iterable[MessageBuilder | SendV31Message],
+        sandbox: bool = False,
+        globals_: dict[str, Any] | None = None,
+    ) -> list[SendResult]:
+        """Asyncio counterpart of :meth:`send` for an :class:`AsyncClient`.
+
+        Returns:
+            list[SendResult]: Exactly one result per input message, in input order.
+        """
+        batches = self._plan(messages, sandbox, globals_)
+        semaphore = asyncio.Semaphore(self.max_workers)
+
+        async def _bounded(batch: tuple[int, SendV31Payload]) -> list[SendResult]:
+            async with semaphore:
+                return await self._adispatch(batch)
+
+        chunks = await asyncio.gather(*(_bounded(batch) for batch in batches))
+        return [result for chunk in chunks for result in chunk]
+
+    def _plan(
+        self,
+        messages: Iterable[MessageBuilder | SendV31Message],
+        sandbox: bool,
+        globals_: dict[str, Any] | None,
+    ) -> list[tuple[int, SendV31Payload]]:
+        """Validate the messages and split them into per-call payloads.
+
+        Returns:
+            list[tuple[int, SendV31Payload]]: Each payload paired with the input index of its first message.
+        """
+        builder = SendPayloadBuilder().set_sandbox_mode(sandbox)
+        if globals_ is not None:
+            builder.set_globals(globals_)
+        empty = True
+        for message in messages:
+            builder.add_message(message)
+            empty = False
+        if empty:
+            return []
+
+        batches = []
+        start = 0
+        for payload in builder.iter_batches(self.max_messages, self.max_bytes):
+            batches.append((start, payload))
+            start += len(payload["Messages"])
+        return batches
+
+    def _dispatch(self, batch: tuple[int, SendV31Payload]) -> list[SendResult]:
+        """Send one payload synchronously and map its response.
+
+        Returns:
+            list[SendResult]: One result per message in the payload.
+        """
+        start, payload = batch
+        count = len(payload["Messages"])
+        try:
+            with nullcontext() if self.concurrency is None else self.concurrency.slot():
+                response = self.client.send.create(data=payload)  # type: ignore[arg-type]
+        except MailjetApiError as e:
+            return self._map_response(start, count, e.response_body, str(e), self.client.config.json_codec)
+        except ApiError as e:
+            return self._failed(start, count, str(e))
+        return self._map_response(start, count, response.content, "", self.client.config.json_codec)
+
+    async def _adispatch(self, batch: tuple[int, SendV31Payload]) -> list[SendResult]:
+        """Send one payload on the event loop and map its response.
+
+        Returns:
+            list[SendResult]: One result per message in the payload.
+        """
+        start, payload = batch
+        count = len(payload["Messages"])
+        try:
+            async with nullcontext() if self.concurrency is None else self.concurrency.aslot():
+                response = await self.client.send.create(data=payload)  # type: ignore[arg-type, misc]
+        except MailjetApiError as e:
+            return self._map_response(start, count, e.response_body, str(e), self.client.config.json_codec)
+        except ApiError as e:
+            return self._failed(start, count, str(e))
+        return self._map_response(start, count, response.content, "", self.client.config.json_codec)
+
+    @staticmethod
+    def _failed(start: int, count: int, error: str) -> list[SendResult]:
+        """Mark every message of a payload as failed with the same error.
+
+        Returns:
+            list[SendResult]: One error result per message in the payload.
+        """
+        errors = ({"ErrorMessage": error},)
+        return [SendResult(index=start + offset, status="error", errors=errors) for offset in range(count)]
+
+    @staticmethod
+    def _map_response(
+        start: int, count: int, body: bytes | str, call_error: str, codec: JsonCodec = STDLIB_CODEC
+    ) -> list[SendResult]:
+        """Map a Send API v3.1 response body back to its input messages.
+
+        Args:
+            start (int): Input index of the payload's first message.
+            count (int): Number of messages in the payload.
+            body (bytes | str): The raw response body.
+            call_error (str): The call-level error message, empty if the HTTP call succeeded.
+            codec (JsonCodec): The codec used to decode the body.
+
+        Returns:
+            list[SendResult]: One result per message in the payload.
+        """
+        if not body:
+            # Accepted without a body (e.g. intercepted by dry_run): nothing more to map.
+            if call_error:
+                return BatchSender._failed(start, count, call_error)
+            return [SendResult(index=start + offset, status="success") for offset in range(count)]
+
+        try:
+            entries = codec.loads(body).get("Messages")
+        except (ValueError, AttributeError):
+            entries = None
+        if not isinstance(entries, list):
+            return BatchSender._failed(start, count, call_error or "Send API response did not contain 'Messages'.")
+
+        results = []
+        for offset in range(count):
+            if offset >= len(entries) or not isinstance(entries[offset], dict):
+                missing = call_error or "Send API response is missing the result for this message."
+                results.append(SendResult(index=start + offset, status="error", errors=({"ErrorMessage": missing},)))
+                continue
+
+            entry = entries[offset]
+            message_ids = tuple(
+                recipient["MessageID"]
+                for field in ("To", "Cc", "Bcc")
+                for recipient in entry.get(field) or ()
+                if isinstance(recipient, dict) and "MessageID" in recipient
+            )
+            results.append(
+                SendResult(
+                    index=start + offset,
+                    status=str(entry.get("Status", "error" if call_error else "success")),
+                    message_ids=message_ids,
+                    errors=tuple(entry.get("Errors") or ()),
+                    custom_id=str(entry.get("CustomID") or ""),
+                )
+            )
+        return results
@@ -19,6 +19,7 @@ from mailjet_rest.utils.guardrails import SecurityGuard
 
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
     from pathlib import Path
 
     from mailjet_rest.types import SendV31Message, SendV31Payload
@@ -267,6 +268,7 @@ class MessageBuilder(_BaseContentBuilder):
             raise ValueError(msg)
 
         # OOM Guards
+        # Measured with the stdlib encoder whatever codec is installed, so the limit never depends on the environment.
         # Use default=str to prevent crash if variables contain non-serializable objects (like datetime or UUID)
         if "Variables" in self._payload and len(json.dumps(self._payload["Variables"], default=str)) > 1024 * 1024:
             msg = "Security Violation: Variables payload too large (exceeds 1MB)."
@@ -299,6 +301,10 @@ class SendPayloadBuilder:
 
     __slots__ = ("_globals", "_messages", "_sandbox")
 
+    # Mailjet Send API v3.1 per-call limits
+    MAX_MESSAGES_PER_CALL: ClassVar[int] = 50
+    MAX_PAYLOAD_BYTES: ClassVar[int] = 15 * 1024 * 1024
+
     def __init__(self) -> None:
         """Initialize an empty Send API payload structure."""
         self._messages: list[SendV31Message] = []
@@ -351,15 +357,65 @@ class SendPayloadBuilder:
             msg = "Payload validation failed: At least one message is required."
             raise ValueError(msg)
 
-        payload: dict[str, Any] = {"Messages": self._messages}
+        return {"Messages": self._messages, **self._root_fields()}  # type: ignore[typeddict-item]
+
+    def iter_batches(
+        self, max_messages: int = MAX_MESSAGES_PER_CALL, max_bytes: int = MAX_PAYLOAD_BYTES
+    ) -> Iterator[SendV31Payload]:
+        """Split the collected messages into root payloads that respect the Send API per-call limits.
+
+        Messages keep their relative order, so the N-th 'Messages[]' entry of each response maps
+        back to the N-th message of the matching payload. A single message larger than 'max_bytes'
+        is emitted on its own and left for the API to reject.
+
+        Args:
+            max_messages (int): Maximum number of messages per payload.
+            max_bytes (int): Maximum serialized payload size in bytes.
+
+        Yields:
+            SendV31Payload: Validated root payloads sharing the builder's SandboxMode and Globals.
+
+        Raises:
+            ValueError: If no messages are included or a limit is not strictly positive.
+        """
+        if not self._messages:
+            msg = "Payload validation failed: At least one message is required."
+            raise ValueError(msg)
+        if max_messages <= 0 or max_bytes <= 0:
+            msg = "Batch limits must be strictly positive integers."
+            raise ValueError(msg)
+
+        root = self._root_fields()
+        # Sizes mirror the wire format produced by requests (default separators, ASCII-escaped).
+        base_size = len(json.dumps({"Messages": [], **root}, default=str))
+        chunk: list[SendV31Message] = []
+        chunk_size = base_size
+
+        for message in self._messages:
+            message_size = len(json.dumps(message, default=str)) + 2  # ", " separator
+            if chunk and (len(chunk) >= max_messages or chunk_size + message_size > max_bytes):
+                yield {"Messages": chunk, **root}  # type: ignore[typeddict-item]
+                chunk, chunk_size = [], base_size
+            chunk.append(message)
+            chunk_size += message_size
+
+        yield {"Messages": chunk, **root}  # type: ignore[typeddict-item]
+
+    def _root_fields(self) -> dict[str, Any]:
+        """Collect the root-level configuration shared by every payload.
+
+        Returns:
+            dict[str, Any]: The optional SandboxMode and Globals entries.
+        """
+        root: dict[str, Any] = {}
 
         if self._sandbox:
-            payload["SandboxMode"] = True
+            root["SandboxMode"] = True
 
         if self._globals is not None:
-            payload["Globals"] = self._globals
+            root["Globals"] = self._globals
 
-        return payload  # type: ignore[return-value]
+        return root
 
 
 class TemplateContentBuilder(_BaseContentBuilder):
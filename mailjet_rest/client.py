@@ -9,14 +9,24 @@ from __future__ import annotations
 
 import difflib
 import logging
+import os
 import secrets
 import sys
+import time
 import warnings
-from contextlib import suppress
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext, suppress
+from functools import partial
 from typing import TYPE_CHECKING, Any, ClassVar, NoReturn
+from urllib.parse import urlsplit
 
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import ConnectionError as RequestsConnectionError, RequestException, Timeout as RequestsTimeout
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_environ_proxies
+from urllib3.exceptions import ConnectTimeoutError, HTTPError as Urllib3HTTPError, NewConnectionError
 from urllib3.util.retry import Retry
 
 from mailjet_rest.config import Config
@@ -28,24 +38,40 @@ from mailjet_rest.errors import (
     AuthorizationError,
     CriticalApiError,
     DoesNotExistError,
+    MailjetApiError,
     MailjetAuthError,
     TimeoutError,  # ruff: ignore[builtin-import-shadowing]
     ValidationError,
 )
-from mailjet_rest.routes import ROUTE_MAP
+from mailjet_rest.pagination import AdaptivePageSizer
+from mailjet_rest.routes import ROUTE_MAP, resource_of
 from mailjet_rest.types import _ALLOWED_TRACE_FIELDS
+from mailjet_rest.utils.cache import ResponseCache
+from mailjet_rest.utils.coalesce import SingleFlight
+from mailjet_rest.utils.codec import STDLIB_CODEC
+from mailjet_rest.utils.deadline import DeadlineBudget
 from mailjet_rest.utils.guardrails import (
     RedactingFilter,
     SecretAuth,
-    SecureHTTPAdapter,
     SecurityGuard,
 )
+from mailjet_rest.utils.instrumentation import CallStats, timed
+from mailjet_rest.utils.pool import PoolConfig, PooledHTTPAdapter, WarmupReport, get_adapter
+from mailjet_rest.utils.ratelimit import RateLimiter
+from mailjet_rest.utils.tracing import get_tracer, recording_tracer, trace_call
 
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable, Mapping
     from types import TracebackType
 
+    from urllib3.connectionpool import ConnectionPool, HTTPConnectionPool
+    from urllib3.response import BaseHTTPResponse
+
     from mailjet_rest.types import HttpMethod, PayloadType, TimeoutType
+    from mailjet_rest.utils.cache import CachedResponse, CacheKey
+    from mailjet_rest.utils.codec import JsonCodec
+    from mailjet_rest.utils.instrumentation import CallHook
 
 if sys.version_info >= (3, 11):
     from typing import Self
@@ -85,13 +111,48 @@ class JitterRetry(Retry):
         # Apply full jitter: random value between 0 and the exponential backoff
         return secrets.SystemRandom().uniform(0, base_backoff) if base_backoff > 0 else 0
 
+    def increment(
+        self,
+        method: str | None = None,
+        url: str | None = None,
+        response: BaseHTTPResponse | None = None,
+        error: Exception | None = None,
+        _pool: ConnectionPool | None = None,
+        _stacktrace: TracebackType | None = None,
+    ) -> Self:
+        """Consume one attempt, reporting the response about to be retried to the call's rate limiter.
 
-class Client:
-    """The central Mailjet API client.
-
-    This class serves as the entry point for all interactions with the Mailjet API.
-    It manages the connection pool, handles retries, and dynamically resolves
-    endpoint attributes based on the static routing registry.
+        Returns:
+            Self: The retry state of the next attempt.
+        """
+        retry = super().increment(method, url, response, error, _pool, _stacktrace)
+        if response is not None:
+            RateLimiter.observe_attempt(response.status, response.headers)
+        return retry
+
+    def sleep(self, response: BaseHTTPResponse | None = None) -> None:
+        """Sleep before the next attempt, unless the call's deadline cannot fit the wait and an attempt."""
+        budget = DeadlineBudget.current()
+        if budget is None:
+            with timed("retry_backoff"):
+                super().sleep(response)
+            return
+
+        budget.end_attempt()
+        delay = self.get_retry_after(response) if response is not None and self.respect_retry_after_header else None
+        if delay is None:
+            delay = self.get_backoff_time()
+        budget.reserve(delay, "retry backoff")
+        if delay > 0:
+            with timed("retry_backoff"):
+                time.sleep(delay)
+
+
+class _BaseClient:
+    """Transport-agnostic core shared by the synchronous and asyncio clients.
+
+    Owns configuration, credential validation, endpoint resolution and every
+    pre-flight guardrail, so both transports enforce identical security rules.
     """
 
     _RETRY_STRATEGY: ClassVar[JitterRetry] = JitterRetry(
@@ -106,15 +167,20 @@ class Client:
             "PUT",
             "DELETE",
         ],  # Mutates are Idempotent-hashed safely below
+        # Once retries run out, hand back the last response so it maps to a status-bearing error
+        # (e.g. 'ApiRateLimitError'), as 'AsyncClient' does, instead of a status-less RetryError.
+        raise_on_status=False,
     )
 
+    _ENDPOINT_CLASS: ClassVar[type[Endpoint]] = Endpoint
+
     def __init__(
         self,
         auth: str | tuple[str, str] | None = None,
         config: Config | None = None,
         **kwargs: Any,
     ) -> None:
-        """Initialize the client with jittered connection pooling.
+        """Validate credentials and build the configuration shared by all transports.
 
         Args:
             auth: A tuple containing the Mailjet API key and secret, or a Bearer token string.
@@ -127,55 +193,70 @@ class Client:
                 "If you are not injecting credentials into the session manually, your API calls will fail. "
                 "Strict initialization may be enforced in SDK v2.0.0.",
                 UserWarning,
-                stacklevel=2,
+                stacklevel=3,
             )
 
         self.config = Config(**kwargs) if config is None else config
-        self.session = requests.Session()
 
         # Delegate auth validation and coercion to SecurityGuard
         self.auth = SecurityGuard.validate_and_coerce_auth(auth)
 
-        if isinstance(self.auth, str):
-            self.session.auth = None
-            self.session.headers.update({"Authorization": f"Bearer {self.auth}"})
-        elif isinstance(self.auth, SecretAuth):
-            self.session.auth = self.auth
-        else:
-            self.session.auth = None  # type: ignore[unreachable]
+        self._endpoint_cache: dict[str, Endpoint] = {}
 
-        self.session.headers.update({"User-Agent": self.config.user_agent})
+        # Page sizes learned by 'stream(adaptive=True)', kept for the life of the client
+        self.page_sizer = AdaptivePageSizer()
 
-        adapter = SecureHTTPAdapter(pool_connections=100, pool_maxsize=100, max_retries=self._RETRY_STRATEGY)
-        self.session.mount("https://", adapter)
+        # Opaque partition of shared response caches; never the credentials themselves
+        self._cache_identity = SecurityGuard.auth_identity(self.auth)
 
-        self._endpoint_cache: dict[str, Endpoint] = {}
+        # Paces requests per endpoint group; shared by every thread or task using this client
+        self.rate_limiter = (
+            RateLimiter(
+                self.config.rate_limits,
+                self.config.rate_limit_backend,
+                SecurityGuard.account_namespace(self.auth),
+            )
+            if self.config.rate_limits
+            else None
+        )
+
+        # Fails fast per route while Mailjet is degraded; may be shared between clients
+        self.circuit_breaker = self.config.circuit_breaker
+
+        # Instrumentation hooks receiving the CallStats of every call; calls are only timed if any
+        self.hooks: list[CallHook] = list(self.config.hooks)
+
+        # Per-endpoint counters and latency histograms, fed as one more hook; may be shared between clients
+        self.metrics = self.config.metrics
+        if self.metrics is not None:
+            self.hooks.append(self.metrics)
+            if self.circuit_breaker is not None:
+                self.metrics.track_circuit_breaker(self.circuit_breaker)
+
+        # OpenTelemetry tracer; None when tracing is off or opentelemetry is not installed
+        self._tracer = get_tracer() if self.config.tracing else None
+
+        # Last timeout object validated and its result, replaced as a whole so threads never see a mix
+        self._checked_timeout: tuple[TimeoutType, float | tuple[float, float] | None] = (None, None)
 
         if getattr(self.config, "enable_security_audit", False):
             SecurityGuard.enable_audit_logging()
 
-    def __enter__(self) -> Self:
-        """Enter the context manager and return the client instance.
+        _LIVE_CLIENTS.add(self)
 
-        Returns:
-            Self: The client instance.
-        """
-        return self
+    def _reset_after_fork(self) -> None:
+        """Drop the state a forked child inherited: limiter buckets, cached responses, circuits and metrics.
 
-    def __exit__(
-        self,
-        exc_type: type[BaseException] | None,
-        exc_val: BaseException | None,
-        exc_tb: TracebackType | None,
-    ) -> None:
-        """Exit the context manager and safely close the HTTP session.
-
-        Args:
-            exc_type (type[BaseException] | None): Exception type.
-            exc_val (BaseException | None): Exception value.
-            exc_tb (TracebackType | None): Traceback.
+        Config and credentials are kept. Transports extend this to replace their connection pools.
         """
-        self.close()
+        if self.rate_limiter is not None:
+            self.rate_limiter.reset_after_fork()
+        if self.config.response_cache is not None:
+            self.config.response_cache.reset_after_fork()
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.reset_after_fork()
+        if self.metrics is not None:
+            self.metrics.reset_after_fork()
 
     def __repr__(self) -> str:
         """OWASP Secrets Management: Redact sensitive information from object representation.
@@ -183,7 +264,7 @@ class Client:
         Returns:
             str: The sanitized and safe string representation of the client instance.
         """
-        return f"<Client API Version='{self.config.version}' URL='{self.config.api_url}'>"
+        return f"<{self.__class__.__name__} API Version='{self.config.version}' URL='{self.config.api_url}'>"
 
     def __str__(self) -> str:
         """OWASP Secrets Management: Redact sensitive information from string representation.
@@ -193,13 +274,6 @@ class Client:
         """
         return f"Mailjet Client ({self.config.version})"
 
-    def close(self) -> None:
-        """Secure resource teardown closing internal sockets."""
-        if hasattr(self, "session") and self.session:
-            self.session.auth = None
-            self.session.headers.clear()
-            self.session.close()
-
     def __getattr__(self, name: str) -> Endpoint:
         """O(1) Route mapping.
 
@@ -224,7 +298,7 @@ class Client:
 
         # If it doesn't exist, we fall back to assuming it's a dynamic path
         # which will be safely encoded by sanitize_segment during _build_url
-        endpoint = Endpoint(client=self, name=name)
+        endpoint = self._ENDPOINT_CLASS(client=self, name=name)  # type: ignore[arg-type]
         self._endpoint_cache[name] = endpoint
         return endpoint
 
@@ -236,6 +310,495 @@ class Client:
         """
         return sorted(set(list(super().__dir__()) + list(ROUTE_MAP.keys())))
 
+    def _validate_request(
+        self,
+        url: str,
+        headers: dict[str, str] | None,
+        timeout: TimeoutType,
+        kwargs: dict[str, Any],
+    ) -> tuple[dict[str, str], float | tuple[float, float] | None, dict[str, Any]]:
+        """Run the transport-independent pre-flight guardrails.
+
+        Args:
+            url (str): The fully constructed API URL.
+            headers (dict[str, str] | None): Custom HTTP headers.
+            timeout (TimeoutType): Per-call timeout override.
+            kwargs (dict[str, Any]): Low-level transport arguments supplied by the caller.
+
+        Returns:
+            tuple: The sanitized headers, the validated timeout and the filtered transport kwargs.
+        """
+        # Ensure headers is a dictionary to prevent crashes if a legacy call explicitly passes None,
+        # or relies on the default fallback, before we attempt to mutate it for Idempotency keys.
+        if headers is None:
+            headers = {}
+
+        # CWE-113: Prevent Request Smuggling / CRLF Injection in headers
+        headers = SecurityGuard.sanitize_headers(headers)
+
+        if not kwargs.get("verify", True):
+            sys.audit("mailjet.security.tls_disabled", url)
+            msg = "Security Violation: Mailjet API TLS verification cannot be disabled."
+            raise ValueError(msg)
+
+        # Safely determine and validate active timeout bounds (CWE-400)
+        active_timeout = timeout if timeout is not None else self.config.timeout
+        req_timeout = self._validated_timeout(active_timeout)
+
+        if not kwargs:
+            return headers, req_timeout, {}
+
+        # Proxy Security Guardrail
+        SecurityGuard.check_request_security(kwargs)
+
+        # CWE-915: Prevent Mass Assignment of internal HTTP client states
+        return headers, req_timeout, SecurityGuard.filter_safe_kwargs(kwargs)
+
+    def _validated_timeout(self, timeout: TimeoutType) -> float | tuple[float, float] | None:
+        """Validate a timeout, reusing the result for the object validated last (usually 'Config.timeout').
+
+        Timeouts are immutable numbers or tuples, so the same object always validates the same way.
+        None is validated on every call to keep its warning.
+
+        Returns:
+            float | tuple[float, float] | None: The validated timeout.
+        """
+        checked, validated = self._checked_timeout
+        if timeout is checked and timeout is not None:
+            return validated
+        validated = SecurityGuard.validate_timeout(timeout)
+        self._checked_timeout = (timeout, validated)
+        return validated
+
+    def _is_dry_run(self, method: str, url: str) -> bool:
+        """Report whether a mutation must be intercepted by the dry-run sandbox.
+
+        Returns:
+            bool: True if the request must not reach the network.
+        """
+        if method in {"POST", "PUT", "DELETE"} and self.config.dry_run:
+            logger.info("DRY RUN: Intercepted %s request to %s", method, url)
+            return True
+        return False
+
+    @staticmethod
+    def _apply_idempotency_key(method: str, data: PayloadType, headers: dict[str, str]) -> None:
+        """Attach the SHA-256 Idempotency-Key to mutation requests in place."""
+        # Allow idempotency hashing for valid batch lists
+        if method in {"POST", "PUT", "DELETE"} and isinstance(data, (dict, list)) and "Idempotency-Key" not in headers:
+            headers["Idempotency-Key"] = SecurityGuard.generate_payload_fingerprint(data)
+
+    @staticmethod
+    def _serialize_body(method: str, data: PayloadType, headers: dict[str, str], codec: JsonCodec) -> PayloadType:
+        """Encode JSON mutation payloads once, deriving the Idempotency-Key from the same bytes.
+
+        When the caller already supplied an Idempotency-Key no fingerprint is needed, so the
+        configured codec serializes the body on its own.
+
+        Returns:
+            PayloadType: The encoded JSON body, or the untouched payload when it takes the regular path.
+        """
+        if (
+            method not in {"POST", "PUT", "DELETE"}
+            or not isinstance(data, (dict, list))
+            or "application/json" not in (headers.get("Content-Type") or "")
+        ):
+            _BaseClient._apply_idempotency_key(method, data, headers)
+            return data
+        try:
+            if "Idempotency-Key" in headers:
+                return codec.dumps(data)
+            body, fingerprint = SecurityGuard.serialize_payload(data)
+        except (TypeError, ValueError, OverflowError):
+            # Not strict JSON (NaN, sets, cycles...): keep the fingerprint + transport encoding path,
+            # which surfaces the same errors as before.
+            _BaseClient._apply_idempotency_key(method, data, headers)
+            return data
+        headers["Idempotency-Key"] = fingerprint
+        return body
+
+    def _cache_lookup(
+        self,
+        method: str,
+        url: str,
+        filters: dict[str, Any] | None,
+        headers: dict[str, str],
+        safe_kwargs: dict[str, Any],
+    ) -> tuple[CacheKey | None, CachedResponse | None]:
+        """Find the cached response of a GET request, fresh or due for revalidation.
+
+        Returns:
+            tuple[CacheKey | None, CachedResponse | None]: The request's cache key (None if the request
+                bypasses the cache) and the cached entry, if any.
+        """
+        cache = self.config.response_cache
+        # Streamed bodies are consumed by the caller and can never be replayed from memory.
+        if cache is None or method != "GET" or safe_kwargs.get("stream"):
+            return None, None
+        key = cache.make_key(self._cache_identity, url, self._clean_filters(filters), headers)
+        entry = cache.get(key)
+        self._record_phase("cache")
+        return key, entry
+
+    def _call_stats(self, method: str, url: str, data: PayloadType) -> CallStats:
+        """Return fresh stats for an instrumented call, carrying the payload's trace fields."""
+        return CallStats(method, url, resource_of(url), telemetry=self._extract_telemetry(data, None)[1])
+
+    @staticmethod
+    def _record_phase(phase: str) -> None:
+        """End a phase of the instrumented call running in this context, if any."""
+        stats = CallStats.current()
+        if stats is not None:
+            stats.mark(phase)
+
+    @staticmethod
+    def _record_body(body: PayloadType) -> None:
+        """End the serialize phase of the instrumented call and note the encoded body size."""
+        stats = CallStats.current()
+        if stats is not None:
+            stats.mark("serialize")
+            stats.bytes_out = len(body) if isinstance(body, (bytes, str)) else 0
+
+    @staticmethod
+    def _record_cache_hit() -> None:
+        """Flag the instrumented call as served from the response cache."""
+        stats = CallStats.current()
+        if stats is not None:
+            stats.cached = True
+
+    def _deadline_budget(self, deadline: float | None) -> DeadlineBudget | None:
+        """Start the total time budget of a call, if it has a deadline.
+
+        Returns:
+            DeadlineBudget | None: The budget, or None when neither the call nor the config sets a deadline.
+        """
+        seconds = deadline if deadline is not None else self.config.deadline
+        return DeadlineBudget(seconds) if seconds is not None else None
+
+    def _warmup_count(self, connections: int) -> int:
+        """Return the number of connections to warm up, capped at the pool size."""
+        if connections <= 0:
+            msg = "warmup() needs at least one connection."
+            raise ValueError(msg)
+        return min(connections, (self.config.pool or PoolConfig()).maxsize)
+
+    def _flight_key(
+        self,
+        method: str,
+        url: str,
+        filters: dict[str, Any] | None,
+        headers: dict[str, str],
+        timeout: TimeoutType,
+        budget: DeadlineBudget | None,
+        safe_kwargs: dict[str, Any],
+    ) -> Hashable | None:
+        """Identify a GET request that identical concurrent calls may share.
+
+        The timeout, the deadline and the transport arguments are part of the key, so a call
+        never waits on (or inherits the failure of) a leader sent with tighter or other settings.
+
+        Returns:
+            Hashable | None: The coalescing key, or None if the request must be sent on its own.
+        """
+        if not self.config.coalesce_requests or method != "GET" or safe_kwargs.get("stream"):
+            return None
+        request = ResponseCache.make_key(self._cache_identity, url, self._clean_filters(filters), headers)
+        transport = tuple(sorted((name, repr(value)) for name, value in safe_kwargs.items()))
+        return request, timeout, None if budget is None else budget.seconds, transport
+
+    def _cache_update(
+        self,
+        method: str,
+        url: str,
+        key: CacheKey | None,
+        status_code: int,
+        headers: Mapping[str, str],
+        content: Callable[[], bytes],
+    ) -> CachedResponse | None:
+        """Record a successful response in the cache, or drop what a mutation made stale.
+
+        Args:
+            method (str): The HTTP method.
+            url (str): The request URL.
+            key (CacheKey | None): The cache key from '_cache_lookup'.
+            status_code (int): The response status.
+            headers (Mapping[str, str]): The response headers.
+            content (Callable[[], bytes]): Reads the response body, only when it is stored.
+
+        Returns:
+            CachedResponse | None: The revalidated entry to serve on '304 Not Modified', otherwise None.
+        """
+        cache = self.config.response_cache
+        if cache is None:
+            return None
+        if method in {"POST", "PUT", "DELETE"} and status_code < 400:
+            cache.invalidate(self._cache_identity, url)
+        elif key is not None and status_code == 304:
+            return cache.revalidated(key, headers)
+        elif key is not None and status_code == 200:
+            cache.put(key, status_code, headers, content())
+        return None
+
+    @staticmethod
+    def _clean_filters(filters: dict[str, Any] | None) -> dict[str, Any] | None:
+        """Strip None filters.
+
+        Returns:
+            dict[str, Any] | None: The query parameters without unset values.
+        """
+        return {k: v for k, v in filters.items() if v is not None} if filters else None
+
+    @staticmethod
+    def _map_http_error(status: int, body: str, json_loader: Callable[[], Any]) -> MailjetApiError | None:
+        """Map an HTTP error status to the matching Mailjet domain exception.
+
+        Args:
+            status (int): The HTTP status code.
+            body (str): The raw response body.
+            json_loader (Callable[[], Any]): Lazily decodes the response body as JSON.
+
+        Returns:
+            MailjetApiError | None: The domain exception to raise, or None if the status has no dedicated mapping.
+        """
+        # DX Improvement: Extract actionable error message from API response
+        error_detail = ""
+        with suppress(Exception):
+            resp_json = json_loader()
+            if "ErrorMessage" in resp_json:
+                error_detail = f": {resp_json['ErrorMessage']}"
+            elif resp_json.get("Messages"):
+                errors = resp_json["Messages"][0].get("Errors", [])
+                if errors:
+                    error_detail = f": {errors[0].get('ErrorMessage', '')}"
+
+        if not error_detail and body:
+            error_detail = f": {body}"
+
+        if status in {401, 403}:
+            return MailjetAuthError(f"Authentication or Authorization failed{error_detail}", status, body)
+        if status == 429:
+            return ApiRateLimitError(f"Rate limit exceeded{error_detail}", status, body)
+        if status == 404:
+            return DoesNotExistError(f"Resource not found{error_detail}", status, body)
+        if status == 400:
+            return ValidationError(f"Payload validation failed{error_detail}", status, body)
+        return None
+
+    @staticmethod
+    def _log_request(method: str, url: str, response: Any, trace_str: str) -> None:
+        """Internal static logging mechanism for formatted API lifecycle traces."""
+        if response.status_code >= 400:
+            logger.error(
+                "API Error %s | %s %s%s | Response: %s",
+                getattr(response, "status_code", "Unknown"),
+                method,
+                url,
+                trace_str,
+                getattr(response, "text", ""),
+            )
+        else:
+            logger.debug("API Success %s | %s %s%s", getattr(response, "status_code", 200), method, url, trace_str)
+
+    @staticmethod
+    def _extract_telemetry(data: Any, _headers: dict[str, str] | None) -> tuple[str, dict[str, str]]:
+        """Extract tracing identifiers for safe logging and structured telemetry.
+
+        Args:
+            data (Any): The request payload.
+
+        Returns:
+            tuple[str, dict[str, str]]: A tuple containing the formatted telemetry trace suffix
+                and a dictionary of structured data.
+        """
+        trace_ctx = []
+        structured_data = {}
+        with suppress(Exception):
+            if isinstance(data, (dict, list)):
+                # Correctly unpack top-level list payloads instead of falling back to [{}]
+                messages = data.get("Messages", [{}]) if isinstance(data, dict) else data
+                target_dict = messages[0] if isinstance(messages, list) and messages else data
+
+                if isinstance(target_dict, dict):
+                    for field in _ALLOWED_TRACE_FIELDS:
+                        if val := target_dict.get(field) or (isinstance(data, dict) and data.get(field)):
+                            clean_val = SecurityGuard.sanitize_log_trace(val)
+                            trace_ctx.append(f"{field}={clean_val}")
+                            structured_data[f"mailjet.{field.lower()}"] = clean_val
+
+        return f" | Trace: [{' '.join(trace_ctx)}]" if trace_ctx else "", structured_data
+
+
+# Clients alive in this process. A forked child (gunicorn, uWSGI or celery prefork workers)
+# inherits their pooled sockets, locks and caches, which are reset before it runs any code.
+_LIVE_CLIENTS: weakref.WeakSet[_BaseClient] = weakref.WeakSet()
+
+
+def _reset_clients_after_fork() -> None:
+    """Reset every live client in a freshly forked child."""
+    for client in list(_LIVE_CLIENTS):
+        client._reset_after_fork()  # ruff: ignore[private-member-access]
+
+
+if hasattr(os, "register_at_fork"):  # pragma: no branch
+    os.register_at_fork(after_in_child=_reset_clients_after_fork)
+
+
+class Client(_BaseClient):
+    """The central Mailjet API client.
+
+    This class serves as the entry point for all interactions with the Mailjet API.
+    It manages the connection pool, handles retries, and dynamically resolves
+    endpoint attributes based on the static routing registry.
+    """
+
+    def __init__(
+        self,
+        auth: str | tuple[str, str] | None = None,
+        config: Config | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize the client with jittered connection pooling.
+
+        Args:
+            auth: A tuple containing the Mailjet API key and secret, or a Bearer token string.
+            config: An optional Config object for advanced behavior tuning.
+            **kwargs: Configuration values (e.g., version, timeout) applied directly to a new Config object.
+        """
+        super().__init__(auth, config, **kwargs)
+        self.session = requests.Session()
+        self._flights = SingleFlight()
+
+        if isinstance(self.auth, str):
+            self.session.auth = None
+            self.session.headers.update({"Authorization": f"Bearer {self.auth}"})
+        elif isinstance(self.auth, SecretAuth):
+            self.session.auth = self.auth
+        else:
+            self.session.auth = None  # type: ignore[unreachable]
+
+        self.session.headers.update({"User-Agent": self.config.user_agent})
+
+        self.session.mount("https://", get_adapter(self.config.pool or PoolConfig(), self._RETRY_STRATEGY))
+
+        # Trusted fast path: environment proxy and CA bundle settings, read once per API host
+        self._environment: dict[tuple[str, str], tuple[dict[str, str], str | bool]] | None = None
+        if self.config.trusted_fast_path:
+            self.session.trust_env = False
+            self._environment = {}
+
+    def __enter__(self) -> Self:
+        """Enter the context manager and return the client instance.
+
+        Returns:
+            Self: The client instance.
+        """
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Exit the context manager and safely close the HTTP session.
+
+        Args:
+            exc_type (type[BaseException] | None): Exception type.
+            exc_val (BaseException | None): Exception value.
+            exc_tb (TracebackType | None): Traceback.
+        """
+        self.close()
+
+    def _reset_after_fork(self) -> None:
+        """Also replace the connection pools and in-flight request table inherited from the parent."""
+        super()._reset_after_fork()
+        self._flights = SingleFlight()
+        for adapter in set(self.session.adapters.values()):
+            if isinstance(adapter, PooledHTTPAdapter) and not adapter.shared:  # Shared ones reset themselves
+                adapter.reset_after_fork()
+
+    def close(self) -> None:
+        """Secure resource teardown closing internal sockets."""
+        if hasattr(self, "session") and self.session:
+            self.session.auth = None
+            self.session.headers.clear()
+            # A shared pool outlives this client: unmount it so closing the session leaves it open.
+            for prefix, adapter in list(self.session.adapters.items()):
+                if getattr(adapter, "shared", False):
+                    del self.session.adapters[prefix]
+            self.session.close()
+
+    def warmup(self, connections: int = 1) -> WarmupReport:
+        """Open and handshake pooled connections to the API host ahead of the first call.
+
+        DNS, TCP and TLS setup then happen here (e.g. right after a deploy or a Lambda cold
+        start) instead of on the first request. Like 'AsyncClient.warmup', this sends
+        'connections' concurrent 'HEAD' probes to the API root, each leaving a keep-alive
+        connection in the pool; already open connections are reused. The probes' status
+        codes are ignored.
+
+        Args:
+            connections (int): Connections to open, capped at the pool's 'maxsize'.
+
+        Returns:
+            WarmupReport: How many connections are warm and how long the warmup took.
+
+        Raises:
+            TimeoutError: If a connection cannot be established within the connect timeout.
+            CriticalApiError: If a connection or TLS handshake fails.
+        """
+        count = self._warmup_count(connections)
+        timeout = self.config.timeout[0] if isinstance(self.config.timeout, tuple) else self.config.timeout
+        started = time.monotonic()
+        try:
+            self._open_connections(count, timeout)
+        except (Urllib3HTTPError, OSError) as e:
+            # urllib3 derives NewConnectionError (e.g. connection refused) from ConnectTimeoutError.
+            if isinstance(e, ConnectTimeoutError) and not isinstance(e, NewConnectionError):
+                msg = f"Connection to Mailjet API timed out during warmup: {e}"
+                raise TimeoutError(msg) from e
+            msg = f"Connection to Mailjet API failed during warmup: {e}"
+            raise CriticalApiError(msg) from e
+
+        report = WarmupReport(connections=count, elapsed=time.monotonic() - started)
+        logger.debug("Warmed up %d connection(s) to %s in %.3fs", count, self.config.api_url, report.elapsed)
+        return report
+
+    def _open_connections(self, count: int, timeout: float | None) -> None:
+        """Open 'count' connections of the API host's pool with concurrent 'HEAD' probes, then release them."""
+        url = self.config.api_url
+        adapter = self.session.get_adapter(url)
+        if not isinstance(adapter, HTTPAdapter):
+            return  # A custom transport manages its own connections
+        # Resolve the pool exactly as a request would, so the next calls find these connections.
+        settings = self.session.merge_environment_settings(url, stream=None, cert=None, **self._transport_settings(url))
+        pool: HTTPConnectionPool = adapter.get_connection_with_tls_context(  # type: ignore[assignment]
+            requests.Request("GET", url).prepare(), settings["verify"], settings["proxies"], settings["cert"]
+        )
+        adapter.cert_verify(pool, url, settings["verify"], settings["cert"])  # type: ignore[no-untyped-call]
+        probe = partial(
+            pool.urlopen,
+            "HEAD",
+            urlsplit(url).path or "/",
+            headers={"User-Agent": self.config.user_agent},
+            retries=False,
+            timeout=timeout,
+            preload_content=False,
+            release_conn=False,
+        )
+        # Every probe keeps its connection until all are done, so each one opens its own.
+        with ThreadPoolExecutor(max_workers=count) as executor:
+            futures = [executor.submit(probe) for _ in range(count)]
+        for future in futures:
+            if future.exception() is None:
+                response = future.result()
+                response.drain_conn()
+                response.release_conn()
+        for future in futures:
+            error = future.exception()
+            if error is not None:
+                raise error
+
     def _execute_request(
         self,
         method: str,
@@ -267,48 +830,80 @@ class Client:
             data=data if not is_json else None,
             params=params,
             timeout=timeout,
-            verify=True,  # Always True, enforced natively against MITM attacks
+            **self._transport_settings(url, kwargs.pop("proxies", None)),
             **kwargs,
         )
 
+    def _transport_settings(self, url: str, proxies: dict[str, str] | None = None) -> dict[str, Any]:
+        """Return the 'proxies' and 'verify' settings of a request.
+
+        Verification is always on, enforced natively against MITM attacks. On the trusted fast
+        path, the proxy and CA bundle environment variables 'requests' would read on every call
+        are read once per scheme and host; proxies passed to the call still take precedence.
+
+        Returns:
+            dict[str, Any]: The 'proxies' and 'verify' arguments to send the request with.
+        """
+        if self._environment is None:
+            return {"proxies": proxies or {}, "verify": True}
+        parts = urlsplit(url)
+        key = (parts.scheme, parts.netloc)
+        environment = self._environment.get(key)
+        if environment is None:
+            ca_bundle = os.environ.get("REQUESTS_CA_BUNDLE") or os.environ.get("CURL_CA_BUNDLE")
+            environment = self._environment[key] = (get_environ_proxies(url), ca_bundle or True)
+        env_proxies, verify = environment
+        if proxies and "no_proxy" in proxies:
+            env_proxies = get_environ_proxies(url, no_proxy=proxies["no_proxy"])
+        return {"proxies": {**env_proxies, **(proxies or {})}, "verify": verify}
+
+    def _pace(self, url: str, budget: DeadlineBudget | None = None) -> None:
+        """Wait for the request's rate limit slot, if its endpoint group is paced."""
+        if self.rate_limiter is None:
+            return
+        delay = self.rate_limiter.reserve(url)
+        if delay > 0:
+            if budget is not None:
+                budget.reserve(delay, "rate limit wait")
+            time.sleep(delay)
+        self._record_phase("rate_limit")
+
+    def _observe_rate_limit(self, url: str, response: requests.Response) -> None:
+        """Feed the rate limiter with the final response; 'JitterRetry' reports the retried ones."""
+        if self.rate_limiter is not None:
+            self.rate_limiter.observe(url, response.status_code, response.headers)
+
+    @staticmethod
+    def _cached_response(entry: CachedResponse, url: str) -> requests.Response:
+        """Materialize a fresh, caller-owned response from a cache entry.
+
+        Returns:
+            requests.Response: A response equivalent to the one originally received.
+        """
+        response = requests.Response()
+        response.status_code = entry.status_code
+        response.headers = CaseInsensitiveDict(entry.headers)
+        response._content = entry.content  # ruff: ignore[private-member-access]
+        response.url = url
+        response.reason = "OK"
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        return response
+
     @staticmethod
-    def _handle_api_error(e: RequestException) -> NoReturn:
+    def _handle_api_error(e: RequestException, codec: JsonCodec = STDLIB_CODEC) -> NoReturn:
         """Map requests exceptions to Mailjet specific API errors."""
         if e.response is not None:
-            status = e.response.status_code
-            body = e.response.text
-
-            # DX Improvement: Extract actionable error message from API response
-            error_detail = ""
-            with suppress(Exception):
-                resp_json = e.response.json()
-                if "ErrorMessage" in resp_json:
-                    error_detail = f": {resp_json['ErrorMessage']}"
-                elif resp_json.get("Messages"):
-                    errors = resp_json["Messages"][0].get("Errors", [])
-                    if errors:
-                        error_detail = f": {errors[0].get('ErrorMessage', '')}"
-
-            if not error_detail and body:
-                error_detail = f": {body}"
-
-            if status in {401, 403}:
-                msg = f"Authentication or Authorization failed{error_detail}"
-                raise MailjetAuthError(msg, status, body) from e
-            if status == 429:
-                msg = f"Rate limit exceeded{error_detail}"
-                raise ApiRateLimitError(msg, status, body) from e
-            if status == 404:
-                msg = f"Resource not found{error_detail}"
-                raise DoesNotExistError(msg, status, body) from e
-            if status == 400:
-                msg = f"Payload validation failed{error_detail}"
-                raise ValidationError(msg, status, body) from e
+            json_loader = partial(codec.loads, e.response.content)
+            error = Client._map_http_error(e.response.status_code, e.response.text, json_loader)
+            if error is not None:
+                raise error from e
+            msg = f"An unexpected Mailjet API network error occurred: {e}"
+            raise MailjetApiError(msg, e.response.status_code, e.response.text) from e
 
         msg = f"An unexpected Mailjet API network error occurred: {e}"
         raise ApiError(msg) from e
 
-    def api_call(  # ruff: ignore[complex-structure]
+    def api_call(
         self,
         method: HttpMethod,
         url: str,
@@ -316,6 +911,7 @@ class Client:
         data: PayloadType = None,
         headers: dict[str, str] | None = None,
         timeout: TimeoutType = None,
+        deadline: float | None = None,
         **kwargs: Any,
     ) -> requests.Response:
         """Execute the authenticated API call with idempotency guards.
@@ -327,64 +923,110 @@ class Client:
             data (PayloadType, optional): Request payload.
             headers (dict[str, str] | None, optional): Custom HTTP headers.
             timeout (TimeoutType, optional): Request timeout.
+            deadline (float | None, optional): Total time budget of the call across retries, in seconds.
+                Overrides 'Config.deadline'.
             **kwargs (Any): Additional arguments passed to 'requests.Session.request'.
 
         Returns:
             requests.Response: The authenticated HTTP response from Mailjet.
         """
-        # Ensure headers is a dictionary to prevent crashes if a legacy call explicitly passes None,
-        # or relies on the default fallback, before we attempt to mutate it for Idempotency keys.
-        if headers is None:
-            headers = {}
-
-        # CWE-113: Prevent Request Smuggling / CRLF Injection in headers
-        headers = SecurityGuard.sanitize_headers(headers)
-
-        if not kwargs.get("verify", True):
-            sys.audit("mailjet.security.tls_disabled", url)
-            msg = "Security Violation: Mailjet API TLS verification cannot be disabled."
-            raise ValueError(msg)
-
-        # Safely determine and validate active timeout bounds (CWE-400)
-        active_timeout = timeout if timeout is not None else self.config.timeout
-        req_timeout = SecurityGuard.validate_timeout(active_timeout)
+        tracer = recording_tracer(self._tracer)
+        if not self.hooks and tracer is None:
+            return self._dispatch(method, url, filters, data, headers, timeout, deadline, **kwargs)
+        stats = self._call_stats(method, url, data)
+        with stats.activate(self.hooks), trace_call(tracer, stats, data):
+            response = self._dispatch(method, url, filters, data, headers, timeout, deadline, **kwargs)
+            stats.record_response(response)
+            return response
 
-        # Proxy Security Guardrail
-        SecurityGuard.check_request_security(kwargs)
+    def _dispatch(
+        self,
+        method: HttpMethod,
+        url: str,
+        filters: dict[str, Any] | None,
+        data: PayloadType,
+        headers: dict[str, str] | None,
+        timeout: TimeoutType,
+        deadline: float | None,
+        **kwargs: Any,
+    ) -> requests.Response:
+        """Validate, serve from cache or send an API call; the body of 'api_call'.
 
-        # CWE-915: Prevent Mass Assignment of internal HTTP client states
-        safe_kwargs = SecurityGuard.filter_safe_kwargs(kwargs)
+        Returns:
+            requests.Response: The authenticated HTTP response from Mailjet.
+        """
+        headers, req_timeout, safe_kwargs = self._validate_request(url, headers, timeout, kwargs)
+        budget = self._deadline_budget(deadline)
+        self._record_phase("validate")
 
         # Idempotency Lock for mutations
-        if method in {"POST", "PUT", "DELETE"}:
-            if self.config.dry_run:
-                logger.info("DRY RUN: Intercepted %s request to %s", method, url)
-                mock = requests.Response()
-                mock.status_code = 200
-                return mock
-
-            # Allow idempotency hashing for valid batch lists
-            if isinstance(data, (dict, list)) and "Idempotency-Key" not in headers:
-                headers["Idempotency-Key"] = SecurityGuard.generate_payload_fingerprint(data)
-
-        # Strip None filters
-        clean_filters = {k: v for k, v in filters.items() if v is not None} if filters else None
+        if self._is_dry_run(method, url):
+            mock = requests.Response()
+            mock.status_code = 200
+            return mock
+
+        cache_key, cached = self._cache_lookup(method, url, filters, headers, safe_kwargs)
+        if cached is not None:
+            if cached.is_fresh():
+                self._record_cache_hit()
+                return self._cached_response(cached, url)
+            headers = {**headers, **cached.validators()}
+        body = self._serialize_body(method, data, headers, self.config.json_codec)
+        self._record_body(body)
+
+        # Only the DEBUG success log shows the trace, so skip scanning the payload otherwise.
+        trace_suffix = self._extract_telemetry(data, headers)[0] if logger.isEnabledFor(logging.DEBUG) else ""
+
+        send = partial(
+            self._send, method, url, filters, body, headers, req_timeout, safe_kwargs, trace_suffix, cache_key, budget
+        )
+        if self.circuit_breaker is not None:
+            send = partial(self.circuit_breaker.call, resource_of(url), send)
+        flight_key = self._flight_key(method, url, filters, headers, req_timeout, budget, safe_kwargs)
+        return send() if flight_key is None else self._flights.do(flight_key, send)
 
-        trace_suffix, _ = self._extract_telemetry(data, headers)
+    def _send(
+        self,
+        method: HttpMethod,
+        url: str,
+        filters: dict[str, Any] | None,
+        body: Any,
+        headers: dict[str, str],
+        req_timeout: TimeoutType,
+        safe_kwargs: dict[str, Any],
+        trace_suffix: str,
+        cache_key: CacheKey | None,
+        budget: DeadlineBudget | None = None,
+    ) -> requests.Response:
+        """Dispatch a validated request and map its outcome to a response or a domain exception.
 
+        Returns:
+            requests.Response: The authenticated HTTP response from Mailjet.
+        """
+        self._pace(url, budget)
         try:
-            response = self._execute_request(
-                method=method,
-                url=url,
-                headers=headers,
-                data=data,
-                params=clean_filters,
-                timeout=req_timeout,
-                **safe_kwargs,
-            )
+            with (
+                nullcontext() if budget is None else budget.activate(),
+                nullcontext() if self.rate_limiter is None else self.rate_limiter.observing(url),
+            ):
+                response = self._execute_request(
+                    method=method,
+                    url=url,
+                    headers=headers,
+                    data=body,
+                    params=self._clean_filters(filters),
+                    timeout=req_timeout if budget is None else budget.timeout(req_timeout),
+                    **safe_kwargs,
+                )
+            self._record_phase("transfer")
+            self._observe_rate_limit(url, response)
             response.raise_for_status()
 
         except RequestsTimeout as e:
+            if budget is not None and budget.expired():
+                budget.end_attempt()
+                msg = "the last attempt ran out of time"
+                raise budget.exceeded(msg) from e
             logger.exception("Timeout Error: %s %s", method, url)
             msg = f"Request to Mailjet API timed out: {e}"
             raise TimeoutError(msg) from e
@@ -394,55 +1036,15 @@ class Client:
             raise CriticalApiError(msg) from e
 
         except RequestException as e:
-            self._handle_api_error(e)
+            self._handle_api_error(e, self.config.json_codec)
 
         else:
             if response.status_code in {200, 201, 204}:
                 self._log_request(method, url, response, trace_suffix)
-            return response
-
-    @staticmethod
-    def _log_request(method: str, url: str, response: requests.Response, trace_str: str) -> None:
-        """Internal static logging mechanism for formatted API lifecycle traces."""
-        if response.status_code >= 400:
-            logger.error(
-                "API Error %s | %s %s%s | Response: %s",
-                getattr(response, "status_code", "Unknown"),
-                method,
-                url,
-                trace_str,
-                getattr(response, "text", ""),
+            revalidated = self._cache_update(
+                method, url, cache_key, response.status_code, response.headers, lambda: response.content
             )
-        else:
-            logger.debug("API Success %s | %s %s%s", getattr(response, "status_code", 200), method, url, trace_str)
-
-    @staticmethod
-    def _extract_telemetry(data: Any, _headers: dict[str, str] | None) -> tuple[str, dict[str, str]]:
-        """Extract tracing identifiers for safe logging and structured telemetry.
-
-        Args:
-            data (Any): The request payload.
-
-        Returns:
-            tuple[str, dict[str, str]]: A tuple containing the formatted telemetry trace suffix
-                and a dictionary of structured data.
-        """
-        trace_ctx = []
-        structured_data = {}
-        with suppress(Exception):
-            if isinstance(data, (dict, list)):
-                # Correctly unpack top-level list payloads instead of falling back to [{}]
-                messages = data.get("Messages", [{}]) if isinstance(data, dict) else data
-                target_dict = messages[0] if isinstance(messages, list) and messages else data
-
-                if isinstance(target_dict, dict):
-                    for field in _ALLOWED_TRACE_FIELDS:
-                        if val := target_dict.get(field) or (isinstance(data, dict) and data.get(field)):
-                            clean_val = SecurityGuard.sanitize_log_trace(val)
-                            trace_ctx.append(f"{field}={clean_val}")
-                            structured_data[f"mailjet.{field.lower()}"] = clean_val
-
-        return f" | Trace: [{' '.join(trace_ctx)}]" if trace_ctx else "", structured_data
+            return response if revalidated is None else self._cached_response(revalidated, url)
 
 
 # --- Deprecated Wrappers ---
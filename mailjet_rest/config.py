@@ -1,11 +1,19 @@
 """Configuration settings for the Mailjet SDK."""
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import ClassVar
 
 from mailjet_rest._version import __version__
 from mailjet_rest.types import _DEFAULT_TIMEOUT, TimeoutType
+from mailjet_rest.utils.breaker import CircuitBreaker
+from mailjet_rest.utils.cache import ResponseCache
+from mailjet_rest.utils.codec import JsonCodec, get_codec
 from mailjet_rest.utils.guardrails import SecurityGuard
+from mailjet_rest.utils.instrumentation import CallHook
+from mailjet_rest.utils.metrics import MetricsRegistry
+from mailjet_rest.utils.pool import PoolConfig
+from mailjet_rest.utils.ratelimit import RateLimit, RateLimitBackend
 
 
 @dataclass(slots=True, kw_only=True)
@@ -18,6 +26,37 @@ class Config:
         api_url (str): The base URL for the Mailjet API.
         user_agent (str): The User-Agent string sent with API requests.
         timeout (TimeoutType): Request timeout in seconds.
+        json_codec (JsonCodec | None): JSON codec for request bodies and responses. Defaults to the
+            fastest installed codec (orjson, ujson, then the standard library); see 'get_codec'.
+        response_cache (ResponseCache | None): Opt-in cache of GET responses, keyed per auth identity
+            so it can be shared between clients. Disabled by default.
+        coalesce_requests (bool): Let identical concurrent GET requests (same URL, filters, headers,
+            credentials, timeout, deadline and transport arguments) share a single in-flight call.
+            Disabled by default.
+        rate_limits (dict[str, RateLimit] | None): Client-side request budgets keyed by endpoint group
+            ('send', 'rest' or 'statistics'); see 'RateLimiter'. Groups left out are not paced.
+        rate_limit_backend (RateLimitBackend | None): Where rate limit buckets live. Share a
+            'FileLockBackend' or 'SQLiteBackend' to give every process one budget per API key.
+            Defaults to private in-process buckets.
+        deadline (float | None): Total time budget of a call in seconds, spanning every attempt and
+            the waits between them; 'timeout' still bounds each attempt. Disabled by default and
+            overridable per call with 'deadline='.
+        circuit_breaker (CircuitBreaker | None): Fails calls fast with 'CircuitOpenError' while a
+            route keeps failing, instead of waiting out timeouts and retries. Disabled by default.
+        pool (PoolConfig | None): Connection pool size, blocking, idle keep-alive and sharing
+            between clients. Defaults to a private pool of 100 connections per host.
+        hooks (Sequence[CallHook]): Callables receiving the 'CallStats' (phase timings, byte counts,
+            retries and trace fields) of every API call once it ends. Calls are only timed when
+            at least one hook is registered or the call is traced.
+        metrics (MetricsRegistry | None): Per-endpoint counters and latency histograms of every call,
+            plus the state of the circuit breaker, exportable in the Prometheus text format; may be
+            shared between clients. Disabled by default.
+        tracing (bool): Emit OpenTelemetry spans per call and per attempt, and propagate W3C trace
+            context, when 'opentelemetry-api' is installed and the application has set a tracer
+            provider; calls are not instrumented before that. Enabled by default.
+        trusted_fast_path (bool): Read the proxy and CA bundle environment variables once per API host
+            instead of on every request ('Client' only; httpx reads them once per 'AsyncClient').
+            Use it when the environment does not change while the client runs. Disabled by default.
     """
 
     ALLOWED_ROOT_DOMAIN: ClassVar[str] = "mailjet.com"
@@ -28,6 +67,18 @@ class Config:
     timeout: TimeoutType = _DEFAULT_TIMEOUT
     dry_run: bool = False
     enable_security_audit: bool = False
+    json_codec: JsonCodec | None = None
+    response_cache: ResponseCache | None = None
+    coalesce_requests: bool = False
+    rate_limits: dict[str, RateLimit] | None = None
+    rate_limit_backend: RateLimitBackend | None = None
+    deadline: float | None = None
+    circuit_breaker: CircuitBreaker | None = None
+    pool: PoolConfig | None = None
+    hooks: Sequence[CallHook] = ()
+    metrics: MetricsRegistry | None = None
+    tracing: bool = True
+    trusted_fast_path: bool = False
 
     def __post_init__(self) -> None:
         """Validate configuration for secure transport and resource limits (OWASP Input Validation)."""
@@ -40,3 +91,12 @@ class Config:
 
         # 2. Validate the timeouts securely (Guardrail handles both scalars and tuples natively)
         self.timeout = SecurityGuard.validate_timeout(self.timeout)
+        if self.deadline is not None and not self.deadline > 0:
+            msg = "Config deadline must be a strictly positive number of seconds."
+            raise ValueError(msg)
+
+        # 3. Resolve the JSON codec once so hot paths never re-detect it
+        if self.json_codec is None:
+            self.json_codec = get_codec()
+        if self.pool is None:
+            self.pool = PoolConfig()
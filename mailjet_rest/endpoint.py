@@ -3,20 +3,30 @@
 from __future__ import annotations
 
 import json
+import time
 import warnings
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any
 
 from mailjet_rest.routes import ROUTE_MAP
 from mailjet_rest.types import _JSON_HEADERS, _TEXT_HEADERS, HttpMethod, PayloadType, TimeoutType
+from mailjet_rest.utils.codec import IncrementalArrayDecoder
 from mailjet_rest.utils.guardrails import SecurityGuard
 
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import Generator, Iterator
 
     import requests
 
     from mailjet_rest.client import Client
+    from mailjet_rest.pagination import AdaptivePageSizer, StreamCursor
+    from mailjet_rest.utils.concurrency import AdaptiveConcurrencyLimiter
+
+
+# Network read size of incrementally parsed stream() pages.
+_STREAM_READ_SIZE = 64 * 1024
 
 
 class Endpoint:
@@ -26,7 +36,7 @@ class Endpoint:
     handling API resource mappings via the strict ROUTE_MAP.
     """
 
-    __slots__ = ("_action_parts", "_name_lower", "_resource_lower", "client", "name")
+    __slots__ = ("_action_parts", "_base_headers", "_name_lower", "_resource_lower", "client", "name")
 
     def __init__(self, client: Client, name: str) -> None:
         """Initialize the endpoint handler with the parent client and route name."""
@@ -35,6 +45,7 @@ class Endpoint:
         self._name_lower = name.lower()
         self._action_parts = self._name_lower.split("_")
         self._resource_lower = self._action_parts[0]
+        self._base_headers = _TEXT_HEADERS if self._name_lower.endswith("_csvdata") else _JSON_HEADERS
 
     def _resolve_registry_route(
         self, base_url: str, version: str, id_val: int | str | None, action_id: int | str | None
@@ -179,20 +190,18 @@ class Endpoint:
     def _build_headers(self, custom_headers: dict[str, str] | None = None) -> dict[str, str]:
         """Build headers based on the endpoint requirements.
 
+        Custom headers are screened for CRLF injection by the client's 'api_call', once per call,
+        together with the base headers.
+
         Args:
             custom_headers (dict[str, str] | None): Custom headers to merge.
 
         Returns:
             dict[str, str]: The composed dictionary of HTTP headers.
         """
-        base_headers = _TEXT_HEADERS if self._name_lower.endswith("_csvdata") else _JSON_HEADERS
-
         if custom_headers:
-            clean_custom = SecurityGuard.sanitize_headers(custom_headers)
-            merged = dict(base_headers)
-            merged.update(clean_custom)
-            return merged
-        return dict(base_headers)
+            return {**self._base_headers, **custom_headers}
+        return dict(self._base_headers)
 
     def __call__(
         self,
@@ -218,13 +227,34 @@ class Endpoint:
         Returns:
             requests.Response: The resulting HTTP response from the request execution.
         """
+        return self.client.api_call(
+            **self._prepare_call(method, id, data, filters, action_id, timeout, kwargs),
+        )
+
+    def _prepare_call(
+        self,
+        method: HttpMethod,
+        id: int | str | None,
+        data: PayloadType,
+        filters: dict[str, Any] | None,
+        action_id: int | str | None,
+        timeout: TimeoutType,
+        kwargs: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Resolve the URL, headers and legacy payload encoding for a single call.
+
+        Shared by the synchronous and asyncio endpoints so both dispatch identical requests.
+
+        Returns:
+            dict[str, Any]: Keyword arguments ready to be passed to the client's 'api_call'.
+        """
         # Pop deprecated/HTTP kwargs safely
         headers = kwargs.pop("headers", None)
         ensure_ascii = kwargs.pop("ensure_ascii", None)
         data_encoding = kwargs.pop("data_encoding", None)
 
         if ensure_ascii is not None or data_encoding is not None:
-            warnings.warn("'ensure_ascii' and 'data_encoding' are deprecated.", DeprecationWarning, stacklevel=2)
+            warnings.warn("'ensure_ascii' and 'data_encoding' are deprecated.", DeprecationWarning, stacklevel=4)
 
             # Include 'list' to ensure batch payloads (arrays) are serialized properly
             # for users relying on legacy encoding arguments.
@@ -233,15 +263,15 @@ class Endpoint:
                 data_str = json.dumps(data, ensure_ascii=ensure_ascii if ensure_ascii is not None else True)
                 data = data_str.encode(data_encoding) if data_encoding else data_str
 
-        return self.client.api_call(
-            method=method,
-            url=self._build_url(id_val=id, action_id=action_id),
-            headers=self._build_headers(headers),
-            data=data,
-            filters=filters,
-            timeout=timeout,
+        return {
+            "method": method,
+            "url": self._build_url(id_val=id, action_id=action_id),
+            "headers": self._build_headers(headers),
+            "data": data,
+            "filters": filters,
+            "timeout": timeout,
             **kwargs,
-        )
+        }
 
     def get(
         self,
@@ -263,25 +293,16 @@ class Endpoint:
         """
         return self(method="GET", id=id, filters=filters, action_id=action_id, **kwargs)
 
-    def stream(
-        self,
-        id: int | str | None = None,
-        filters: dict[str, Any] | None = None,
-        action_id: int | str | None = None,
-        chunk_size: int = 1000,
-        **kwargs: Any,
-    ) -> Generator[dict[str, Any], None, None]:
-        """Automatically paginates over GET requests yielding resource dictionaries.
+    @staticmethod
+    def _init_stream_filters(filters: dict[str, Any] | None, chunk_size: int) -> dict[str, Any]:
+        """Validate the page size and seed the Limit/Offset pagination filters.
 
         Args:
-            id (int | str | None): The primary resource ID.
-            filters (dict[str, Any] | None): Query string URL parameters.
-            action_id (int | str | None): Sub-action ID.
-            chunk_size (int): Objects returned per loop (Limit). Defaults to 1000.
-            **kwargs (Any): Additional args passed to requests.
+            filters (dict[str, Any] | None): Query string URL parameters supplied by the caller.
+            chunk_size (int): Objects returned per loop (Limit).
 
-        Yields:
-            dict[str, Any]: Individual resource objects from the paginated API response.
+        Returns:
+            dict[str, Any]: A private copy of the filters ready for offset pagination.
         """
         # Prevent infinite CPU/Network loops if 0 or negative numbers are passed
         if chunk_size <= 0:
@@ -296,19 +317,306 @@ class Endpoint:
         # Protect against 'None' values throwing a TypeError when cast to int
         offset_val = current_filters.get("Offset")
         current_filters["Offset"] = int(offset_val) if offset_val is not None else 0
+        return current_filters
 
-        while True:
-            response = self.get(id=id, filters=current_filters, action_id=action_id, **kwargs)
-            body = response.json()
-            data = body.get("Data", [])
+    @staticmethod
+    def _count_filters(filters: dict[str, Any]) -> dict[str, Any]:
+        """Derive the 'countOnly' query used to size a prefetching stream.
+
+        Args:
+            filters (dict[str, Any]): The seeded pagination filters.
+
+        Returns:
+            dict[str, Any]: The caller's filters without pagination, asking only for the total.
+        """
+        count_filters = {k: v for k, v in filters.items() if k not in {"Limit", "Offset"}}
+        count_filters["countOnly"] = 1
+        return count_filters
+
+    @staticmethod
+    def _validate_prefetch(prefetch: int, concurrency: AdaptiveConcurrencyLimiter | None = None) -> None:
+        """Reject negative prefetch depths, and concurrency limits without prefetching, before any request is sent."""
+        if prefetch < 0:
+            msg = "stream() prefetch must be a positive integer (0 disables prefetching)."
+            raise ValueError(msg)
+        if concurrency is not None and not prefetch:
+            msg = "stream() concurrency limits apply to prefetched pages and require a positive prefetch."
+            raise ValueError(msg)
+
+    @staticmethod
+    def _validate_sequential(prefetch: int, cursor: StreamCursor | None, incremental: bool) -> None:
+        """Reject prefetching modes that need one page fully read before the next is requested."""
+        if prefetch and (cursor is not None or incremental):
+            msg = "stream() cursor pagination and incremental parsing are sequential and cannot be combined with prefetch."
+            raise ValueError(msg)
+
+    @staticmethod
+    def _validate_adaptive(adaptive: bool, prefetch: int, incremental: bool) -> None:
+        """Reject adaptive sizing where whole pages cannot be timed one after another."""
+        if adaptive and (prefetch or incremental):
+            msg = "stream() adaptive page sizing times whole pages and cannot be combined with prefetch or incremental."
+            raise ValueError(msg)
+
+    @staticmethod
+    def _parse_count(body: Any) -> int | None:
+        """Extract the total from a 'countOnly' response.
+
+        Returns:
+            int | None: The number of matching objects, or None if the API did not report it.
+        """
+        count = body.get("Count") if isinstance(body, dict) else None
+        return count if isinstance(count, int) and not isinstance(count, bool) else None
+
+    def _fetch_page(
+        self, id: int | str | None, filters: dict[str, Any], action_id: int | str | None, kwargs: dict[str, Any]
+    ) -> list[dict[str, Any]]:
+        """Fetch and decode a single page of a stream.
+
+        Returns:
+            list[dict[str, Any]]: The 'Data' items of the page.
+        """
+        response = self.get(id=id, filters=filters, action_id=action_id, **kwargs)
+        return self.client.config.json_codec.loads(response.content).get("Data", [])
+
+    def _limited_page(
+        self,
+        id: int | str | None,
+        filters: dict[str, Any],
+        action_id: int | str | None,
+        kwargs: dict[str, Any],
+        concurrency: AdaptiveConcurrencyLimiter | None = None,
+    ) -> list[dict[str, Any]]:
+        """Fetch a prefetched page, holding a slot of the adaptive concurrency limiter if any.
+
+        Returns:
+            list[dict[str, Any]]: The 'Data' items of the page.
+        """
+        if concurrency is None:
+            return self._fetch_page(id, filters, action_id, kwargs)
+        with concurrency.slot():
+            return self._fetch_page(id, filters, action_id, kwargs)
+
+    def _sized_page(
+        self,
+        id: int | str | None,
+        filters: dict[str, Any],
+        action_id: int | str | None,
+        sizer: AdaptivePageSizer,
+        kwargs: dict[str, Any],
+    ) -> list[dict[str, Any]]:
+        """Fetch a single page and teach the sizer how long it took and how large it was.
+
+        Returns:
+            list[dict[str, Any]]: The 'Data' items of the page.
+        """
+        started = time.perf_counter()
+        response = self.get(id=id, filters=filters, action_id=action_id, **kwargs)
+        body = response.content
+        data = self.client.config.json_codec.loads(body).get("Data", [])
+        sizer.observe(self.name, filters["Limit"], len(data), time.perf_counter() - started, len(body))
+        return data
+
+    def _parse_page(
+        self, id: int | str | None, filters: dict[str, Any], action_id: int | str | None, kwargs: dict[str, Any]
+    ) -> Generator[dict[str, Any], None, None]:
+        """Fetch a page with a streamed body and yield its 'Data' items as soon as each one is parsed.
+
+        Yields:
+            dict[str, Any]: The 'Data' items of the page, in page order.
+        """
+        response = self.get(id=id, filters=filters, action_id=action_id, **{**kwargs, "stream": True})
+        decoder = IncrementalArrayDecoder()
+        try:
+            for chunk in response.iter_content(chunk_size=_STREAM_READ_SIZE):
+                yield from decoder.feed(chunk)
+            yield from decoder.close()
+        finally:
+            response.close()
+
+    def _page_items(
+        self,
+        id: int | str | None,
+        filters: dict[str, Any],
+        action_id: int | str | None,
+        incremental: bool,
+        kwargs: dict[str, Any],
+        sizer: AdaptivePageSizer | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Select how a sequential stream reads its next page.
+
+        Returns:
+            Iterator[dict[str, Any]]: The 'Data' items of the page, in page order.
+        """
+        if incremental:
+            return self._parse_page(id, filters, action_id, kwargs)
+        if sizer is not None:
+            return iter(self._sized_page(id, filters, action_id, sizer, kwargs))
+        return iter(self._fetch_page(id, filters, action_id, kwargs))
 
-            yield from data
+    def _prefetch_pages(
+        self,
+        id: int | str | None,
+        filters: dict[str, Any],
+        action_id: int | str | None,
+        prefetch: int,
+        total: int,
+        kwargs: dict[str, Any],
+        concurrency: AdaptiveConcurrencyLimiter | None = None,
+    ) -> Generator[dict[str, Any], None, None]:
+        """Fetch up to 'prefetch' offset windows concurrently while yielding items in order.
+
+        At most 'prefetch' pages are buffered or in flight at any time, and no more requests than
+        the 'concurrency' limit allows. If the collection grew past 'total' while streaming, the
+        remaining tail is fetched serially.
+
+        Yields:
+            dict[str, Any]: Individual resource objects, in offset order.
+        """
+        chunk_size = filters["Limit"]
+        offsets = iter(range(filters["Offset"], total, chunk_size))
+        pending: deque[Future[list[dict[str, Any]]]] = deque()
+        next_offset: int = filters["Offset"]
+
+        with ThreadPoolExecutor(max_workers=prefetch, thread_name_prefix="mailjet-stream") as pool:
+
+            def schedule() -> None:
+                offset = next(offsets, None)
+                if offset is not None:
+                    page_filters = {**filters, "Offset": offset}
+                    pending.append(pool.submit(self._limited_page, id, page_filters, action_id, kwargs, concurrency))
+
+            for _ in range(prefetch):
+                schedule()
+            try:
+                while pending:
+                    data = pending.popleft().result()
+                    schedule()
+                    yield from data
+                    if len(data) < chunk_size:
+                        return
+                    next_offset += chunk_size
+            finally:
+                for future in pending:
+                    future.cancel()
+
+        yield from self._serial_pages(id, {**filters, "Offset": next_offset}, action_id, kwargs)
+
+    def _serial_pages(
+        self,
+        id: int | str | None,
+        filters: dict[str, Any],
+        action_id: int | str | None,
+        kwargs: dict[str, Any],
+        incremental: bool = False,
+        sizer: AdaptivePageSizer | None = None,
+    ) -> Generator[dict[str, Any], None, None]:
+        """Fetch pages one after another until a short page marks the end.
+
+        Yields:
+            dict[str, Any]: Individual resource objects, in offset order.
+        """
+        while True:
+            chunk_size, count = filters["Limit"], 0
+            for item in self._page_items(id, filters, action_id, incremental, kwargs, sizer):
+                count += 1
+                yield item
 
             # Break early if we've reached the absolute end
-            if not data or len(data) < chunk_size:
+            if count < chunk_size:
                 break
 
-            current_filters["Offset"] += chunk_size
+            filters["Offset"] += chunk_size
+            if sizer is not None:
+                filters["Limit"] = sizer.limit_for(self.name, chunk_size)
+
+    def _cursor_pages(
+        self,
+        id: int | str | None,
+        filters: dict[str, Any],
+        action_id: int | str | None,
+        cursor: StreamCursor,
+        kwargs: dict[str, Any],
+        incremental: bool = False,
+        sizer: AdaptivePageSizer | None = None,
+    ) -> Generator[dict[str, Any], None, None]:
+        """Fetch keyset pages bounded by the cursor, advancing it as items are consumed.
+
+        Yields:
+            dict[str, Any]: Individual resource objects, in ascending cursor order.
+        """
+        while True:
+            chunk_size, count, start = filters["Limit"], 0, cursor.after
+            page_filters = cursor.page_filters(filters)
+            for item in self._page_items(id, page_filters, action_id, incremental, kwargs, sizer):
+                count += 1
+                if cursor.accepts(item):
+                    yield item
+                    cursor.after = item[cursor.field]
+
+            if count < chunk_size:
+                break
+            cursor.ensure_progress(start)
+            if sizer is not None:
+                filters["Limit"] = sizer.limit_for(self.name, chunk_size)
+
+    def stream(
+        self,
+        id: int | str | None = None,
+        filters: dict[str, Any] | None = None,
+        action_id: int | str | None = None,
+        chunk_size: int = 1000,
+        prefetch: int = 0,
+        cursor: StreamCursor | None = None,
+        incremental: bool = False,
+        adaptive: bool = False,
+        concurrency: AdaptiveConcurrencyLimiter | None = None,
+        **kwargs: Any,
+    ) -> Generator[dict[str, Any], None, None]:
+        """Automatically paginates over GET requests yielding resource dictionaries.
+
+        Args:
+            id (int | str | None): The primary resource ID.
+            filters (dict[str, Any] | None): Query string URL parameters.
+            action_id (int | str | None): Sub-action ID.
+            chunk_size (int): Objects returned per loop (Limit). Defaults to 1000.
+            prefetch (int): Number of pages fetched concurrently over the pooled session. When
+                positive, a 'countOnly' request sizes the collection first. Defaults to 0 (serial).
+            cursor (StreamCursor | None): Switches to keyset pagination sorted by ID. The cursor is
+                advanced in place and its 'token' can be persisted to resume the export later.
+            incremental (bool): Stream each response body and yield items as soon as they are parsed,
+                bounding memory by one object instead of one page. Defaults to False.
+            adaptive (bool): Tune the page size from observed latency and response size, starting
+                from the size learned for this resource by the client's 'page_sizer' (or 'chunk_size'
+                on first use). Defaults to False.
+            concurrency (AdaptiveConcurrencyLimiter | None): Caps the prefetched pages in flight with
+                an AIMD limit that backs off on 429/503, timeouts and latency spikes. Requires 'prefetch'.
+            **kwargs (Any): Additional args passed to requests.
+
+        Yields:
+            dict[str, Any]: Individual resource objects from the paginated API response.
+        """
+        current_filters = self._init_stream_filters(filters, chunk_size)
+        self._validate_prefetch(prefetch, concurrency)
+        self._validate_sequential(prefetch, cursor, incremental)
+        self._validate_adaptive(adaptive, prefetch, incremental)
+
+        sizer = self.client.page_sizer if adaptive else None
+        if sizer is not None:
+            current_filters["Limit"] = sizer.limit_for(self.name, chunk_size)
+
+        if cursor is not None:
+            yield from self._cursor_pages(id, current_filters, action_id, cursor, kwargs, incremental, sizer)
+            return
+
+        if prefetch:
+            count_filters = self._count_filters(current_filters)
+            count_response = self.get(id=id, filters=count_filters, action_id=action_id, **kwargs)
+            total = self._parse_count(self.client.config.json_codec.loads(count_response.content))
+            if total is not None:
+                yield from self._prefetch_pages(id, current_filters, action_id, prefetch, total, kwargs, concurrency)
+                return
+
+        yield from self._serial_pages(id, current_filters, action_id, kwargs, incremental, sizer)
 
     def create(
         self,
@@ -11,6 +11,22 @@ class MailjetNetworkError(ApiError):
     """Raised for transport-level issues (timeouts, TLS violations)."""
 
 
+class CircuitOpenError(MailjetNetworkError):
+    """Raised without contacting the API while a route's circuit breaker is open."""
+
+    def __init__(self, message: str, route: str = "", retry_after: float = 0.0) -> None:
+        """Initialize the circuit error.
+
+        Args:
+            message: The error message.
+            route: The route whose circuit is open (e.g. 'send').
+            retry_after: Seconds until the circuit lets a probe call through.
+        """
+        super().__init__(message)
+        self.route = route
+        self.retry_after = retry_after
+
+
 class MailjetApiError(ApiError):
     """Raised for 4xx/5xx API responses."""
 
@@ -39,6 +55,33 @@ class TimeoutError(MailjetNetworkError):  # ruff: ignore[builtin-variable-shadow
     """Legacy exception: maintained for backward compatibility."""
 
 
+class DeadlineExceededError(TimeoutError):
+    """Raised when a call's total deadline runs out across its attempts and waits."""
+
+    def __init__(
+        self,
+        message: str,
+        deadline: float = 0.0,
+        elapsed: float = 0.0,
+        attempts: tuple[float, ...] = (),
+        waits: dict[str, float] | None = None,
+    ) -> None:
+        """Initialize the deadline error.
+
+        Args:
+            message: The error message, detailing how the budget was spent.
+            deadline: The total budget, in seconds.
+            elapsed: Seconds spent before giving up.
+            attempts: Duration of every finished attempt, in seconds.
+            waits: Seconds spent waiting between attempts, by reason.
+        """
+        super().__init__(message)
+        self.deadline = deadline
+        self.elapsed = elapsed
+        self.attempts = attempts
+        self.waits = waits or {}
+
+
 class CriticalApiError(MailjetNetworkError):
     """Legacy exception: now a NetworkError."""
 
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import re
+from functools import lru_cache
 from types import MappingProxyType
 from typing import Final, NamedTuple
+from urllib.parse import urlsplit
 
 
 class Route(NamedTuple):
@@ -148,3 +151,67 @@ _ROUTE_MAP: RouteMapType = {
 }
 
 ROUTE_MAP: Final[MappingProxyType[str, Route]] = MappingProxyType(_ROUTE_MAP)
+
+
+# Path segments that precede the resource name in Mailjet URLs (e.g. '/v3/REST/template/7').
+_ROUTE_PREFIXES: Final = frozenset({"rest", "data"})
+
+
+def resource_of(url: str) -> str:
+    """Extract the resource name a Mailjet URL addresses.
+
+    Args:
+        url (str): A fully built API URL (e.g. 'https://api.mailjet.com/v3/REST/template/7').
+
+    Returns:
+        str: The lowercase resource name (e.g. 'template').
+    """
+    segments = [segment for segment in urlsplit(url).path.split("/") if segment]
+    if segments and segments[0].lower().startswith("v"):
+        segments = segments[1:]
+    if segments and segments[0].lower() in _ROUTE_PREFIXES:
+        segments = segments[1:]
+    return segments[0].lower() if segments else ""
+
+
+def _compile_endpoint_pattern() -> tuple[re.Pattern[str], dict[str, str]]:
+    """Compile every registry route into one pattern matching URL paths, most specific first.
+
+    Routes pinned to a version and routes with more literal segments are tried first;
+    ties keep the registry order. Trailing segments (ids, dynamic actions) are allowed.
+
+    Returns:
+        tuple[re.Pattern[str], dict[str, str]]: The pattern, and the route name of each named group.
+    """
+    ranked = sorted(
+        ROUTE_MAP.items(),
+        key=lambda item: (item[1].version is None, -sum("{" not in part for part in item[1].path.split("/"))),
+    )
+    branches = []
+    names = {}
+    for index, (name, route) in enumerate(ranked):
+        version = r"v[^/]+" if route.version is None else re.escape(route.version)
+        parts = "/".join("[^/]+" if "{" in part else re.escape(part) for part in route.path.split("/"))
+        branches.append(f"(?P<r{index}>/{version}/{parts}(?:/[^/]*)*)")
+        names[f"r{index}"] = name
+    return re.compile("|".join(branches), re.IGNORECASE), names
+
+
+_ENDPOINT_PATTERN, _ENDPOINT_NAMES = _compile_endpoint_pattern()
+
+
+@lru_cache(maxsize=1024)
+def endpoint_of(url: str) -> str:
+    """Resolve the registry route name a Mailjet URL was built from, for per-endpoint metrics.
+
+    Args:
+        url (str): A fully built API URL (e.g. 'https://api.mailjet.com/v3/REST/contact/7/getcontactslists').
+
+    Returns:
+        str: The 'ROUTE_MAP' key (e.g. 'contact_getcontactslists'), or the resource name
+            (see 'resource_of') for URLs of dynamic endpoints missing from the registry.
+    """
+    match = _ENDPOINT_PATTERN.fullmatch(urlsplit(url).path)
+    if match is None or match.lastgroup is None:
+        return resource_of(url)
+    return _ENDPOINT_NAMES[match.lastgroup]
@@ -0,0 +1,288 @@
+"""Per-route circuit breaking to shed load during Mailjet incidents.
+
+While an endpoint is degraded, every call still waits for a full timeout plus the
+``JitterRetry`` attempts and their backoff, tying up worker threads for minutes. A
+:class:`CircuitBreaker` attached through ``Config(circuit_breaker=...)`` tracks the
+outcome of recent calls per route (the resource name, e.g. ``send`` or ``contact``).
+Once the failure rate over that window crosses a threshold the route's circuit opens
+and calls fail fast with :class:`~mailjet_rest.errors.CircuitOpenError`; after a cool
+down a few probe calls are let through (half-open) and close the circuit again if
+Mailjet answers.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, TypeVar
+
+from mailjet_rest.errors import ApiError, CircuitOpenError, DeadlineExceededError
+
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+
+__all__ = ["CLOSED", "HALF_OPEN", "OPEN", "CircuitBreaker"]
+
+
+T = TypeVar("T")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class _Circuit:
+    """State of one route's circuit. Guarded by the breaker's lock."""
+
+    outcomes: deque[bool]
+    state: str = CLOSED
+    opened_at: float = 0.0
+    probes: int = 0
+    trips: int = 0
+    rejected: int = 0
+    last_failure: str = ""
+
+
+class CircuitBreaker:
+    """Thread- and asyncio-safe circuit breaker keyed by route.
+
+    Failures are transport errors (timeouts, connection failures, exhausted retries) and
+    5xx responses. Client errors such as 400 or 404 prove the API is answering and count
+    as successes; 429 is left to the rate limiter and retries.
+
+    Example:
+        >>> breaker = CircuitBreaker(failure_rate=0.5, minimum_calls=10, reset_timeout=30)
+        >>> client = Client(auth=(key, secret), config=Config(circuit_breaker=breaker))
+        >>> breaker.snapshot()["send"]["state"]
+        'closed'
+    """
+
+    __slots__ = ("_circuits", "_lock", "failure_rate", "half_open_calls", "minimum_calls", "reset_timeout", "window")
+
+    def __init__(
+        self,
+        failure_rate: float = 0.5,
+        minimum_calls: int = 10,
+        window: int = 50,
+        reset_timeout: float = 30.0,
+        half_open_calls: int = 1,
+    ) -> None:
+        """Initialize the breaker.
+
+        Args:
+            failure_rate (float): Share of failed calls in the window that opens a circuit, in (0, 1].
+            minimum_calls (int): Calls a window must hold before its failure rate is trusted.
+            window (int): Number of most recent calls per route the failure rate is computed over.
+            reset_timeout (float): Seconds an open circuit rejects calls before probing recovery.
+            half_open_calls (int): Probe calls allowed in flight while a circuit is half-open.
+        """
+        if not 0 < failure_rate <= 1:
+            msg = "CircuitBreaker failure_rate must be in (0, 1]."
+            raise ValueError(msg)
+        if not 0 < minimum_calls <= window or half_open_calls <= 0 or reset_timeout < 0:
+            msg = "CircuitBreaker requires 0 < minimum_calls <= window, half_open_calls > 0 and reset_timeout >= 0."
+            raise ValueError(msg)
+
+        self.failure_rate = failure_rate
+        self.minimum_calls = minimum_calls
+        self.window = window
+        self.reset_timeout = reset_timeout
+        self.half_open_calls = half_open_calls
+        self._circuits: dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def is_failure(error: BaseException) -> bool:
+        """Tell whether a failed call counts against the route's health.
+
+        Errors carrying an HTTP status are classified by it, including calls whose retries ran out:
+        a '429' left after every retry is throttling, for the rate limiter, not an outage. A deadline
+        given up before any attempt was sent (e.g. during a client-side rate limit wait) says nothing
+        about the route and is not counted either.
+
+        Returns:
+            bool: True for transport errors and 5xx responses.
+        """
+        if isinstance(error, DeadlineExceededError) and not error.attempts:
+            return False
+        status = getattr(error, "status_code", None)
+        if isinstance(status, int):
+            return status >= 500
+        return isinstance(error, ApiError)
+
+    def state(self, route: str) -> str:
+        """Return the current state of a route's circuit: 'closed', 'open' or 'half_open'."""
+        with self._lock:
+            circuit = self._circuits.get(route)
+            return CLOSED if circuit is None else self._advance(circuit, time.monotonic()).state
+
+    def snapshot(self) -> dict[str, dict[str, float | str]]:
+        """Current state of every route seen so far, for metrics and logs.
+
+        Returns:
+            dict[str, dict[str, float | str]]: Per route, the state, the failure rate and call count of
+                the window, how often the circuit opened and how many calls it rejected.
+        """
+        now = time.monotonic()
+        with self._lock:
+            return {
+                route: {
+                    "state": self._advance(circuit, now).state,
+                    "failure_rate": self._rate(circuit),
+                    "calls": len(circuit.outcomes),
+                    "trips": circuit.trips,
+                    "rejected": circuit.rejected,
+                }
+                for route, circuit in self._circuits.items()
+            }
+
+    def reset(self, route: str | None = None) -> None:
+        """Close one route's circuit, or every circuit, and forget their history."""
+        with self._lock:
+            if route is None:
+                self._circuits.clear()
+            else:
+                self._circuits.pop(route, None)
+
+    def reset_after_fork(self) -> None:
+        """Drop the circuits and lock inherited by a forked child, whose lock may be held forever."""
+        self._lock = threading.Lock()
+        self._circuits = {}
+
+    def allow(self, route: str) -> bool:
+        """Admit a call on a route, or fail fast while its circuit is open.
+
+        Args:
+            route (str): The route the call targets.
+
+        Returns:
+            bool: True if the call is a half-open probe, whose outcome decides the circuit's fate.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with every probe slot taken.
+        """
+        now = time.monotonic()
+        with self._lock:
+            circuit = self._circuits.get(route)
+            if circuit is None:
+                circuit = self._circuits[route] = _Circuit(outcomes=deque(maxlen=self.window))
+            self._advance(circuit, now)
+            if circuit.state == CLOSED:
+                return False
+            if circuit.state == HALF_OPEN and circuit.probes < self.half_open_calls:
+                circuit.probes += 1
+                return True
+            circuit.rejected += 1
+            retry_after = max(0.0, circuit.opened_at + self.reset_timeout - now)
+
+        msg = f"Circuit for Mailjet route '{route}' is open after repeated failures ({circuit.last_failure})."
+        raise CircuitOpenError(msg, route=route, retry_after=retry_after)
+
+    def record(self, route: str, failed: bool | None, probe: bool = False) -> None:
+        """Record the outcome of an admitted call.
+
+        Args:
+            route (str): The route the call targeted.
+            failed (bool | None): Whether the call failed, or None if it was abandoned (e.g. cancelled)
+                before reaching a verdict.
+            probe (bool): Whether the call was admitted as a half-open probe.
+        """
+        with self._lock:
+            circuit = self._circuits.get(route)
+            if circuit is None:
+                return
+            if probe:
+                circuit.probes -= 1
+                if circuit.state == HALF_OPEN and failed is not None:
+                    if failed:
+                        self._trip(route, circuit)
+                    else:
+                        self._close(route, circuit)
+                return
+            if circuit.state != CLOSED or failed is None:
+                # Calls admitted before the circuit opened say nothing about recovery.
+                return
+            circuit.outcomes.append(failed)
+            if len(circuit.outcomes) >= self.minimum_calls and self._rate(circuit) >= self.failure_rate:
+                self._trip(route, circuit)
+
+    def call(self, route: str, fn: Callable[[], T]) -> T:
+        """Run 'fn' through the route's circuit.
+
+        Returns:
+            T: The result of 'fn'.
+        """
+        probe = self.allow(route)
+        try:
+            result = fn()
+        except Exception as e:
+            self._failed(route, e, probe)
+            raise
+        except BaseException:
+            self.record(route, None, probe)
+            raise
+        self.record(route, failed=False, probe=probe)
+        return result
+
+    async def acall(self, route: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """Asyncio counterpart of :meth:`call`.
+
+        Returns:
+            T: The result of 'fn'.
+        """
+        probe = self.allow(route)
+        try:
+            result = await fn()
+        except Exception as e:
+            self._failed(route, e, probe)
+            raise
+        except BaseException:
+            self.record(route, None, probe)
+            raise
+        self.record(route, failed=False, probe=probe)
+        return result
+
+    def _failed(self, route: str, error: Exception, probe: bool) -> None:
+        """Record a call that raised, remembering the cause of failures for the open-circuit message."""
+        failed = self.is_failure(error)
+        if failed:
+            with self._lock:
+                circuit = self._circuits.get(route)
+                if circuit is not None:
+                    circuit.last_failure = type(error).__name__
+        self.record(route, failed, probe)
+
+    def _advance(self, circuit: _Circuit, now: float) -> _Circuit:
+        """Return the circuit, half-open if it was open for 'reset_timeout'. The caller must hold the lock."""
+        if circuit.state == OPEN and now - circuit.opened_at >= self.reset_timeout:
+            circuit.state = HALF_OPEN
+            circuit.probes = 0
+        return circuit
+
+    @staticmethod
+    def _rate(circuit: _Circuit) -> float:
+        """Return the failure rate of a circuit's window. The caller must hold the lock."""
+        return sum(circuit.outcomes) / len(circuit.outcomes) if circuit.outcomes else 0.0
+
+    @staticmethod
+    def _trip(route: str, circuit: _Circuit) -> None:
+        """Open a circuit. The caller must hold the lock."""
+        circuit.state = OPEN
+        circuit.opened_at = time.monotonic()
+        circuit.trips += 1
+        logger.warning("Circuit for Mailjet route '%s' opened (%s)", route, circuit.last_failure or "failures")
+
+    @staticmethod
+    def _close(route: str, circuit: _Circuit) -> None:
+        """Close a circuit after a successful probe and start a fresh window. The caller must hold the lock."""
+        circuit.state = CLOSED
+        circuit.outcomes.clear()
+        logger.info("Circuit for Mailjet route '%s' closed", route)
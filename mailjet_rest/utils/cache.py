@@ -0,0 +1,261 @@
+"""Opt-in in-memory cache for idempotent GET responses.
+
+Reference resources such as ``template``, ``sender`` or ``myprofile`` rarely change but
+are read on nearly every job. A :class:`ResponseCache` attached through
+``Config(response_cache=...)`` serves those reads from memory for a per-resource TTL,
+revalidates stale entries with ``If-None-Match``/``If-Modified-Since`` when Mailjet sent
+validators, evicts least recently used entries past its entry and byte budgets, and keys
+every entry by the caller's auth identity so one cache can safely serve several accounts.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from mailjet_rest.routes import resource_of
+
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+
+__all__ = ["CachedResponse", "ResponseCache"]
+
+
+CacheKey = tuple[str, str, tuple[tuple[str, str], ...], tuple[tuple[str, str], ...]]
+
+# Cached bodies are stored decoded, so their transfer framing must not be replayed.
+_FRAMING_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+
+
+@dataclass(slots=True)
+class CachedResponse:
+    """A cached GET response and its revalidation state.
+
+    Attributes:
+        status_code (int): The HTTP status of the cached response.
+        headers (dict[str, str]): The response headers.
+        content (bytes): The raw response body.
+        resource (str): The resource name the entry belongs to (e.g. 'template').
+        expires_at (float): Monotonic deadline after which the entry must be revalidated.
+        etag (str): The 'ETag' validator, if the API sent one.
+        last_modified (str): The 'Last-Modified' validator, if the API sent one.
+    """
+
+    status_code: int
+    headers: dict[str, str]
+    content: bytes
+    resource: str
+    expires_at: float
+    etag: str = ""
+    last_modified: str = ""
+
+    @property
+    def size(self) -> int:
+        """Approximate memory held by the entry, in bytes.
+
+        Returns:
+            int: The body size plus the header sizes.
+        """
+        return len(self.content) + sum(len(k) + len(v) for k, v in self.headers.items())
+
+    def is_fresh(self) -> bool:
+        """Whether the entry can be served without contacting the API.
+
+        Returns:
+            bool: True until the entry's TTL elapses.
+        """
+        return time.monotonic() < self.expires_at
+
+    def validators(self) -> dict[str, str]:
+        """Conditional request headers revalidating the entry.
+
+        Returns:
+            dict[str, str]: 'If-None-Match' and/or 'If-Modified-Since', or an empty mapping.
+        """
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """Thread-safe TTL/LRU cache of GET responses, bounded by entry count and memory.
+
+    Example:
+        >>> cache = ResponseCache(ttl=60, ttls={"myprofile": 3600, "contact": 0})
+        >>> client = Client(auth=(key, secret), config=Config(response_cache=cache))
+    """
+
+    __slots__ = ("_entries", "_lock", "_size", "max_bytes", "max_entries", "ttl", "ttls")
+
+    def __init__(
+        self,
+        ttl: float = 60.0,
+        ttls: Mapping[str, float] | None = None,
+        max_entries: int = 1024,
+        max_bytes: int = 16 * 1024 * 1024,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            ttl (float): Default time-to-live of an entry, in seconds.
+            ttls (Mapping[str, float] | None): Per-resource TTL overrides keyed by resource name
+                (e.g. {'template': 300}). A TTL of 0 disables caching for that resource.
+            max_entries (int): Maximum number of cached responses.
+            max_bytes (int): Maximum total size of the cached responses, in bytes.
+        """
+        if ttl < 0 or any(value < 0 for value in (ttls or {}).values()):
+            msg = "ResponseCache TTLs must be non-negative."
+            raise ValueError(msg)
+        if max_entries <= 0 or max_bytes <= 0:
+            msg = "ResponseCache max_entries and max_bytes must be strictly positive."
+            raise ValueError(msg)
+
+        self.ttl = ttl
+        self.ttls = {name.lower(): value for name, value in (ttls or {}).items()}
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[CacheKey, CachedResponse] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of cached responses."""
+        return len(self._entries)
+
+    # Resource name a URL addresses (e.g. 'template'), shared with the rate limiter.
+    resource_of = staticmethod(resource_of)
+
+    @staticmethod
+    def make_key(identity: str, url: str, params: Mapping[str, Any] | None, headers: Mapping[str, str]) -> CacheKey:
+        """Build the cache key of a GET request.
+
+        Args:
+            identity (str): Opaque digest of the caller's credentials.
+            url (str): The fully built API URL.
+            params (Mapping[str, Any] | None): The query parameters, without unset values.
+            headers (Mapping[str, str]): The request headers.
+
+        Returns:
+            CacheKey: A hashable key that is independent of parameter and header ordering.
+        """
+        normalized_params = tuple(sorted((str(k), str(v)) for k, v in (params or {}).items()))
+        normalized_headers = tuple(sorted((k.lower(), str(v)) for k, v in headers.items()))
+        return identity, url, normalized_params, normalized_headers
+
+    def ttl_for(self, resource: str) -> float:
+        """Return the time-to-live of a resource's entries, in seconds."""
+        return self.ttls.get(resource, self.ttl)
+
+    def get(self, key: CacheKey) -> CachedResponse | None:
+        """Look up an entry, fresh or stale, and mark it as recently used.
+
+        Returns:
+            CachedResponse | None: The cached entry, or None on a miss.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: CacheKey, status_code: int, headers: Mapping[str, str], content: bytes) -> CachedResponse | None:
+        """Store a successful response, evicting least recently used entries past the budgets.
+
+        Args:
+            key (CacheKey): The request's cache key.
+            status_code (int): The HTTP status of the response.
+            headers (Mapping[str, str]): The response headers.
+            content (bytes): The raw response body.
+
+        Returns:
+            CachedResponse | None: The stored entry, or None if the response is not cacheable.
+        """
+        resource = self.resource_of(key[1])
+        ttl = self.ttl_for(resource)
+        lowered = {k.lower(): v for k, v in headers.items()}
+        if ttl <= 0 or "no-store" in lowered.get("cache-control", "").lower():
+            return None
+
+        entry = CachedResponse(
+            status_code=status_code,
+            headers={k: v for k, v in headers.items() if k.lower() not in _FRAMING_HEADERS},
+            content=content,
+            resource=resource,
+            expires_at=time.monotonic() + ttl,
+            etag=lowered.get("etag", ""),
+            last_modified=lowered.get("last-modified", ""),
+        )
+        if entry.size > self.max_bytes:
+            return None
+
+        with self._lock:
+            self._discard(key)
+            self._entries[key] = entry
+            self._size += entry.size
+            while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+                self._discard(next(iter(self._entries)))
+        return entry
+
+    def revalidated(self, key: CacheKey, headers: Mapping[str, str]) -> CachedResponse | None:
+        """Extend an entry after the API answered '304 Not Modified'.
+
+        Args:
+            key (CacheKey): The request's cache key.
+            headers (Mapping[str, str]): The '304' response headers, which may carry new validators.
+
+        Returns:
+            CachedResponse | None: The refreshed entry, or None if it was evicted meanwhile.
+        """
+        lowered = {k.lower(): v for k, v in headers.items()}
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            entry.expires_at = time.monotonic() + self.ttl_for(entry.resource)
+            entry.etag = lowered.get("etag", entry.etag)
+            entry.last_modified = lowered.get("last-modified", entry.last_modified)
+            self._entries.move_to_end(key)
+            return entry
+
+    def invalidate(self, identity: str, url: str) -> int:
+        """Drop every entry of the resource a mutation touched, for one auth identity.
+
+        Args:
+            identity (str): Opaque digest of the caller's credentials.
+            url (str): The URL of the mutation.
+
+        Returns:
+            int: The number of dropped entries.
+        """
+        resource = self.resource_of(url)
+        with self._lock:
+            stale = [key for key, entry in self._entries.items() if key[0] == identity and entry.resource == resource]
+            for key in stale:
+                self._discard(key)
+        return len(stale)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def reset_after_fork(self) -> None:
+        """Drop the entries and lock inherited by a forked child, whose lock may be held forever."""
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._size = 0
+
+    def _discard(self, key: CacheKey) -> None:
+        """Remove an entry and release its budget. The caller must hold the lock."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= entry.size
@@ -0,0 +1,120 @@
+"""Single-flight coalescing of identical concurrent GET requests.
+
+When a burst of workers starts, they typically read the same reference objects
+(``contactslist``, ``template``, ``sender``) within milliseconds of each other. A
+:class:`SingleFlight` lets the first caller perform the request while every identical
+call that arrives before it completes waits for, and shares, its outcome: the same
+response or the same exception. :class:`AsyncSingleFlight` is the asyncio counterpart.
+
+Followers receive a shallow copy of the leader's response, so per-caller mutations such
+as setting ``encoding`` never leak between callers. Only fully read bodies are shared;
+streamed requests are never coalesced.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import threading
+from concurrent.futures import Future
+from functools import partial
+from typing import TYPE_CHECKING, Any, TypeVar
+
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Hashable
+
+
+__all__ = ["AsyncSingleFlight", "SingleFlight"]
+
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Thread-safe coalescing of identical in-flight calls."""
+
+    __slots__ = ("_calls", "_lock")
+
+    def __init__(self) -> None:
+        """Initialize an empty flight table."""
+        self._calls: dict[Hashable, Future[Any]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of calls currently in flight."""
+        return len(self._calls)
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """Run 'fn', or wait for the identical call already in flight.
+
+        Args:
+            key (Hashable): Identity of the call; equal keys are coalesced.
+            fn (Callable[[], T]): Performs the call when no identical call is in flight.
+
+        Returns:
+            T: The leader's result (a shallow copy of it for followers).
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+
+        if not leader:
+            return copy.copy(future.result())
+
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+
+class AsyncSingleFlight:
+    """Coalescing of identical in-flight coroutines on one event loop.
+
+    The shared call runs as its own task, so a cancelled caller never cancels the request
+    for the other callers waiting on it.
+    """
+
+    __slots__ = ("_calls",)
+
+    def __init__(self) -> None:
+        """Initialize an empty flight table."""
+        self._calls: dict[Hashable, asyncio.Future[Any]] = {}
+
+    def __len__(self) -> int:
+        """Return the number of calls currently in flight."""
+        return len(self._calls)
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Await 'fn', or the identical call already in flight.
+
+        Args:
+            key (Hashable): Identity of the call; equal keys are coalesced.
+            fn (Callable[[], Awaitable[T]]): Starts the call when no identical call is in flight.
+
+        Returns:
+            T: The leader's result (a shallow copy of it for followers).
+        """
+        task = self._calls.get(key)
+        if task is not None:
+            return copy.copy(await asyncio.shield(task))
+
+        task = self._calls[key] = asyncio.ensure_future(fn())
+        task.add_done_callback(partial(self._forget, key))
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: asyncio.Future[Any]) -> None:
+        """Retire a finished call so the next identical request goes to the network."""
+        self._calls.pop(key, None)
+        if not task.cancelled():
+            # Mark the outcome as retrieved even if every caller was cancelled meanwhile.
+            task.exception()
@@ -0,0 +1,356 @@
+"""Pluggable JSON codecs for request and response bodies.
+
+The SDK encodes and decodes JSON on every hot path (request bodies, paginated
+'stream()' pages, Send API results). This module exposes those operations behind
+a tiny :class:`JsonCodec` so faster native libraries can be plugged in through
+``Config(json_codec=...)``. ``orjson`` and ``ujson`` are auto-detected when
+installed; the standard library is always available as a fallback.
+
+Note:
+    Idempotency fingerprints are always computed over the standard library's
+    canonical form, so swapping codecs never changes an ``Idempotency-Key``.
+"""
+
+from __future__ import annotations
+
+import codecs
+import importlib
+import importlib.util
+import json
+import re
+from dataclasses import dataclass
+from functools import cache
+from typing import TYPE_CHECKING, Any
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+__all__ = ["STDLIB_CODEC", "IncrementalArrayDecoder", "JsonCodec", "get_codec"]
+
+
+@dataclass(slots=True, frozen=True)
+class JsonCodec:
+    """A pair of JSON encode/decode callables.
+
+    Attributes:
+        name (str): Codec identifier (e.g. 'json', 'orjson', 'ujson').
+        dumps (Callable[[Any], bytes]): Serializes a value to UTF-8 JSON bytes. Must raise
+            TypeError or ValueError for values it cannot represent.
+        loads (Callable[[bytes | str], Any]): Parses a JSON document. Must raise ValueError on invalid input.
+    """
+
+    name: str
+    dumps: Callable[[Any], bytes]
+    loads: Callable[[bytes | str], Any]
+
+
+def _stdlib_dumps(value: Any) -> bytes:
+    """Encode exactly like ``requests``' ``json=`` argument does.
+
+    Returns:
+        bytes: The UTF-8 JSON document.
+    """
+    return json.dumps(value, allow_nan=False).encode("utf-8")
+
+
+STDLIB_CODEC = JsonCodec(name="json", dumps=_stdlib_dumps, loads=json.loads)
+
+
+def _orjson_codec() -> JsonCodec:
+    """Build the orjson codec. Non-string keys are accepted like the standard library does.
+
+    Whatever orjson cannot encode exactly like the standard library is handed to it instead, so
+    the same payload encodes or fails the same way whichever codec is installed: integers beyond
+    64 bits, str/int/dict/list subclasses, dataclasses and datetimes (which orjson would rather
+    raise on than serialize), and documents with a 'null', since orjson writes NaN and infinities
+    as null where the standard library raises ValueError.
+
+    Returns:
+        JsonCodec: The orjson-backed codec.
+    """
+    orjson = importlib.import_module("orjson")
+    option = (
+        orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_SUBCLASS
+    )
+
+    def dumps(value: Any) -> bytes:
+        try:
+            encoded = orjson.dumps(value, option=option)
+        except TypeError:
+            return _stdlib_dumps(value)
+        return _stdlib_dumps(value) if b"null" in encoded else encoded
+
+    return JsonCodec(name="orjson", dumps=dumps, loads=orjson.loads)
+
+
+def _ujson_codec() -> JsonCodec:
+    """Build the ujson codec.
+
+    Values ujson rejects (non-finite floats, integers it cannot represent) are handed to the
+    standard library, which encodes them or raises its own TypeError or ValueError.
+
+    Returns:
+        JsonCodec: The ujson-backed codec.
+    """
+    ujson = importlib.import_module("ujson")
+
+    def dumps(value: Any) -> bytes:
+        try:
+            return ujson.dumps(value, allow_nan=False).encode("utf-8")
+        except (TypeError, ValueError, OverflowError):
+            return _stdlib_dumps(value)
+
+    return JsonCodec(name="ujson", dumps=dumps, loads=ujson.loads)
+
+
+_FACTORIES: dict[str, Callable[[], JsonCodec]] = {
+    "json": lambda: STDLIB_CODEC,
+    "orjson": _orjson_codec,
+    "ujson": _ujson_codec,
+}
+
+# Preference order for auto-detection, fastest first.
+_AUTO_ORDER: tuple[str, ...] = ("orjson", "ujson")
+
+
+@cache
+def _detect_codec_name() -> str:
+    """Pick the fastest installed codec without importing the candidates that are missing.
+
+    Returns:
+        str: The name of the preferred available codec.
+    """
+    return next((name for name in _AUTO_ORDER if importlib.util.find_spec(name) is not None), "json")
+
+
+@cache
+def _load_codec(name: str) -> JsonCodec:
+    """Build a codec once per process.
+
+    Returns:
+        JsonCodec: The codec registered under the given name.
+    """
+    return _FACTORIES[name]()
+
+
+def get_codec(name: str = "auto") -> JsonCodec:
+    """Resolve a JSON codec by name.
+
+    Args:
+        name (str): 'auto' (default) picks the fastest installed codec, otherwise one of
+            'orjson', 'ujson' or 'json' (standard library).
+
+    Returns:
+        JsonCodec: The resolved codec, shared across the process.
+
+    Raises:
+        ValueError: If the codec name is unknown.
+    """
+    if name == "auto":
+        name = _detect_codec_name()
+    if name not in _FACTORIES:
+        msg = f"Unknown JSON codec '{name}'. Expected one of: auto, {', '.join(sorted(_FACTORIES))}."
+        raise ValueError(msg)
+    return _load_codec(name)
+
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_NUMBER_TAIL = frozenset(".eE+-")
+
+
+class IncrementalArrayDecoder:
+    """Sans-IO parser yielding the elements of one array member of a JSON object as bytes arrive.
+
+    Feeding a Mailjet page such as ``{"Count": 2, "Data": [{...}, {...}], "Total": 2}`` chunk
+    by chunk returns every ``Data`` element as soon as it is complete, so at most one element
+    (plus one network chunk) is buffered instead of the whole page. Members after the array
+    are skipped. Elements are decoded with the standard library regardless of the client codec.
+    """
+
+    __slots__ = ("_buffer", "_decode", "_items", "_key", "_member", "_pos", "_step", "_text")
+
+    def __init__(self, key: str = "Data") -> None:
+        """Initialize the parser.
+
+        Args:
+            key (str): The top-level member whose array elements are yielded.
+        """
+        self._key = key
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._decode = json.JSONDecoder().raw_decode
+        self._buffer = ""
+        self._pos = 0
+        self._items: list[Any] = []
+        self._member = ""
+        self._step: Callable[[bool], bool] = self._object_start
+
+    def feed(self, chunk: bytes) -> list[Any]:
+        """Consume the next chunk of the document.
+
+        Returns:
+            list[Any]: The array elements completed by this chunk, in document order.
+        """
+        return self._drain(self._text.decode(chunk), final=False)
+
+    def close(self) -> list[Any]:
+        """Signal the end of the document.
+
+        Returns:
+            list[Any]: Any array elements completed by the final bytes.
+
+        Raises:
+            ValueError: If the document is malformed or truncated.
+        """
+        items = self._drain(self._text.decode(b"", final=True), final=True)
+        if self._step != self._done:
+            msg = "Truncated JSON document: expected the end of the top-level object."
+            raise ValueError(msg)
+        return items
+
+    def _drain(self, text: str, final: bool) -> list[Any]:
+        """Run the state machine over the buffered text until it needs more input.
+
+        Returns:
+            list[Any]: The array elements completed so far.
+        """
+        self._buffer = self._buffer[self._pos :] + text
+        self._pos = 0
+        while self._step(final):
+            pass
+        items, self._items = self._items, []
+        return items
+
+    def _peek(self, final: bool) -> str:
+        """Skip whitespace and return the next character, or '' if more input is needed.
+
+        Returns:
+            str: The next significant character.
+        """
+        self._pos = _WHITESPACE.match(self._buffer, self._pos).end()  # type: ignore[union-attr]
+        if self._pos < len(self._buffer):
+            return self._buffer[self._pos]
+        if final:
+            msg = "Truncated JSON document."
+            raise ValueError(msg)
+        return ""
+
+    def _value(self, final: bool) -> tuple[bool, Any]:
+        """Decode the value at the cursor once it is provably complete.
+
+        Returns:
+            tuple[bool, Any]: Whether a value was decoded, and the value itself.
+        """
+        try:
+            value, end = self._decode(self._buffer, self._pos)
+        except ValueError:
+            if final:
+                raise
+            return False, None
+        # A token ending the buffer, or a number cut before its fraction or exponent
+        # (e.g. '1.' or '2e'), may continue in the next chunk.
+        if not final and (end == len(self._buffer) or self._buffer[end] in _NUMBER_TAIL):
+            return False, None
+        self._pos = end
+        return True, value
+
+    def _expect(self, final: bool, allowed: str) -> str:
+        """Consume one structural character out of 'allowed'.
+
+        Returns:
+            str: The consumed character, or '' if more input is needed.
+        """
+        char = self._peek(final)
+        if char and char not in allowed:
+            msg = f"Unexpected character {char!r} at position {self._pos}: expected one of {allowed!r}."
+            raise ValueError(msg)
+        if char:
+            self._pos += 1
+        return char
+
+    # State machine steps: each consumes one token and returns True, or returns False when the
+    # buffer ends mid-token and the parser must wait for the next chunk.
+
+    def _object_start(self, final: bool) -> bool:
+        if not self._expect(final, "{"):
+            return False
+        self._step = self._first_member
+        return True
+
+    def _first_member(self, final: bool) -> bool:
+        char = self._peek(final)
+        if char == "}":
+            self._pos += 1
+            self._step = self._done
+        elif char:
+            self._step = self._member_key
+        return bool(char)
+
+    def _member_key(self, final: bool) -> bool:
+        if not self._peek(final):
+            return False
+        decoded, key = self._value(final)
+        if not decoded:
+            return False
+        if not isinstance(key, str):
+            msg = "Object keys must be strings."
+            raise ValueError(msg)  # ruff: ignore[type-check-without-type-error]
+        self._member = key
+        self._step = self._colon
+        return True
+
+    def _colon(self, final: bool) -> bool:
+        if not self._expect(final, ":"):
+            return False
+        self._step = self._member_value
+        return True
+
+    def _member_value(self, final: bool) -> bool:
+        if self._member == self._key:
+            if not self._expect(final, "["):
+                return False
+            self._step = self._first_item
+            return True
+        if not self._peek(final) or not self._value(final)[0]:
+            return False
+        self._step = self._after_member
+        return True
+
+    def _after_member(self, final: bool) -> bool:
+        char = self._expect(final, ",}")
+        if char:
+            self._step = self._member_key if char == "," else self._done
+        return bool(char)
+
+    def _first_item(self, final: bool) -> bool:
+        char = self._peek(final)
+        if char == "]":
+            # The rest of the document (e.g. 'Total') is not needed.
+            self._step = self._done
+        elif char:
+            self._step = self._item
+        return bool(char)
+
+    def _item(self, final: bool) -> bool:
+        if not self._peek(final):
+            return False
+        decoded, value = self._value(final)
+        if not decoded:
+            return False
+        self._items.append(value)
+        self._step = self._after_item
+        return True
+
+    def _after_item(self, final: bool) -> bool:
+        char = self._expect(final, ",]")
+        if char:
+            self._step = self._item if char == "," else self._done
+        return bool(char)
+
+    def _done(self, final: bool) -> bool:  # ruff: ignore[unused-method-argument]
+        self._buffer, self._pos = "", 0
+        return False
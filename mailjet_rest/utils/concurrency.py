@@ -0,0 +1,222 @@
+"""Adaptive (AIMD) concurrency limiting driven by Mailjet's overload feedback.
+
+A fixed pool size for bulk jobs is guesswork: too low wastes throughput, too high
+triggers ``429`` storms and ``JitterRetry`` sleeps. An :class:`AdaptiveConcurrencyLimiter`
+caps the number of requests in flight and tunes that cap like TCP congestion control:
+it grows additively (about one slot per window of successful requests) while latency
+stays close to its healthy baseline, and shrinks multiplicatively on ``429``/``503``,
+timeouts or latency spikes. :class:`~mailjet_rest.batch.BatchSender` and
+``Endpoint.stream(prefetch=...)`` accept one through their ``concurrency`` argument.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from typing import TYPE_CHECKING, ClassVar
+
+from mailjet_rest.errors import TimeoutError  # ruff: ignore[builtin-import-shadowing]
+
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, Generator
+
+
+__all__ = ["AdaptiveConcurrencyLimiter"]
+
+
+class AdaptiveConcurrencyLimiter:
+    """Thread- and asyncio-safe AIMD limit on the number of requests in flight.
+
+    Example:
+        >>> limiter = AdaptiveConcurrencyLimiter(initial=4, max_limit=32)
+        >>> results = BatchSender(client, max_workers=32, concurrency=limiter).send(messages)
+        >>> limiter.limit  # the sustainable concurrency the job converged to
+    """
+
+    # Statuses meaning "slow down" rather than "this request is wrong".
+    OVERLOAD_STATUSES: ClassVar[frozenset[int]] = frozenset({429, 503})
+
+    __slots__ = (
+        "_baseline",
+        "_cond",
+        "_decreased_at",
+        "_in_flight",
+        "_limit",
+        "_waiters",
+        "backoff",
+        "latency_tolerance",
+        "max_limit",
+        "min_limit",
+        "smoothing",
+    )
+
+    def __init__(
+        self,
+        initial: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        backoff: float = 0.5,
+        latency_tolerance: float = 2.0,
+        smoothing: float = 0.1,
+    ) -> None:
+        """Initialize the limiter.
+
+        Args:
+            initial (int): Starting number of requests allowed in flight.
+            min_limit (int): The limit never drops below this.
+            max_limit (int): The limit never grows above this.
+            backoff (float): Factor the limit is multiplied by on overload, in (0, 1).
+            latency_tolerance (float): A request slower than this multiple of the baseline latency
+                counts as overload.
+            smoothing (float): Weight of each healthy sample in the baseline latency average, in (0, 1].
+        """
+        if not 0 < min_limit <= initial <= max_limit:
+            msg = "AdaptiveConcurrencyLimiter requires 0 < min_limit <= initial <= max_limit."
+            raise ValueError(msg)
+        if not 0 < backoff < 1 or not 0 < smoothing <= 1 or latency_tolerance <= 1:
+            msg = "AdaptiveConcurrencyLimiter requires 0 < backoff < 1, 0 < smoothing <= 1 and latency_tolerance > 1."
+            raise ValueError(msg)
+
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff = backoff
+        self.latency_tolerance = latency_tolerance
+        self.smoothing = smoothing
+        self._limit = float(initial)
+        self._in_flight = 0
+        self._baseline = 0.0
+        self._decreased_at = 0.0
+        self._cond = threading.Condition()
+        self._waiters: deque[asyncio.Future[None]] = deque()
+
+    @property
+    def limit(self) -> int:
+        """The number of requests currently allowed in flight.
+
+        Returns:
+            int: The current limit.
+        """
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """The number of requests currently holding a slot.
+
+        Returns:
+            int: The in-flight count.
+        """
+        return self._in_flight
+
+    def snapshot(self) -> dict[str, float]:
+        """Current state, for metrics and logs.
+
+        Returns:
+            dict[str, float]: The limit, in-flight count and baseline latency (seconds).
+        """
+        with self._cond:
+            return {"limit": self.limit, "in_flight": self._in_flight, "baseline_latency": self._baseline}
+
+    @classmethod
+    def is_overload(cls, error: BaseException) -> bool:
+        """Tell whether a failed request signals that Mailjet is overloaded.
+
+        Returns:
+            bool: True for timeouts and 429/503 responses.
+        """
+        if isinstance(error, TimeoutError):
+            return True
+        return getattr(error, "status_code", None) in cls.OVERLOAD_STATUSES
+
+    @contextmanager
+    def slot(self) -> Generator[None, None, None]:
+        """Hold one slot for a blocking request, waiting while the limit is reached.
+
+        Yields:
+            None: Once the request may be sent.
+        """
+        with self._cond:
+            while self._in_flight >= self.limit:
+                self._cond.wait()
+            self._in_flight += 1
+        started = time.monotonic()
+        try:
+            yield
+        except BaseException as e:
+            self._release(started, overloaded=self.is_overload(e))
+            raise
+        self._release(started, overloaded=False)
+
+    @asynccontextmanager
+    async def aslot(self) -> AsyncGenerator[None, None]:
+        """Asyncio counterpart of :meth:`slot`.
+
+        Yields:
+            None: Once the request may be sent.
+        """
+        await self._acquire_async()
+        started = time.monotonic()
+        try:
+            yield
+        except BaseException as e:
+            self._release(started, overloaded=self.is_overload(e))
+            raise
+        self._release(started, overloaded=False)
+
+    async def _acquire_async(self) -> None:
+        """Take a slot, or queue until a releasing request hands one over."""
+        with self._cond:
+            if self._in_flight < self.limit and not self._waiters:
+                self._in_flight += 1
+                return
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            with self._cond:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                    raise
+            if not waiter.cancelled():
+                # The slot was handed over just before the cancellation: give it back. A cancelled
+                # waiter's slot is returned by '_hand_over' instead.
+                self._release(None, overloaded=False)
+            raise
+
+    def _release(self, started: float | None, overloaded: bool) -> None:
+        """Free a slot, adjust the limit from the request's outcome and wake waiters."""
+        with self._cond:
+            self._in_flight -= 1
+            if started is not None:
+                self._observe(started, time.monotonic() - started, overloaded)
+            while self._waiters and self._in_flight < self.limit:
+                waiter = self._waiters.popleft()
+                self._in_flight += 1
+                waiter.get_loop().call_soon_threadsafe(self._hand_over, waiter)
+            self._cond.notify_all()
+
+    def _hand_over(self, waiter: asyncio.Future[None]) -> None:
+        """Resolve a queued waiter on its own event loop, or return its slot if it gave up."""
+        if waiter.done():
+            self._release(None, overloaded=False)
+        else:
+            waiter.set_result(None)
+
+    def _observe(self, started: float, latency: float, overloaded: bool) -> None:
+        """Apply AIMD to one finished request. The caller must hold the lock."""
+        spike = self._baseline > 0 and latency > self._baseline * self.latency_tolerance
+        if overloaded or spike:
+            # Requests sent before the last decrease reflect the old limit: react once per window.
+            if started >= self._decreased_at:
+                self._limit = max(float(self.min_limit), self._limit * self.backoff)
+                self._decreased_at = time.monotonic()
+            return
+
+        self._baseline = (
+            latency if self._baseline == 0 else self._baseline + self.smoothing * (latency - self._baseline)
+        )
+        self._limit = min(float(self.max_limit), self._limit + 1 / self._limit)
@@ -0,0 +1,172 @@
+"""Total wall-time budgets spanning every attempt of a call.
+
+``Config.timeout`` bounds a single attempt, so a call that keeps failing can take the
+timeout times four attempts plus the ``JitterRetry`` backoff sleeps. A
+:class:`DeadlineBudget` caps the whole call instead: each attempt's timeout is clipped to
+the time left, and a retry (or a rate limit wait) is only started when the wait plus an
+attempt as slow as the slowest one so far still fits. When it does not, the call fails
+with :class:`~mailjet_rest.errors.DeadlineExceededError` describing how the budget was spent.
+
+The budget of the call in progress is published through a context variable, so the
+retry policy running inside urllib3 can consult it without any extra plumbing.
+"""
+
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from urllib3.util.timeout import Timeout
+
+from mailjet_rest.errors import DeadlineExceededError
+
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+
+__all__ = ["DeadlineBudget"]
+
+
+# Floor of a clipped timeout: socket timeouts must stay strictly positive.
+_MIN_TIMEOUT = 0.001
+
+_CURRENT: ContextVar[DeadlineBudget | None] = ContextVar("mailjet_deadline", default=None)
+
+
+@dataclass(slots=True)
+class DeadlineBudget:
+    """Wall-time budget of one API call, across attempts, retry sleeps and rate limit waits.
+
+    Attributes:
+        seconds (float): The total budget.
+        started (float): Monotonic time the call started.
+        attempts (list[float]): Duration of every finished attempt, in seconds.
+        waits (dict[str, float]): Time spent waiting, by reason (e.g. 'retry backoff').
+    """
+
+    seconds: float
+    started: float = field(init=False)
+    attempts: list[float] = field(default_factory=list)
+    waits: dict[str, float] = field(default_factory=dict)
+    _attempt_started: float = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Validate the budget and start timing the first attempt."""
+        if not self.seconds > 0:
+            msg = "A deadline must be a strictly positive number of seconds."
+            raise ValueError(msg)
+        self.started = self._attempt_started = time.monotonic()
+
+    @classmethod
+    def current(cls) -> DeadlineBudget | None:
+        """Return the budget of the call running in this context, if it has one."""
+        return _CURRENT.get()
+
+    @contextmanager
+    def activate(self) -> Generator[DeadlineBudget, None, None]:
+        """Publish the budget to code running in this context (e.g. the retry policy).
+
+        Yields:
+            DeadlineBudget: The active budget.
+        """
+        token = _CURRENT.set(self)
+        try:
+            yield self
+        finally:
+            _CURRENT.reset(token)
+
+    @property
+    def remaining(self) -> float:
+        """Seconds left before the deadline, never negative.
+
+        Returns:
+            float: The remaining budget.
+        """
+        return max(0.0, self.started + self.seconds - time.monotonic())
+
+    def expired(self) -> bool:
+        """Whether the budget is spent.
+
+        Returns:
+            bool: True once the deadline has passed.
+        """
+        return self.remaining <= 0
+
+    def end_attempt(self) -> None:
+        """Record the duration of the attempt that just finished."""
+        self.attempts.append(time.monotonic() - self._attempt_started)
+
+    def reserve(self, delay: float, reason: str) -> None:
+        """Account for a wait before the next attempt, or give up if that attempt cannot fit.
+
+        The call is given up with 'DeadlineExceededError' when the wait plus an attempt as slow
+        as the slowest one so far would overrun the deadline.
+
+        Args:
+            delay (float): The wait the caller is about to sleep, in seconds.
+            reason (str): What the wait is for (e.g. 'retry backoff', 'rate limit wait').
+        """
+        needed = delay + max(self.attempts, default=0.0)
+        if needed > self.remaining:
+            msg = f"{needed:.2f}s needed for a {reason} of {delay:.2f}s and another attempt"
+            raise self.exceeded(msg)
+        self.waits[reason] = self.waits.get(reason, 0.0) + delay
+        self._attempt_started = time.monotonic() + delay
+
+    def clip(self, timeout: float | tuple[float, float] | None) -> float | tuple[float, float]:
+        """Clip a per-attempt timeout to the time left.
+
+        Returns:
+            float | tuple[float, float]: The timeout, with each phase bounded by the remaining budget.
+        """
+        remaining = max(self.remaining, _MIN_TIMEOUT)
+        if timeout is None:
+            return remaining
+        if isinstance(timeout, tuple):
+            return min(timeout[0], remaining), min(timeout[1], remaining)
+        return min(timeout, remaining)
+
+    def timeout(self, timeout: float | tuple[float, float] | None) -> Timeout:
+        """Build a urllib3 timeout that re-clips itself to the time left for every retried attempt.
+
+        Returns:
+            Timeout: A timeout bounding each attempt's connect and read phases together.
+        """
+        connect, read = timeout if isinstance(timeout, tuple) else (timeout, timeout)
+        return _DeadlineTimeout(self, connect, read)
+
+    def exceeded(self, reason: str) -> DeadlineExceededError:
+        """Build the error reporting how the budget was spent.
+
+        Args:
+            reason (str): Why the call stops (e.g. 'the last attempt timed out').
+
+        Returns:
+            DeadlineExceededError: The error to raise.
+        """
+        elapsed = time.monotonic() - self.started
+        attempts = ", ".join(f"{duration:.2f}s" for duration in self.attempts) or "none finished"
+        waits = "".join(f", {kind} {seconds:.2f}s" for kind, seconds in self.waits.items())
+        msg = (
+            f"Deadline of {self.seconds:.2f}s exceeded after {elapsed:.2f}s ({reason}). "
+            f"Spent on: {len(self.attempts)} attempt(s) ({attempts}){waits}; {self.remaining:.2f}s left."
+        )
+        return DeadlineExceededError(
+            msg, deadline=self.seconds, elapsed=elapsed, attempts=tuple(self.attempts), waits=dict(self.waits)
+        )
+
+
+class _DeadlineTimeout(Timeout):
+    """urllib3 timeout whose total is recomputed from the budget each time urllib3 starts an attempt."""
+
+    def __init__(self, budget: DeadlineBudget, connect: float | None, read: float | None) -> None:
+        super().__init__(connect=connect, read=read, total=max(budget.remaining, _MIN_TIMEOUT))
+        self._budget = budget
+
+    def clone(self) -> Timeout:
+        """Return a fresh timeout for the next attempt, bounded by the time left."""
+        return _DeadlineTimeout(self._budget, self._connect, self._read)  # type: ignore[arg-type]
@@ -10,29 +10,39 @@ from __future__ import annotations
 import base64
 import contextlib
 import hashlib
+import hmac
 import json
 import logging
 import math
+import os
 import re
+import secrets
 import ssl
 import sys
 import tempfile
+import threading
 import unicodedata
 import warnings
+import weakref
 from functools import lru_cache
 from html.parser import HTMLParser
+from json.encoder import encode_basestring_ascii
+from operator import itemgetter
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, ClassVar, Final, NoReturn
 from urllib.parse import quote, unquote, urlparse
 
 
 if TYPE_CHECKING:
+    import socket
+
     import requests
 
     from mailjet_rest.types import TimeoutType
 
 from requests.adapters import HTTPAdapter
 from requests.auth import AuthBase
+from requests.utils import DEFAULT_CA_BUNDLE_PATH
 
 from mailjet_rest.errors import ValidationError
 
@@ -51,6 +61,27 @@ _PATH_CONTROL_CHAR_RE: Final = re.compile(r"[\x00-\x1f\x7f]")
 # Expanded to include iframe, object, embed, and applet
 _XSS_PATTERN: Final = re.compile(r"<(script|svg|iframe|object|embed|applet)|javascript:|onload=", re.IGNORECASE)
 
+# Per-process key of credential identities: digests are never comparable across processes or runs.
+_IDENTITY_KEY: Final = secrets.token_bytes(32)
+
+
+def _keyed_digest(material: str) -> str:
+    """HMAC-SHA256 a credential under the per-process identity key.
+
+    Returns:
+        str: The hex digest.
+    """
+    return hmac.new(_IDENTITY_KEY, material.encode("utf-8"), hashlib.sha256).hexdigest()
+
+
+def _account_digest(material: str) -> str:
+    """Hash a credential identifier into a digest that is stable across processes and hosts.
+
+    Returns:
+        str: The hex digest.
+    """
+    return hashlib.sha256(f"mailjet-account:{material}".encode()).hexdigest()
+
 
 @lru_cache(maxsize=1)
 def _get_secret_pattern() -> re.Pattern[str]:
@@ -67,17 +98,131 @@ def _get_secret_pattern() -> re.Pattern[str]:
     )
 
 
+class _ResumingSSLContext(ssl.SSLContext):
+    """Client SSL context resuming TLS sessions per server hostname across connections."""
+
+    def __init__(self, protocol: int = ssl.PROTOCOL_TLS_CLIENT) -> None:
+        """Initialize the session store (the protocol is consumed by 'ssl.SSLContext.__new__')."""
+        del protocol
+        self.sessions: dict[str, ssl.SSLSession] = {}
+        self._latest: dict[str, weakref.ref[ssl.SSLSocket]] = {}
+        self._sessions_lock = threading.Lock()
+
+    def release(self, ssock: ssl.SSLSocket) -> None:
+        """Keep the session of a connection about to close, with the tickets it received since its handshake."""
+        if ssock.server_hostname:
+            with contextlib.suppress(ValueError, ssl.SSLError, OSError):
+                self.remember(ssock.server_hostname, ssock.session)
+
+    def remember(self, server_hostname: str, session: ssl.SSLSession | None) -> None:
+        """Keep a server's latest resumable session, preferring ones that carry a ticket."""
+        if session is None:
+            return
+        with self._sessions_lock:
+            if session.has_ticket or server_hostname not in self.sessions:
+                self.sessions[server_hostname] = session
+
+    def session_for(self, server_hostname: str) -> ssl.SSLSession | None:
+        """Return the session to offer a server, refreshed from its most recent connection.
+
+        Returns:
+            ssl.SSLSession | None: The session to resume, or None for a full handshake.
+        """
+        ref = self._latest.get(server_hostname)
+        latest = ref() if ref is not None else None
+        if latest is not None:
+            # A connection that exchanged data holds the tickets sent after its handshake.
+            with contextlib.suppress(ValueError, ssl.SSLError):
+                self.remember(server_hostname, latest.session)
+        return self.sessions.get(server_hostname)
+
+    @override
+    def wrap_socket(  # type: ignore[override]
+        self,
+        sock: socket.socket,
+        server_side: bool = False,
+        do_handshake_on_connect: bool = True,
+        suppress_ragged_eofs: bool = True,
+        server_hostname: str | bytes | None = None,
+        session: ssl.SSLSession | None = None,
+    ) -> ssl.SSLSocket:
+        """Wrap a socket, offering the last session of the same server for resumption.
+
+        Returns:
+            ssl.SSLSocket: The TLS socket, handshaked unless 'do_handshake_on_connect' is False.
+        """
+        host = server_hostname.decode("ascii") if isinstance(server_hostname, bytes) else server_hostname
+        if session is None and host and not server_side:
+            session = self.session_for(host)
+        ssock = super().wrap_socket(
+            sock,
+            server_side=server_side,
+            do_handshake_on_connect=do_handshake_on_connect,
+            suppress_ragged_eofs=suppress_ragged_eofs,
+            server_hostname=server_hostname,
+            session=session,
+        )
+        if host and not server_side:
+            self._latest[host] = weakref.ref(ssock)
+            if do_handshake_on_connect:
+                self.release(ssock)  # Resumable right away over TLS 1.2, refreshed later for TLS 1.3 tickets
+        return ssock
+
+
+# The hardened client contexts of the current process, keyed by PID so a forked child never
+# reuses its parent's contexts (nor the TLS sessions cached in them), and by the CA bundle they
+# trust: None for requests' default bundle, else the path passed as 'verify' (or REQUESTS_CA_BUNDLE).
+_SSL_CONTEXTS: Final[dict[tuple[int, str | None], ssl.SSLContext]] = {}
+
+
 class SecureHTTPAdapter(HTTPAdapter):
     """Custom HTTP Adapter enforcing modern TLS versions (CWE-319)."""
 
     @staticmethod
-    def _get_secure_ssl_context() -> ssl.SSLContext:
-        """Create and return a hardened SSL context enforcing TLS 1.2+.
+    def _get_secure_ssl_context(ca_bundle: str | None = None) -> ssl.SSLContext:
+        """Return the process-wide hardened SSL context enforcing TLS 1.2+ for a CA bundle.
+
+        Loading the CA store takes milliseconds, so each context is built once per process
+        (again after a fork) and shared by every pool and client verifying against the same
+        bundle, which also lets them resume each other's TLS sessions with the same hosts.
+        A custom bundle gets a context of its own, so it is never trusted by other connections.
+
+        Args:
+            ca_bundle (str | None): CA bundle file or directory to trust; None for requests' default.
 
         Returns:
             ssl.SSLContext: The configured SSL context.
         """
-        context = ssl.create_default_context()
+        key = (os.getpid(), ca_bundle)
+        context = _SSL_CONTEXTS.get(key)
+        if context is None:
+            for stale in [other for other in _SSL_CONTEXTS if other[0] != key[0]]:
+                _SSL_CONTEXTS.pop(stale, None)  # Drop the parent's contexts in a forked child
+            context = _SSL_CONTEXTS.setdefault(key, SecureHTTPAdapter._new_secure_ssl_context(ca_bundle))
+        return context
+
+    @staticmethod
+    def _new_secure_ssl_context(ca_bundle: str | None = None) -> ssl.SSLContext:
+        """Create a hardened SSL context enforcing TLS 1.2+, with TLS session resumption.
+
+        Mirrors 'ssl.create_default_context()' for server authentication.
+
+        Args:
+            ca_bundle (str | None): CA bundle file or directory to trust; None for requests' default.
+
+        Returns:
+            ssl.SSLContext: The configured SSL context.
+        """
+        context = _ResumingSSLContext(ssl.PROTOCOL_TLS_CLIENT)  # Verifies certificates and hostnames
+        context.load_default_certs(ssl.Purpose.SERVER_AUTH)
+        if ca_bundle is None:
+            context.load_verify_locations(DEFAULT_CA_BUNDLE_PATH)  # What requests verifies against by default
+        elif Path(ca_bundle).is_dir():
+            context.load_verify_locations(capath=ca_bundle)
+        else:
+            context.load_verify_locations(ca_bundle)
+        if sys.version_info >= (3, 13):
+            context.verify_flags |= ssl.VERIFY_X509_PARTIAL_CHAIN | ssl.VERIFY_X509_STRICT
         context.minimum_version = ssl.TLSVersion.TLSv1_2
         return context
 
@@ -86,6 +231,19 @@ class SecureHTTPAdapter(HTTPAdapter):
         kwargs["ssl_context"] = self._get_secure_ssl_context()
         super().init_poolmanager(*args, **kwargs)
 
+    @override
+    def cert_verify(self, conn: Any, url: str, verify: bool | str, cert: str | tuple[str, str] | None) -> None:
+        super().cert_verify(conn, url, verify, cert)  # type: ignore[no-untyped-call]
+        # urllib3 re-parses 'ca_certs' into the context for every new connection: use a context that
+        # already trusts the bundle instead. urllib3 keeps one pool per bundle, so this only swaps
+        # the context of pools verifying against a custom one.
+        conn_kw = getattr(conn, "conn_kw", {})
+        if not isinstance(conn_kw.get("ssl_context"), _ResumingSSLContext) or verify is False:
+            return
+        if verify is not True:
+            conn_kw["ssl_context"] = self._get_secure_ssl_context(conn.ca_certs or conn.ca_cert_dir)
+        conn.ca_certs = conn.ca_cert_dir = None
+
     @override
     def proxy_manager_for(self, proxy: str, **proxy_kwargs: Any) -> Any:
         """Ensure proxy connections also strictly enforce TLS 1.2+.
@@ -156,6 +314,22 @@ class SecretAuth(AuthBase):
         """Return a safe representation of the credential."""
         return "SecretAuth(***REDACTED***)"
 
+    def identity(self) -> str:
+        """Derive an opaque identifier of the credentials for keying shared caches.
+
+        Returns:
+            str: A keyed digest that cannot be reversed into the credentials.
+        """
+        return _keyed_digest(f"basic:{self._api_key}:{self._api_secret}")
+
+    def account(self) -> str:
+        """Derive a stable identifier of the account for coordinating processes.
+
+        Returns:
+            str: A SHA-256 digest of the public API key only; the secret never contributes.
+        """
+        return _account_digest(f"basic:{self._api_key}")
+
 
 class RedactingFilter(logging.Filter):
     """Deep recursive logging filter to automatically scrub API keys and secrets (CWE-117, CWE-316)."""
@@ -220,32 +394,378 @@ class RedactingFilter(logging.Filter):
 
         return data
 
+    def _collect_strings(self, data: Any, strings: list[str], depth: int = 0) -> bool:
+        """Gather the strings '_deep_redact' would scrub.
+
+        Returns:
+            bool: True if the structure is nested deeper than 'MAX_REDACTION_DEPTH', which
+                '_deep_redact' truncates even when no secret is found.
+        """
+        if depth > self.MAX_REDACTION_DEPTH:
+            return True
+        if isinstance(data, str):
+            strings.append(data)
+            return False
+        if isinstance(data, dict):
+            data = data.values()
+        elif not isinstance(data, (list, tuple, set)):
+            return False
+        truncated = False
+        for item in data:
+            truncated = self._collect_strings(item, strings, depth + 1) or truncated
+        return truncated
+
+    @staticmethod
+    def _will_emit(record: logging.LogRecord) -> bool:
+        """Whether any handler reachable from the record's logger accepts its level.
+
+        Mirrors 'Logger.callHandlers', including the last resort handler used when none is configured.
+
+        Returns:
+            bool: False if every handler would drop the record, so scrubbing it is wasted work.
+        """
+        found = False
+        current: logging.Logger | None = logging.getLogger(record.name)
+        while current is not None:
+            for handler in current.handlers:
+                found = True
+                if record.levelno >= handler.level:
+                    return True
+            current = current.parent if current.propagate else None
+        last_resort = logging.lastResort
+        return not found and last_resort is not None and record.levelno >= last_resort.level
+
+    def _needs_redaction(self, record: logging.LogRecord, extras: list[str]) -> bool:
+        """Scan every string of the record at once for anything the secret pattern matches.
+
+        Joining the fields can only add matches across field boundaries, never hide one, so a
+        miss proves the record clean and a hit falls back to field-by-field redaction.
+
+        Returns:
+            bool: True if the record may hold a secret or nests deeper than 'MAX_REDACTION_DEPTH'.
+        """
+        strings = [record.msg] if isinstance(record.msg, str) else []
+        truncated = isinstance(record.args, (dict, tuple)) and self._collect_strings(record.args, strings)
+        for attr_name in extras:
+            truncated = self._collect_strings(record.__dict__[attr_name], strings) or truncated
+        return truncated or _get_secret_pattern().search("\n".join(strings)) is not None
+
     @override
     def filter(self, record: logging.LogRecord) -> bool:
         """Filter out sensitive secrets from log records safely.
 
+        Records that no handler will emit are left untouched, and records without anything
+        resembling a secret are detected with one scan and passed through unchanged.
+
         Returns:
             bool: Always True (permits the log to write but strictly scrubs the content beforehand).
         """
         try:  # ruff: ignore[too-many-statements-in-try-clause]
+            extras = [name for name in record.__dict__ if name not in self._STANDARD_ATTRS]
+            if not self._will_emit(record) or not self._needs_redaction(record, extras):
+                return True
+
             # 1. Redact primary flat string message
             if isinstance(record.msg, str):
-                record.msg = self._redact_str(record.msg)
+                record.msg = self._deep_redact(record.msg)
 
             # 2. Redact tuple/dict args WITHOUT changing their base types
             if isinstance(record.args, (dict, tuple)):
                 record.args = self._deep_redact(record.args)
 
             # 3. Redact dynamically injected 'extra' log attributes
-            for attr_name, attr_value in record.__dict__.items():
-                if attr_name not in self._STANDARD_ATTRS:
-                    record.__dict__[attr_name] = self._deep_redact(attr_value)
+            for attr_name in extras:
+                record.__dict__[attr_name] = self._deep_redact(record.__dict__[attr_name])
         except Exception as e:  # ruff: ignore[blind-except]
             # Failsafe: Never let logging filters crash application execution
             logging.getLogger(__name__).debug("Redaction filter failed: %s", e)
         return True
 
 
+_FLOAT_CONSTANTS: Final[dict[str, str]] = {"nan": "NaN", "inf": "Infinity", "-inf": "-Infinity"}
+# Bypass subclass overrides (IntEnum, custom floats) exactly like json.encoder does.
+_INT_REPR: Final = int.__repr__
+_FLOAT_REPR: Final = float.__repr__
+_FAST_SCALARS: Final[frozenset[type]] = frozenset({str, int, float, bool, type(None)})
+# C-accelerated encoder for flat containers; same settings as the canonical form.
+_FLAT_ENCODER: Final = json.JSONEncoder(sort_keys=True, default=str).encode
+_STRICT_FLAT_ENCODER: Final = json.JSONEncoder(sort_keys=True, allow_nan=False).encode
+
+
+def _canonical_float(value: float) -> str:
+    """Render a float exactly like ``json.dumps`` does (allow_nan=True).
+
+    Returns:
+        str: The JSON number, or NaN/Infinity/-Infinity for non-finite values.
+    """
+    text = _FLOAT_REPR(value)
+    return _FLOAT_CONSTANTS.get(text, text)
+
+
+def _canonical_key(key: Any) -> str:
+    """Coerce a mapping key exactly like ``json.dumps`` does (skipkeys=False).
+
+    Returns:
+        str: The unescaped JSON object key.
+
+    Raises:
+        TypeError: If the key type cannot be represented as a JSON object key.
+    """
+    if isinstance(key, str):
+        return key
+    if isinstance(key, float):
+        return _canonical_float(key)
+    if key is True:
+        return "true"
+    if key is False:
+        return "false"
+    if key is None:
+        return "null"
+    if isinstance(key, int):
+        return _INT_REPR(key)
+    msg = f"keys must be str, int, float, bool or None, not {key.__class__.__name__}"
+    raise TypeError(msg)
+
+
+def _canonical_scalar(value: Any) -> str:
+    """Encode a non-container value exactly like ``json.dumps(default=str)`` does.
+
+    Returns:
+        str: The JSON fragment for the value.
+    """
+    if isinstance(value, str):
+        return encode_basestring_ascii(value)
+    if value is None:
+        return "null"
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    if isinstance(value, int):
+        return _INT_REPR(value)
+    if isinstance(value, float):
+        return _canonical_float(value)
+    # Non-JSON-native values fall back to their string form, mirroring default=str.
+    return encode_basestring_ascii(str(value))
+
+
+def _strict_scalar(value: Any) -> str:
+    """Encode a non-container value like ``json.dumps(allow_nan=False)`` does.
+
+    Returns:
+        str: The JSON fragment for the value.
+
+    Raises:
+        ValueError: If the value is a non-finite float.
+        TypeError: If the value is not natively JSON serializable.
+    """
+    if isinstance(value, float) and not math.isfinite(value):
+        msg = "Out of range float values are not JSON compliant"
+        raise ValueError(msg)
+    if isinstance(value, (str, int, float)) or value is None:
+        return _canonical_scalar(value)
+    msg = f"Object of type {value.__class__.__name__} is not JSON serializable"
+    raise TypeError(msg)
+
+
+class _CanonicalDigest:
+    """Single-pass canonical JSON encoder that feeds SHA-256 while walking the payload.
+
+    The emitted byte stream is identical to
+    ``json.dumps(stripped, sort_keys=True, default=str)``, so fingerprints stay stable,
+    but neither the stripped copy nor the full JSON string is ever materialized.
+    Cycle detection uses one shared stack of the container ids on the current path.
+    """
+
+    __slots__ = ("_active", "_chunks", "_hasher")
+
+    MAX_DEPTH: ClassVar[int] = 50
+    # Number of pending string fragments buffered before they are fed to the hasher.
+    FLUSH_THRESHOLD: ClassVar[int] = 2048
+
+    # Encoding policy for leaves and flat containers, overridden by the strict body encoder.
+    _scalar = staticmethod(_canonical_scalar)
+    _flat = staticmethod(_FLAT_ENCODER)
+
+    def __init__(self) -> None:
+        """Initialize an empty digest."""
+        self._active: set[int] = set()
+        self._chunks: list[str] = []
+        self._hasher = hashlib.sha256()
+
+    def hexdigest(self, payload: Any) -> str:
+        """Encode the payload into the hash and return the digest.
+
+        Returns:
+            str: The hex SHA-256 digest of the canonical JSON encoding.
+        """
+        self._encode(payload, 0)
+        self._flush()
+        return self._hasher.hexdigest()
+
+    def _flush(self) -> None:
+        self._hasher.update("".join(self._chunks).encode("ascii"))
+        self._chunks.clear()
+
+    @staticmethod
+    def _circular() -> str:
+        return '"[Circular]"'
+
+    def _encode(self, data: Any, depth: int) -> None:
+        chunks = self._chunks
+        if id(data) in self._active:
+            chunks.append(self._circular())
+            return
+        if depth > self.MAX_DEPTH:
+            msg = "Security Violation: Payload exceeds maximum safe nesting depth."
+            raise ValueError(msg)
+
+        if isinstance(data, dict):
+            self._encode_object(data, depth)
+        elif isinstance(data, (list, tuple, set)):
+            self._encode_array(data, depth)
+        else:
+            chunks.append(self._scalar(data))
+
+        if len(chunks) >= self.FLUSH_THRESHOLD:
+            self._flush()
+
+    def _encode_member(self, value: Any, depth: int) -> None:
+        """Encode a container member, inlining JSON scalars when the depth budget allows.
+
+        Scalars can never close a cycle, so they skip the generic :meth:`_encode` dispatch.
+        """
+        if depth <= self.MAX_DEPTH and type(value) in _FAST_SCALARS:
+            self._chunks.append(self._scalar(value))
+        else:
+            self._encode(value, depth)
+
+    def _encode_object(self, data: dict[Any, Any], depth: int) -> None:
+        chunks = self._chunks
+        volatile = SecurityGuard.VOLATILE_IDEMPOTENCY_KEYS
+        if volatile.isdisjoint(data):
+            if depth < self.MAX_DEPTH and _FAST_SCALARS.issuperset(map(type, data.values())):
+                # Flat object: nothing to strip or recurse into, let the C encoder handle it.
+                chunks.append(self._flat(data))
+                return
+            items = sorted(data.items(), key=itemgetter(0))
+        else:
+            items = sorted(((k, v) for k, v in data.items() if k not in volatile), key=itemgetter(0))
+
+        marker = id(data)
+        self._active.add(marker)
+        separator = "{"
+        for key, value in items:
+            name = key if type(key) is str else _canonical_key(key)
+            chunks.append(f"{separator}{encode_basestring_ascii(name)}: ")
+            self._encode_member(value, depth + 1)
+            separator = ", "
+        chunks.append("}" if items else "{}")
+        self._active.discard(marker)
+
+    def _encode_array(self, data: list[Any] | tuple[Any, ...] | set[Any], depth: int) -> None:
+        chunks = self._chunks
+        if depth < self.MAX_DEPTH and not isinstance(data, set) and _FAST_SCALARS.issuperset(map(type, data)):
+            chunks.append(self._flat(data))
+            return
+
+        marker = id(data)
+        self._active.add(marker)
+        separator = "["
+        for item in data:
+            chunks.append(separator)
+            self._encode_member(item, depth + 1)
+            separator = ", "
+        chunks.append("]" if separator == ", " else "[]")
+        self._active.discard(marker)
+
+
+class _CanonicalBody(_CanonicalDigest):
+    """Strict variant producing the JSON wire body and its fingerprint from one walk.
+
+    Every fragment lands in the body; fragments belonging to volatile keys (and the
+    separators they would leave dangling) are recorded as excluded spans, so the digest
+    equals :class:`_CanonicalDigest`'s without serializing anything twice. Values that
+    the standard library refuses to serialize (cycles, NaN, sets, arbitrary objects)
+    raise instead of being coerced, so callers can fall back to the regular path.
+    """
+
+    __slots__ = ("_excluded",)
+
+    # The body must be kept whole, so nothing is flushed before the walk completes.
+    FLUSH_THRESHOLD: ClassVar[int] = sys.maxsize
+
+    _scalar = staticmethod(_strict_scalar)
+    _flat = staticmethod(_STRICT_FLAT_ENCODER)
+
+    def __init__(self) -> None:
+        """Initialize an empty body."""
+        super().__init__()
+        self._excluded: list[tuple[int, int]] = []
+
+    def encode(self, payload: Any) -> tuple[bytes, str]:
+        """Serialize the payload and hash its stripped canonical form.
+
+        Returns:
+            tuple[bytes, str]: The ASCII JSON body and its hex SHA-256 fingerprint.
+        """
+        self._encode(payload, 0)
+        body = "".join(self._chunks).encode("ascii")
+        if not self._excluded:
+            self._hasher.update(body)
+            return body, self._hasher.hexdigest()
+
+        position = 0
+        for start, end in sorted(self._excluded):
+            if start >= position:  # Spans nested in an already excluded span are skipped with it
+                self._hasher.update("".join(self._chunks[position:start]).encode("ascii"))
+                position = end
+        self._hasher.update("".join(self._chunks[position:]).encode("ascii"))
+        return body, self._hasher.hexdigest()
+
+    @override
+    @staticmethod
+    def _circular() -> str:
+        msg = "Circular reference detected"
+        raise ValueError(msg)
+
+    @override
+    def _encode_object(self, data: dict[Any, Any], depth: int) -> None:
+        volatile = SecurityGuard.VOLATILE_IDEMPOTENCY_KEYS
+        if volatile.isdisjoint(data):
+            super()._encode_object(data, depth)
+            return
+
+        chunks = self._chunks
+        marker = id(data)
+        self._active.add(marker)
+        chunks.append("{")
+        emitted = kept = False
+        for key, value in sorted(data.items(), key=itemgetter(0)):
+            start = len(chunks)
+            if emitted:
+                chunks.append(", ")
+            name = key if type(key) is str else _canonical_key(key)
+            chunks.append(f"{encode_basestring_ascii(name)}: ")
+            self._encode_member(value, depth + 1)
+            if key in volatile:
+                self._excluded.append((start, len(chunks)))
+            elif emitted and not kept:
+                # First kept member after volatile ones: the digest has no separator here.
+                self._excluded.append((start, start + 1))
+            emitted = True
+            kept = kept or key not in volatile
+        chunks.append("}")
+        self._active.discard(marker)
+
+    @override
+    def _encode_array(self, data: list[Any] | tuple[Any, ...] | set[Any], depth: int) -> None:
+        if isinstance(data, set):
+            msg = "Object of type set is not JSON serializable"
+            raise TypeError(msg)
+        super()._encode_array(data, depth)
+
+
 class SecurityGuard:
     """Centralized OWASP API security and payload guardrails."""
 
@@ -408,39 +928,26 @@ class SecurityGuard:
         Returns:
             str: The generated SHA-256 hash.
         """
-
-        def _deep_strip(data: Any, depth: int = 0, seen: set[int] | None = None) -> Any:
-            if seen is None:
-                seen = set()
-
-            # Active Cycle Detection (CWE-674) to prevent RecursionError crashes
-            if id(data) in seen:
-                return "[Circular]"
-
-            if depth > 50:
-                msg = "Security Violation: Payload exceeds maximum safe nesting depth."
-                raise ValueError(msg)
-
-            if isinstance(data, dict):
-                seen.add(id(data))
-                return {
-                    k: _deep_strip(v, depth + 1, seen.copy())
-                    for k, v in data.items()
-                    if k not in SecurityGuard.VOLATILE_IDEMPOTENCY_KEYS
-                }
-            if isinstance(data, (list, tuple, set)):
-                seen.add(id(data))
-                return [_deep_strip(item, depth + 1, seen.copy()) for item in data]
-            return data
-
         try:
-            safe_payload = _deep_strip(payload)
-            serialized = json.dumps(safe_payload, sort_keys=True, default=str)
-            return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+            return _CanonicalDigest().hexdigest(payload)
         except Exception as e:
             msg = "Payload hashing failed due to malformed or deeply nested structure."
             raise ValueError(msg) from e
 
+    @staticmethod
+    def serialize_payload(payload: dict[str, Any] | list[Any]) -> tuple[bytes, str]:
+        """Serialize a JSON payload once into wire bytes and its Idempotency fingerprint.
+
+        The fingerprint is identical to :meth:`generate_payload_fingerprint` and is derived
+        from the very fragments that make up the body, so the payload is never encoded twice.
+        Unlike the fingerprint, the body is strict JSON: cycles, non-finite floats and excessive
+        nesting raise ValueError, values the standard encoder cannot serialize raise TypeError.
+
+        Returns:
+            tuple[bytes, str]: The UTF-8 (ASCII-escaped) JSON body and its SHA-256 fingerprint.
+        """
+        return _CanonicalBody().encode(payload)
+
     @staticmethod
     def validate_attachment_path(file_path: Path | str, safe_base_dir: Path | str | None = None) -> Path:
         """Prevent Path Traversal (CWE-22) via strict resolution boundary checks.
@@ -713,6 +1220,38 @@ class SecurityGuard:
                 raise ValueError(msg)
         return SecretAuth((key.strip(), secret.strip()))
 
+    @staticmethod
+    def auth_identity(auth: str | SecretAuth | None) -> str:
+        """Derive an opaque, per-process identifier of the credentials (CWE-316).
+
+        Used to partition caches shared between clients without keeping the credentials
+        (or a stable hash of them) in cache keys.
+
+        Returns:
+            str: An HMAC-SHA256 hex digest, or an empty string for anonymous clients.
+        """
+        if auth is None:
+            return ""
+        if isinstance(auth, SecretAuth):
+            return auth.identity()
+        return _keyed_digest(f"bearer:{auth}")
+
+    @staticmethod
+    def account_namespace(auth: str | SecretAuth | None) -> str:
+        """Derive a stable identifier of the Mailjet account the credentials belong to.
+
+        Unlike 'auth_identity' it is identical in every process and on every host, so that
+        budgets kept in shared stores (files, databases, Redis) are partitioned per account.
+
+        Returns:
+            str: A SHA-256 hex digest, or 'anonymous' for clients without credentials.
+        """
+        if auth is None:
+            return "anonymous"
+        if isinstance(auth, SecretAuth):
+            return auth.account()
+        return _account_digest(f"bearer:{auth}")
+
     @staticmethod
     def validate_and_coerce_auth(auth: str | tuple[str, str] | None) -> str | SecretAuth | None:
         """Validate and coerce authentication credentials securely (CWE-113, CWE-316).
@@ -0,0 +1,180 @@
+"""Per-call instrumentation hooks: phase timings, byte counts and retries of every API call.
+
+Register callables with ``Config(hooks=[...])`` (or append to ``client.hooks``). After each
+``api_call`` finishes, successfully or not, every hook receives a :class:`CallStats` telling
+where the call spent its time:
+
+- ``validate``: header sanitization, timeout and transport argument checks.
+- ``cache``: response cache lookup (only with a response cache).
+- ``serialize``: JSON encoding and the Idempotency-Key fingerprint.
+- ``rate_limit``: waiting for a client-side rate limit slot (only with rate limits).
+- ``pool_wait``: checking a connection out of the pool.
+- ``connect`` / ``tls``: TCP connection and TLS handshake of new connections.
+- ``server``: from the request being sent to the response headers arriving.
+- ``retry_backoff``: sleeping between attempts.
+- ``transfer``: the remaining transport time, mostly sending the request and reading the body.
+
+Transport phases add up over every attempt of the call. Without hooks (or tracing, see
+:mod:`mailjet_rest.utils.tracing`) nothing is timed; what remains is a handful of context
+variable lookups per call.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Callable, Generator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, TypeAlias
+
+
+__all__ = ["CallHook", "CallStats"]
+
+
+logger = logging.getLogger(__name__)
+
+_CURRENT: ContextVar[CallStats | None] = ContextVar("mailjet_call_stats", default=None)
+
+
+@dataclass(slots=True)
+class CallStats:
+    """Timings and sizes of one API call, handed to every instrumentation hook when it ends.
+
+    Attributes:
+        method (str): The HTTP method.
+        url (str): The request URL, without query parameters.
+        route (str): The resource the URL addresses (e.g. 'contact'); see 'resource_of'.
+        started (float): Monotonic time the call started.
+        elapsed (float): Seconds the whole call took.
+        phases (dict[str, float]): Seconds spent per phase (see the module documentation).
+        status (int | None): Status of the final response, None if the call raised first.
+        attempts (int): Connections checked out for the call, one per attempt.
+        statuses (list[int]): Status of every attempt's response, including retried ones.
+        bytes_out (int): Size of the encoded request body (0 for bodies encoded by the transport, e.g. files).
+        bytes_in (int): Size of the response body, 0 for streamed, cached or dry-run responses.
+        cached (bool): Whether the response was served from the response cache.
+        telemetry (dict[str, str]): The allow-listed trace fields of the payload (e.g. 'mailjet.customid').
+        error (BaseException | None): The exception the call raised, if any.
+    """
+
+    method: str
+    url: str
+    route: str
+    started: float = field(init=False)
+    elapsed: float = 0.0
+    phases: dict[str, float] = field(default_factory=dict)
+    status: int | None = None
+    attempts: int = 0
+    statuses: list[int] = field(default_factory=list)
+    bytes_out: int = 0
+    bytes_in: int = 0
+    cached: bool = False
+    telemetry: dict[str, str] = field(default_factory=dict)
+    error: BaseException | None = None
+    _mark: float = field(init=False, repr=False)
+    _nested: float = field(default=0.0, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Start timing the call and its first phase."""
+        self.started = self._mark = time.monotonic()
+
+    @property
+    def retries(self) -> int:
+        """Attempts beyond the first one.
+
+        Returns:
+            int: The number of retried attempts.
+        """
+        return max(self.attempts - 1, 0)
+
+    @property
+    def final_status(self) -> int | None:
+        """Status of the final response, or of the last attempt when the call raised on an error status.
+
+        Returns:
+            int | None: The status, or None when no response came back.
+        """
+        if self.status is not None:
+            return self.status
+        return self.statuses[-1] if self.statuses else None
+
+    @classmethod
+    def current(cls) -> CallStats | None:
+        """Return the stats of the call running in this context, if it is instrumented."""
+        return _CURRENT.get()
+
+    def add(self, phase: str, seconds: float) -> None:
+        """Add time measured inside the running phase (e.g. by the connection pool) to another phase."""
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+        self._nested += seconds
+
+    def mark(self, phase: str) -> None:
+        """End the running phase, charging it the time since the last mark not already added elsewhere."""
+        now = time.monotonic()
+        self.phases[phase] = self.phases.get(phase, 0.0) + max(now - self._mark - self._nested, 0.0)
+        self._mark = now
+        self._nested = 0.0
+
+    @contextmanager
+    def timed(self, phase: str) -> Generator[None, None, None]:
+        """Add the duration of the block to a phase nested in the running one.
+
+        Yields:
+            None: Control to the timed block.
+        """
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self.add(phase, time.monotonic() - started)
+
+    def record_response(self, response: Any) -> None:
+        """Take the status and body size of the call's final response (requests or httpx)."""
+        self.status = response.status_code
+        content = getattr(response, "_content", None)  # Only set once the body was read
+        if isinstance(content, bytes) and not self.cached:
+            self.bytes_in = len(content)
+
+    @contextmanager
+    def activate(self, hooks: list[CallHook]) -> Generator[CallStats, None, None]:
+        """Publish the stats to the transport while the call runs, then hand them to every hook.
+
+        A failing hook is logged and never fails the call.
+
+        Yields:
+            CallStats: The stats being recorded.
+        """
+        token = _CURRENT.set(self)
+        try:
+            yield self
+        except BaseException as e:
+            self.error = e
+            raise
+        finally:
+            _CURRENT.reset(token)
+            self.elapsed = time.monotonic() - self.started
+            for hook in hooks:
+                _notify(hook, self)
+
+
+CallHook: TypeAlias = Callable[[CallStats], None]
+
+
+def timed(phase: str) -> AbstractContextManager[None]:
+    """Time a block into a phase of the instrumented call running in this context, if any.
+
+    Returns:
+        AbstractContextManager[None]: A timer, or a no-op when the call is not instrumented.
+    """
+    stats = _CURRENT.get()
+    return nullcontext() if stats is None else stats.timed(phase)
+
+
+def _notify(hook: CallHook, stats: CallStats) -> None:
+    """Hand the stats to a hook, logging instead of raising if it fails."""
+    try:
+        hook(stats)
+    except Exception:  # ruff: ignore[blind-except]
+        logger.warning("Instrumentation hook %r failed", hook, exc_info=True)
@@ -0,0 +1,433 @@
+"""Per-endpoint counters and latency histograms, exportable in the Prometheus text format.
+
+A :class:`MetricsRegistry` passed as ``Config(metrics=...)`` (and exposed as ``client.metrics``)
+is an instrumentation hook (see :mod:`mailjet_rest.utils.instrumentation`): every finished call
+updates the series of its endpoint (the ``ROUTE_MAP`` name, e.g. ``contact_managecontactslists``)
+and HTTP method. Recording a call takes one uncontended lock for a few integer additions, so one
+registry can be shared by every client and thread of a process.
+
+The registry also reports the live state of the resilience components it tracks: the per-route
+circuits of a :class:`~mailjet_rest.utils.breaker.CircuitBreaker` (a client attaches its own when
+both are configured) and the current limit of any
+:class:`~mailjet_rest.utils.concurrency.AdaptiveConcurrencyLimiter` passed to
+:meth:`MetricsRegistry.track_concurrency_limiter`. They are read at export time: states and limits as gauges,
+how often a circuit opened or rejected calls as counters.
+
+Example:
+    >>> metrics = MetricsRegistry()
+    >>> client = Client(auth=(key, secret), config=Config(metrics=metrics))
+    >>> client.contact.get()
+    >>> metrics.snapshot()[("contact", "GET")].requests
+    1
+    >>> print(metrics.export())  # Serve it on your /metrics endpoint
+"""
+
+from __future__ import annotations
+
+import itertools
+import threading
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Final, Protocol, TypeAlias
+
+from mailjet_rest.routes import endpoint_of
+from mailjet_rest.utils.breaker import CLOSED, HALF_OPEN, OPEN
+
+
+if TYPE_CHECKING:
+    from mailjet_rest.utils.breaker import CircuitBreaker
+    from mailjet_rest.utils.concurrency import AdaptiveConcurrencyLimiter
+    from mailjet_rest.utils.instrumentation import CallStats
+
+
+__all__ = [
+    "LATENCY_BUCKETS",
+    "EndpointMetrics",
+    "GaugeSnapshot",
+    "LatencyHistogram",
+    "MetricsExporter",
+    "MetricsRegistry",
+    "MetricsSnapshot",
+    "PrometheusExporter",
+]
+
+
+# Circuit states from the most to the least severe; a route tracked by several breakers reports the worst.
+_CIRCUIT_STATES: Final = (OPEN, HALF_OPEN, CLOSED)
+
+# Upper bounds in seconds of the latency buckets, Prometheus' defaults plus one for slow sends.
+LATENCY_BUCKETS: Final = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+@dataclass(slots=True)
+class LatencyHistogram:
+    """Fixed-bucket histogram of call durations.
+
+    Attributes:
+        bounds (tuple[float, ...]): Increasing upper bounds of the buckets, in seconds.
+        counts (list[int]): Observations per bucket (not cumulative); the extra last bucket
+            holds the ones above every bound.
+        total (float): Sum of every observed duration.
+        count (int): Number of observations.
+    """
+
+    bounds: tuple[float, ...]
+    counts: list[int] = field(default_factory=list)
+    total: float = 0.0
+    count: int = 0
+
+    def __post_init__(self) -> None:
+        """Allocate one bucket per bound, plus the overflow bucket."""
+        if not self.counts:
+            self.counts = [0] * (len(self.bounds) + 1)
+
+    def observe(self, seconds: float) -> None:
+        """Count one duration in the first bucket whose bound it does not exceed."""
+        self.counts[bisect_left(self.bounds, seconds)] += 1
+        self.total += seconds
+        self.count += 1
+
+    def copy(self) -> LatencyHistogram:
+        """Return an independent copy of the histogram."""
+        return LatencyHistogram(self.bounds, list(self.counts), self.total, self.count)
+
+
+@dataclass(slots=True)
+class EndpointMetrics:
+    """Counters of one endpoint and HTTP method.
+
+    Attributes:
+        latency (LatencyHistogram): Durations of the calls, retries and backoff included.
+        requests (int): Finished calls, cache hits included.
+        status_classes (dict[str, int]): Calls per class of their final status ('2xx', '4xx', '5xx', ...),
+            or 'error' when no response was received.
+        retries (int): Extra attempts made by the retry policy ('JitterRetry').
+        throttled (int): Attempts answered with 429 Too Many Requests, retried ones included.
+        bytes_out (int): Request body bytes sent, once per call.
+        bytes_in (int): Response body bytes received.
+        pool_wait (float): Seconds spent checking connections out of the pool.
+    """
+
+    latency: LatencyHistogram
+    requests: int = 0
+    status_classes: dict[str, int] = field(default_factory=dict)
+    retries: int = 0
+    throttled: int = 0
+    bytes_out: int = 0
+    bytes_in: int = 0
+    pool_wait: float = 0.0
+
+    def copy(self) -> EndpointMetrics:
+        """Return an independent copy of the counters."""
+        return EndpointMetrics(
+            self.latency.copy(),
+            self.requests,
+            dict(self.status_classes),
+            self.retries,
+            self.throttled,
+            self.bytes_out,
+            self.bytes_in,
+            self.pool_wait,
+        )
+
+
+# Counters keyed by (endpoint, HTTP method), e.g. ('send', 'POST').
+MetricsSnapshot: TypeAlias = dict[tuple[str, str], EndpointMetrics]
+
+
+@dataclass(slots=True)
+class GaugeSnapshot:
+    """Current state of the circuit breakers and concurrency limiters tracked by a registry.
+
+    Attributes:
+        circuits (dict[str, dict[str, float | str]]): Per route, the circuit 'state' (the worst one
+            when several breakers track the route) and how often it 'opened' and 'rejected' calls.
+        concurrency (dict[str, dict[str, float]]): Per limiter name, its current 'limit' and
+            'in_flight' count.
+    """
+
+    circuits: dict[str, dict[str, float | str]] = field(default_factory=dict)
+    concurrency: dict[str, dict[str, float]] = field(default_factory=dict)
+
+
+class MetricsExporter(Protocol):
+    """Renders a snapshot of a registry for a monitoring system."""
+
+    def export(self, snapshot: MetricsSnapshot, gauges: GaugeSnapshot | None = None) -> str:
+        """Render the snapshot.
+
+        Args:
+            snapshot (MetricsSnapshot): The per-endpoint counters.
+            gauges (GaugeSnapshot | None): The state of the tracked breakers and limiters, if any.
+
+        Returns:
+            str: The rendered metrics.
+        """
+        ...
+
+
+class MetricsRegistry:
+    """Thread-safe per-endpoint counters, fed by the instrumentation hooks of one or more clients.
+
+    Calls are keyed by endpoint name and HTTP method, so the number of series stays bounded
+    by the routes an application uses; ids and query parameters never become labels.
+    """
+
+    __slots__ = ("_breakers", "_endpoints", "_limiters", "_lock", "buckets")
+
+    def __init__(self, buckets: tuple[float, ...] = LATENCY_BUCKETS) -> None:
+        """Initialize an empty registry.
+
+        Args:
+            buckets (tuple[float, ...]): Strictly increasing, positive upper bounds of the latency
+                buckets in seconds.
+        """
+        if not buckets or buckets[0] <= 0 or any(low >= high for low, high in itertools.pairwise(buckets)):
+            msg = "MetricsRegistry buckets must be strictly increasing positive bounds."
+            raise ValueError(msg)
+        self.buckets = tuple(float(bound) for bound in buckets)
+        self._endpoints: MetricsSnapshot = {}
+        self._breakers: list[CircuitBreaker] = []
+        self._limiters: dict[str, AdaptiveConcurrencyLimiter] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, stats: CallStats) -> None:
+        """Record a finished call; the registry is registered as an instrumentation hook."""
+        key = (endpoint_of(stats.url), stats.method)
+        status = stats.final_status
+        status_class = "error" if status is None else f"{status // 100}xx"
+        throttled = stats.statuses.count(429)
+        pool_wait = stats.phases.get("pool_wait", 0.0)
+        with self._lock:
+            metrics = self._endpoints.get(key)
+            if metrics is None:
+                metrics = self._endpoints[key] = EndpointMetrics(LatencyHistogram(self.buckets))
+            metrics.latency.observe(stats.elapsed)
+            metrics.requests += 1
+            metrics.status_classes[status_class] = metrics.status_classes.get(status_class, 0) + 1
+            metrics.retries += stats.retries
+            metrics.throttled += throttled
+            metrics.bytes_out += stats.bytes_out
+            metrics.bytes_in += stats.bytes_in
+            metrics.pool_wait += pool_wait
+
+    def snapshot(self, *, reset: bool = False) -> MetricsSnapshot:
+        """Return a consistent copy of every series.
+
+        Args:
+            reset (bool): Also clear the registry, atomically, so the next snapshot holds only
+                the calls made in between (for exporters pushing deltas).
+
+        Returns:
+            MetricsSnapshot: The counters keyed by (endpoint, HTTP method).
+        """
+        with self._lock:
+            if reset:
+                endpoints, self._endpoints = self._endpoints, {}
+                return endpoints
+            return {key: metrics.copy() for key, metrics in self._endpoints.items()}
+
+    def track_circuit_breaker(self, breaker: CircuitBreaker) -> None:
+        """Export the per-route state of a circuit breaker; tracking the same breaker twice is a no-op."""
+        with self._lock:
+            if all(tracked is not breaker for tracked in self._breakers):
+                self._breakers.append(breaker)
+
+    def track_concurrency_limiter(self, limiter: AdaptiveConcurrencyLimiter, name: str = "default") -> None:
+        """Export the current limit of an adaptive concurrency limiter.
+
+        Args:
+            limiter (AdaptiveConcurrencyLimiter): The limiter, e.g. the one given to a 'BatchSender'.
+            name (str): Value of its 'limiter' label; tracking another limiter under the same name
+                replaces it.
+        """
+        with self._lock:
+            self._limiters[name] = limiter
+
+    def gauges(self) -> GaugeSnapshot:
+        """Read the current state of the tracked circuit breakers and concurrency limiters.
+
+        Returns:
+            GaugeSnapshot: The circuits per route and the limiters per name.
+        """
+        with self._lock:
+            breakers, limiters = list(self._breakers), dict(self._limiters)
+        gauges = GaugeSnapshot(concurrency={name: limiter.snapshot() for name, limiter in limiters.items()})
+        for breaker in breakers:
+            for route, circuit in breaker.snapshot().items():
+                merged = gauges.circuits.setdefault(route, {"state": CLOSED, "opened": 0, "rejected": 0})
+                merged["state"] = min(merged["state"], circuit["state"], key=_CIRCUIT_STATES.index)
+                merged["opened"] = int(merged["opened"]) + int(circuit["trips"])
+                merged["rejected"] = int(merged["rejected"]) + int(circuit["rejected"])
+        return gauges
+
+    def reset(self) -> None:
+        """Forget every series; tracked breakers and limiters stay tracked."""
+        with self._lock:
+            self._endpoints = {}
+
+    def reset_after_fork(self) -> None:
+        """Replace the lock and drop the parent's series in a forked child, so they are not counted twice.
+
+        Tracked breakers and limiters are kept; clients reset their breaker after a fork themselves.
+        """
+        self._lock = threading.Lock()
+        self._endpoints = {}
+
+    def export(self, exporter: MetricsExporter | None = None) -> str:
+        """Render the current series with an exporter.
+
+        Args:
+            exporter (MetricsExporter | None): The exporter. Defaults to a 'PrometheusExporter'.
+
+        Returns:
+            str: The rendered metrics.
+        """
+        return (exporter or PrometheusExporter()).export(self.snapshot(), self.gauges())
+
+
+class PrometheusExporter:
+    """Renders snapshots in the Prometheus text exposition format (version 0.0.4)."""
+
+    __slots__ = ("namespace",)
+
+    CONTENT_TYPE: Final = "text/plain; version=0.0.4; charset=utf-8"
+
+    def __init__(self, namespace: str = "mailjet") -> None:
+        """Initialize the exporter.
+
+        Args:
+            namespace (str): Prefix of every metric name.
+        """
+        self.namespace = namespace
+
+    def export(self, snapshot: MetricsSnapshot, gauges: GaugeSnapshot | None = None) -> str:
+        """Render the snapshot as counters and a request duration histogram per endpoint and method.
+
+        Circuit breakers are rendered as a state set per route ('circuit_state', 1 for the current
+        state) with counters of how often the circuit opened and rejected calls; concurrency limiters
+        as gauges of their current limit and in-flight count.
+
+        Args:
+            snapshot (MetricsSnapshot): The per-endpoint counters.
+            gauges (GaugeSnapshot | None): The state of the tracked breakers and limiters, if any.
+
+        Returns:
+            str: The exposition text, ending with a newline.
+        """
+        ns = self.namespace
+        series = sorted(snapshot.items())
+        lines: list[str] = []
+        counters = (
+            ("requests_total", "requests", "API calls made."),
+            ("retries_total", "retries", "Extra attempts made by the retry policy."),
+            ("throttled_total", "throttled", "Attempts answered with 429 Too Many Requests."),
+            ("request_bytes_total", "bytes_out", "Request body bytes sent."),
+            ("response_bytes_total", "bytes_in", "Response body bytes received."),
+            ("pool_wait_seconds_total", "pool_wait", "Seconds spent waiting for a pooled connection."),
+        )
+        for name, attribute, help_text in counters:
+            lines += [f"# HELP {ns}_{name} {help_text}", f"# TYPE {ns}_{name} counter"]
+            lines += [
+                f"{ns}_{name}{{{_labels(key)}}} {_number(getattr(metrics, attribute))}" for key, metrics in series
+            ]
+
+        lines += [
+            f"# HELP {ns}_responses_total API calls by final status class.",
+            f"# TYPE {ns}_responses_total counter",
+        ]
+        for key, metrics in series:
+            for status_class, count in sorted(metrics.status_classes.items()):
+                lines.append(f'{ns}_responses_total{{{_labels(key)},status_class="{status_class}"}} {count}')
+
+        name = f"{ns}_request_duration_seconds"
+        lines += [f"# HELP {name} API call duration, retries included.", f"# TYPE {name} histogram"]
+        for key, metrics in series:
+            lines += _histogram_lines(name, _labels(key), metrics.latency)
+        if gauges is not None:
+            lines += self._resilience_lines(gauges)
+        return "\n".join(lines) + "\n"
+
+    def _resilience_lines(self, gauges: GaugeSnapshot) -> list[str]:
+        """Render the circuit breaker and concurrency limiter series.
+
+        Returns:
+            list[str]: The metadata and sample lines; none for an empty snapshot.
+        """
+        ns = self.namespace
+        lines: list[str] = []
+        circuits = sorted(gauges.circuits.items())
+        if circuits:
+            lines += [
+                f"# HELP {ns}_circuit_state Circuit breaker state per route, 1 for the current state.",
+                f"# TYPE {ns}_circuit_state gauge",
+            ]
+            for route, circuit in circuits:
+                lines += [
+                    f'{ns}_circuit_state{{route="{_escape(route)}",state="{state}"}} {int(circuit["state"] == state)}'
+                    for state in _CIRCUIT_STATES
+                ]
+            for name, key, help_text in (
+                ("circuit_opens_total", "opened", "Times the route's circuit opened."),
+                ("circuit_rejections_total", "rejected", "Calls failed fast while the route's circuit was open."),
+            ):
+                lines += [f"# HELP {ns}_{name} {help_text}", f"# TYPE {ns}_{name} counter"]
+                lines += [f'{ns}_{name}{{route="{_escape(route)}"}} {circuit[key]}' for route, circuit in circuits]
+        limiters = sorted(gauges.concurrency.items())
+        if limiters:
+            for name, key, help_text in (
+                ("concurrency_limit", "limit", "Requests the adaptive concurrency limiter allows in flight."),
+                ("concurrency_in_flight", "in_flight", "Requests holding a slot of the concurrency limiter."),
+            ):
+                lines += [f"# HELP {ns}_{name} {help_text}", f"# TYPE {ns}_{name} gauge"]
+                lines += [
+                    f'{ns}_{name}{{limiter="{_escape(limiter)}"}} {_number(state[key])}' for limiter, state in limiters
+                ]
+        return lines
+
+
+def _labels(key: tuple[str, str]) -> str:
+    """Render the endpoint and method labels of a series.
+
+    Returns:
+        str: The labels, with backslashes, quotes and newlines escaped.
+    """
+    endpoint, method = (_escape(value) for value in key)
+    return f'endpoint="{endpoint}",method="{method}"'
+
+
+def _escape(value: str) -> str:
+    """Escape a label value.
+
+    Returns:
+        str: The value with backslashes, quotes and newlines escaped.
+    """
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _number(value: float) -> str:
+    """Render a sample value.
+
+    Returns:
+        str: Integers without a decimal point, floats in their shortest exact form.
+    """
+    return str(value) if isinstance(value, int) else repr(float(value))
+
+
+def _histogram_lines(name: str, labels: str, histogram: LatencyHistogram) -> list[str]:
+    """Render the cumulative buckets, sum and count of one histogram series.
+
+    Returns:
+        list[str]: The sample lines.
+    """
+    lines = []
+    cumulative = 0
+    for bound, count in zip(histogram.bounds, histogram.counts, strict=False):  # Skips the overflow bucket
+        cumulative += count
+        lines.append(f'{name}_bucket{{{labels},le="{bound!r}"}} {cumulative}')
+    lines += [
+        f'{name}_bucket{{{labels},le="+Inf"}} {histogram.count}',
+        f"{name}_sum{{{labels}}} {histogram.total!r}",
+        f"{name}_count{{{labels}}} {histogram.count}",
+    ]
+    return lines
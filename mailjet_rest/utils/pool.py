@@ -0,0 +1,307 @@
+"""Connection pool sizing, idle keep-alive and process-wide pool sharing.
+
+Every :class:`~mailjet_rest.client.Client` used to mount its own 100-connection
+adapter, so a process running one client per sub-account kept one pool (and one
+set of TLS handshakes) per client. :class:`PoolConfig`, passed as ``Config(pool=...)``,
+sizes the pool, chooses whether a saturated pool blocks, closes connections that sat
+idle for too long (before a load balancer silently drops them), and can share one
+process-wide adapter between every client with equal pool settings. Inside a shared
+adapter, urllib3 keeps one pool per host and TLS settings, so clients talking to the
+same API host reuse each other's warm connections while credentials stay per client.
+"""
+
+from __future__ import annotations
+
+import os
+import ssl
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.poolmanager import PoolManager
+
+from mailjet_rest.utils.guardrails import SecureHTTPAdapter, _ResumingSSLContext
+from mailjet_rest.utils.instrumentation import CallStats, timed
+from mailjet_rest.utils.tracing import trace_attempt
+
+
+if sys.version_info >= (3, 12):
+    from typing import override
+else:
+    from typing_extensions import override
+
+
+if TYPE_CHECKING:
+    import socket
+    from collections.abc import Mapping
+
+    from urllib3._base_connection import BaseHTTPConnection
+    from urllib3.response import BaseHTTPResponse, HTTPResponse
+    from urllib3.util.retry import Retry
+
+
+__all__ = ["PoolConfig", "PooledHTTPAdapter", "WarmupReport", "get_adapter"]
+
+
+@dataclass(frozen=True, slots=True)
+class PoolConfig:
+    """Connection pool settings of a client.
+
+    'AsyncClient' applies 'maxsize' and 'idle_timeout' to its httpx pool; httpx pools are
+    bound to one event loop and always wait (up to the pool timeout) for a free
+    connection, so 'block' and 'shared' only affect 'Client'.
+
+    Attributes:
+        connections (int): Number of per-host pools to keep (requests' 'pool_connections').
+        maxsize (int): Connections kept open per host (requests' 'pool_maxsize').
+        block (bool): Wait for a free connection once 'maxsize' are busy, instead of opening
+            an extra connection that is discarded after use.
+        idle_timeout (float | None): Seconds a pooled connection may sit idle before it is
+            closed instead of reused. None keeps idle connections open indefinitely.
+        shared (bool): Share one process-wide pool between every client with equal pool settings.
+    """
+
+    connections: int = 100
+    maxsize: int = 100
+    block: bool = False
+    idle_timeout: float | None = None
+    shared: bool = False
+
+    def __post_init__(self) -> None:
+        """Validate the pool sizes and idle timeout."""
+        if self.connections <= 0 or self.maxsize <= 0:
+            msg = "PoolConfig connections and maxsize must be strictly positive."
+            raise ValueError(msg)
+        if self.idle_timeout is not None and not self.idle_timeout > 0:
+            msg = "PoolConfig idle_timeout must be a strictly positive number of seconds."
+            raise ValueError(msg)
+
+
+@dataclass(frozen=True, slots=True)
+class WarmupReport:
+    """Outcome of 'Client.warmup()' / 'AsyncClient.warmup()'.
+
+    Attributes:
+        connections (int): Connections to the API host left warm in the pool.
+        elapsed (float): Seconds the warmup took.
+    """
+
+    connections: int
+    elapsed: float
+
+
+class _TimedHTTPConnection(HTTPConnection):
+    """Connection reporting its TCP connect and response wait to the instrumented call, if any."""
+
+    @override
+    def _new_conn(self) -> socket.socket:
+        with timed("connect"):
+            return super()._new_conn()
+
+    @override
+    def getresponse(self) -> HTTPResponse:  # type: ignore[override]
+        stats = CallStats.current()
+        if stats is None:
+            return super().getresponse()
+        with stats.timed("server"):
+            response = super().getresponse()
+        stats.statuses.append(response.status)
+        return response
+
+
+class _TimedHTTPSConnection(_TimedHTTPConnection, HTTPSConnection):
+    """HTTPS flavour of :class:`_TimedHTTPConnection`, also reporting the TLS handshake and keeping TLS sessions."""
+
+    @override
+    def connect(self) -> None:
+        stats = CallStats.current()
+        if stats is None:
+            super().connect()
+            return
+        started = time.monotonic()
+        tcp_before = stats.phases.get("connect", 0.0)
+        super().connect()
+        tcp = stats.phases.get("connect", 0.0) - tcp_before
+        stats.add("tls", time.monotonic() - started - tcp)
+
+    @override
+    def close(self) -> None:
+        # TLS 1.3 tickets arrive after the handshake: hand the final session back for the next connection.
+        sock = self.sock
+        if isinstance(sock, ssl.SSLSocket) and isinstance(sock.context, _ResumingSSLContext):
+            sock.context.release(sock)
+        super().close()
+
+
+class _MailjetHTTPConnectionPool(HTTPConnectionPool):
+    """Connection pool closing connections idle for longer than 'idle_timeout', timing checkouts and tracing attempts."""
+
+    ConnectionCls = _TimedHTTPConnection
+    idle_timeout: float | None = None
+
+    @override
+    def _get_conn(self, timeout: float | None = None) -> BaseHTTPConnection:
+        stats = CallStats.current()
+        if stats is not None:
+            stats.attempts += 1  # urllib3 checks a connection out for every attempt
+            started = time.monotonic()
+        conn = super()._get_conn(timeout)
+        if stats is not None:
+            stats.add("pool_wait", time.monotonic() - started)
+        idle_since = getattr(conn, "mailjet_idle_since", None)
+        if (
+            idle_since is not None
+            and self.idle_timeout is not None
+            and time.monotonic() - idle_since > self.idle_timeout
+        ):
+            conn.close()  # urllib3 reconnects a closed connection on its next request
+        return conn
+
+    @override
+    def _make_request(
+        self,
+        conn: BaseHTTPConnection,
+        method: str,
+        url: str,
+        body: Any = None,
+        headers: Mapping[str, str] | None = None,
+        *args: Any,
+        **kwargs: Any,
+    ) -> BaseHTTPResponse:
+        # Called once per attempt, retries included
+        with trace_attempt(method, self.host, self.port) as attempt:
+            if attempt is None:
+                return super()._make_request(conn, method, url, body, headers, *args, **kwargs)
+            response = super()._make_request(
+                conn, method, url, body, {**(headers or {}), **attempt.context}, *args, **kwargs
+            )
+            attempt.record(response.status)
+            return response
+
+    @override
+    def _put_conn(self, conn: BaseHTTPConnection | None) -> None:
+        if conn is not None:
+            conn.mailjet_idle_since = time.monotonic()  # type: ignore[attr-defined]
+        super()._put_conn(conn)
+
+
+class _MailjetHTTPSConnectionPool(_MailjetHTTPConnectionPool, HTTPSConnectionPool):
+    """HTTPS flavour of :class:`_MailjetHTTPConnectionPool`."""
+
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class _MailjetPoolManager(PoolManager):
+    """Pool manager handing out pools that expire idle connections and report phase timings."""
+
+    def __init__(self, *args: Any, idle_timeout: float | None, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.idle_timeout = idle_timeout
+        self.pool_classes_by_scheme = {"http": _MailjetHTTPConnectionPool, "https": _MailjetHTTPSConnectionPool}
+
+    @override
+    def _new_pool(
+        self, scheme: str, host: str, port: int, request_context: dict[str, Any] | None = None
+    ) -> HTTPConnectionPool:
+        pool = super()._new_pool(scheme, host, port, request_context)
+        pool.idle_timeout = self.idle_timeout  # type: ignore[attr-defined]
+        return pool
+
+
+class PooledHTTPAdapter(SecureHTTPAdapter):
+    """TLS 1.2+ adapter sized by a :class:`PoolConfig`, optionally expiring idle connections.
+
+    Its pools report checkout, connect, TLS and server wait times to instrumentation hooks
+    (see :mod:`mailjet_rest.utils.instrumentation`) and trace every attempt (see
+    :mod:`mailjet_rest.utils.tracing`); connections through a proxy are neither timed nor traced.
+    """
+
+    __attrs__: ClassVar[list[str]] = [*SecureHTTPAdapter.__attrs__, "idle_timeout", "shared"]  # Kept when pickled
+
+    def __init__(self, pool: PoolConfig, max_retries: Retry | int = 0) -> None:
+        """Initialize the adapter.
+
+        Args:
+            pool (PoolConfig): The pool settings.
+            max_retries (Retry | int): The retry policy of every request sent through the adapter.
+        """
+        # Read by init_poolmanager, which the base initializer calls.
+        self.idle_timeout = pool.idle_timeout
+        self.shared = pool.shared
+        super().__init__(
+            pool_connections=pool.connections,
+            pool_maxsize=pool.maxsize,
+            max_retries=max_retries,
+            pool_block=pool.block,
+        )
+
+    def reset_after_fork(self) -> None:
+        """Replace every pool (and proxy pool) inherited by a forked child with empty ones.
+
+        The inherited connections are dropped without any TLS or TCP shutdown, so the parent
+        keeps using them undisturbed.
+        """
+        self.proxy_manager = {}
+        self.init_poolmanager(self._pool_connections, self._pool_maxsize, block=self._pool_block)
+
+    @override
+    def init_poolmanager(self, connections: int, maxsize: int, block: bool = False, **pool_kwargs: Any) -> None:
+        # Mirrors HTTPAdapter.init_poolmanager with the expiring, instrumented pool manager.
+        self._pool_connections = connections
+        self._pool_maxsize = maxsize
+        self._pool_block = block
+        self.poolmanager = _MailjetPoolManager(
+            num_pools=connections,
+            maxsize=maxsize,
+            block=block,
+            idle_timeout=self.idle_timeout,
+            ssl_context=self._get_secure_ssl_context(),
+            **pool_kwargs,
+        )
+
+
+class _SharedAdapters:
+    """Process-wide adapters handed out by :func:`get_adapter`, keyed by pool settings and retry policy."""
+
+    def __init__(self) -> None:
+        self.adapters: dict[tuple[PoolConfig, int], tuple[Retry | int, PooledHTTPAdapter]] = {}
+        self.lock = threading.Lock()
+
+    def reset_after_fork(self) -> None:
+        """Replace the lock and every shared pool inherited by a forked child."""
+        self.lock = threading.Lock()
+        for _, adapter in self.adapters.values():
+            adapter.reset_after_fork()
+
+
+_SHARED = _SharedAdapters()
+if hasattr(os, "register_at_fork"):  # pragma: no branch
+    os.register_at_fork(after_in_child=_SHARED.reset_after_fork)
+
+
+def get_adapter(pool: PoolConfig, max_retries: Retry | int = 0) -> PooledHTTPAdapter:
+    """Return a new adapter for the pool settings, or the process-wide one if 'pool.shared'.
+
+    Shared adapters are keyed by the pool settings and the retry policy, and are never
+    closed by 'Client.close()'.
+
+    Args:
+        pool (PoolConfig): The pool settings.
+        max_retries (Retry | int): The retry policy of the adapter.
+
+    Returns:
+        PooledHTTPAdapter: The adapter to mount on the session.
+    """
+    if not pool.shared:
+        return PooledHTTPAdapter(pool, max_retries)
+    key = (pool, id(max_retries))
+    with _SHARED.lock:
+        entry = _SHARED.adapters.get(key)
+        if entry is None:
+            # Holding the retry policy keeps its id from being reused by another object.
+            entry = _SHARED.adapters[key] = (max_retries, PooledHTTPAdapter(pool, max_retries))
+        return entry[1]
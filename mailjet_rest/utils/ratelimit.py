@@ -0,0 +1,500 @@
+"""Proactive client-side rate limiting per Mailjet endpoint group.
+
+``JitterRetry`` only reacts once Mailjet has already answered ``429 Too Many Requests``,
+so at high concurrency a large share of the request budget is spent on calls that were
+always going to be rejected. A :class:`RateLimiter` paces requests before they leave
+with one token bucket per endpoint group (``send``, ``rest``, ``statistics``) and pauses
+a group when Mailjet reports its budget exhausted, through ``Retry-After``,
+``X-RateLimit-Remaining``/``X-RateLimit-Reset`` or a bare ``429``.
+
+Bucket state lives in a pluggable :class:`RateLimitBackend`. The default
+:class:`MemoryBackend` only coordinates the threads of one process; :class:`FileLockBackend`
+and :class:`SQLiteBackend` let every worker process on a host (e.g. gunicorn or celery
+prefork pools) draw from one budget per API key. Any object implementing ``reserve`` and
+``pause`` atomically (e.g. a Redis Lua script) can be plugged in the same way.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, ClassVar, Protocol
+
+from mailjet_rest.routes import resource_of
+
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None  # type: ignore[assignment]
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Generator, Mapping
+
+    # Bucket update: receives the stored (tokens, updated) state and the current time, and
+    # returns the tokens to store together with the value handed back to the caller.
+    _Step = Callable[[tuple[float, float] | None, float], tuple[float, float]]
+
+
+__all__ = [
+    "FileLockBackend",
+    "MemoryBackend",
+    "RateLimit",
+    "RateLimitBackend",
+    "RateLimiter",
+    "SQLiteBackend",
+    "TokenBucket",
+]
+
+
+# 'X-RateLimit-Reset' values above this are absolute epoch timestamps rather than delays.
+_EPOCH_THRESHOLD = 1_000_000_000
+
+# Limiter and URL of the call running in this context, told about the attempts the retry policy replays.
+_OBSERVING: ContextVar[tuple[RateLimiter, str] | None] = ContextVar("mailjet_rate_limit_observer", default=None)
+
+
+@dataclass(slots=True, frozen=True)
+class RateLimit:
+    """Request budget of one endpoint group.
+
+    Attributes:
+        rate (float): Sustained requests per second.
+        burst (int): Requests that may leave back to back after an idle period.
+    """
+
+    rate: float
+    burst: int = 1
+
+    def __post_init__(self) -> None:
+        """Validate the budget."""
+        if self.rate <= 0 or self.burst < 1:
+            msg = "RateLimit requires a strictly positive rate and a burst of at least 1."
+            raise ValueError(msg)
+
+
+def _refilled(state: tuple[float, float] | None, now: float, rate: float, burst: int) -> float:
+    """Tokens available at 'now' in a bucket last stored as (tokens, updated), full if never stored.
+
+    Returns:
+        float: The refilled token count, capped at the bucket capacity.
+    """
+    if state is None:
+        return float(burst)
+    tokens, updated = state
+    return min(float(burst), tokens + max(0.0, now - updated) * rate)
+
+
+class RateLimitBackend(Protocol):
+    """Storage of token bucket state shared by every client that should draw from one budget.
+
+    Both operations must be atomic with respect to every other process using the same store.
+    Keys combine an account namespace and an endpoint group (e.g. '<digest>:send').
+    """
+
+    def reserve(self, key: str, rate: float, burst: int) -> float:
+        """Take one token from a bucket, borrowing against future refills when it is empty.
+
+        Returns:
+            float: Seconds the caller must wait before sending.
+        """
+        ...
+
+    def pause(self, key: str, seconds: float, rate: float, burst: int) -> None:
+        """Hold back every request not yet reserved from a bucket for at least 'seconds'."""
+        ...
+
+
+class TokenBucket:
+    """Thread-safe token bucket handing out reservations.
+
+    Callers reserve a token and then sleep for the returned delay outside the lock, so the
+    same bucket paces threads (``time.sleep``) and event loops (``asyncio.sleep``) alike.
+    """
+
+    __slots__ = ("_lock", "_tokens", "_updated", "burst", "rate")
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        """Initialize a full bucket.
+
+        Args:
+            rate (float): Tokens added per second.
+            burst (int): Bucket capacity.
+        """
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one token, borrowing against future refills when the bucket is empty.
+
+        Returns:
+            float: Seconds the caller must wait before sending.
+        """
+        with self._lock:
+            self._refill()
+            self._tokens -= 1
+            return max(0.0, -self._tokens / self.rate)
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every request not yet reserved for at least 'seconds'."""
+        with self._lock:
+            self._refill()
+            self._tokens = min(self._tokens, -seconds * self.rate)
+
+    def _refill(self) -> None:
+        """Credit the tokens accrued since the last update. The caller must hold the lock."""
+        now = time.monotonic()
+        self._tokens = _refilled((self._tokens, self._updated), now, self.rate, self.burst)
+        self._updated = now
+
+
+class MemoryBackend:
+    """In-process buckets: coordinates threads and tasks, but not separate processes."""
+
+    __slots__ = ("_buckets", "_lock")
+
+    def __init__(self) -> None:
+        """Initialize an empty bucket table."""
+        self._buckets: dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def reserve(self, key: str, rate: float, burst: int) -> float:
+        """Take one token from a bucket.
+
+        Returns:
+            float: Seconds the caller must wait before sending.
+        """
+        return self._bucket(key, rate, burst).reserve()
+
+    def pause(self, key: str, seconds: float, rate: float, burst: int) -> None:
+        """Hold back a bucket for at least 'seconds'."""
+        self._bucket(key, rate, burst).pause(seconds)
+
+    def reset_after_fork(self) -> None:
+        """Drop the buckets and lock inherited by a forked child, whose lock may be held forever."""
+        self._lock = threading.Lock()
+        self._buckets = {}
+
+    def _bucket(self, key: str, rate: float, burst: int) -> TokenBucket:
+        """Return the bucket of a key, creating it full on first use.
+
+        Returns:
+            TokenBucket: The bucket.
+        """
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = TokenBucket(rate, burst)
+            return bucket
+
+
+class _StoredBuckets(ABC):
+    """Bucket arithmetic over an external store whose '_update' runs a step atomically.
+
+    State is timestamped with the wall clock, which every process on a host shares. Stores
+    implement '_update'; a store that does not cannot be instantiated.
+    """
+
+    __slots__ = ()
+
+    def reserve(self, key: str, rate: float, burst: int) -> float:
+        """Take one token from a bucket.
+
+        Returns:
+            float: Seconds the caller must wait before sending.
+        """
+
+        def step(state: tuple[float, float] | None, now: float) -> tuple[float, float]:
+            tokens = _refilled(state, now, rate, burst) - 1
+            return tokens, max(0.0, -tokens / rate)
+
+        return self._update(key, step)
+
+    def pause(self, key: str, seconds: float, rate: float, burst: int) -> None:
+        """Hold back a bucket for at least 'seconds'."""
+
+        def step(state: tuple[float, float] | None, now: float) -> tuple[float, float]:
+            return min(_refilled(state, now, rate, burst), -seconds * rate), 0.0
+
+        self._update(key, step)
+
+    @abstractmethod
+    def _update(self, key: str, step: _Step) -> float:
+        """Apply 'step' to the stored state of a bucket atomically across processes.
+
+        Returns:
+            float: The step's result.
+        """
+
+
+class FileLockBackend(_StoredBuckets):
+    """Buckets kept in a JSON file guarded by an exclusive 'flock', shared by every process on a host.
+
+    POSIX only. The lock is taken per request and released when the file is closed, so a
+    crashed worker can never leave the budget locked.
+    """
+
+    __slots__ = ("path",)
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        """Initialize the backend.
+
+        Args:
+            path (str | os.PathLike[str]): The state file, created on first use with owner-only permissions.
+        """
+        if fcntl is None:  # pragma: no cover
+            msg = "FileLockBackend requires POSIX file locks (fcntl); use SQLiteBackend on this platform."
+            raise RuntimeError(msg)
+        self.path = Path(path)
+
+    def _update(self, key: str, step: _Step) -> float:
+        """Run a bucket step while holding the file lock.
+
+        Returns:
+            float: The step's result.
+        """
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        with os.fdopen(fd, "r+b") as handle:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+            try:
+                states = json.loads(handle.read() or b"{}")
+            except ValueError:
+                # A torn or foreign file only costs the current budget, never availability.
+                states = {}
+            now = time.time()
+            stored = states.get(key)
+            tokens, result = step(tuple(stored) if stored else None, now)
+            states[key] = [tokens, now]
+            handle.seek(0)
+            handle.truncate()
+            handle.write(json.dumps(states, separators=(",", ":")).encode("ascii"))
+            handle.flush()
+        return result
+
+
+class SQLiteBackend(_StoredBuckets):
+    """Buckets kept in an SQLite database, updated in 'BEGIN IMMEDIATE' transactions.
+
+    Works wherever SQLite file locking does (every process on a host, any platform).
+    Connections are opened lazily per thread and per process, so the backend survives forks.
+    """
+
+    __slots__ = ("_local", "path", "timeout")
+
+    def __init__(self, path: str | os.PathLike[str], timeout: float = 5.0) -> None:
+        """Initialize the backend.
+
+        Args:
+            path (str | os.PathLike[str]): The database file, created on first use.
+            timeout (float): Seconds to wait for another process to release the database lock.
+        """
+        self.path = Path(path)
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def __reduce__(self) -> tuple[type[SQLiteBackend], tuple[Path, float]]:
+        """Pickle the location only, so the backend can be handed to spawned worker processes.
+
+        Returns:
+            tuple[type[SQLiteBackend], tuple[Path, float]]: The constructor and its arguments.
+        """
+        return type(self), (self.path, self.timeout)
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return this thread's connection, reopening it in forked children.
+
+        Returns:
+            sqlite3.Connection: An autocommit connection with the bucket table created.
+        """
+        if getattr(self._local, "pid", None) != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS mailjet_rate_limits "
+                "(key TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL)"
+            )
+            self._local.connection, self._local.pid = connection, os.getpid()
+        return self._local.connection
+
+    def _update(self, key: str, step: _Step) -> float:
+        """Run a bucket step inside an exclusive write transaction.
+
+        Returns:
+            float: The step's result.
+        """
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            row = connection.execute("SELECT tokens, updated FROM mailjet_rate_limits WHERE key = ?", (key,)).fetchone()
+            now = time.time()
+            tokens, result = step(row, now)
+            connection.execute("INSERT OR REPLACE INTO mailjet_rate_limits VALUES (?, ?, ?)", (key, tokens, now))
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+        return result
+
+
+class RateLimiter:
+    """Per-client pacing of requests by endpoint group, shared by every thread and task.
+
+    Groups without a configured :class:`RateLimit` are not paced.
+
+    Example:
+        >>> limits = {"send": RateLimit(rate=50, burst=10), "statistics": RateLimit(rate=2)}
+        >>> client = Client(auth=(key, secret), config=Config(rate_limits=limits))
+    """
+
+    GROUPS: ClassVar[tuple[str, ...]] = ("send", "rest", "statistics")
+
+    # Pause applied on a 429 that carries no hint about when the budget refills.
+    DEFAULT_PENALTY: ClassVar[float] = 1.0
+
+    # Longest pause a server hint may impose; the headers are not trusted beyond it.
+    MAX_PAUSE: ClassVar[float] = 3600.0
+
+    __slots__ = ("_backend", "_limits", "namespace")
+
+    def __init__(
+        self,
+        limits: Mapping[str, RateLimit],
+        backend: RateLimitBackend | None = None,
+        namespace: str = "",
+    ) -> None:
+        """Initialize the limiter.
+
+        Args:
+            limits (Mapping[str, RateLimit]): Budgets keyed by group name ('send', 'rest' or 'statistics').
+            backend (RateLimitBackend | None): Where bucket state lives. Defaults to a private MemoryBackend.
+            namespace (str): Prefix of the bucket keys, so accounts sharing a backend get separate budgets.
+        """
+        unknown = set(limits) - set(self.GROUPS)
+        if unknown:
+            msg = f"Unknown rate limit group(s) {sorted(unknown)}. Expected any of: {', '.join(self.GROUPS)}."
+            raise ValueError(msg)
+        self._limits = dict(limits)
+        self._backend = MemoryBackend() if backend is None else backend
+        self.namespace = namespace
+
+    @staticmethod
+    def group_of(url: str) -> str:
+        """Classify a request URL into its endpoint group.
+
+        Returns:
+            str: 'send' for the Send API, 'statistics' for statistics resources, otherwise 'rest'.
+        """
+        resource = resource_of(url)
+        if resource == "send":
+            return "send"
+        if "statistics" in resource or resource == "statcounters":
+            return "statistics"
+        return "rest"
+
+    def reserve(self, url: str) -> float:
+        """Reserve a slot for a request.
+
+        Returns:
+            float: Seconds to wait before sending it.
+        """
+        group = self.group_of(url)
+        limit = self._limits.get(group)
+        if limit is None:
+            return 0.0
+        return self._backend.reserve(f"{self.namespace}:{group}", limit.rate, limit.burst)
+
+    def reset_after_fork(self) -> None:
+        """Reset in-process buckets inherited by a forked child.
+
+        Stored backends need nothing: file locks are taken per request and SQLite
+        connections are reopened per process.
+        """
+        if isinstance(self._backend, MemoryBackend):
+            self._backend.reset_after_fork()
+
+    def observe(self, url: str, status_code: int, headers: Mapping[str, str]) -> None:
+        """Learn from a response: pause the group when Mailjet reports its budget exhausted.
+
+        Args:
+            url (str): The request URL.
+            status_code (int): The response status.
+            headers (Mapping[str, str]): The response headers (case-insensitive mappings are expected).
+        """
+        group = self.group_of(url)
+        limit = self._limits.get(group)
+        if limit is None:
+            return
+        pause = self._pause_hint(headers)
+        if pause is None and status_code == 429:
+            pause = self.DEFAULT_PENALTY
+        if pause:
+            self._backend.pause(f"{self.namespace}:{group}", pause, limit.rate, limit.burst)
+
+    @contextmanager
+    def observing(self, url: str) -> Generator[None, None, None]:
+        """Publish the limiter to code running in this context, so retried attempts reach 'observe'.
+
+        Transports that retry below the client (urllib3 for 'Client') only hand back the final
+        response; their retry policy reports the attempts in between through 'observe_attempt'.
+
+        Yields:
+            None: While the call runs.
+        """
+        token = _OBSERVING.set((self, url))
+        try:
+            yield
+        finally:
+            _OBSERVING.reset(token)
+
+    @staticmethod
+    def observe_attempt(status_code: int, headers: Mapping[str, str]) -> None:
+        """Feed a retried attempt's response to the limiter of the call running in this context, if any."""
+        observing = _OBSERVING.get()
+        if observing is not None:
+            limiter, url = observing
+            limiter.observe(url, status_code, headers)
+
+    @staticmethod
+    def _pause_hint(headers: Mapping[str, str]) -> float | None:
+        """Read how long the API asked clients to hold back, if at all.
+
+        Non-finite hints ('inf', 'nan') are ignored and the others are capped at 'MAX_PAUSE',
+        so a server (or a proxy in front of it) can never stall the client indefinitely.
+
+        Returns:
+            float | None: The pause in seconds, or None if the headers carry no usable hint.
+        """
+        pause = RateLimiter._header_pause(headers)
+        if pause is None or not math.isfinite(pause):
+            return None
+        return min(max(0.0, pause), RateLimiter.MAX_PAUSE)
+
+    @staticmethod
+    def _header_pause(headers: Mapping[str, str]) -> float | None:
+        """Parse the pause requested by 'Retry-After' or an exhausted 'X-RateLimit-Reset', unbounded.
+
+        Returns:
+            float | None: The requested pause in seconds, or None if the headers carry no parsable hint.
+        """
+        try:
+            if "Retry-After" in headers:
+                return float(headers["Retry-After"])
+            if headers.get("X-RateLimit-Remaining") == "0" and "X-RateLimit-Reset" in headers:
+                reset = float(headers["X-RateLimit-Reset"])
+                return reset - time.time() if reset > _EPOCH_THRESHOLD else reset
+        except ValueError:
+            # HTTP-date or otherwise unparsable hints fall back to the default penalty.
+            return None
+        return None
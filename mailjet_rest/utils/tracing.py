@@ -0,0 +1,218 @@
+"""OpenTelemetry spans for every API call and every attempt, when OpenTelemetry is installed.
+
+Each ``api_call`` runs in a ``"<METHOD> <endpoint>"`` span (e.g. ``POST send``) carrying the
+``ROUTE_MAP`` endpoint name, the final status, the request and response body sizes, the
+number of messages sent and the payload's trace fields (``mailjet.customid``,
+``mailjet.templateid``...). Every attempt made by the retry policy is a child ``CLIENT`` span
+whose W3C trace context (``traceparent``) is injected into that attempt's request headers,
+so Mailjet-bound latency shows up in distributed traces across services.
+
+Spans go to the tracer provider configured by the application. Without ``opentelemetry-api``,
+or until the application sets a tracer provider, calls take the untraced path;
+``Config(tracing=False)`` opts out.
+"""
+
+from __future__ import annotations
+
+import importlib
+import importlib.util
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import cache
+from typing import TYPE_CHECKING, Any
+
+from mailjet_rest._version import __version__
+from mailjet_rest.routes import endpoint_of
+from mailjet_rest.utils.instrumentation import CallStats
+
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+    from opentelemetry.trace import Span, Tracer
+
+
+__all__ = ["TracedAttempt", "get_tracer", "recording_tracer", "trace_attempt", "trace_call"]
+
+
+# Tracer of the traced call running in this context; attempts are only traced inside one.
+_CURRENT: ContextVar[Tracer | None] = ContextVar("mailjet_call_tracer", default=None)
+
+
+@cache
+def get_tracer() -> Tracer | None:
+    """Return the SDK's OpenTelemetry tracer, or None when OpenTelemetry is not installed.
+
+    The tracer follows the application's global tracer provider, even one set later.
+
+    Returns:
+        Tracer | None: The tracer of the 'mailjet_rest' instrumentation scope.
+    """
+    if importlib.util.find_spec("opentelemetry") is None:
+        return None
+    trace, _ = _otel()
+    return trace.get_tracer("mailjet_rest", __version__)
+
+
+def recording_tracer(tracer: Tracer | None) -> Tracer | None:
+    """Return the tracer to trace a call with, or None when its spans would not be recorded.
+
+    The SDK's own tracer follows the global tracer provider. Until the application installs
+    one, that provider is OpenTelemetry's default proxy (or no-op) provider, whose spans are
+    never recorded, so calls keep the untraced path. Other tracers are always used.
+
+    Returns:
+        Tracer | None: The tracer, or None to skip tracing the call.
+    """
+    if tracer is None or tracer is not get_tracer():
+        return tracer
+    trace, _ = _otel()
+    provider = trace.get_tracer_provider()
+    return None if isinstance(provider, (trace.ProxyTracerProvider, trace.NoOpTracerProvider)) else tracer
+
+
+@cache
+def _otel() -> tuple[Any, Any]:
+    """Import the OpenTelemetry modules the spans need, once.
+
+    Returns:
+        tuple[Any, Any]: The 'opentelemetry.trace' and 'opentelemetry.propagate' modules.
+    """
+    return importlib.import_module("opentelemetry.trace"), importlib.import_module("opentelemetry.propagate")
+
+
+@dataclass(slots=True)
+class TracedAttempt:
+    """The span of one attempt and the header fields propagating its trace context.
+
+    Attributes:
+        span (Span): The attempt's 'CLIENT' span.
+        context (dict[str, str]): Header fields to add to the attempt's request: 'traceparent',
+            plus those of any other propagator the application configured (e.g. 'baggage').
+    """
+
+    span: Span
+    context: dict[str, str]
+
+    def record(self, status: int) -> None:
+        """Set the attempt's response status; 4xx and 5xx mark the span as failed."""
+        self.span.set_attribute("http.response.status_code", status)
+        if status >= 400:
+            _set_error(self.span, str(status))
+
+
+def trace_call(tracer: Tracer | None, stats: CallStats, data: Any) -> AbstractContextManager[None]:
+    """Run an instrumented call in a span, if there is a tracer.
+
+    Args:
+        tracer (Tracer | None): The client's tracer; None disables tracing.
+        stats (CallStats): The stats of the call, read when the span ends.
+        data (Any): The request payload, for its message count.
+
+    Returns:
+        AbstractContextManager[None]: The span's scope, or a no-op.
+    """
+    return nullcontext() if tracer is None else _call_span(tracer, stats, data)
+
+
+def trace_attempt(method: str, host: str | None, port: int | None) -> AbstractContextManager[TracedAttempt | None]:
+    """Run one attempt of the traced call running in this context in a child span, if any.
+
+    Args:
+        method (str): The HTTP method.
+        host (str | None): The server host.
+        port (int | None): The server port.
+
+    Returns:
+        AbstractContextManager[TracedAttempt | None]: The attempt's span and trace context headers,
+            or None when the call is not traced.
+    """
+    tracer = _CURRENT.get()
+    return nullcontext() if tracer is None else _attempt_span(tracer, method, host, port)
+
+
+@contextmanager
+def _call_span(tracer: Tracer, stats: CallStats, data: Any) -> Generator[None, None, None]:
+    """Span of a whole call; its attributes are completed from the stats when it ends.
+
+    Yields:
+        None: Control to the call.
+    """
+    route = endpoint_of(stats.url)
+    attributes: dict[str, Any] = {
+        "http.request.method": stats.method,
+        "url.full": stats.url,
+        "mailjet.route": route,
+        **stats.telemetry,
+    }
+    messages = _message_count(data)
+    if messages is not None:
+        attributes["mailjet.message_count"] = messages
+
+    with tracer.start_as_current_span(f"{stats.method} {route}", attributes=attributes) as span:
+        token = _CURRENT.set(tracer)
+        try:
+            yield
+        except BaseException as e:
+            span.set_attribute("error.type", type(e).__qualname__)  # Replaced by the status if one came back
+            raise
+        finally:
+            _CURRENT.reset(token)
+            if span.is_recording():
+                _record_outcome(span, stats)
+
+
+@contextmanager
+def _attempt_span(
+    tracer: Tracer, method: str, host: str | None, port: int | None
+) -> Generator[TracedAttempt, None, None]:
+    """Span of one attempt, made current so its trace context is the one propagated.
+
+    Yields:
+        TracedAttempt: The attempt's span and trace context headers.
+    """
+    trace, propagate = _otel()
+    attributes: dict[str, Any] = {"http.request.method": method}
+    if host is not None:
+        attributes["server.address"] = host
+    if port is not None:
+        attributes["server.port"] = port
+    stats = CallStats.current()
+    if stats is not None and stats.attempts > 1:
+        attributes["http.request.resend_count"] = stats.attempts - 1
+
+    with tracer.start_as_current_span(method, kind=trace.SpanKind.CLIENT, attributes=attributes) as span:
+        context: dict[str, str] = {}
+        propagate.inject(context)
+        yield TracedAttempt(span, context)
+
+
+def _record_outcome(span: Span, stats: CallStats) -> None:
+    """Complete a call span with the final status, body sizes and retries of the call."""
+    span.set_attribute("http.request.body.size", stats.bytes_out)
+    span.set_attribute("http.response.body.size", stats.bytes_in)
+    span.set_attribute("mailjet.attempts", stats.attempts)
+    span.set_attribute("mailjet.cached", stats.cached)
+    status = stats.final_status
+    if status is not None:
+        span.set_attribute("http.response.status_code", status)
+        if status >= 400:
+            _set_error(span, str(status))
+
+
+def _set_error(span: Span, error_type: str) -> None:
+    """Mark a span as failed with an 'error.type'."""
+    trace, _ = _otel()
+    span.set_attribute("error.type", error_type)
+    span.set_status(trace.Status(trace.StatusCode.ERROR))
+
+
+def _message_count(data: Any) -> int | None:
+    """Count the messages of a Send API payload.
+
+    Returns:
+        int | None: The number of messages, or None for payloads that do not send messages.
+    """
+    messages = data.get("Messages") if isinstance(data, dict) else data
+    return len(messages) if isinstance(messages, list) else None
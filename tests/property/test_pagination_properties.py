@@ -2,12 +2,14 @@
 Powered by Hypothesis.
 """
 
+import json
 from unittest.mock import MagicMock
 
 from hypothesis import given, settings, strategies as st
 
 from mailjet_rest.client import Client
 from mailjet_rest.endpoint import Endpoint
+from mailjet_rest.utils.codec import STDLIB_CODEC
 
 
 # Disable the 200ms deadline because simulating hundreds of paginated
@@ -26,6 +28,7 @@ def test_property_pagination_math(total_items: int, chunk_size: int) -> None:
     mock_client.config = MagicMock()
     mock_client.config.version = "v3"
     mock_client.config.api_url = "https://api.mailjet.com/"
+    mock_client.config.json_codec = STDLIB_CODEC
 
     endpoint = Endpoint(client=mock_client, name="contact")
 
@@ -43,7 +46,7 @@ def test_property_pagination_math(total_items: int, chunk_size: int) -> None:
         page_data = database[offset : offset + limit]
 
         mock_response = MagicMock()
-        mock_response.json.return_value = {"Data": page_data}
+        mock_response.content = json.dumps({"Data": page_data}).encode()
         return mock_response
 
     mock_client.api_call.side_effect = mock_api_call
@@ -2,6 +2,8 @@
 Powered by Hypothesis.
 """
 
+import hashlib
+import json
 from pathlib import Path
 from typing import Any
 from urllib.parse import urlparse
@@ -103,6 +105,59 @@ def test_property_idempotency_fingerprint_lists(base_payload: Any) -> None:
         pass
 
 
+_json_scalars = st.one_of(
+    st.none(), st.booleans(), st.integers(), st.floats(allow_nan=True, allow_infinity=True), st.text()
+)
+_json_trees = st.recursive(
+    _json_scalars,
+    lambda children: st.one_of(
+        st.lists(children, max_size=5),
+        st.tuples(children, children),
+        st.dictionaries(st.sampled_from(["CustomID", "SandboxMode", "a", "b", "Ω"]) | st.text(), children, max_size=5),
+    ),
+    max_leaves=40,
+)
+
+
+@settings(max_examples=300)
+@given(payload=st.dictionaries(st.text(), _json_trees, max_size=5))
+def test_property_idempotency_fingerprint_canonical_json(payload: dict[str, Any]) -> None:
+    """INVARIANT: The streaming fingerprint is the SHA-256 of the stripped json.dumps(sort_keys=True) form,
+    so Idempotency-Keys never change across SDK versions.
+    """
+
+    def strip(data: Any) -> Any:
+        if isinstance(data, dict):
+            return {k: strip(v) for k, v in data.items() if k not in SecurityGuard.VOLATILE_IDEMPOTENCY_KEYS}
+        if isinstance(data, (list, tuple)):
+            return [strip(item) for item in data]
+        return data
+
+    expected = json.dumps(strip(payload), sort_keys=True, default=str)
+    assert SecurityGuard.generate_payload_fingerprint(payload) == hashlib.sha256(expected.encode()).hexdigest()
+
+
+@settings(max_examples=300)
+@given(payload=st.dictionaries(st.text(), _json_trees, max_size=5))
+def test_property_serialized_body_matches_fingerprint(payload: dict[str, Any]) -> None:
+    """INVARIANT: The single-pass wire body is valid JSON for the full payload, and its fingerprint
+    equals the standalone one, whenever the standard encoder could serialize the payload at all.
+    """
+    try:
+        expected_body = json.dumps(payload, sort_keys=True, allow_nan=False).encode()
+    except ValueError:
+        expected_body = None
+
+    try:
+        body, fingerprint = SecurityGuard.serialize_payload(payload)
+    except ValueError:
+        assert expected_body is None
+        return
+
+    assert body == expected_body
+    assert fingerprint == SecurityGuard.generate_payload_fingerprint(payload)
+
+
 @settings(max_examples=100)
 @given(payload=st.text(min_size=1, max_size=6 * 1024 * 1024))
 def test_property_html_size_limits(payload: str) -> None:
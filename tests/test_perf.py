@@ -1,15 +1,30 @@
 """Performance and throughput benchmark tests for the Mailjet SDK."""
 
+import hashlib
+import io
+import json
+import logging
+import os
+import shutil
+import ssl
+import subprocess
+import threading
+import time
 import tracemalloc
 from collections.abc import Generator
 from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from typing import Any
 
 import pytest
 import requests
 import responses
 
-from mailjet_rest.client import Client
+from mailjet_rest.client import Client, Config
+from mailjet_rest.utils import guardrails
+from mailjet_rest.utils.cache import ResponseCache
+from mailjet_rest.utils.guardrails import SecureHTTPAdapter
+from mailjet_rest.utils.metrics import MetricsRegistry
 
 # Graceful import fallback for Differential Benchmarking against older tags (v1.7.0)
 try:
@@ -73,6 +88,17 @@ def test_request_cycle_performance(benchmark: Any, mocked_mailjet: responses.Req
     benchmark.pedantic(send_request, rounds=50, iterations=10)
 
 
+def test_request_cycle_performance_trusted_fast_path(benchmark: Any, mocked_mailjet: responses.RequestsMock) -> None:
+    """Same cycle with Config(trusted_fast_path=True): no per-request environment proxy scan."""
+    client = Client(auth=("api", "key"), config=Config(trusted_fast_path=True))
+    payload = {"Email": "perf@example.com", "Name": "Benchmark User"}
+
+    def send_request() -> Any:
+        return client.contact.create(data=payload)
+
+    benchmark.pedantic(send_request, rounds=50, iterations=10)
+
+
 # ------------------------------------------------------------------------
 # BENCHMARK 3: FLUENT BUILDERS (v1.8.0+)
 # ------------------------------------------------------------------------
@@ -112,6 +138,310 @@ def test_idempotency_fingerprint_performance(benchmark: Any) -> None:
     benchmark(generate_hash)
 
 
+def _legacy_payload_fingerprint(payload: Any) -> str:
+    """Reference copy of the pre-1.9 fingerprint (stripped deep copy + json.dumps).
+
+    Kept here so the streaming encoder can be benchmarked and diffed against it.
+    """
+
+    def _deep_strip(data: Any, depth: int = 0, seen: set[int] | None = None) -> Any:
+        if seen is None:
+            seen = set()
+        if id(data) in seen:
+            return "[Circular]"
+        if depth > 50:
+            msg = "Security Violation: Payload exceeds maximum safe nesting depth."
+            raise ValueError(msg)
+        if isinstance(data, dict):
+            seen.add(id(data))
+            return {
+                k: _deep_strip(v, depth + 1, seen.copy())
+                for k, v in data.items()
+                if k not in SecurityGuard.VOLATILE_IDEMPOTENCY_KEYS
+            }
+        if isinstance(data, (list, tuple, set)):
+            seen.add(id(data))
+            return [_deep_strip(item, depth + 1, seen.copy()) for item in data]
+        return data
+
+    serialized = json.dumps(_deep_strip(payload), sort_keys=True, default=str)
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+def _large_send_batch() -> dict[str, Any]:
+    """A 50-message Send API v3.1 batch with large, nested Variables."""
+    return {
+        "Messages": [
+            {
+                "From": {"Email": "shop@example.com", "Name": "Shop"},
+                "To": [{"Email": f"user_{i}@example.com", "Name": f"Ûser {i}"}],
+                "CustomID": f"order-{i}",
+                "Subject": "Your order",
+                "HTMLPart": "<p>Merci pour votre commande</p>" * 200,
+                "Variables": {
+                    **{f"field_{j}": f"value {j}" for j in range(100)},
+                    "items": [
+                        {"sku": f"SKU-{k}", "qty": k, "price": k * 1.25, "tags": ["new", "sale"]} for k in range(40)
+                    ],
+                },
+            }
+            for i in range(50)
+        ],
+        "SandboxMode": False,
+    }
+
+
+@pytest.mark.skipif(not MODERN_SDK_AVAILABLE, reason="Guardrails not available in this tag")
+def test_idempotency_fingerprint_large_batch_legacy(benchmark: Any) -> None:
+    """Baseline: stripped deep copy, per-node seen.copy() and a full json.dumps string."""
+    payload = _large_send_batch()
+    benchmark(_legacy_payload_fingerprint, payload)
+
+
+@pytest.mark.skipif(not MODERN_SDK_AVAILABLE, reason="Guardrails not available in this tag")
+def test_idempotency_fingerprint_large_batch_streaming(benchmark: Any) -> None:
+    """Single-pass canonical encoder feeding SHA-256 incrementally."""
+    assert SecurityGuard is not None
+    payload = _large_send_batch()
+    benchmark(SecurityGuard.generate_payload_fingerprint, payload)
+
+
+@pytest.mark.skipif(not MODERN_SDK_AVAILABLE, reason="Guardrails not available in this tag")
+def test_idempotency_fingerprint_streaming_peak_memory() -> None:
+    """The streaming encoder never materializes the stripped copy or the full JSON string."""
+    assert SecurityGuard is not None
+    payload = _large_send_batch()
+
+    peaks = []
+    for fingerprint in (_legacy_payload_fingerprint, SecurityGuard.generate_payload_fingerprint):
+        tracemalloc.start()
+        fingerprint(payload)
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+
+    legacy_peak, streaming_peak = peaks
+    print(f"\nFingerprint peak memory: legacy {legacy_peak / 1024:.0f} KB, streaming {streaming_peak / 1024:.0f} KB")
+    assert streaming_peak * 4 < legacy_peak
+
+
+@pytest.mark.skipif(not MODERN_SDK_AVAILABLE, reason="Guardrails not available in this tag")
+def test_idempotency_fingerprint_streaming_matches_legacy() -> None:
+    """The streaming encoder must not change any existing Idempotency-Key."""
+    assert SecurityGuard is not None
+    cyclic: dict[str, Any] = {"Name": "loop"}
+    cyclic["Self"] = [cyclic, cyclic]
+    payloads: list[Any] = [
+        _large_send_batch(),
+        {"Messages": [{"Variables": {"n": float("nan"), "inf": float("inf"), "f": 0.1, "big": 10**30}}]},
+        {1: "int key", 2.5: "float key"},
+        {"Tags": {"b", "a"}, "Pair": (1, "é"), "Raw": b"bytes", "Nested": [[{"CustomID": "x"}]]},
+        cyclic,
+        [],
+    ]
+    for payload in payloads:
+        assert SecurityGuard.generate_payload_fingerprint(payload) == _legacy_payload_fingerprint(payload)
+
+
+def _legacy_body_and_fingerprint(payload: Any) -> tuple[bytes, str]:
+    """Pre-1.9 mutation path: fingerprint pass, then a second serialization by requests' json=."""
+    fingerprint = SecurityGuard.generate_payload_fingerprint(payload)
+    return json.dumps(payload, allow_nan=False).encode("utf-8"), fingerprint
+
+
+@pytest.mark.skipif(not MODERN_SDK_AVAILABLE, reason="Guardrails not available in this tag")
+def test_request_body_encoding_legacy(benchmark: Any) -> None:
+    """Baseline: fingerprint and wire body computed by two independent serialization passes."""
+    payload = _large_send_batch()
+    benchmark(_legacy_body_and_fingerprint, payload)
+
+
+@pytest.mark.skipif(not MODERN_SDK_AVAILABLE, reason="Guardrails not available in this tag")
+def test_request_body_encoding_single_pass(benchmark: Any) -> None:
+    """Body bytes and Idempotency-Key derived from one serialization pass."""
+    assert SecurityGuard is not None
+    payload = _large_send_batch()
+    body, fingerprint = benchmark(SecurityGuard.serialize_payload, payload)
+    assert json.loads(body) == payload
+    assert fingerprint == SecurityGuard.generate_payload_fingerprint(payload)
+
+
+# ------------------------------------------------------------------------
+# BENCHMARK 4b: PLUGGABLE JSON CODECS
+# ------------------------------------------------------------------------
+
+def _codec_or_skip(name: str) -> Any:
+    """Resolve a codec, skipping the benchmark when its library is not installed."""
+    try:
+        from mailjet_rest.utils.codec import get_codec
+    except ImportError:
+        pytest.skip("Pluggable codecs not available in this tag")
+    if name != "json":
+        pytest.importorskip(name)
+    return get_codec(name)
+
+
+@pytest.mark.parametrize("codec_name", ["json", "orjson"])
+def test_stream_page_decoding_performance(benchmark: Any, codec_name: str) -> None:
+    """Measure stream() over 1000-row pages with each JSON codec."""
+    codec = _codec_or_skip(codec_name)
+    rows = [
+        {
+            "ID": i,
+            "Email": f"user_{i}@example.com",
+            "Name": f"User {i}",
+            "IsExcludedFromCampaigns": False,
+            "CreatedAt": "2026-01-01T00:00:00Z",
+            "DeliveredCount": i % 7,
+        }
+        for i in range(1000)
+    ]
+    full_page = json.dumps({"Count": 1000, "Data": rows, "Total": 3000}).encode()
+    last_page = json.dumps({"Count": 0, "Data": [], "Total": 3000}).encode()
+
+    def page(request: Any) -> tuple[int, dict[str, str], bytes]:
+        return 200, {"Content-Type": "application/json"}, last_page if "Offset=3000" in request.url else full_page
+
+    client = Client(auth=("api", "key"), config=Config(json_codec=codec))
+    with responses.RequestsMock() as rsps:
+        rsps.add_callback(responses.GET, "https://api.mailjet.com/v3/REST/contact", callback=page)
+        count = benchmark(lambda: sum(1 for _ in client.contact.stream(chunk_size=1000)))
+    assert count == 3000
+
+
+@pytest.mark.parametrize("codec_name", ["json", "orjson"])
+def test_bulk_send_codec_performance(benchmark: Any, codec_name: str) -> None:
+    """Measure a 50-message Send API v3.1 call (builders, encoding, result decoding) with each codec."""
+    codec = _codec_or_skip(codec_name)
+    from mailjet_rest.batch import BatchSender
+
+    results = {"Messages": [{"Status": "success", "To": [{"MessageID": i}]} for i in range(50)]}
+
+    def build_messages() -> list[Any]:
+        assert MessageBuilder is not None
+        return [
+            MessageBuilder()
+            .set_sender("shop@example.com", "Shop")
+            .add_recipient(f"user_{i}@example.com")
+            .set_content(text="Hello", html="<p>Hello</p>")
+            .set_variables({f"field_{j}": f"value {j}" for j in range(200)})
+            for i in range(50)
+        ]
+
+    client = Client(auth=("api", "key"), config=Config(version="v3.1", json_codec=codec))
+    sender = BatchSender(client)
+    with responses.RequestsMock() as rsps:
+        rsps.add(responses.POST, "https://api.mailjet.com/v3.1/send", json=results)
+        sent = benchmark(lambda: sender.send(build_messages()))
+    assert len(sent) == 50
+    assert all(result.ok for result in sent)
+
+
+def _wide_page_session(client: Client) -> bytes:
+    """Serve a single wide 'contactdata' page from memory through a streamed body."""
+    rows = [
+        {"ID": i, "ContactID": i, "Data": [{"Name": f"field_{j}", "Value": "x" * 40} for j in range(20)]}
+        for i in range(1000)
+    ]
+    body = json.dumps({"Count": 1000, "Data": rows, "Total": 1000}).encode()
+
+    def request(**kwargs: Any) -> requests.Response:
+        resp = requests.Response()
+        resp.status_code = 200
+        resp.raw = io.BytesIO(body)
+        return resp
+
+    client.session.request = request  # type: ignore[method-assign]
+    return body
+
+
+@pytest.mark.parametrize("incremental", [False, True])
+def test_stream_incremental_parsing_performance(benchmark: Any, incremental: bool) -> None:
+    """Measure stream() over a ~1.5MB page, parsed whole or incrementally."""
+    client = Client(auth=("api", "key"))
+    _wide_page_session(client)
+
+    count = benchmark(lambda: sum(1 for _ in client.contactdata.stream(chunk_size=2000, incremental=incremental)))
+    assert count == 1000
+
+
+def test_stream_incremental_parsing_peak_memory() -> None:
+    """Incremental parsing must bound memory by one network chunk plus one object, not one page."""
+    client = Client(auth=("api", "key"))
+    body = _wide_page_session(client)
+
+    def peak(incremental: bool) -> int:
+        tracemalloc.start()
+        for _ in client.contactdata.stream(chunk_size=2000, incremental=incremental):
+            pass
+        _, peak_bytes = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return peak_bytes
+
+    page_peak, incremental_peak = peak(False), peak(True)
+    assert page_peak > len(body)
+    assert incremental_peak * 4 < page_peak
+
+
+@pytest.mark.parametrize("prefetch", [0, 8])
+def test_stream_prefetch_performance(benchmark: Any, prefetch: int) -> None:
+    """Measure stream() over 20 pages served with 20ms of simulated network latency each."""
+    total, chunk = 2000, 100
+
+    def page(request: Any) -> tuple[int, dict[str, str], str]:
+        params = request.params
+        if params.get("countOnly"):
+            return 200, {}, json.dumps({"Count": total, "Data": [], "Total": total})
+        time.sleep(0.02)
+        offset = int(params["Offset"])
+        rows = [{"ID": i} for i in range(offset, min(offset + chunk, total))]
+        return 200, {}, json.dumps({"Count": len(rows), "Data": rows})
+
+    client = Client(auth=("api", "key"))
+    with responses.RequestsMock() as rsps:
+        rsps.add_callback(responses.GET, "https://api.mailjet.com/v3/REST/contact", callback=page)
+        count = benchmark.pedantic(
+            lambda: sum(1 for _ in client.contact.stream(chunk_size=chunk, prefetch=prefetch)), rounds=3
+        )
+    assert count == total
+
+
+@pytest.mark.parametrize("cached", [False, True])
+def test_reference_lookup_cache_performance(benchmark: Any, cached: bool) -> None:
+    """Measure repeated template lookups with 5ms of simulated latency, with and without a response cache."""
+
+    def template(_request: Any) -> tuple[int, dict[str, str], str]:
+        time.sleep(0.005)
+        return 200, {"ETag": '"v1"'}, json.dumps({"Count": 1, "Data": [{"ID": 7, "Name": "Welcome"}]})
+
+    client = Client(auth=("api", "key"), config=Config(response_cache=ResponseCache() if cached else None))
+    with responses.RequestsMock() as rsps:
+        rsps.add_callback(responses.GET, "https://api.mailjet.com/v3/REST/template/7", callback=template)
+        benchmark.pedantic(lambda: client.template.get(id=7).json(), rounds=20, iterations=5)
+        if cached:
+            assert len(rsps.calls) == 1
+
+
+@pytest.mark.parametrize("coalesce", [False, True])
+def test_cold_start_burst_coalescing_performance(benchmark: Any, coalesce: bool) -> None:
+    """Measure 32 workers reading the same template at once, with 20ms of simulated latency per request."""
+    workers = 32
+
+    def template(_request: Any) -> tuple[int, dict[str, str], str]:
+        time.sleep(0.02)
+        return 200, {}, json.dumps({"Count": 1, "Data": [{"ID": 7}]})
+
+    def burst() -> None:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(lambda _: client.template.get(id=7), range(workers)))
+
+    client = Client(auth=("api", "key"), config=Config(coalesce_requests=coalesce))
+    with responses.RequestsMock() as rsps:
+        rsps.add_callback(responses.GET, "https://api.mailjet.com/v3/REST/template/7", callback=template)
+        benchmark.pedantic(burst, rounds=5)
+        if coalesce:
+            assert len(rsps.calls) < 5 * workers
+
+
 # ------------------------------------------------------------------------
 # BENCHMARK 5: SYNCHRONOUS CONNECTION POOLING (THREADING)
 # ------------------------------------------------------------------------
@@ -132,6 +462,113 @@ def test_sync_client_concurrent_throughput(benchmark: Any, mocked_mailjet: respo
     with Client(auth=("api", "key")) as client:
         benchmark.pedantic(dispatch_batch, rounds=10, iterations=5)
 
+
+@pytest.mark.parametrize("cached_context", [False, True])
+def test_client_construction_performance(
+    benchmark: Any, monkeypatch: pytest.MonkeyPatch, cached_context: bool
+) -> None:
+    """Measure Client construction, with the hardened SSLContext cached per process or rebuilt each time."""
+    if not cached_context:
+        monkeypatch.setattr(
+            SecureHTTPAdapter, "_get_secure_ssl_context", staticmethod(SecureHTTPAdapter._new_secure_ssl_context)
+        )
+    benchmark(lambda: Client(auth=("api", "key")).close())
+
+
+@pytest.fixture
+def local_tls_api(tmp_path: Any, monkeypatch: pytest.MonkeyPatch) -> Generator[tuple[str, Any], None, None]:
+    """Serve the API over TLS on localhost, trusted by a private process-wide client SSLContext."""
+    if shutil.which("openssl") is None:
+        pytest.skip("needs the openssl CLI to issue a test certificate")
+    for name in ("REQUESTS_CA_BUNDLE", "CURL_CA_BUNDLE"):
+        monkeypatch.delenv(name, raising=False)  # Verify against requests' default bundle
+    cert, key = tmp_path / "cert.pem", tmp_path / "key.pem"
+    args = "req -x509 -newkey rsa:2048 -nodes -days 1 -subj /CN=localhost -addext subjectAltName=DNS:localhost"
+    subprocess.run(["openssl", *args.split(), "-keyout", str(key), "-out", str(cert)], check=True, capture_output=True)
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def do_GET(self) -> None:
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", "2")
+            self.end_headers()
+            self.wfile.write(b"[]")
+
+        def log_message(self, *args: Any) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    server_context.load_cert_chain(cert, key)
+    server.socket = server_context.wrap_socket(server.socket, server_side=True)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    context = SecureHTTPAdapter._new_secure_ssl_context()
+    context.load_verify_locations(cert)
+    monkeypatch.setitem(guardrails._SSL_CONTEXTS, (os.getpid(), None), context)
+    yield f"https://localhost:{server.server_port}/", context
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.parametrize("resume", [False, True])
+def test_tls_reconnect_performance(benchmark: Any, local_tls_api: tuple[str, Any], resume: bool) -> None:
+    """Measure a request on a fresh connection, with and without TLS session resumption."""
+    api_url, context = local_tls_api
+    client = Client(auth=("api", "key"), api_url=api_url)
+    client.contact.get()
+
+    def reconnect() -> None:
+        client.session.adapters["https://"].poolmanager.clear()  # Drop the pooled connection
+        if not resume:
+            context.sessions.clear()
+            context._latest.clear()
+        client.contact.get()
+
+    benchmark.pedantic(reconnect, rounds=30, iterations=1)
+    client.close()
+
+@pytest.mark.parametrize("debug", [False, True])
+def test_api_call_logging_overhead(
+    benchmark: Any, mocked_mailjet: responses.RequestsMock, monkeypatch: pytest.MonkeyPatch, debug: bool
+) -> None:
+    """Measure one api_call with the SDK logger at WARNING, or at DEBUG writing every record through a handler."""
+    logger = logging.getLogger("mailjet_rest.client")
+    stream = io.StringIO()
+    handler = logging.StreamHandler(stream)
+    monkeypatch.setattr(logger, "level", logging.DEBUG if debug else logging.WARNING)
+    monkeypatch.setattr(logger, "propagate", False)
+    monkeypatch.setattr(logger, "handlers", [handler])
+    logger.manager._clear_cache()
+
+    client = Client(auth=("api", "key"))
+    payload = {"Email": "perf@example.com", "Name": "Benchmark User", "CustomID": "order-42"}
+    benchmark.pedantic(lambda: client.contact.create(data=payload), rounds=50, iterations=10)
+
+    logger.manager._clear_cache()
+    assert ("API Success 201" in stream.getvalue()) is debug
+
+@pytest.mark.parametrize("hooked", [False, True])
+def test_instrumentation_hook_overhead(benchmark: Any, mocked_mailjet: responses.RequestsMock, hooked: bool) -> None:
+    """Measure one api_call without instrumentation hooks, and with a hook collecting every CallStats."""
+    seen: list[Any] = []
+    client = Client(auth=("api", "key"), config=Config(hooks=[seen.append] if hooked else ()))
+    payload = {"Email": "perf@example.com", "Name": "Benchmark User", "CustomID": "order-42"}
+    benchmark.pedantic(lambda: client.contact.create(data=payload), rounds=50, iterations=10)
+    assert bool(seen) is hooked
+
+def test_metrics_registry_overhead(benchmark: Any, mocked_mailjet: responses.RequestsMock) -> None:
+    """Measure one api_call feeding a MetricsRegistry (compare with the hooked instrumentation benchmark)."""
+    metrics = MetricsRegistry()
+    client = Client(auth=("api", "key"), config=Config(metrics=metrics))
+    payload = {"Email": "perf@example.com", "Name": "Benchmark User", "CustomID": "order-42"}
+    benchmark.pedantic(lambda: client.contact.create(data=payload), rounds=50, iterations=10)
+    assert metrics.snapshot()[("contact", "POST")].requests > 0
+
 # ------------------------------------------------------------------------
 # BENCHMARK 6: MEMORY FOOTPRINT & LEAK PREVENTION (__slots__)
 # ------------------------------------------------------------------------
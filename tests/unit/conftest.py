@@ -0,0 +1,71 @@
+"""Shared fixtures of the unit tests: a local HTTP server and clients sending to it."""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable, Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+import pytest
+
+from mailjet_rest.client import Client
+
+
+class _ScriptedHandler(BaseHTTPRequestHandler):
+    """Answers with the next scripted (status, headers) pair, then with 'status', and a small JSON body."""
+
+    protocol_version = "HTTP/1.1"
+    script: list[tuple[int, dict[str, str]]] = []
+    status = 200
+    received = 0
+
+    def do_GET(self) -> None:
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        type(self).received += 1
+        status, headers = self.script.pop(0) if self.script else (self.status, {})
+        body = b'{"Count": 0}' if status < 400 else b'{"ErrorMessage": "Scripted failure"}'
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_POST = do_GET
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+
+@pytest.fixture
+def handler() -> type[BaseHTTPRequestHandler]:
+    """Default handler of 'server', fresh per test: set its 'script' or 'status' to shape the answers."""
+    return type("Scripted", (_ScriptedHandler,), {"script": []})
+
+
+@pytest.fixture
+def server(handler: type[BaseHTTPRequestHandler]) -> Iterator[ThreadingHTTPServer]:
+    """Serve the 'handler' fixture (a module's own, or the scripted default) on a free local port."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    server.daemon_threads = True
+    server.block_on_close = False
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def local_client(server: ThreadingHTTPServer) -> Callable[..., Client]:
+    """Build clients sending to the local server; keyword arguments are passed on as 'Config' fields."""
+
+    def build(**config: Any) -> Client:
+        config.setdefault("api_url", f"http://127.0.0.1:{server.server_port}/")
+        client = Client(auth=("pub", "priv"), **config)
+        # Route plain HTTP through the pooled adapter, so retries, pooling and timings apply as over TLS.
+        client.session.mount("http://", client.session.adapters["https://"])
+        return client
+
+    return build
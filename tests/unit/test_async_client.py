@@ -0,0 +1,491 @@
+"""Unit tests for the asyncio Mailjet client."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from mailjet_rest import AsyncClient
+from mailjet_rest.client import Client, JitterRetry
+from mailjet_rest.async_client import AsyncEndpoint
+from mailjet_rest.errors import (
+    ApiError,
+    ApiRateLimitError,
+    CriticalApiError,
+    DoesNotExistError,
+    MailjetApiError,
+    MailjetAuthError,
+    TimeoutError,
+    ValidationError,
+)
+from mailjet_rest.pagination import StreamCursor
+from mailjet_rest.utils.cache import ResponseCache
+from mailjet_rest.utils.concurrency import AdaptiveConcurrencyLimiter
+from mailjet_rest.utils.ratelimit import RateLimit
+from mailjet_rest.utils.guardrails import SecurityGuard
+
+
+Handler = Callable[[Any], Any]
+_REAL_SLEEP = asyncio.sleep
+
+
+def _client(handler: Handler, **kwargs: Any) -> AsyncClient:
+    """Build an AsyncClient whose pool is served by an in-memory transport."""
+    client = AsyncClient(auth=kwargs.pop("auth", ("pub", "priv")), **kwargs)
+    client.session._transport = httpx.MockTransport(handler)
+    return client
+
+
+@pytest.fixture(autouse=True)
+def no_backoff_sleep(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Skip JitterRetry sleeps so retry tests run instantly."""
+
+    async def _instant(_delay: float) -> None:
+        return None
+
+    monkeypatch.setattr("mailjet_rest.async_client.asyncio.sleep", _instant)
+
+
+def test_async_endpoints_resolve_from_route_map() -> None:
+    client = AsyncClient(auth=("pub", "priv"), version="v3.1")
+    assert isinstance(client.send, AsyncEndpoint)
+    assert client.send is client.send
+    assert client.send._build_url() == "https://api.mailjet.com/v3.1/send"
+    assert client.contactslist_managecontact._build_url(id_val=7) == (
+        "https://api.mailjet.com/v3.1/REST/contactslist/7/managecontact"
+    )
+    assert "AsyncClient" in repr(client)
+
+
+def test_async_create_sends_json_with_idempotency_key() -> None:
+    seen: dict[str, Any] = {}
+    payload = {"Messages": [{"To": [{"Email": "a@example.com"}], "CustomID": "c-1"}]}
+
+    def handler(request: Any) -> Any:
+        seen["request"] = request
+        return httpx.Response(200, json={"Messages": [{"Status": "success"}]})
+
+    async def run() -> Any:
+        async with _client(handler, version="v3.1") as client:
+            return await client.send.create(data=payload)
+
+    response = asyncio.run(run())
+    request = seen["request"]
+
+    assert response.json()["Messages"][0]["Status"] == "success"
+    assert request.method == "POST"
+    assert str(request.url) == "https://api.mailjet.com/v3.1/send"
+    assert json.loads(request.content) == payload
+    assert request.headers["Idempotency-Key"] == SecurityGuard.generate_payload_fingerprint(payload)
+    assert request.headers["Authorization"].startswith("Basic ")
+    assert "mailjet-apiv3-python" in request.headers["User-Agent"]
+
+
+def test_async_bearer_token_and_filters() -> None:
+    seen: dict[str, Any] = {}
+
+    def handler(request: Any) -> Any:
+        seen["request"] = request
+        return httpx.Response(200, json={"Data": []})
+
+    async def run() -> None:
+        async with _client(handler, auth="token-123", version="v1") as client:
+            await client.templates.get(filters={"Limit": 5, "Skip": None})
+
+    asyncio.run(run())
+    request = seen["request"]
+    assert request.headers["Authorization"] == "Bearer token-123"
+    assert dict(request.url.params) == {"Limit": "5"}
+
+
+def test_async_update_and_delete_methods() -> None:
+    methods: list[tuple[str, str]] = []
+
+    def handler(request: Any) -> Any:
+        methods.append((request.method, request.url.path))
+        return httpx.Response(204 if request.method == "DELETE" else 200, json={})
+
+    async def run() -> None:
+        async with _client(handler) as client:
+            await client.contact.update(id=42, data={"Name": "New"})
+            await client.contact.delete(id=42)
+
+    asyncio.run(run())
+    assert methods == [("PUT", "/v3/REST/contact/42"), ("DELETE", "/v3/REST/contact/42")]
+
+
+@pytest.mark.parametrize(
+    ("status", "exc_class"),
+    [(400, ValidationError), (401, MailjetAuthError), (404, DoesNotExistError)],
+)
+def test_async_error_mapping(status: int, exc_class: type[Exception]) -> None:
+    def handler(request: Any) -> Any:
+        return httpx.Response(status, json={"ErrorMessage": "boom"})
+
+    async def run() -> None:
+        async with _client(handler) as client:
+            await client.contact.get(id=1)
+
+    with pytest.raises(exc_class, match="boom"):
+        asyncio.run(run())
+
+
+def test_async_retries_transient_status_then_succeeds() -> None:
+    calls = 0
+
+    def handler(request: Any) -> Any:
+        nonlocal calls
+        calls += 1
+        if calls < 3:
+            return httpx.Response(503)
+        return httpx.Response(200, json={"Data": [{"ID": 1}]})
+
+    async def run() -> Any:
+        async with _client(handler) as client:
+            return await client.contact.get()
+
+    response = asyncio.run(run())
+    assert response.status_code == 200
+    assert calls == 3
+
+
+def test_async_rate_limit_exhausts_retry_budget() -> None:
+    calls = 0
+
+    def handler(request: Any) -> Any:
+        nonlocal calls
+        calls += 1
+        return httpx.Response(429, headers={"Retry-After": "0"}, json={"ErrorMessage": "slow down"})
+
+    async def run() -> None:
+        async with _client(handler) as client:
+            await client.contact.get()
+
+    with pytest.raises(ApiRateLimitError, match="slow down"):
+        asyncio.run(run())
+    assert calls == 4  # initial attempt + 3 JitterRetry retries
+
+
+@pytest.mark.parametrize("status", [429, 500, 503])
+def test_clients_raise_the_same_error_when_retries_run_out(
+    status: int, handler: Any, local_client: Callable[..., Client], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(JitterRetry, "get_backoff_time", lambda self: 0.0)
+    handler.status = status
+    sync_client = local_client()
+
+    async def run() -> None:
+        async with AsyncClient(auth=("pub", "priv"), api_url=sync_client.config.api_url) as client:
+            await client.contact.get()
+
+    with pytest.raises(MailjetApiError) as sync_error:
+        sync_client.contact.get()
+    with pytest.raises(MailjetApiError) as async_error:
+        asyncio.run(run())
+
+    assert type(sync_error.value) is type(async_error.value)
+    assert sync_error.value.status_code == async_error.value.status_code == status
+    assert sync_error.value.response_body == async_error.value.response_body
+    assert handler.received == 8  # 4 attempts per client
+
+
+def test_async_unmapped_server_error_raises_api_error() -> None:
+    def handler(request: Any) -> Any:
+        return httpx.Response(501)
+
+    async def run() -> None:
+        async with _client(handler) as client:
+            await client.contact.get()
+
+    with pytest.raises(ApiError, match="unexpected Mailjet API network error occurred: 501"):
+        asyncio.run(run())
+
+
+def test_async_timeout_and_connection_errors() -> None:
+    def timeout_handler(request: Any) -> Any:
+        raise httpx.ReadTimeout("Read timed out", request=request)
+
+    def connect_handler(request: Any) -> Any:
+        raise httpx.ConnectError("Connection refused", request=request)
+
+    async def run(handler: Handler) -> None:
+        async with _client(handler) as client:
+            await client.contact.get()
+
+    with pytest.raises(TimeoutError, match="Request to Mailjet API timed out: Read timed out"):
+        asyncio.run(run(timeout_handler))
+    with pytest.raises(CriticalApiError, match="Connection to Mailjet API failed"):
+        asyncio.run(run(connect_handler))
+
+
+def test_async_stream_paginates() -> None:
+    offsets: list[str] = []
+
+    def handler(request: Any) -> Any:
+        offset = request.url.params["Offset"]
+        offsets.append(offset)
+        pages = {"0": [{"ID": 1}, {"ID": 2}], "2": [{"ID": 3}]}
+        return httpx.Response(200, json={"Data": pages.get(offset, [])})
+
+    async def run() -> list[dict[str, Any]]:
+        async with _client(handler) as client:
+            return [item async for item in client.contact.stream(chunk_size=2)]
+
+    items = asyncio.run(run())
+    assert [item["ID"] for item in items] == [1, 2, 3]
+    assert offsets == ["0", "2"]
+
+
+def test_async_stream_prefetch_yields_in_order_concurrently() -> None:
+    stats = {"active": 0, "max_active": 0, "count_calls": 0}
+    offsets: list[int] = []
+
+    async def handler(request: Any) -> Any:
+        params = request.url.params
+        if params.get("countOnly"):
+            stats["count_calls"] += 1
+            return httpx.Response(200, json={"Count": 25, "Data": []})
+        offset, limit = int(params["Offset"]), int(params["Limit"])
+        offsets.append(offset)
+        stats["active"] += 1
+        stats["max_active"] = max(stats["max_active"], stats["active"])
+        await _REAL_SLEEP(0.01)
+        stats["active"] -= 1
+        return httpx.Response(200, json={"Data": [{"ID": i} for i in range(offset, min(offset + limit, 25))]})
+
+    async def run() -> list[dict[str, Any]]:
+        async with _client(handler) as client:
+            return [item async for item in client.contact.stream(chunk_size=5, prefetch=3)]
+
+    items = asyncio.run(run())
+    assert [item["ID"] for item in items] == list(range(25))
+    assert stats["count_calls"] == 1
+    assert sorted(offsets) == [0, 5, 10, 15, 20, 25]
+    assert 1 < stats["max_active"] <= 3
+
+
+def test_async_stream_prefetch_respects_concurrency_limiter() -> None:
+    stats = {"active": 0, "max_active": 0}
+    limiter = AdaptiveConcurrencyLimiter(initial=2, max_limit=2)
+
+    async def handler(request: Any) -> Any:
+        params = request.url.params
+        if params.get("countOnly"):
+            return httpx.Response(200, json={"Count": 25, "Data": []})
+        offset, limit = int(params["Offset"]), int(params["Limit"])
+        stats["active"] += 1
+        stats["max_active"] = max(stats["max_active"], stats["active"])
+        await _REAL_SLEEP(0.01)
+        stats["active"] -= 1
+        return httpx.Response(200, json={"Data": [{"ID": i} for i in range(offset, min(offset + limit, 25))]})
+
+    async def run() -> list[dict[str, Any]]:
+        async with _client(handler) as client:
+            return [item async for item in client.contact.stream(chunk_size=5, prefetch=5, concurrency=limiter)]
+
+    assert [item["ID"] for item in asyncio.run(run())] == list(range(25))
+    assert stats["max_active"] == 2
+    assert limiter.in_flight == 0
+
+
+def test_async_stream_prefetch_falls_back_without_count() -> None:
+    offsets: list[str] = []
+
+    def handler(request: Any) -> Any:
+        if request.url.params.get("countOnly"):
+            return httpx.Response(200, json={"Data": []})
+        offsets.append(request.url.params["Offset"])
+        pages = {"0": [{"ID": 1}, {"ID": 2}], "2": [{"ID": 3}]}
+        return httpx.Response(200, json={"Data": pages.get(request.url.params["Offset"], [])})
+
+    async def run(prefetch: int) -> list[dict[str, Any]]:
+        async with _client(handler) as client:
+            return [item async for item in client.contact.stream(chunk_size=2, prefetch=prefetch)]
+
+    assert [item["ID"] for item in asyncio.run(run(4))] == [1, 2, 3]
+    assert offsets == ["0", "2"]
+    with pytest.raises(ValueError, match="prefetch must be a positive integer"):
+        asyncio.run(run(-1))
+
+
+def test_async_stream_cursor_advances_by_id() -> None:
+    bounds: list[str | None] = []
+
+    def handler(request: Any) -> Any:
+        bound = request.url.params.get("FromID")
+        bounds.append(bound)
+        rows = [{"ID": i} for i in (2, 4, 6, 8, 10) if bound is None or i > int(bound)]
+        return httpx.Response(200, json={"Data": rows[:2]})
+
+    async def run(cursor: StreamCursor) -> list[int]:
+        async with _client(handler) as client:
+            return [item["ID"] async for item in client.contact.stream(chunk_size=2, cursor=cursor)]
+
+    cursor = StreamCursor()
+    assert asyncio.run(run(cursor)) == [2, 4, 6, 8, 10]
+    assert bounds == [None, "4", "8"]
+    assert StreamCursor.from_token(cursor.token).after == 10
+
+
+def test_async_stream_incremental_parses_streamed_bodies() -> None:
+    rows = [{"ID": i} for i in range(5)]
+
+    async def body(page: list[dict[str, Any]]) -> Any:
+        raw = json.dumps({"Count": len(page), "Data": page}).encode()
+        for start in range(0, len(raw), 4):
+            yield raw[start : start + 4]
+
+    def handler(request: Any) -> Any:
+        if request.url.path.endswith("/404"):
+            return httpx.Response(404, content=body([]), headers={"Content-Type": "application/json"})
+        offset = int(request.url.params["Offset"])
+        return httpx.Response(200, content=body(rows[offset : offset + 2]))
+
+    async def run(id: int | None = None) -> list[dict[str, Any]]:
+        async with _client(handler) as client:
+            return [item async for item in client.contact.stream(id=id, chunk_size=2, incremental=True)]
+
+    assert asyncio.run(run()) == rows
+    with pytest.raises(DoesNotExistError):
+        asyncio.run(run(id=404))
+
+
+def test_async_stream_adaptive_page_size() -> None:
+    limits: list[int] = []
+
+    def handler(request: Any) -> Any:
+        offset, limit = int(request.url.params["Offset"]), int(request.url.params["Limit"])
+        limits.append(limit)
+        return httpx.Response(200, json={"Data": [{"ID": i} for i in range(offset, min(offset + limit, 70))]})
+
+    async def run() -> AsyncClient:
+        async with _client(handler) as client:
+            assert len([item async for item in client.contact.stream(chunk_size=10, adaptive=True)]) == 70
+            return client
+
+    client = asyncio.run(run())
+    assert limits == [10, 20, 40, 80]  # The last request returns an empty page.
+    assert client.page_sizer.limit_for("contact", 10) == 80
+
+
+def test_async_response_cache_hit_and_revalidation() -> None:
+    seen: list[Any] = []
+
+    def handler(request: Any) -> Any:
+        seen.append(request)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304, headers={"ETag": '"v1"'})
+        return httpx.Response(200, json={"Data": [{"ID": 7}]}, headers={"ETag": '"v1"'})
+
+    cache = ResponseCache(ttl=60)
+
+    async def run() -> list[Any]:
+        async with _client(handler, response_cache=cache) as client:
+            responses = [await client.template.get(id=7), await client.template.get(id=7)]
+            for entry in cache._entries.values():
+                entry.expires_at = 0
+            responses.append(await client.template.get(id=7))
+            return responses
+
+    responses = asyncio.run(run())
+    assert len(seen) == 2
+    assert seen[1].headers["If-None-Match"] == '"v1"'
+    assert [response.status_code for response in responses] == [200, 200, 200]
+    assert all(response.json() == {"Data": [{"ID": 7}]} for response in responses)
+
+
+def test_async_coalesces_concurrent_identical_gets() -> None:
+    seen: list[Any] = []
+
+    async def handler(request: Any) -> Any:
+        seen.append(request)
+        await _REAL_SLEEP(0.01)
+        return httpx.Response(200, json={"Data": [{"ID": 7}]})
+
+    async def run() -> list[Any]:
+        async with _client(handler, coalesce_requests=True) as client:
+            return await asyncio.gather(
+                *(client.template.get(id=7) for _ in range(5)), client.template.get(id=7, filters={"Limit": 1})
+            )
+
+    responses = asyncio.run(run())
+    assert len(seen) == 2
+    assert all(response.json() == {"Data": [{"ID": 7}]} for response in responses)
+    assert len({id(response) for response in responses}) == 6
+
+
+def test_async_rate_limiter_learns_from_retried_429s(monkeypatch: pytest.MonkeyPatch) -> None:
+    statuses = [429, 200, 200]
+    sleeps: list[float] = []
+
+    async def _record(delay: float) -> None:
+        sleeps.append(delay)
+
+    monkeypatch.setattr("mailjet_rest.async_client.asyncio.sleep", _record)
+
+    def handler(request: Any) -> Any:
+        return httpx.Response(statuses.pop(0), headers={"Retry-After": "2"}, json={})
+
+    async def run() -> None:
+        limits = {"rest": RateLimit(rate=100, burst=5)}
+        async with _client(handler, rate_limits=limits) as client:
+            await client.contact.get()
+            await client.contact.get()
+
+    asyncio.run(run())
+    # The JitterRetry backoff honours Retry-After, then the next call waits for the paused group.
+    assert sleeps == pytest.approx([2.0, 2.0], abs=0.05)
+
+
+def test_async_stream_rejects_invalid_chunk_size() -> None:
+    async def run() -> None:
+        async with _client(lambda request: httpx.Response(200)) as client:
+            async for _ in client.contact.stream(chunk_size=0):
+                pass
+
+    with pytest.raises(ValueError, match="strictly positive"):
+        asyncio.run(run())
+
+
+def test_async_dry_run_intercepts_mutations() -> None:
+    def handler(request: Any) -> Any:
+        pytest.fail("Network request executed during dry_run!")
+
+    async def run() -> Any:
+        async with _client(handler, dry_run=True) as client:
+            return await client.contact.create(data={"Name": "Test"})
+
+    assert asyncio.run(run()).status_code == 200
+
+
+def test_async_guardrails_are_shared() -> None:
+    def handler(request: Any) -> Any:
+        pytest.fail("Guardrails must fail before dispatch")
+
+    async def run(**kwargs: Any) -> None:
+        async with _client(handler) as client:
+            await client.contact.get(**kwargs)
+
+    with pytest.raises(ValueError, match="TLS verification cannot be disabled"):
+        asyncio.run(run(verify=False))
+    with pytest.raises(ValueError, match="CRLF injection"):
+        asyncio.run(run(headers={"X-Bad": "a\r\nb"}))
+    with pytest.raises(ValueError, match="per-request 'proxies'"):
+        asyncio.run(run(proxies={"https": "https://proxy.example.com"}))
+
+
+def test_async_aclose_clears_session_headers() -> None:
+    async def run() -> AsyncClient:
+        async with AsyncClient(auth="token-123") as client:
+            pass
+        return client
+
+    client = asyncio.run(run())
+    assert client.session.is_closed
+    assert "Authorization" not in client.session.headers
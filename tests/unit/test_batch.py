@@ -0,0 +1,199 @@
+"""Unit tests for the bulk Send API v3.1 batching engine."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+from typing import Any
+
+import pytest
+import requests
+import responses
+from requests.exceptions import ConnectionError as RequestsConnectionError
+
+from mailjet_rest.batch import BatchSender, SendResult
+from mailjet_rest.builders import MessageBuilder
+from mailjet_rest.client import Client
+from mailjet_rest.utils.concurrency import AdaptiveConcurrencyLimiter
+
+SEND_URL = "https://api.mailjet.com/v3.1/send"
+
+
+def _message(i: int) -> dict[str, Any]:
+    return {
+        "From": {"Email": "sender@example.com"},
+        "To": [{"Email": f"user{i}@example.com"}],
+        "TextPart": "Hello",
+        "CustomID": f"row-{i}",
+    }
+
+
+def _echo_send(request: Any) -> tuple[int, dict[str, str], str]:
+    """Fake Send API v3.1 that accepts every message except those whose CustomID ends in '-bad'."""
+    messages = json.loads(request.body)["Messages"]
+    entries = []
+    for message in messages:
+        if message["CustomID"].endswith("-bad"):
+            entries.append({"Status": "error", "Errors": [{"ErrorMessage": "Invalid", "StatusCode": 400}]})
+        else:
+            recipient_id = int(message["To"][0]["Email"].removeprefix("user").split("@")[0])
+            entries.append(
+                {
+                    "Status": "success",
+                    "CustomID": message["CustomID"],
+                    "To": [{"Email": message["To"][0]["Email"], "MessageID": 1000 + recipient_id}],
+                }
+            )
+    status = 400 if any(e["Status"] == "error" for e in entries) else 200
+    return status, {}, json.dumps({"Messages": entries})
+
+
+@pytest.fixture
+def client_v31() -> Client:
+    return Client(auth=("pub", "priv"), version="v3.1")
+
+
+@responses.activate
+def test_batch_sender_splits_and_maps_results_in_order(client_v31: Client) -> None:
+    responses.add_callback(responses.POST, SEND_URL, callback=_echo_send)
+
+    results = BatchSender(client_v31, max_workers=4).send(_message(i) for i in range(125))
+
+    assert len(responses.calls) == 3
+    assert sorted(len(json.loads(c.request.body)["Messages"]) for c in responses.calls) == [25, 50, 50]
+    assert [r.index for r in results] == list(range(125))
+    assert all(r.ok for r in results)
+    assert results[7].message_id == 1007
+    assert results[124].custom_id == "row-124"
+
+
+@responses.activate
+def test_batch_sender_maps_partial_failures(client_v31: Client) -> None:
+    responses.add_callback(responses.POST, SEND_URL, callback=_echo_send)
+    messages = [_message(0), {**_message(1), "CustomID": "row-1-bad"}, _message(2)]
+
+    results = BatchSender(client_v31).send(messages)
+
+    assert [r.status for r in results] == ["success", "error", "success"]
+    assert results[1].errors[0]["ErrorMessage"] == "Invalid"
+    assert results[1].message_id is None
+    assert results[2].message_ids == (1002,)
+
+
+@responses.activate
+def test_batch_sender_transport_failure_marks_only_that_chunk(client_v31: Client) -> None:
+    calls = 0
+    lock = threading.Lock()
+
+    def flaky(request: Any) -> tuple[int, dict[str, str], str]:
+        nonlocal calls
+        with lock:
+            calls += 1
+        if json.loads(request.body)["Messages"][0]["CustomID"] == "row-0":
+            raise RequestsConnectionError("Connection reset")
+        return _echo_send(request)
+
+    responses.add_callback(responses.POST, SEND_URL, callback=flaky)
+
+    results = BatchSender(client_v31, max_messages=2).send(_message(i) for i in range(4))
+
+    assert [r.ok for r in results] == [False, False, True, True]
+    assert "Connection to Mailjet API failed" in results[0].errors[0]["ErrorMessage"]
+    assert calls == 2
+
+
+def test_batch_sender_adapts_concurrency_to_rate_limits(
+    client_v31: Client, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    stats = {"active": 0, "max_active": 0, "calls": 0, "min_limit": 4}
+    lock = threading.Lock()
+    throttled_together = threading.Barrier(2, timeout=5)
+
+    def fake_request(data: Any = None, **kwargs: Any) -> requests.Response:
+        with lock:
+            stats["calls"] += 1
+            stats["active"] += 1
+            stats["max_active"] = max(stats["max_active"], stats["active"])
+            stats["min_limit"] = min(stats["min_limit"], limiter.limit)
+            throttled = stats["calls"] <= 2
+        if throttled:
+            throttled_together.wait()
+        time.sleep(0.01)
+        with lock:
+            stats["active"] -= 1
+        resp = requests.Response()
+        if throttled:
+            resp.status_code = 429
+            resp._content = b'{"ErrorMessage": "Too many requests"}'
+        else:
+            resp.status_code = 200
+            resp._content = b'{"Messages": [{"Status": "success"}]}'
+        return resp
+
+    monkeypatch.setattr(client_v31.session, "request", fake_request)
+    limiter = AdaptiveConcurrencyLimiter(initial=4, max_limit=8)
+
+    results = BatchSender(client_v31, max_workers=8, max_messages=1, concurrency=limiter).send(
+        _message(i) for i in range(12)
+    )
+
+    assert [r.ok for r in results].count(False) == 2
+    assert stats["max_active"] <= 4
+    assert stats["min_limit"] == 2  # Halved once for the burst of 429s sent under the same limit
+    assert limiter.in_flight == 0
+
+
+def test_batch_sender_accepts_message_builders(client_v31: Client, monkeypatch: pytest.MonkeyPatch) -> None:
+    sent: list[Any] = []
+
+    def fake_request(data: Any = None, **kwargs: Any) -> requests.Response:
+        sent.append(json.loads(data))
+        resp = requests.Response()
+        resp.status_code = 200
+        resp._content = b'{"Messages": [{"Status": "success", "To": [{"MessageID": 1}]}]}'
+        return resp
+
+    monkeypatch.setattr(client_v31.session, "request", fake_request)
+    builder = MessageBuilder().set_sender("a@example.com").add_recipient("b@example.com").set_content(text="Hi")
+
+    results = BatchSender(client_v31).send([builder], sandbox=True, globals_={"Subject": "S"})
+
+    assert results == [SendResult(index=0, status="success", message_ids=(1,))]
+    assert sent[0]["SandboxMode"] is True
+    assert sent[0]["Globals"] == {"Subject": "S"}
+
+
+def test_batch_sender_dry_run_and_empty_input() -> None:
+    client = Client(auth=("pub", "priv"), version="v3.1", dry_run=True)
+    sender = BatchSender(client)
+
+    assert sender.send([]) == []
+    assert [r.status for r in sender.send([_message(0), _message(1)])] == ["success", "success"]
+
+
+def test_batch_sender_validation() -> None:
+    with pytest.raises(ValueError, match="version='v3.1'"):
+        BatchSender(Client(auth=("pub", "priv"), version="v3"))
+    with pytest.raises(ValueError, match="max_workers"):
+        BatchSender(Client(auth=("pub", "priv"), version="v3.1"), max_workers=0)
+
+
+def test_batch_sender_asend_with_async_client() -> None:
+    httpx = pytest.importorskip("httpx")
+    from mailjet_rest.async_client import AsyncClient
+
+    def handler(request: Any) -> Any:
+        messages = json.loads(request.content)["Messages"]
+        return httpx.Response(
+            200, json={"Messages": [{"Status": "success", "CustomID": m["CustomID"]} for m in messages]}
+        )
+
+    async def run() -> list[SendResult]:
+        async with AsyncClient(auth=("pub", "priv"), version="v3.1") as client:
+            client.session._transport = httpx.MockTransport(handler)
+            return await BatchSender(client, max_workers=2).asend(_message(i) for i in range(60))
+
+    results = asyncio.run(run())
+    assert [r.custom_id for r in results] == [f"row-{i}" for i in range(60)]
@@ -0,0 +1,249 @@
+"""Unit tests for the per-route circuit breaker."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+import requests
+
+from mailjet_rest.client import Client, Config, JitterRetry
+from mailjet_rest.errors import (
+    ApiError,
+    ApiRateLimitError,
+    CircuitOpenError,
+    CriticalApiError,
+    DeadlineExceededError,
+    DoesNotExistError,
+    MailjetApiError,
+    MailjetNetworkError,
+    TimeoutError,
+)
+from mailjet_rest.utils.breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    now = [1000.0]
+    monkeypatch.setattr("mailjet_rest.utils.breaker.time.monotonic", lambda: now[0])
+    return now
+
+
+def _outcome(breaker: CircuitBreaker, route: str, error: Exception | None) -> None:
+    def fn() -> str:
+        if error is not None:
+            raise error
+        return "ok"
+
+    if error is None:
+        assert breaker.call(route, fn) == "ok"
+    else:
+        with pytest.raises(type(error)):
+            breaker.call(route, fn)
+
+
+def test_breaker_opens_on_failure_rate_and_fails_fast(clock: list[float]) -> None:
+    breaker = CircuitBreaker(failure_rate=0.5, minimum_calls=4, window=10, reset_timeout=30)
+
+    _outcome(breaker, "send", None)
+    _outcome(breaker, "send", TimeoutError("Request to Mailjet API timed out"))
+    _outcome(breaker, "send", None)
+    assert breaker.state("send") == CLOSED  # Below minimum_calls
+
+    _outcome(breaker, "send", MailjetApiError("Service unavailable", 503))
+    assert breaker.state("send") == OPEN
+    assert breaker.state("contact") == CLOSED
+
+    clock[0] += 10
+    with pytest.raises(CircuitOpenError, match="route 'send' is open.*MailjetApiError") as exc_info:
+        breaker.call("send", lambda: pytest.fail("an open circuit must not call through"))
+    assert exc_info.value.route == "send"
+    assert exc_info.value.retry_after == pytest.approx(20)
+    assert isinstance(exc_info.value, MailjetNetworkError)
+    assert breaker.snapshot()["send"] == {
+        "state": OPEN,
+        "failure_rate": 0.5,
+        "calls": 4,
+        "trips": 1,
+        "rejected": 1,
+    }
+
+
+@pytest.mark.parametrize(
+    ("error", "failed"),
+    [
+        (TimeoutError("timed out"), True),
+        (DeadlineExceededError("Deadline exceeded", attempts=(0.4,)), True),
+        (DeadlineExceededError("Deadline exceeded (rate limit wait)", attempts=()), False),
+        (CriticalApiError("Connection to Mailjet API failed"), True),
+        (ApiError("An unexpected Mailjet API network error occurred: Max retries exceeded"), True),
+        (MailjetApiError("Internal error", 500), True),
+        (DoesNotExistError("Resource not found", 404), False),
+        (MailjetApiError("Rate limit exceeded", 429), False),
+        (ApiRateLimitError("Rate limit exceeded", 429), False),
+        (ValueError("bad input"), False),
+    ],
+)
+def test_breaker_classifies_failures(error: Exception, failed: bool) -> None:
+    assert CircuitBreaker.is_failure(error) is failed
+
+
+def test_breaker_half_opens_and_recovers(clock: list[float]) -> None:
+    breaker = CircuitBreaker(minimum_calls=2, window=2, reset_timeout=5, half_open_calls=1)
+    for _ in range(2):
+        _outcome(breaker, "contact", TimeoutError("timed out"))
+    assert breaker.state("contact") == OPEN
+
+    clock[0] += 5
+    assert breaker.state("contact") == HALF_OPEN
+    probe = breaker.allow("contact")
+    assert probe is True
+    with pytest.raises(CircuitOpenError):
+        breaker.allow("contact")  # The only probe slot is taken
+
+    breaker.record("contact", failed=True, probe=probe)
+    assert breaker.state("contact") == OPEN  # A failed probe re-opens for a full cool down
+    clock[0] += 5
+
+    _outcome(breaker, "contact", DoesNotExistError("Resource not found", 404))
+    assert breaker.state("contact") == CLOSED
+    assert breaker.snapshot()["contact"]["trips"] == 2
+    assert breaker.snapshot()["contact"]["calls"] == 0
+
+
+def test_breaker_releases_abandoned_probes(clock: list[float]) -> None:
+    breaker = CircuitBreaker(minimum_calls=1, window=1, reset_timeout=1)
+    _outcome(breaker, "send", TimeoutError("timed out"))
+    clock[0] += 1
+
+    async def cancelled() -> None:
+        raise asyncio.CancelledError
+
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(breaker.acall("send", cancelled))
+    assert breaker.state("send") == HALF_OPEN
+    assert breaker.allow("send") is True  # The cancelled probe gave its slot back
+
+
+def test_breaker_ignores_late_outcomes_and_resets(clock: list[float]) -> None:
+    breaker = CircuitBreaker(minimum_calls=1, window=5, reset_timeout=1)
+    late = breaker.allow("send")
+    _outcome(breaker, "send", TimeoutError("timed out"))
+    clock[0] += 1
+    assert breaker.state("send") == HALF_OPEN
+
+    # A call admitted before the circuit opened must not close it.
+    breaker.record("send", failed=False, probe=late)
+    assert breaker.state("send") == HALF_OPEN
+
+    breaker.reset("send")
+    assert breaker.state("send") == CLOSED
+    breaker.reset()
+    assert breaker.snapshot() == {}
+
+
+def test_breaker_validation() -> None:
+    with pytest.raises(ValueError, match="failure_rate"):
+        CircuitBreaker(failure_rate=0)
+    with pytest.raises(ValueError, match="minimum_calls <= window"):
+        CircuitBreaker(minimum_calls=20, window=10)
+    with pytest.raises(ValueError, match="half_open_calls > 0"):
+        CircuitBreaker(half_open_calls=0)
+
+
+def test_client_sheds_load_per_route(monkeypatch: pytest.MonkeyPatch, clock: list[float]) -> None:
+    breaker = CircuitBreaker(minimum_calls=3, window=3, reset_timeout=30)
+    client = Client(auth=("pub", "priv"), config=Config(circuit_breaker=breaker))
+    calls: list[str] = []
+
+    def mock_req(method: str, url: str, **kwargs: Any) -> requests.Response:
+        calls.append(url)
+        resp = requests.Response()
+        resp.status_code = 503 if "/contact" in url else 200
+        resp._content = b"{}"
+        return resp
+
+    monkeypatch.setattr(client.session, "request", mock_req)
+
+    for _ in range(3):
+        with pytest.raises(MailjetApiError) as exc_info:
+            client.contact.get()
+        assert exc_info.value.status_code == 503
+    with pytest.raises(CircuitOpenError):
+        client.contact.get()
+    assert client.template.get().status_code == 200
+
+    assert len(calls) == 4
+    assert client.circuit_breaker is breaker
+    assert breaker.snapshot()["contact"]["state"] == OPEN
+    assert breaker.snapshot()["template"]["state"] == CLOSED
+    assert Client(auth=("pub", "priv")).circuit_breaker is None
+
+
+def test_rate_limit_waits_beyond_the_deadline_keep_the_circuit_closed(monkeypatch: pytest.MonkeyPatch) -> None:
+    from mailjet_rest.utils.ratelimit import RateLimit
+
+    breaker = CircuitBreaker(minimum_calls=3, window=3)
+    config = Config(circuit_breaker=breaker, rate_limits={"rest": RateLimit(rate=0.1)}, deadline=0.5)
+    client = Client(auth=("pub", "priv"), config=config)
+    monkeypatch.setattr(client.session, "request", lambda **kwargs: pytest.fail("must not be sent"))
+    client.rate_limiter.reserve(client.contact._build_url())  # Spend the only token
+
+    for _ in range(4):
+        with pytest.raises(DeadlineExceededError, match="rate limit wait"):
+            client.contact.get()
+    assert breaker.state("contact") == CLOSED
+
+
+def test_throttling_that_outlasts_the_retries_keeps_the_circuit_closed(
+    handler: Any, local_client: Callable[..., Client], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(JitterRetry, "get_backoff_time", lambda self: 0.0)
+    breaker = CircuitBreaker(minimum_calls=1, window=1)
+    client = local_client(circuit_breaker=breaker)
+
+    handler.status = 429
+    for _ in range(2):
+        with pytest.raises(ApiRateLimitError):
+            client.contact.get()
+    assert breaker.state("contact") == CLOSED
+
+    handler.status = 503
+    with pytest.raises(MailjetApiError):
+        client.contact.get()
+    assert breaker.state("contact") == OPEN
+
+
+def test_async_client_sheds_load_per_route(monkeypatch: pytest.MonkeyPatch, clock: list[float]) -> None:
+    httpx = pytest.importorskip("httpx")
+    from mailjet_rest.async_client import AsyncClient
+
+    async def instant(_delay: float) -> None:
+        return None
+
+    monkeypatch.setattr("mailjet_rest.async_client.asyncio.sleep", instant)
+
+    calls: list[str] = []
+
+    def handler(request: Any) -> Any:
+        calls.append(str(request.url))
+        return httpx.Response(200 if calls[-1].endswith("/contact/1") else 500, json={})
+
+    async def run() -> None:
+        breaker = CircuitBreaker(minimum_calls=2, window=2, reset_timeout=1)
+        async with AsyncClient(auth=("pub", "priv"), config=Config(circuit_breaker=breaker)) as client:
+            client.session._transport = httpx.MockTransport(handler)
+            for _ in range(2):
+                with pytest.raises(MailjetApiError):
+                    await client.contact.get()
+            with pytest.raises(CircuitOpenError):
+                await client.contact.get()
+
+            clock[0] += 1
+            assert (await client.contact.get(id=1)).status_code == 200
+            assert breaker.state("contact") == CLOSED
+
+    asyncio.run(run())
+    assert len(calls) == 2 * 4 + 1  # Two calls exhausting their retries, then the successful probe
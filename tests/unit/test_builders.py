@@ -290,3 +290,56 @@ def test_template_content_builder_meta_branches() -> None:
     assert b2._payload["Name"] == "N"
     b3 = TemplateContentBuilder().set_meta(locale="L")
     assert b3._payload["Locale"] == "L"
+
+
+def _plain_message(i: int, body: str = "Hello") -> dict:
+    return {"From": {"Email": "s@example.com"}, "To": [{"Email": f"r{i}@example.com"}], "TextPart": body}
+
+
+def test_send_payload_builder_iter_batches_respects_message_limit() -> None:
+    """Verify iter_batches splits messages by the per-call message cap while preserving order."""
+    builder = SendPayloadBuilder().set_sandbox_mode(True).set_globals({"Subject": "G"})
+    for i in range(120):
+        builder.add_message(_plain_message(i))
+
+    batches = list(builder.iter_batches())
+    assert [len(b["Messages"]) for b in batches] == [50, 50, 20]
+    assert all(b["SandboxMode"] is True and b["Globals"] == {"Subject": "G"} for b in batches)
+    emails = [m["To"][0]["Email"] for b in batches for m in b["Messages"]]
+    assert emails == [f"r{i}@example.com" for i in range(120)]
+
+
+def test_send_payload_builder_iter_batches_respects_byte_limit() -> None:
+    """Verify iter_batches keeps every serialized payload under the byte cap."""
+    import json
+
+    builder = SendPayloadBuilder()
+    for i in range(10):
+        builder.add_message(_plain_message(i, body="x" * 1000))
+
+    max_bytes = 3500
+    batches = list(builder.iter_batches(max_bytes=max_bytes))
+    assert len(batches) > 1
+    assert sum(len(b["Messages"]) for b in batches) == 10
+    assert all(len(json.dumps(b).encode()) <= max_bytes for b in batches)
+
+
+def test_send_payload_builder_iter_batches_isolates_oversized_message() -> None:
+    """Verify a message larger than the byte cap is emitted alone rather than dropped."""
+    builder = SendPayloadBuilder()
+    builder.add_message(_plain_message(0))
+    builder.add_message(_plain_message(1, body="x" * 5000))
+    builder.add_message(_plain_message(2))
+
+    batches = list(builder.iter_batches(max_bytes=1000))
+    assert [len(b["Messages"]) for b in batches] == [1, 1, 1]
+
+
+def test_send_payload_builder_iter_batches_validation() -> None:
+    """Verify iter_batches rejects empty payloads and non-positive limits."""
+    with pytest.raises(ValueError, match="At least one message"):
+        list(SendPayloadBuilder().iter_batches())
+
+    builder = SendPayloadBuilder().add_message(_plain_message(0))
+    with pytest.raises(ValueError, match="strictly positive"):
+        list(builder.iter_batches(max_messages=0))
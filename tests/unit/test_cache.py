@@ -0,0 +1,209 @@
+"""Unit tests for the opt-in GET response cache."""
+
+from __future__ import annotations
+
+import threading
+from typing import Any
+
+import pytest
+import requests
+
+from mailjet_rest.client import Client, Config
+from mailjet_rest.utils.cache import ResponseCache
+
+
+_URL = "https://api.mailjet.com/v3/REST/template/7"
+
+
+def _key(identity: str = "me", url: str = _URL, **params: Any) -> Any:
+    return ResponseCache.make_key(identity, url, params, {"Accept": "application/json"})
+
+
+@pytest.mark.parametrize(
+    ("url", "resource"),
+    [
+        ("https://api.mailjet.com/v3/REST/template/7", "template"),
+        ("https://api.mailjet.com/v3/REST/contactslist/7/managecontact", "contactslist"),
+        ("https://api.mailjet.com/v3/DATA/contactslist/7/CSVData/text:plain", "contactslist"),
+        ("https://api.mailjet.com/v1/templates", "templates"),
+        ("https://api.mailjet.com/v3/send", "send"),
+        ("https://api.mailjet.com/", ""),
+    ],
+)
+def test_resource_of(url: str, resource: str) -> None:
+    assert ResponseCache.resource_of(url) == resource
+
+
+def test_make_key_ignores_ordering() -> None:
+    first = ResponseCache.make_key("me", _URL, {"Limit": 10, "Offset": 0}, {"A": "1", "b": "2"})
+    second = ResponseCache.make_key("me", _URL, {"Offset": 0, "Limit": 10}, {"B": "2", "a": "1"})
+    assert first == second
+    assert first != ResponseCache.make_key("you", _URL, {"Limit": 10, "Offset": 0}, {"A": "1", "b": "2"})
+
+
+def test_rejects_invalid_budgets() -> None:
+    with pytest.raises(ValueError, match="non-negative"):
+        ResponseCache(ttl=-1)
+    with pytest.raises(ValueError, match="non-negative"):
+        ResponseCache(ttls={"template": -1})
+    with pytest.raises(ValueError, match="strictly positive"):
+        ResponseCache(max_entries=0)
+
+
+def test_put_and_expiry(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = [100.0]
+    monkeypatch.setattr("mailjet_rest.utils.cache.time.monotonic", lambda: now[0])
+    cache = ResponseCache(ttl=10, ttls={"Contact": 0})
+
+    entry = cache.put(_key(), 200, {"ETag": '"v1"', "Content-Encoding": "gzip", "Content-Length": "3"}, b"{}")
+    assert entry is not None
+    assert entry.headers == {"ETag": '"v1"'}
+    assert cache.get(_key()) is entry
+    assert entry.is_fresh()
+    now[0] = 111.0
+    assert not entry.is_fresh()
+    assert entry.validators() == {"If-None-Match": '"v1"'}
+
+    # Per-resource TTL of 0 and 'no-store' responses are never cached.
+    assert cache.put(_key(url="https://api.mailjet.com/v3/REST/contact"), 200, {}, b"{}") is None
+    assert cache.put(_key(Limit=1), 200, {"Cache-Control": "private, no-store"}, b"{}") is None
+    assert len(cache) == 1
+
+
+def test_revalidated_extends_the_entry(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = [0.0]
+    monkeypatch.setattr("mailjet_rest.utils.cache.time.monotonic", lambda: now[0])
+    cache = ResponseCache(ttl=10)
+    cache.put(_key(), 200, {"Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}, b"{}")
+
+    now[0] = 20.0
+    entry = cache.revalidated(_key(), {"ETag": '"v2"'})
+    assert entry is not None
+    assert entry.is_fresh()
+    assert entry.validators() == {"If-None-Match": '"v2"', "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT"}
+    assert cache.revalidated(_key(Limit=5), {}) is None
+
+
+def test_lru_eviction_by_entries_and_bytes() -> None:
+    cache = ResponseCache(max_entries=2)
+    cache.put(_key(Limit=1), 200, {}, b"1")
+    cache.put(_key(Limit=2), 200, {}, b"2")
+    assert cache.get(_key(Limit=1)) is not None  # Limit=2 is now the least recently used.
+    cache.put(_key(Limit=3), 200, {}, b"3")
+    assert cache.get(_key(Limit=2)) is None
+    assert len(cache) == 2
+
+    cache = ResponseCache(max_bytes=10)
+    assert cache.put(_key(Limit=1), 200, {}, b"x" * 11) is None
+    cache.put(_key(Limit=2), 200, {}, b"x" * 6)
+    cache.put(_key(Limit=3), 200, {}, b"x" * 6)
+    assert cache.get(_key(Limit=2)) is None
+    assert cache.get(_key(Limit=3)) is not None
+
+
+def test_invalidate_is_scoped_to_resource_and_identity() -> None:
+    cache = ResponseCache()
+    cache.put(_key(), 200, {}, b"{}")
+    cache.put(_key(Limit=1), 200, {}, b"{}")
+    cache.put(_key(identity="other"), 200, {}, b"{}")
+    cache.put(_key(url="https://api.mailjet.com/v3/REST/sender"), 200, {}, b"{}")
+
+    assert cache.invalidate("me", "https://api.mailjet.com/v3/REST/template") == 2
+    assert len(cache) == 2
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_concurrent_puts_respect_budgets() -> None:
+    cache = ResponseCache(max_entries=50)
+
+    def fill(worker: int) -> None:
+        for i in range(200):
+            cache.put(_key(Limit=worker * 1000 + i), 200, {}, b"{}")
+            cache.get(_key(Limit=worker * 1000 + i // 2))
+
+    threads = [threading.Thread(target=fill, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(cache) == 50
+    assert cache._size == 50 * 2
+
+
+# --- Client integration ---
+
+
+def _client(cache: ResponseCache, auth: tuple[str, str] = ("pub", "priv")) -> Client:
+    return Client(auth=auth, config=Config(response_cache=cache))
+
+
+def _recorder(client: Client, monkeypatch: pytest.MonkeyPatch, status: int = 200) -> list[dict[str, Any]]:
+    calls: list[dict[str, Any]] = []
+
+    def mock_req(method: str, url: str, **kwargs: Any) -> requests.Response:
+        calls.append({"method": method, "url": url, **kwargs})
+        resp = requests.Response()
+        resp.status_code = status if method == "GET" else 201
+        resp.headers["ETag"] = f'"v{len(calls)}"'
+        resp._content = b'{"Data": [{"ID": 7}]}' if resp.status_code == 200 else b""
+        return resp
+
+    monkeypatch.setattr(client.session, "request", mock_req)
+    return calls
+
+
+def test_client_serves_fresh_hits_from_memory(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = _client(ResponseCache(ttl=60))
+    calls = _recorder(client, monkeypatch)
+
+    first = client.template.get(id=7)
+    second = client.template.get(id=7)
+    assert len(calls) == 1
+    assert second.json() == first.json() == {"Data": [{"ID": 7}]}
+    assert second.headers["etag"] == '"v1"'
+    assert second is not first
+
+    client.template.get(id=7, filters={"Limit": 1})
+    client.template.get(id=7, stream=True)
+    assert len(calls) == 3
+
+
+def test_client_sends_validators_and_serves_304(monkeypatch: pytest.MonkeyPatch) -> None:
+    cache = ResponseCache(ttl=60)
+    client = _client(cache)
+    _recorder(client, monkeypatch)
+    client.template.get(id=7)
+    for entry in cache._entries.values():
+        entry.expires_at = 0
+
+    calls = _recorder(client, monkeypatch, status=304)
+    response = client.template.get(id=7)
+    assert calls[0]["headers"]["If-None-Match"] == '"v1"'
+    assert response.status_code == 200
+    assert response.json() == {"Data": [{"ID": 7}]}
+    assert next(iter(cache._entries.values())).is_fresh()
+
+
+def test_client_cache_is_partitioned_by_credentials(monkeypatch: pytest.MonkeyPatch) -> None:
+    cache = ResponseCache()
+    alice, bob = _client(cache, ("alice", "secret-a")), _client(cache, ("bob", "secret-b"))
+    alice_calls, bob_calls = _recorder(alice, monkeypatch), _recorder(bob, monkeypatch)
+
+    alice.template.get(id=7)
+    bob.template.get(id=7)
+    assert len(alice_calls) == len(bob_calls) == 1
+    assert len(cache) == 2
+
+
+def test_client_mutations_invalidate_the_resource(monkeypatch: pytest.MonkeyPatch) -> None:
+    cache = ResponseCache()
+    client = _client(cache)
+    calls = _recorder(client, monkeypatch)
+
+    client.template.get(id=7)
+    client.sender.get()
+    client.template.update(id=7, data={"Name": "renamed"})
+    assert len(cache) == 1
+    client.template.get(id=7)
+    assert [call["method"] for call in calls] == ["GET", "GET", "PUT", "GET"]
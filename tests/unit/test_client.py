@@ -4,6 +4,7 @@
 
 from __future__ import annotations
 
+import json as json_module
 import logging
 from contextlib import suppress
 from typing import TYPE_CHECKING, Any
@@ -237,6 +238,47 @@ def test_client_execute_request_non_json(client_offline: Client, monkeypatch: py
     )
 
 
+def test_client_json_mutation_body_encoded_once(client_offline: Client, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Coverage: JSON mutations hand pre-encoded bytes to requests and hash the very same fragments."""
+    captured: dict[str, Any] = {}
+
+    def mock_req(method: str, url: str, data: Any = None, json: Any = None, **kwargs: Any) -> requests.Response:
+        captured.update(data=data, json=json, headers=kwargs["headers"])
+        resp = requests.Response()
+        resp.status_code = 201
+        return resp
+
+    monkeypatch.setattr(client_offline.session, "request", mock_req)
+    payload = {"Email": "é@example.com", "CustomID": "volatile", "Properties": {"age": 42}}
+    client_offline.contact.create(data=payload)
+
+    assert captured["json"] is None
+    assert isinstance(captured["data"], bytes)
+    assert json_module.loads(captured["data"]) == payload
+    assert captured["headers"]["Idempotency-Key"] == SecurityGuard.generate_payload_fingerprint(payload)
+
+
+def test_client_non_strict_json_falls_back_to_transport_encoding(
+    client_offline: Client, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Coverage: Payloads the strict encoder rejects keep the regular json= path and fingerprint."""
+    captured: dict[str, Any] = {}
+
+    def mock_req(method: str, url: str, data: Any = None, json: Any = None, **kwargs: Any) -> requests.Response:
+        captured.update(data=data, json=json, headers=kwargs["headers"])
+        resp = requests.Response()
+        resp.status_code = 200
+        return resp
+
+    monkeypatch.setattr(client_offline.session, "request", mock_req)
+    payload = {"Score": float("nan")}
+    client_offline.contact.update(id=1, data=payload)
+
+    assert captured["data"] is None
+    assert captured["json"] is payload
+    assert captured["headers"]["Idempotency-Key"] == SecurityGuard.generate_payload_fingerprint(payload)
+
+
 def test_client_endpoint_caching(client_offline: Client) -> None:
     """Coverage: Verify __getattr__ efficiently returns from cache."""
     ep1 = client_offline.contact
@@ -684,3 +726,87 @@ def test_extract_telemetry_edge_cases(client_offline: Client) -> None:
     # Coverage for when the payload is a string, not a dict
     suffix, d = client_offline._extract_telemetry("string data", None)
     assert suffix == ""
+
+
+def test_timeout_validated_once_per_timeout_object(client_offline: Client, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Verify the configured timeout is validated once, and again when it is replaced."""
+    calls: list[Any] = []
+    validate = SecurityGuard.validate_timeout
+
+    def counting(timeout: Any) -> Any:
+        calls.append(timeout)
+        return validate(timeout)
+
+    monkeypatch.setattr(SecurityGuard, "validate_timeout", counting)
+    url = "https://api.mailjet.com/v3/REST/contact"
+    for _ in range(3):
+        assert client_offline._validate_request(url, None, None, {})[1] == client_offline.config.timeout
+    assert calls == [client_offline.config.timeout]
+
+    client_offline.config.timeout = (5, 30)
+    assert client_offline._validate_request(url, None, None, {})[1] == (5, 30)
+    with pytest.raises(ValueError, match="Timeout"):
+        client_offline._validate_request(url, None, 0, {})
+    assert calls.count((5, 30)) == 1
+
+
+def test_custom_headers_screened_once_per_call(client_offline: Client, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Verify endpoint headers reach the client unscreened and are sanitized once by api_call."""
+    calls: list[dict[str, str]] = []
+    sanitize = SecurityGuard.sanitize_headers
+
+    def counting(headers: dict[str, str]) -> dict[str, str]:
+        calls.append(headers)
+        return sanitize(headers)
+
+    def mock_resp(**kwargs: Any) -> requests.Response:
+        r = requests.Response()
+        r.status_code = 200
+        return r
+
+    monkeypatch.setattr(SecurityGuard, "sanitize_headers", counting)
+    monkeypatch.setattr(client_offline.session, "request", mock_resp)
+    client_offline.contact.get(headers={"X-Trace": "abc"})
+    assert len(calls) == 1
+
+    with pytest.raises(ValueError, match="CRLF"):
+        client_offline.contact.get(headers={"X-Trace": "abc\r\nX-Injected: 1"})
+
+
+def test_trusted_fast_path_reads_environment_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Verify the trusted fast path snapshots proxy settings per host and keeps per-call overrides."""
+    lookups: list[tuple[str, Any]] = []
+
+    def environ_proxies(url: str, no_proxy: Any = None) -> dict[str, str]:
+        lookups.append((url, no_proxy))
+        return {} if no_proxy else {"https": "https://proxy.internal:3128"}
+
+    sent: list[dict[str, Any]] = []
+
+    def mock_resp(**kwargs: Any) -> requests.Response:
+        sent.append(kwargs)
+        r = requests.Response()
+        r.status_code = 200
+        return r
+
+    monkeypatch.setattr("mailjet_rest.client.get_environ_proxies", environ_proxies)
+    monkeypatch.setenv("REQUESTS_CA_BUNDLE", "/etc/ssl/corporate.pem")
+    client = Client(auth=("a", "b"), trusted_fast_path=True)
+    monkeypatch.setattr(client.session, "request", mock_resp)
+    assert client.session.trust_env is False
+
+    client.contact.get()
+    client.contact.get(id=7)
+    assert len(lookups) == 1
+    assert sent[-1]["proxies"] == {"https": "https://proxy.internal:3128"}
+    assert sent[-1]["verify"] == "/etc/ssl/corporate.pem"
+
+    client.contact.get(proxies={"https": "https://other:8080"})
+    assert sent[-1]["proxies"] == {"https": "https://other:8080"}
+    client.contact.get(proxies={"no_proxy": "mailjet.com"})
+    assert sent[-1]["proxies"] == {"no_proxy": "mailjet.com"}
+
+    plain = Client(auth=("a", "b"))
+    monkeypatch.setattr(plain.session, "request", mock_resp)
+    plain.contact.get()
+    assert (plain.session.trust_env, sent[-1]["verify"], sent[-1]["proxies"]) == (True, True, {})
@@ -0,0 +1,147 @@
+"""Unit tests for single-flight request coalescing."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import pytest
+import requests
+
+from mailjet_rest.client import Client, Config
+from mailjet_rest.errors import DoesNotExistError
+from mailjet_rest.utils.coalesce import AsyncSingleFlight, SingleFlight
+from mailjet_rest.utils.deadline import DeadlineBudget
+
+
+def _burst(client: Client, workers: int, **kwargs: Any) -> list[Any]:
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(client.template.get, id=7, **kwargs) for _ in range(workers)]
+        return [future.exception() or future.result() for future in futures]
+
+
+def _slow_session(client: Client, monkeypatch: pytest.MonkeyPatch, status: int = 200) -> list[str]:
+    calls: list[str] = []
+    release = threading.Event()
+
+    def mock_req(method: str, url: str, **kwargs: Any) -> requests.Response:
+        calls.append(url)
+        release.wait(5)
+        resp = requests.Response()
+        resp.status_code = status
+        resp._content = b'{"Data": [{"ID": 7}]}'
+        return resp
+
+    monkeypatch.setattr(client.session, "request", mock_req)
+    threading.Timer(0.2, release.set).start()
+    return calls
+
+
+def test_single_flight_shares_results_and_errors() -> None:
+    flights = SingleFlight()
+    release = threading.Event()
+    runs: list[int] = []
+
+    def slow() -> list[int]:
+        runs.append(1)
+        release.wait(5)
+        return [42]
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [pool.submit(flights.do, "k", slow) for _ in range(4)]
+        time.sleep(0.2)
+        assert len(flights) == 1
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert runs == [1]
+    assert results == [[42]] * 4
+    assert len({id(result) for result in results}) == 4  # Followers get their own copy.
+    assert len(flights) == 0
+
+    def boom() -> None:
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        flights.do("k", boom)
+    assert len(flights) == 0
+
+
+def test_async_single_flight_survives_caller_cancellation() -> None:
+    flights = AsyncSingleFlight()
+    runs: list[int] = []
+
+    async def slow() -> dict[str, int]:
+        runs.append(1)
+        await asyncio.sleep(0.01)
+        return {"ID": 7}
+
+    async def run() -> list[Any]:
+        leader = asyncio.ensure_future(flights.do("k", slow))
+        followers = [asyncio.ensure_future(flights.do("k", slow)) for _ in range(3)]
+        await asyncio.sleep(0)
+        leader.cancel()
+        results = await asyncio.gather(*followers)
+        assert len(flights) == 0
+        return results
+
+    assert asyncio.run(run()) == [{"ID": 7}] * 3
+    assert runs == [1]
+
+
+def test_client_coalesces_concurrent_identical_gets(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = Client(auth=("pub", "priv"), coalesce_requests=True)
+    calls = _slow_session(client, monkeypatch)
+
+    responses = _burst(client, 8)
+    assert len(calls) == 1
+    assert all(response.json() == {"Data": [{"ID": 7}]} for response in responses)
+    assert len({id(response) for response in responses}) == 8
+
+
+def test_client_shares_errors_with_followers(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = Client(auth=("pub", "priv"), coalesce_requests=True)
+    calls = _slow_session(client, monkeypatch, status=404)
+
+    outcomes = _burst(client, 4)
+    assert len(calls) == 1
+    assert all(isinstance(outcome, DoesNotExistError) for outcome in outcomes)
+
+
+@pytest.mark.parametrize(
+    ("config", "kwargs"),
+    [
+        (Config(), {}),
+        (Config(coalesce_requests=True), {"stream": True}),
+    ],
+)
+def test_client_does_not_coalesce_opted_out_requests(
+    monkeypatch: pytest.MonkeyPatch, config: Config, kwargs: dict[str, Any]
+) -> None:
+    client = Client(auth=("pub", "priv"), config=config)
+    calls = _slow_session(client, monkeypatch)
+
+    _burst(client, 3, **kwargs)
+    assert len(calls) == 3
+
+
+def test_client_does_not_coalesce_across_credentials() -> None:
+    alice = Client(auth=("alice", "a"), coalesce_requests=True)
+    bob = Client(auth=("bob", "b"), coalesce_requests=True)
+    assert alice._flight_key("GET", "u", None, {}, 15, None, {}) != bob._flight_key("GET", "u", None, {}, 15, None, {})
+    assert alice._flight_key("POST", "u", None, {}, 15, None, {}) is None
+
+
+def test_client_does_not_coalesce_across_timeouts_deadlines_or_transport_arguments() -> None:
+    client = Client(auth=("pub", "priv"), coalesce_requests=True)
+    key = client._flight_key("GET", "u", None, {}, 15, None, {})
+    assert key == client._flight_key("GET", "u", None, {}, 15, None, {})
+    assert key != client._flight_key("GET", "u", None, {}, 60, None, {})
+    assert key != client._flight_key("GET", "u", None, {}, 15, DeadlineBudget(5.0), {})
+    assert key != client._flight_key("GET", "u", None, {}, 15, None, {"proxies": {"https": "https://proxy:3128"}})
+    assert client._flight_key("GET", "u", None, {}, 15, DeadlineBudget(5.0), {}) == client._flight_key(
+        "GET", "u", None, {}, 15, DeadlineBudget(5.0), {}
+    )
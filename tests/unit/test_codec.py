@@ -0,0 +1,210 @@
+"""Unit tests for the pluggable JSON codec layer."""
+
+from __future__ import annotations
+
+import datetime
+import json
+from typing import Any
+
+import pytest
+import requests
+
+from mailjet_rest.builders import MessageBuilder
+from mailjet_rest.client import Client, Config
+from mailjet_rest.errors import ApiError
+from mailjet_rest.utils.codec import STDLIB_CODEC, IncrementalArrayDecoder, JsonCodec, get_codec
+
+
+def _spy_codec(calls: list[str]) -> JsonCodec:
+    """A stdlib-backed codec recording every call."""
+
+    def dumps(value: Any) -> bytes:
+        calls.append("dumps")
+        return STDLIB_CODEC.dumps(value)
+
+    def loads(raw: bytes | str) -> Any:
+        calls.append("loads")
+        return json.loads(raw)
+
+    return JsonCodec(name="spy", dumps=dumps, loads=loads)
+
+
+def _response(status: int, body: Any) -> requests.Response:
+    resp = requests.Response()
+    resp.status_code = status
+    resp._content = json.dumps(body).encode()
+    return resp
+
+
+def test_get_codec_resolves_names() -> None:
+    assert get_codec("json") is STDLIB_CODEC
+    assert get_codec("auto") is get_codec()
+    with pytest.raises(ValueError, match="Unknown JSON codec 'simdjson'"):
+        get_codec("simdjson")
+
+
+def test_get_codec_prefers_orjson_when_installed() -> None:
+    pytest.importorskip("orjson")
+    codec = get_codec()
+    assert codec.name == "orjson"
+    assert codec.loads(codec.dumps({1: "int key", "s": "é"})) == {"1": "int key", "s": "é"}
+
+
+def test_stdlib_codec_matches_requests_encoding() -> None:
+    payload = {"Name": "é", "List": [1, 2.5, None]}
+    assert STDLIB_CODEC.dumps(payload) == json.dumps(payload).encode()
+    with pytest.raises(ValueError, match="Out of range float"):
+        STDLIB_CODEC.dumps({"n": float("nan")})
+
+
+@pytest.mark.parametrize("name", ["json", "orjson", "ujson"])
+@pytest.mark.parametrize(
+    "value",
+    [
+        {"n": float("nan")},
+        [1, float("-inf")],
+        {"when": datetime.date(2026, 1, 1)},
+        {"big": 2**70, "none": None, 1: "int key"},
+    ],
+)
+def test_every_codec_fails_where_the_stdlib_fails(name: str, value: Any) -> None:
+    if name != "json":
+        pytest.importorskip(name)
+    codec = get_codec(name)
+    try:
+        expected = STDLIB_CODEC.dumps(value)
+    except (TypeError, ValueError) as e:
+        with pytest.raises(type(e)):
+            codec.dumps(value)
+    else:
+        assert json.loads(codec.dumps(value)) == json.loads(expected)
+
+
+def test_config_resolves_default_codec() -> None:
+    assert Config().json_codec is get_codec()
+    assert Config(json_codec=STDLIB_CODEC).json_codec is STDLIB_CODEC
+
+
+def test_stream_and_errors_decode_with_configured_codec(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[str] = []
+    client = Client(auth=("pub", "priv"), config=Config(json_codec=_spy_codec(calls)))
+    pages = iter([_response(200, {"Data": [{"ID": 1}, {"ID": 2}]}), _response(200, {"Data": [{"ID": 3}]})])
+    monkeypatch.setattr(client.session, "request", lambda **kwargs: next(pages))
+
+    assert [item["ID"] for item in client.contact.stream(chunk_size=2)] == [1, 2, 3]
+    assert calls == ["loads", "loads"]
+
+    monkeypatch.setattr(client.session, "request", lambda **kwargs: _response(404, {"ErrorMessage": "gone"}))
+    with pytest.raises(Exception, match="Resource not found: gone"):
+        client.contact.get(id=1)
+    assert calls[-1] == "loads"
+
+
+def test_caller_idempotency_key_skips_fingerprint_and_uses_codec(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[str] = []
+    captured: dict[str, Any] = {}
+    client = Client(auth=("pub", "priv"), config=Config(json_codec=_spy_codec(calls)))
+
+    def fake_request(**kwargs: Any) -> requests.Response:
+        captured.update(kwargs)
+        return _response(201, {"Data": []})
+
+    monkeypatch.setattr(client.session, "request", fake_request)
+    client.contact.create(data={"Email": "a@example.com"}, headers={"Idempotency-Key": "k-1"})
+
+    assert calls == ["dumps"]
+    assert captured["data"] == b'{"Email": "a@example.com"}'
+    assert captured["headers"]["Idempotency-Key"] == "k-1"
+
+
+def test_non_finite_floats_fail_alike_with_or_without_an_idempotency_key(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = Client(auth=("pub", "priv"))
+    monkeypatch.setattr(client.session.adapters["https://"], "send", lambda *args, **kwargs: pytest.fail("sent"))
+
+    for headers in ({}, {"Idempotency-Key": "k-1"}):
+        with pytest.raises(ApiError, match="Out of range float values"):
+            client.contact.create(data={"x": float("nan")}, headers=headers)
+
+
+def test_builder_variables_size_check_handles_non_serializable_values() -> None:
+    builder = (
+        MessageBuilder()
+        .set_sender("a@example.com")
+        .add_recipient("b@example.com")
+        .set_content(text="Hi")
+        .set_variables({"when": datetime.date(2026, 1, 1), "blob": "x" * 10})
+    )
+    assert builder.build()["Variables"]["blob"] == "x" * 10
+
+    builder.set_variables({"when": datetime.date(2026, 1, 1), "blob": "x" * (1024 * 1024)})
+    with pytest.raises(ValueError, match="Variables payload too large"):
+        builder.build()
+
+
+def test_builder_variables_size_check_ignores_the_installed_codec() -> None:
+    # 400k non-ASCII characters: ~0.8 MB as raw UTF-8 (orjson), ~2.4 MB with the stdlib's \u escapes.
+    builder = (
+        MessageBuilder()
+        .set_sender("a@example.com")
+        .add_recipient("b@example.com")
+        .set_content(text="Hi")
+        .set_variables({"name": "\u00e9" * 400_000})
+    )
+    with pytest.raises(ValueError, match="Variables payload too large"):
+        builder.build()
+
+    builder.set_variables({"ratio": float("nan")})
+    assert builder.build()["Variables"]["ratio"] != 0
+
+
+def _feed_in_chunks(raw: bytes, size: int) -> list[Any]:
+    decoder = IncrementalArrayDecoder()
+    items = []
+    for start in range(0, len(raw), size):
+        items.extend(decoder.feed(raw[start : start + size]))
+    return items + decoder.close()
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 64, 1 << 16])
+@pytest.mark.parametrize("indent", [None, 2])
+def test_incremental_decoder_matches_full_parse(size: int, indent: int | None) -> None:
+    page = {
+        "Count": 7,
+        "Meta": {"Data": ["nested members are skipped"]},
+        "Data": [{"ID": 1, "Name": 'Zoë ☃ "quoted"'}, {"Nested": [1, {"x": None}]}, -1.5e10, 1e-5, 12, True, ""],
+        "Total": 7,
+    }
+    raw = json.dumps(page, indent=indent, ensure_ascii=False).encode()
+
+    assert _feed_in_chunks(raw, size) == page["Data"]
+
+
+@pytest.mark.parametrize("raw", [b"{}", b'{"Count": 0}', b'{"Data": []}', b' {"Data" : [ ] , "Total": 0} '])
+def test_incremental_decoder_empty_pages(raw: bytes) -> None:
+    assert _feed_in_chunks(raw, 3) == []
+
+
+def test_incremental_decoder_yields_items_before_the_document_ends() -> None:
+    decoder = IncrementalArrayDecoder()
+
+    assert decoder.feed(b'{"Count": 2, "Data": [{"ID": 1}, {"ID"') == [{"ID": 1}]
+    assert decoder.feed(b": 2}]") == [{"ID": 2}]
+    assert decoder.feed(b', "Total": 2}') == []
+    assert decoder.close() == []
+
+
+@pytest.mark.parametrize(
+    ("raw", "match"),
+    [
+        (b"", "Truncated"),
+        (b'{"Data": [1, 2', "Truncated"),
+        (b"[1, 2]", "expected one of '{'"),
+        (b'{"Data": {"ID": 1}}', "expected one of '\\['"),
+        (b'{"Data": [1,, 2]}', "Expecting value"),
+    ],
+)
+def test_incremental_decoder_rejects_malformed_documents(raw: bytes, match: str) -> None:
+    decoder = IncrementalArrayDecoder()
+    with pytest.raises(ValueError, match=match):
+        decoder.feed(raw)
+        decoder.close()
@@ -0,0 +1,192 @@
+"""Unit tests for the adaptive (AIMD) concurrency limiter."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+from mailjet_rest.client import Client, JitterRetry
+from mailjet_rest.errors import ApiRateLimitError, MailjetApiError, TimeoutError, ValidationError
+from mailjet_rest.utils.concurrency import AdaptiveConcurrencyLimiter
+
+
+def _fail(limiter: AdaptiveConcurrencyLimiter, error: Exception) -> None:
+    with pytest.raises(type(error)), limiter.slot():
+        raise error
+
+
+def test_limiter_grows_additively_on_success() -> None:
+    limiter = AdaptiveConcurrencyLimiter(initial=2, max_limit=4)
+
+    for _ in range(3):
+        with limiter.slot():
+            pass
+    assert limiter.limit == 3  # 2 + 1/2 + 1/2.5 + 1/2.9
+
+    for _ in range(50):
+        with limiter.slot():
+            pass
+    assert limiter.limit == 4  # Capped at max_limit
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        ApiRateLimitError("Rate limit exceeded", 429),
+        MailjetApiError("Service unavailable", 503),
+        TimeoutError("Request to Mailjet API timed out"),
+    ],
+)
+def test_limiter_backs_off_multiplicatively_on_overload(error: Exception) -> None:
+    limiter = AdaptiveConcurrencyLimiter(initial=16, max_limit=16)
+
+    _fail(limiter, error)
+
+    assert limiter.limit == 8
+    assert limiter.in_flight == 0
+
+
+def test_limiter_ignores_client_errors_and_respects_min_limit() -> None:
+    limiter = AdaptiveConcurrencyLimiter(initial=4, min_limit=2)
+
+    _fail(limiter, ValidationError("Payload validation failed", 400))
+    assert limiter.limit == 4
+
+    for _ in range(5):
+        _fail(limiter, ApiRateLimitError("Rate limit exceeded", 429))
+    assert limiter.limit == 2
+
+
+@pytest.mark.parametrize(("status", "error"), [(429, ApiRateLimitError), (503, MailjetApiError)])
+def test_limiter_backs_off_when_the_client_runs_out_of_retries(
+    status: int,
+    error: type[Exception],
+    handler: Any,
+    local_client: Callable[..., Client],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(JitterRetry, "get_backoff_time", lambda self: 0.0)
+    handler.status = status
+    client = local_client()
+    limiter = AdaptiveConcurrencyLimiter(initial=8, max_limit=8)
+
+    with pytest.raises(error) as raised, limiter.slot():
+        client.contact.get()
+
+    assert raised.value.status_code == status
+    assert handler.received == 4  # The first attempt and 3 retries
+    assert limiter.limit == 4
+
+
+def test_limiter_decreases_once_per_window() -> None:
+    limiter = AdaptiveConcurrencyLimiter(initial=8, max_limit=8)
+    entered = threading.Barrier(4)
+
+    def overloaded() -> None:
+        with pytest.raises(ApiRateLimitError), limiter.slot():
+            entered.wait()
+            raise ApiRateLimitError("Rate limit exceeded", 429)
+
+    threads = [threading.Thread(target=overloaded) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Four requests sent under the same limit rejected together count as a single overload signal.
+    assert limiter.limit == 4
+
+
+def test_limiter_treats_latency_spikes_as_overload() -> None:
+    limiter = AdaptiveConcurrencyLimiter(initial=8, max_limit=8, latency_tolerance=3.0, smoothing=1.0)
+
+    with limiter.slot():
+        time.sleep(0.01)
+    with limiter.slot():
+        time.sleep(0.1)
+
+    assert limiter.limit == 4
+    assert 0.005 < limiter.snapshot()["baseline_latency"] < 0.05
+
+
+def test_limiter_caps_threads_in_flight() -> None:
+    limiter = AdaptiveConcurrencyLimiter(initial=3, max_limit=3)
+    lock = threading.Lock()
+    active = peak = 0
+
+    def work() -> None:
+        nonlocal active, peak
+        with limiter.slot():
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.01)
+            with lock:
+                active -= 1
+
+    threads = [threading.Thread(target=work) for _ in range(12)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert peak == 3
+    assert limiter.snapshot() == {"limit": 3, "in_flight": 0, "baseline_latency": pytest.approx(0.01, abs=0.05)}
+
+
+def test_limiter_caps_tasks_in_flight_and_survives_cancellation() -> None:
+    limiter = AdaptiveConcurrencyLimiter(initial=2, max_limit=2)
+    active = peak = 0
+
+    async def work() -> None:
+        nonlocal active, peak
+        async with limiter.aslot():
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+    async def run() -> None:
+        tasks = [asyncio.ensure_future(work()) for _ in range(10)]
+        await asyncio.sleep(0)
+        tasks[5].cancel()  # Queued waiter gives up before its turn
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    asyncio.run(run())
+
+    assert peak == 2
+    assert limiter.in_flight == 0
+
+
+def test_limiter_returns_slot_handed_to_cancelled_waiter() -> None:
+    limiter = AdaptiveConcurrencyLimiter(initial=1, max_limit=1)
+
+    async def run() -> None:
+        async with limiter.aslot():
+            waiter = asyncio.ensure_future(limiter.aslot().__aenter__())
+            await asyncio.sleep(0)
+        # The slot was handed over to 'waiter' but it is cancelled before it resumes.
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+        assert limiter.in_flight == 0
+
+        async with limiter.aslot():
+            assert limiter.in_flight == 1
+
+    asyncio.run(run())
+
+
+def test_limiter_validation() -> None:
+    with pytest.raises(ValueError, match="min_limit <= initial <= max_limit"):
+        AdaptiveConcurrencyLimiter(initial=10, max_limit=5)
+    with pytest.raises(ValueError, match="min_limit <= initial <= max_limit"):
+        AdaptiveConcurrencyLimiter(min_limit=0)
+    with pytest.raises(ValueError, match="0 < backoff < 1"):
+        AdaptiveConcurrencyLimiter(backoff=1.0)
+    with pytest.raises(ValueError, match="latency_tolerance > 1"):
+        AdaptiveConcurrencyLimiter(latency_tolerance=1.0)
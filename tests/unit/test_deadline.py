@@ -0,0 +1,178 @@
+"""Unit tests for total deadline budgets spanning retries."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Callable
+from http.server import BaseHTTPRequestHandler
+from typing import Any
+
+import pytest
+
+from mailjet_rest.client import Client, Config, JitterRetry
+from mailjet_rest.errors import DeadlineExceededError, MailjetApiError, TimeoutError
+from mailjet_rest.utils.deadline import DeadlineBudget
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    now = [1000.0]
+    monkeypatch.setattr("mailjet_rest.utils.deadline.time.monotonic", lambda: now[0])
+    return now
+
+
+def test_budget_reserves_waits_that_fit_another_attempt(clock: list[float]) -> None:
+    budget = DeadlineBudget(2.0)
+
+    clock[0] += 0.4
+    budget.end_attempt()
+    budget.reserve(0.5, "retry backoff")  # 0.5 + 0.4 fits in the 1.6s left
+    clock[0] += 0.5 + 0.6
+    budget.end_attempt()
+    assert budget.attempts == pytest.approx([0.4, 0.6])
+
+    with pytest.raises(DeadlineExceededError) as exc_info:
+        budget.reserve(0.2, "retry backoff")  # 0.2 + 0.6 does not fit in the 0.5s left
+
+    error = exc_info.value
+    assert isinstance(error, TimeoutError)
+    assert error.deadline == 2.0
+    assert error.elapsed == pytest.approx(1.5)
+    assert error.attempts == pytest.approx((0.4, 0.6))
+    assert error.waits == {"retry backoff": 0.5}
+    assert str(error) == (
+        "Deadline of 2.00s exceeded after 1.50s (0.80s needed for a retry backoff of 0.20s and another attempt). "
+        "Spent on: 2 attempt(s) (0.40s, 0.60s), retry backoff 0.50s; 0.50s left."
+    )
+
+
+def test_budget_clips_timeouts_to_the_time_left(clock: list[float]) -> None:
+    budget = DeadlineBudget(2.0)
+    clock[0] += 1.5
+
+    assert budget.clip(10) == pytest.approx(0.5)
+    assert budget.clip((0.2, 10)) == pytest.approx((0.2, 0.5))
+    assert budget.clip(None) == pytest.approx(0.5)
+
+    timeout = budget.timeout((3.0, 10.0))
+    assert timeout.total == pytest.approx(0.5)
+    clock[0] += 0.3
+    retried = timeout.clone()
+    assert retried.total == pytest.approx(0.2)
+    assert (retried.connect_timeout, retried._read) == (pytest.approx(0.2), 10.0)
+
+    clock[0] += 1
+    assert budget.expired()
+    assert budget.clip(10) == pytest.approx(0.001)
+
+
+def test_budget_activation_and_validation() -> None:
+    budget = DeadlineBudget(1.0)
+    assert DeadlineBudget.current() is None
+    with budget.activate():
+        assert DeadlineBudget.current() is budget
+    assert DeadlineBudget.current() is None
+
+    with pytest.raises(ValueError, match="strictly positive"):
+        DeadlineBudget(0)
+    with pytest.raises(ValueError, match="deadline must be a strictly positive"):
+        Config(deadline=-1)
+
+
+class _SlowUnavailable(BaseHTTPRequestHandler):
+    """Answers every request with a 503 after 'delay' seconds."""
+
+    delay = 0.05
+
+    def do_GET(self) -> None:
+        time.sleep(self.delay)
+        body = b'{"ErrorMessage": "Service unavailable"}'
+        try:
+            self.send_response(503)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        except OSError:
+            pass  # The client gave up on this attempt
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+
+@pytest.fixture
+def handler() -> type[BaseHTTPRequestHandler]:
+    return _SlowUnavailable
+
+
+def test_client_stops_retrying_when_the_next_attempt_cannot_fit(
+    local_client: Callable[..., Client], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(JitterRetry, "get_backoff_time", lambda self: 0.3)
+    client = local_client(deadline=0.5)
+
+    started = time.monotonic()
+    with pytest.raises(DeadlineExceededError, match=r"Spent on: 2 attempt\(s\).*retry backoff 0.30s") as exc_info:
+        client.contact.get()
+
+    assert time.monotonic() - started < 0.6  # Within the deadline, give or take scheduling
+    assert len(exc_info.value.attempts) == 2
+    assert exc_info.value.waits == {"retry backoff": 0.3}
+
+    # Without a deadline the same call exhausts JitterRetry instead.
+    monkeypatch.setattr(JitterRetry, "get_backoff_time", lambda self: 0.0)
+    with pytest.raises(MailjetApiError) as exhausted:
+        local_client().contact.get()
+    assert exhausted.value.status_code == 503
+
+
+def test_client_clips_attempt_timeouts_to_the_deadline(
+    local_client: Callable[..., Client], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(_SlowUnavailable, "delay", 2.0)
+    client = local_client(timeout=10, deadline=5)
+
+    started = time.monotonic()
+    with pytest.raises(DeadlineExceededError, match="Deadline of 0.30s exceeded"):
+        client.contact.get(deadline=0.3)  # The per-call deadline overrides the config
+
+    assert time.monotonic() - started < 1.0
+
+
+def test_client_gives_up_on_rate_limit_waits_beyond_the_deadline(monkeypatch: pytest.MonkeyPatch) -> None:
+    from mailjet_rest.utils.ratelimit import RateLimit
+
+    client = Client(auth=("pub", "priv"), config=Config(rate_limits={"rest": RateLimit(rate=1)}, deadline=0.5))
+    monkeypatch.setattr(client.session, "request", lambda **kwargs: pytest.fail("must not be sent"))
+    client.rate_limiter.reserve(client.contact._build_url())  # Spend the only token
+
+    with pytest.raises(DeadlineExceededError, match="rate limit wait of 1.00s"):
+        client.contact.get()
+
+
+def test_async_client_honours_deadline(monkeypatch: pytest.MonkeyPatch) -> None:
+    httpx = pytest.importorskip("httpx")
+    from mailjet_rest.async_client import AsyncClient
+
+    monkeypatch.setattr(JitterRetry, "get_backoff_time", lambda self: 0.3)
+    read_timeouts: list[float] = []
+
+    async def handler(request: Any) -> Any:
+        read_timeouts.append(request.extensions["timeout"]["read"])
+        await asyncio.sleep(0.05)
+        return httpx.Response(503, json={"ErrorMessage": "Service unavailable"})
+
+    async def run() -> None:
+        async with AsyncClient(auth=("pub", "priv"), deadline=0.5) as client:
+            client.session._transport = httpx.MockTransport(handler)
+            await client.contact.get()
+
+    started = time.monotonic()
+    with pytest.raises(DeadlineExceededError, match=r"Spent on: 2 attempt\(s\)"):
+        asyncio.run(run())
+
+    assert time.monotonic() - started < 0.6  # Within the deadline, give or take scheduling
+    assert len(read_timeouts) == 2
+    assert read_timeouts[0] <= 0.5
+    assert read_timeouts[1] < 0.2
@@ -1,7 +1,17 @@
+import io
+import json
+import threading
+import time
+from typing import Any
+
 import pytest
+import requests
 import responses
 
 from mailjet_rest.client import Client
+from mailjet_rest.endpoint import Endpoint
+from mailjet_rest.pagination import AdaptivePageSizer, StreamCursor
+from mailjet_rest.utils.concurrency import AdaptiveConcurrencyLimiter
 
 
 @pytest.fixture
@@ -89,3 +99,249 @@ def test_endpoint_dynamic_data_routing(client_offline: Client) -> None:
     """Coverage: Test dynamic data_ route building."""
     url = client_offline.data_testroute._build_url()
     assert "v3/data/testroute" in url
+
+
+def _paged_contacts(total: int, delay: float = 0.0) -> tuple[Any, dict[str, Any]]:
+    """Thread-safe fake of session.request serving 'total' contacts and recording concurrency."""
+    stats: dict[str, Any] = {"offsets": [], "count_calls": 0, "active": 0, "max_active": 0}
+    lock = threading.Lock()
+
+    def request(**kwargs: Any) -> requests.Response:
+        params = kwargs["params"]
+        resp = requests.Response()
+        resp.status_code = 200
+        if params.get("countOnly"):
+            stats["count_calls"] += 1
+            assert "Limit" not in params and "Offset" not in params
+            resp._content = json.dumps({"Count": total, "Data": [], "Total": total}).encode()
+            return resp
+
+        with lock:
+            stats["active"] += 1
+            stats["max_active"] = max(stats["max_active"], stats["active"])
+            stats["offsets"].append(params["Offset"])
+        time.sleep(delay)
+        with lock:
+            stats["active"] -= 1
+        offset, limit = params["Offset"], params["Limit"]
+        rows = [{"ID": i} for i in range(offset, min(offset + limit, total))]
+        resp._content = json.dumps({"Count": len(rows), "Data": rows}).encode()
+        return resp
+
+    return request, stats
+
+
+def test_stream_prefetch_yields_in_order_concurrently(
+    client_offline: Client, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    request, stats = _paged_contacts(total=95, delay=0.02)
+    monkeypatch.setattr(client_offline.session, "request", request)
+
+    items = list(client_offline.contact.stream(chunk_size=10, prefetch=4, filters={"IsExcluded": False}))
+
+    assert [item["ID"] for item in items] == list(range(95))
+    assert stats["count_calls"] == 1
+    assert sorted(stats["offsets"]) == list(range(0, 100, 10))
+    assert 1 < stats["max_active"] <= 4
+
+
+def test_stream_prefetch_resumes_from_offset_and_finishes_grown_tail(
+    client_offline: Client, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    request, stats = _paged_contacts(total=40)
+    # Report a stale total: the last 20 objects were created after the count.
+    monkeypatch.setattr(Endpoint, "_parse_count", staticmethod(lambda body: 20))
+    monkeypatch.setattr(client_offline.session, "request", request)
+
+    items = list(client_offline.contact.stream(chunk_size=10, prefetch=3, filters={"Offset": 10}))
+
+    assert [item["ID"] for item in items] == list(range(10, 40))
+    assert stats["offsets"] == [10, 20, 30, 40]
+
+
+def test_stream_prefetch_early_exit_and_fallback(client_offline: Client, monkeypatch: pytest.MonkeyPatch) -> None:
+    request, stats = _paged_contacts(total=1000)
+    monkeypatch.setattr(client_offline.session, "request", request)
+
+    stream = client_offline.contact.stream(chunk_size=10, prefetch=2)
+    assert [next(stream)["ID"] for _ in range(3)] == [0, 1, 2]
+    stream.close()
+    assert len(stats["offsets"]) <= 3  # Never more than the prefetch window plus the page being consumed
+
+    def no_count(**kwargs: Any) -> requests.Response:
+        if kwargs["params"].get("countOnly"):
+            resp = requests.Response()
+            resp.status_code = 200
+            resp._content = b"{}"
+            return resp
+        return request(**kwargs)
+
+    monkeypatch.setattr(client_offline.session, "request", no_count)
+    assert len(list(client_offline.contact.stream(chunk_size=250, prefetch=4))) == 1000
+
+    with pytest.raises(ValueError, match="prefetch must be a positive integer"):
+        next(client_offline.contact.stream(prefetch=-1))
+
+
+def test_stream_prefetch_respects_concurrency_limiter(
+    client_offline: Client, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    request, stats = _paged_contacts(total=95, delay=0.01)
+    monkeypatch.setattr(client_offline.session, "request", request)
+    limiter = AdaptiveConcurrencyLimiter(initial=2, max_limit=2)
+
+    items = list(client_offline.contact.stream(chunk_size=10, prefetch=6, concurrency=limiter))
+
+    assert [item["ID"] for item in items] == list(range(95))
+    assert stats["max_active"] <= 2
+    assert limiter.in_flight == 0
+
+    with pytest.raises(ValueError, match="require a positive prefetch"):
+        next(client_offline.contact.stream(concurrency=limiter))
+
+
+def _keyset_contacts(ids: list[int], inclusive: bool = True) -> tuple[Any, list[dict[str, Any]]]:
+    """Fake of session.request serving contacts sorted by ID and bounded by 'FromID'."""
+    calls: list[dict[str, Any]] = []
+
+    def request(**kwargs: Any) -> requests.Response:
+        params = kwargs["params"]
+        calls.append(dict(params))
+        assert "Offset" not in params and params["Sort"] == "ID"
+        bound = params.get("FromID")
+        rows = [{"ID": i} for i in sorted(ids) if bound is None or i > bound or (inclusive and i == bound)]
+        resp = requests.Response()
+        resp.status_code = 200
+        resp.raw = io.BytesIO(json.dumps({"Data": rows[: params["Limit"]]}).encode())
+        return resp
+
+    return request, calls
+
+
+def test_stream_cursor_pages_by_id_and_resumes_from_token(
+    client_offline: Client, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    ids = [3, 5, 8, 13, 21, 34, 55]
+    request, calls = _keyset_contacts(ids)
+    monkeypatch.setattr(client_offline.session, "request", request)
+
+    cursor = StreamCursor()
+    seen = []
+    for item in client_offline.contact.stream(chunk_size=3, cursor=cursor):
+        seen.append(item["ID"])
+        if item["ID"] == 13:
+            token = cursor.token  # Item 13 is in progress, so the job "crashes" here.
+            break
+
+    assert seen == [3, 5, 8, 13]
+    assert cursor.after == 8
+    assert [call.get("FromID") for call in calls] == [None, 8]
+
+    ids.append(89)  # Rows created during the outage are picked up on resume.
+    resumed = StreamCursor.from_token(token)
+    rest = [item["ID"] for item in client_offline.contact.stream(chunk_size=3, cursor=resumed)]
+    assert rest == [13, 21, 34, 55, 89]
+    assert resumed.after == 89
+
+
+def test_stream_cursor_rejects_prefetch_offset_and_ignored_bound(
+    client_offline: Client, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    with pytest.raises(ValueError, match="cannot be combined with prefetch"):
+        next(client_offline.contact.stream(cursor=StreamCursor(), prefetch=2))
+    with pytest.raises(ValueError, match="'Offset'"):
+        next(client_offline.contact.stream(cursor=StreamCursor(), filters={"Offset": 10}))
+
+    def ignores_bound(**kwargs: Any) -> requests.Response:
+        resp = requests.Response()
+        resp.status_code = 200
+        resp._content = json.dumps({"Data": [{"ID": 1}, {"ID": 2}]}).encode()
+        return resp
+
+    monkeypatch.setattr(client_offline.session, "request", ignores_bound)
+    with pytest.raises(ValueError, match="ignored the 'FromID' cursor filter"):
+        list(client_offline.contact.stream(chunk_size=2, cursor=StreamCursor()))
+
+
+class _CountingBody(io.BytesIO):
+    """Response body recording how many network reads were consumed."""
+
+    reads = 0
+
+    def read(self, size: int | None = -1) -> bytes:
+        self.reads += 1
+        return super().read(size)
+
+
+def test_stream_incremental_yields_before_page_is_read(client_offline: Client, monkeypatch: pytest.MonkeyPatch) -> None:
+    bodies: list[_CountingBody] = []
+    rows = [{"ID": i, "Email": f"user_{i}@example.com"} for i in range(3000)]
+
+    def request(**kwargs: Any) -> requests.Response:
+        assert kwargs["stream"] is True
+        offset = kwargs["params"]["Offset"]
+        resp = requests.Response()
+        resp.status_code = 200
+        resp.raw = _CountingBody(json.dumps({"Count": 3000, "Data": rows[offset : offset + 3000], "Total": 3000}).encode())
+        bodies.append(resp.raw)
+        return resp
+
+    monkeypatch.setattr(client_offline.session, "request", request)
+
+    stream = client_offline.contact.stream(chunk_size=3000, incremental=True)
+    assert next(stream) == rows[0]
+    assert bodies[0].reads == 1  # Only the first 64KB of a ~150KB page has been read.
+    stream.close()
+    assert bodies[0].closed
+
+    assert list(client_offline.contact.stream(chunk_size=3000, incremental=True)) == rows
+    assert bodies[1].reads > 1
+
+    with pytest.raises(ValueError, match="cannot be combined with prefetch"):
+        next(client_offline.contact.stream(incremental=True, prefetch=2))
+
+
+def test_stream_incremental_with_cursor(client_offline: Client, monkeypatch: pytest.MonkeyPatch) -> None:
+    request, calls = _keyset_contacts([1, 2, 3, 4, 5], inclusive=False)
+    monkeypatch.setattr(client_offline.session, "request", request)
+
+    cursor = StreamCursor()
+    items = list(client_offline.contact.stream(chunk_size=2, cursor=cursor, incremental=True))
+
+    assert [item["ID"] for item in items] == [1, 2, 3, 4, 5]
+    assert [call.get("FromID") for call in calls] == [None, 2, 4]
+    assert cursor.after == 5
+
+
+def test_stream_adaptive_learns_page_size_per_resource(client_offline: Client, monkeypatch: pytest.MonkeyPatch) -> None:
+    limits: list[int] = []
+    rows = [{"ID": i, "Blob": "x" * 90} for i in range(500)]
+
+    def request(**kwargs: Any) -> requests.Response:
+        params = kwargs["params"]
+        limits.append(params["Limit"])
+        resp = requests.Response()
+        resp.status_code = 200
+        resp._content = json.dumps({"Data": rows[params["Offset"] : params["Offset"] + params["Limit"]]}).encode()
+        return resp
+
+    monkeypatch.setattr(client_offline.session, "request", request)
+    client_offline.page_sizer = AdaptivePageSizer(max_page_bytes=10_000)
+
+    items = list(client_offline.contact.stream(chunk_size=20, adaptive=True))
+
+    assert items == rows
+    # Doubles while pages are small, then settles under the ~100 objects that fit in 10KB.
+    assert limits[:3] == [20, 40, 80]
+    assert all(limit <= 100 for limit in limits)
+    learned = client_offline.page_sizer.limit_for("contact", 20)
+    assert learned == limits[-1]
+
+    limits.clear()
+    list(client_offline.contact.stream(chunk_size=20, adaptive=True))
+    assert limits[0] == learned
+    list(client_offline.contact.stream(chunk_size=20))
+    assert limits[-1] == 20  # Fixed-size streams are unaffected.
+
+    with pytest.raises(ValueError, match="adaptive page sizing"):
+        next(client_offline.contact.stream(adaptive=True, incremental=True))
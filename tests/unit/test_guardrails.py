@@ -1,15 +1,27 @@
 # pyright: reportIndexIssue=false
 """Unit tests for the guardrails.py security module."""
 
+import hashlib
+import json
 import logging
+import os
+import shutil
+import ssl
+import subprocess
+import threading
+from collections.abc import Iterator
 from html.parser import HTMLParser
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from mailjet_rest.utils.guardrails import RedactingFilter, SecretAuth, SecurityGuard
+from mailjet_rest.client import Client
+from mailjet_rest.errors import ApiError
+from mailjet_rest.utils import guardrails
+from mailjet_rest.utils.guardrails import RedactingFilter, SecretAuth, SecureHTTPAdapter, SecurityGuard
 
 
 class TestRedactingFilter:
@@ -65,6 +77,51 @@ class TestRedactingFilter:
         assert isinstance(record.args, dict)
         assert record.args["a"]["b"]["c"]["d"]["e"] == "[MAX_DEPTH_REACHED]"
 
+    def test_records_no_handler_emits_are_left_untouched(self) -> None:
+        logger = logging.getLogger("mailjet_rest.tests.redaction_gate")
+        logger.propagate = False
+        handler = logging.NullHandler(logging.WARNING)
+        logger.addHandler(handler)
+        try:
+            args = ("api_key=abcdef",)
+            record = logger.makeRecord(logger.name, logging.DEBUG, "", 0, "Sending %s", args, None)
+            RedactingFilter().filter(record)
+            assert record.args is args  # Dropped by the handler: not scrubbed
+
+            record = logger.makeRecord(logger.name, logging.ERROR, "", 0, "Sending %s", args, None)
+            RedactingFilter().filter(record)
+            assert record.getMessage() == "Sending api_key=********"
+        finally:
+            logger.removeHandler(handler)
+
+    def test_clean_records_pass_through_a_single_scan(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        args = ("GET", "https://api.mailjet.com/v3/REST/contact", {"Count": ["1", 2]})
+        record = logging.LogRecord("test", logging.ERROR, "", 0, "%s %s %s", args, None)
+        record.mailjet_trace = {"CustomID": "order-42"}
+        searched: list[str] = []
+        pattern = guardrails._get_secret_pattern()
+
+        class RecordingPattern:
+            def search(self, text: str) -> Any:
+                searched.append(text)
+                return pattern.search(text)
+
+        monkeypatch.setattr(guardrails, "_get_secret_pattern", RecordingPattern)
+        RedactingFilter().filter(record)
+
+        assert record.args is args  # Unchanged, not rebuilt
+        assert searched == ["%s %s %s\nGET\nhttps://api.mailjet.com/v3/REST/contact\n1\norder-42"]
+
+    def test_redaction_honours_subclass_overrides(self) -> None:
+        class Masking(RedactingFilter):
+            @staticmethod
+            def _redact_str(data: str) -> str:
+                return "[MASKED]" if "token=" in data else data
+
+        secret = "token=" + "abc123" * 4
+        assert RedactingFilter()._deep_redact((secret, "plain")) == ("token=********", "plain")
+        assert Masking()._deep_redact((secret, "plain")) == ("[MASKED]", "plain")
+
 
 class TestSecurityGuard:
     def test_validate_config_url_valid(self) -> None:
@@ -225,6 +282,118 @@ def test_generate_payload_fingerprint_max_depth() -> None:
         SecurityGuard.generate_payload_fingerprint(deep)
 
 
+def test_generate_payload_fingerprint_canonical_form() -> None:
+    """Coverage: The streaming encoder hashes the exact json.dumps(sort_keys=True, default=str) bytes."""
+
+    class Opaque:
+        def __str__(self) -> str:
+            return "opaque-é"
+
+    payload: dict[Any, Any] = {
+        "b": [1, 2.5, float("nan"), float("-inf"), None, True],
+        "a": {"z": "ünïcode", "y": (1, 2), "CustomID": "dropped"},
+        "obj": Opaque(),
+        "empty": [{}, []],
+    }
+    expected = json.dumps(
+        {
+            "b": [1, 2.5, float("nan"), float("-inf"), None, True],
+            "a": {"z": "ünïcode", "y": [1, 2]},
+            "obj": "opaque-é",
+            "empty": [{}, []],
+        },
+        sort_keys=True,
+        default=str,
+    )
+    assert SecurityGuard.generate_payload_fingerprint(payload) == hashlib.sha256(expected.encode()).hexdigest()
+
+
+def test_generate_payload_fingerprint_non_string_keys() -> None:
+    """Coverage: int/float/bool/None keys are coerced like json.dumps; mixed-type keys cannot be sorted."""
+    payload = {2: "b", 1.5: "a"}
+    expected = json.dumps(payload, sort_keys=True)
+    assert SecurityGuard.generate_payload_fingerprint(payload) == hashlib.sha256(expected.encode()).hexdigest()
+
+    with pytest.raises(ValueError, match="Payload hashing failed"):
+        SecurityGuard.generate_payload_fingerprint({1: "a", "b": 2})
+    with pytest.raises(ValueError, match="Payload hashing failed"):
+        SecurityGuard.generate_payload_fingerprint({"nested": {(1, 2): "tuple key"}})
+
+
+def test_generate_payload_fingerprint_shared_references_are_not_cycles() -> None:
+    """Coverage: Only ancestors on the current path count as cycles, shared siblings are hashed in full."""
+    shared = {"k": [1, 2]}
+    with_shared = [shared, shared]
+    with_copies = [{"k": [1, 2]}, {"k": [1, 2]}]
+    assert SecurityGuard.generate_payload_fingerprint(with_shared) == SecurityGuard.generate_payload_fingerprint(
+        with_copies
+    )
+
+    cyclic: list[Any] = [1]
+    cyclic.append(cyclic)
+    assert SecurityGuard.generate_payload_fingerprint(cyclic) == SecurityGuard.generate_payload_fingerprint(
+        [1, "[Circular]"]
+    )
+
+
+def test_generate_payload_fingerprint_depth_boundary() -> None:
+    """Coverage: Values nested exactly 50 levels deep are accepted, one level deeper is rejected."""
+
+    def nest(levels: int) -> Any:
+        node: Any = "leaf"
+        for _ in range(levels):
+            node = [node]
+        return node
+
+    assert SecurityGuard.generate_payload_fingerprint(nest(50))
+    with pytest.raises(ValueError, match="Payload hashing failed"):
+        SecurityGuard.generate_payload_fingerprint(nest(51))
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {"a": 1, "b": [1, 2], "c": {"d": None}},
+        {"CustomID": "first", "Name": "x", "Nested": {"k": [1.5, True]}},
+        {"A": 1, "CustomID": "middle", "Z": {"v": 2}},
+        {"A": [{}], "SandboxMode": True},
+        {"CustomID": "x", "EventPayload": {"SandboxMode": 1, "k": "v"}},
+        [{"CustomID": "a", "To": [{"Email": "ü@example.com"}]}, {"EventPayload": "b", "Vars": {"n": 1}}],
+        {"Ids": {2: "two", 1.5: "one"}, "Msg": [{"CustomID": 1, "k": [1, {"EventPayload": 2}]}]},
+    ],
+)
+def test_serialize_payload_matches_fingerprint(payload: Any) -> None:
+    """Coverage: The single-pass body keeps volatile keys on the wire but out of the fingerprint."""
+    body, fingerprint = SecurityGuard.serialize_payload(payload)
+
+    assert fingerprint == SecurityGuard.generate_payload_fingerprint(payload)
+    assert body == json.dumps(payload, sort_keys=True).encode()
+
+
+@pytest.mark.parametrize(
+    ("payload", "exc_class"),
+    [
+        ({"a": float("nan")}, ValueError),
+        ({"nested": {"inf": [1, float("inf"), {"x": 1}]}}, ValueError),
+        ({"tags": {"a", "b"}}, TypeError),
+        ({"raw": b"bytes"}, TypeError),
+        ({"obj": object(), "n": {"x": 1}}, TypeError),
+    ],
+)
+def test_serialize_payload_rejects_non_strict_json(payload: Any, exc_class: type[Exception]) -> None:
+    """Coverage: Values the wire encoder cannot represent raise so callers can fall back."""
+    with pytest.raises(exc_class):
+        SecurityGuard.serialize_payload(payload)
+
+
+def test_serialize_payload_rejects_cycles() -> None:
+    """Coverage: Cycles are an error on the wire, unlike the '[Circular]' placeholder used for hashing."""
+    cyclic: dict[str, Any] = {"k": []}
+    cyclic["k"].append(cyclic)
+    with pytest.raises(ValueError, match="Circular reference"):
+        SecurityGuard.serialize_payload(cyclic)
+
+
 def test_validate_attachment_path_no_sandbox() -> None:
     """Coverage: Fallback zero-trust checks for OS roots and path traversal."""
     with pytest.raises(ValueError, match="Path traversal tokens"):
@@ -264,6 +433,23 @@ def test_secretauth_repr() -> None:
     assert repr(auth) == "SecretAuth(***REDACTED***)"
 
 
+def test_auth_identity_is_opaque_and_per_credential() -> None:
+    basic = SecurityGuard.auth_identity(SecretAuth(("user", "pass")))
+    assert basic == SecurityGuard.auth_identity(SecretAuth(("user", "pass")))
+    assert basic != SecurityGuard.auth_identity(SecretAuth(("user", "other")))
+    assert basic != SecurityGuard.auth_identity("user:pass")
+    assert "pass" not in basic
+    assert SecurityGuard.auth_identity(None) == ""
+
+
+def test_account_namespace_is_stable_and_secret_free() -> None:
+    namespace = SecurityGuard.account_namespace(SecretAuth(("public", "secret")))
+    assert namespace == SecretAuth(("public", "rotated")).account()
+    assert namespace == hashlib.sha256(b"mailjet-account:basic:public").hexdigest()
+    assert namespace != SecurityGuard.account_namespace("token")
+    assert SecurityGuard.account_namespace(None) == "anonymous"
+
+
 def test_redacting_filter_exceptions(monkeypatch: pytest.MonkeyPatch) -> None:
     """Coverage: Trigger string parsing failures inside logging filter."""
     filter_ = RedactingFilter()
@@ -333,3 +519,96 @@ def test_normalize_domain_exceptions() -> None:
 
     with pytest.raises(ValueError, match="Invalid IDN"):
         SecurityGuard.normalize_domain("x" * 1000)
+
+
+def test_secure_ssl_context_is_cached_per_process(monkeypatch: pytest.MonkeyPatch) -> None:
+    context = SecureHTTPAdapter._get_secure_ssl_context()
+    assert SecureHTTPAdapter._get_secure_ssl_context() is context
+    assert context.minimum_version == ssl.TLSVersion.TLSv1_2
+    assert context.verify_mode == ssl.CERT_REQUIRED
+    assert context.check_hostname
+
+    # A forked child (new PID) builds its own context instead of inheriting the parent's sessions.
+    monkeypatch.setattr("mailjet_rest.utils.guardrails.os.getpid", lambda: -1)
+    child = SecureHTTPAdapter._get_secure_ssl_context()
+    assert child is not context
+    assert SecureHTTPAdapter._get_secure_ssl_context() is child
+
+
+class _TLSHandler(BaseHTTPRequestHandler):
+    """Records whether each request arrived over a resumed TLS session."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    resumed: list[bool] = []
+
+    def do_GET(self) -> None:
+        self.resumed.append(self.connection.session_reused)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"[]")
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+
+@pytest.fixture
+def tls_server(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[tuple[str, Path]]:
+    """Serve HTTPS on localhost with a fresh self-signed certificate; yield its URL and certificate."""
+    if shutil.which("openssl") is None:
+        pytest.skip("needs the openssl CLI to issue a test certificate")
+    for name in ("REQUESTS_CA_BUNDLE", "CURL_CA_BUNDLE"):
+        monkeypatch.delenv(name, raising=False)  # Verify against requests' default bundle
+    cert, key = tmp_path / "cert.pem", tmp_path / "key.pem"
+    args = "req -x509 -newkey rsa:2048 -nodes -days 1 -subj /CN=localhost -addext subjectAltName=DNS:localhost"
+    subprocess.run(  # noqa: S603
+        ["openssl", *args.split(), "-keyout", str(key), "-out", str(cert)], check=True, capture_output=True
+    )
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _TLSHandler)
+    server_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    server_context.load_cert_chain(cert, key)
+    server.socket = server_context.wrap_socket(server.socket, server_side=True)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    _TLSHandler.resumed = []
+    yield f"https://localhost:{server.server_port}/", cert
+    server.shutdown()
+    server.server_close()
+
+
+def test_tls_sessions_resume_across_reconnects_and_clients(
+    tls_server: tuple[str, Path], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    api_url, cert = tls_server
+    # A private process-wide context trusting the test certificate.
+    context = SecureHTTPAdapter._new_secure_ssl_context()
+    context.load_verify_locations(cert)
+    monkeypatch.setitem(guardrails._SSL_CONTEXTS, (os.getpid(), None), context)
+
+    first = Client(auth=("pub", "priv"), api_url=api_url)
+    first.contact.get()
+    first.close()  # The next connection must reconnect
+    second = Client(auth=("pub", "priv"), api_url=api_url)
+    second.contact.get()
+    second.close()
+
+    assert _TLSHandler.resumed == [False, True]
+    assert "localhost" in context.sessions
+
+
+def test_custom_ca_bundle_gets_its_own_context(tls_server: tuple[str, Path], monkeypatch: pytest.MonkeyPatch) -> None:
+    api_url, cert = tls_server
+    default = SecureHTTPAdapter._get_secure_ssl_context()
+
+    monkeypatch.setenv("REQUESTS_CA_BUNDLE", str(cert))
+    with Client(auth=("pub", "priv"), api_url=api_url) as client:
+        client.contact.get()
+    assert guardrails._SSL_CONTEXTS[os.getpid(), str(cert)] is not default
+
+    # The bundle trusted for that client is not trusted by clients verifying against the default one.
+    monkeypatch.delenv("REQUESTS_CA_BUNDLE")
+    with Client(auth=("pub", "priv"), api_url=api_url) as client, pytest.raises(ApiError):
+        client.contact.get()
+    assert _TLSHandler.resumed == [False]
@@ -0,0 +1,207 @@
+"""Unit tests for per-call instrumentation hooks."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Callable
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+import pytest
+from urllib3.connection import HTTPConnection, HTTPSConnection
+
+from mailjet_rest.client import Client, JitterRetry
+from mailjet_rest.errors import ApiError
+from mailjet_rest.utils import instrumentation
+from mailjet_rest.utils.cache import ResponseCache
+from mailjet_rest.utils.instrumentation import CallStats
+from mailjet_rest.utils.pool import _TimedHTTPSConnection
+
+
+class _Flaky(BaseHTTPRequestHandler):
+    """Answers 503 to the first 'failures' requests, then an empty JSON list."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    failures = 0
+    received: list[int] = []  # Request body sizes
+
+    def do_GET(self) -> None:
+        size = int(self.headers.get("Content-Length", 0))
+        self.rfile.read(size)
+        _Flaky.received.append(size)
+        status, body = (503, b'{"ErrorMessage": "Busy"}') if _Flaky.failures > 0 else (200, b"[]")
+        _Flaky.failures -= 1
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_POST = do_GET
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+
+@pytest.fixture
+def handler() -> type[BaseHTTPRequestHandler]:
+    _Flaky.failures = 0
+    _Flaky.received = []
+    return _Flaky
+
+
+def test_marks_charge_each_phase_the_time_not_added_elsewhere(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = [10.0]
+    monkeypatch.setattr(instrumentation.time, "monotonic", lambda: now[0])
+    stats = CallStats("GET", "https://api.mailjet.com/v3/REST/contact", "contact")
+
+    now[0] += 0.1
+    stats.mark("validate")
+    now[0] += 0.5
+    stats.add("server", 0.3)
+    stats.add("server", 0.1)
+    stats.mark("transfer")
+
+    assert stats.phases == pytest.approx({"validate": 0.1, "server": 0.4, "transfer": 0.1})
+    assert stats.retries == 0
+
+
+def test_hooks_receive_phase_timings_sizes_and_telemetry(local_client: Callable[..., Client]) -> None:
+    seen: list[CallStats] = []
+    with local_client(hooks=[seen.append]) as client:
+        client.contact.create(data={"Email": "a@example.com", "CustomID": "order-42"})
+        client.contact.get()
+
+    created, listed = seen
+    assert (created.method, created.route, created.status, created.error) == ("POST", "contact", 200, None)
+    assert created.telemetry == {"mailjet.customid": "order-42"}
+    assert created.bytes_out == _Flaky.received[0] > 0
+    assert created.bytes_in == 2
+    assert (created.attempts, created.statuses) == (1, [200])
+    assert {"validate", "serialize", "pool_wait", "connect", "server", "transfer"} <= created.phases.keys()
+    assert sum(created.phases.values()) <= created.elapsed
+    assert "connect" not in listed.phases  # Reused the pooled connection
+
+
+def test_hooks_see_retries_and_failures(local_client: Callable[..., Client], monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(JitterRetry, "get_backoff_time", lambda self: 0.01)
+    seen: list[CallStats] = []
+    client = local_client(hooks=[seen.append])
+
+    _Flaky.failures = 2
+    client.contact.get()
+    assert (seen[0].attempts, seen[0].retries, seen[0].statuses) == (3, 2, [503, 503, 200])
+    assert seen[0].phases["retry_backoff"] >= 0.02
+
+    _Flaky.failures = 4
+    with pytest.raises(ApiError):
+        client.contact.get()
+    assert seen[1].status is None
+    assert isinstance(seen[1].error, ApiError)
+    assert seen[1].statuses == [503] * 4
+
+
+def test_failing_hooks_never_fail_the_call(
+    local_client: Callable[..., Client], caplog: pytest.LogCaptureFixture
+) -> None:
+    def broken(stats: CallStats) -> None:
+        raise RuntimeError
+
+    seen: list[CallStats] = []
+    client = local_client(hooks=[broken, seen.append])
+    with caplog.at_level(logging.WARNING, logger="mailjet_rest.utils.instrumentation"):
+        assert client.contact.get().json() == []
+    assert len(seen) == 1
+    assert "Instrumentation hook" in caplog.text
+
+
+def test_calls_are_not_timed_without_hooks(
+    local_client: Callable[..., Client], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    client = local_client(tracing=False)  # Traced calls are timed too, if opentelemetry is installed
+    monkeypatch.setattr(client, "_call_stats", lambda *args: pytest.fail("must not be instrumented"))
+    client.contact.get()
+
+    seen: list[CallStats] = []
+    client.hooks.append(seen.append)
+    monkeypatch.undo()
+    client.contact.get()
+    assert len(seen) == 1
+
+
+def test_cache_hits_are_flagged(local_client: Callable[..., Client]) -> None:
+    seen: list[CallStats] = []
+    client = local_client(hooks=[seen.append], response_cache=ResponseCache())
+    client.contact.get()
+    client.contact.get()
+
+    assert [stats.cached for stats in seen] == [False, True]
+    assert seen[1].bytes_in == 0
+    assert seen[1].attempts == 0
+    assert "cache" in seen[1].phases
+
+
+def test_https_connections_split_tcp_connect_and_tls(monkeypatch: pytest.MonkeyPatch) -> None:
+    def new_conn(self: Any) -> None:
+        time.sleep(0.01)
+
+    def connect(self: Any) -> None:
+        self._new_conn()
+        time.sleep(0.02)  # The TLS handshake
+
+    monkeypatch.setattr(HTTPConnection, "_new_conn", new_conn)
+    monkeypatch.setattr(HTTPSConnection, "connect", connect)
+    stats = CallStats("GET", "https://api.mailjet.com/v3/REST/contact", "contact")
+    with stats.activate([]):
+        _TimedHTTPSConnection("api.mailjet.com").connect()
+
+    assert stats.phases["connect"] >= 0.01
+    assert stats.phases["tls"] >= 0.02
+    assert stats.phases["connect"] + stats.phases["tls"] <= time.monotonic() - stats.started
+
+
+def test_async_client_reports_attempts_and_phases(monkeypatch: pytest.MonkeyPatch) -> None:
+    httpx = pytest.importorskip("httpx")
+    from mailjet_rest.async_client import AsyncClient
+
+    monkeypatch.setattr(JitterRetry, "get_backoff_time", lambda self: 0.0)
+    statuses = iter([429, 200])
+
+    def handler(request: Any) -> Any:
+        return httpx.Response(next(statuses), json={"Count": 1})
+
+    seen: list[CallStats] = []
+
+    async def run() -> None:
+        async with AsyncClient(auth=("pub", "priv"), hooks=[seen.append]) as client:
+            client.session._transport = httpx.MockTransport(handler)
+            await client.send.create(data={"Messages": [{"TemplateID": 7}]})
+
+    asyncio.run(run())
+    (stats,) = seen
+    assert (stats.route, stats.status, stats.attempts, stats.statuses) == ("send", 200, 2, [429, 200])
+    assert stats.telemetry == {"mailjet.templateid": "7"}
+    assert {"validate", "serialize", "retry_backoff", "transfer"} <= stats.phases.keys()
+    assert stats.bytes_in == len(b'{"Count":1}')
+
+
+def test_async_client_traces_connection_phases(server: ThreadingHTTPServer) -> None:
+    pytest.importorskip("httpx")
+    from mailjet_rest.async_client import AsyncClient
+
+    seen: list[CallStats] = []
+
+    async def run() -> None:
+        url = f"http://127.0.0.1:{server.server_port}/"
+        async with AsyncClient(auth=("pub", "priv"), api_url=url, hooks=[seen.append]) as client:
+            await client.contact.get()
+            await client.contact.get()
+
+    asyncio.run(run())
+    first, second = seen
+    assert {"pool_wait", "connect", "server", "transfer"} <= first.phases.keys()
+    assert "connect" not in second.phases
+    assert first.bytes_in == 2
@@ -0,0 +1,226 @@
+"""Unit tests for the per-endpoint metrics registry and its Prometheus exporter."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from http.server import BaseHTTPRequestHandler
+from typing import Any
+
+import pytest
+
+from mailjet_rest.client import Client, Config, JitterRetry
+from mailjet_rest.errors import ApiError, MailjetApiError
+from mailjet_rest.routes import endpoint_of
+from mailjet_rest.utils.breaker import CLOSED, OPEN, CircuitBreaker
+from mailjet_rest.utils.concurrency import AdaptiveConcurrencyLimiter
+from mailjet_rest.utils.instrumentation import CallStats
+from mailjet_rest.utils.metrics import GaugeSnapshot, MetricsRegistry, MetricsSnapshot, PrometheusExporter
+
+
+class _Scripted(BaseHTTPRequestHandler):
+    """Answers with the next scripted status (then 200) and a small JSON body."""
+
+    protocol_version = "HTTP/1.1"
+    statuses: list[int] = []
+
+    def do_GET(self) -> None:
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        status = _Scripted.statuses.pop(0) if _Scripted.statuses else 200
+        body = b'{"Count": 0}'
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_POST = do_GET
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+
+@pytest.fixture
+def handler() -> type[BaseHTTPRequestHandler]:
+    _Scripted.statuses = []
+    return _Scripted
+
+
+def _trip(breaker: CircuitBreaker, route: str) -> None:
+    def fail() -> None:
+        raise MailjetApiError("Service unavailable", 503)
+
+    with pytest.raises(MailjetApiError):
+        breaker.call(route, fail)
+
+
+def _stats(url: str, method: str = "GET", elapsed: float = 0.02, **fields: Any) -> CallStats:
+    stats = CallStats(method, url, "", **fields)
+    stats.elapsed = elapsed
+    return stats
+
+
+@pytest.mark.parametrize(
+    ("url", "endpoint"),
+    [
+        ("https://api.mailjet.com/v3/REST/contact", "contact"),
+        ("https://api.mailjet.com/v3/REST/contact/7", "contact"),
+        ("https://api.mailjet.com/v3/REST/contact/7/getcontactslists", "contact_getcontactslists"),
+        ("https://api.mailjet.com/v3/REST/contact/managemanycontacts", "contact_managemanycontacts"),
+        ("https://api.mailjet.com/v3.1/send", "send"),
+        ("https://api.mailjet.com/v1/REST/templates/7/contents", "template_contents"),
+        ("https://api.mailjet.com/v3/REST/templates/7/contents", "templates_contents"),
+        ("https://api.mailjet.com/v3/REST/statistics/link-click", "statistics_linkClick"),
+        ("https://api.mailjet.com/v1/data/images/3", "data_images"),
+        ("https://api.mailjet.com/v3/REST/unlisted/3", "unlisted"),
+    ],
+)
+def test_endpoint_of(url: str, endpoint: str) -> None:
+    assert endpoint_of(url) == endpoint
+
+
+def test_registry_counts_calls_per_endpoint_and_method() -> None:
+    metrics = MetricsRegistry(buckets=(0.01, 0.1, 1))
+    metrics(_stats("https://api.mailjet.com/v3.1/send", "POST", 0.05, status=200, attempts=3, statuses=[429, 503, 200]))
+    metrics(_stats("https://api.mailjet.com/v3.1/send", "POST", 2.0, statuses=[500]))
+    metrics(_stats("https://api.mailjet.com/v3/REST/contact/7", elapsed=0.001, bytes_in=12))
+    metrics(_stats("https://api.mailjet.com/v3/REST/contact", phases={"pool_wait": 0.25}))
+
+    snapshot = metrics.snapshot()
+    send = snapshot["send", "POST"]
+    assert (send.requests, send.retries, send.throttled) == (2, 2, 1)
+    assert send.status_classes == {"2xx": 1, "5xx": 1}
+    assert send.latency.counts == [0, 1, 0, 1]
+    assert send.latency.total == pytest.approx(2.05)
+    contact = snapshot["contact", "GET"]
+    assert contact.status_classes == {"error": 2}
+    assert (contact.bytes_in, contact.pool_wait, contact.latency.counts) == (12, 0.25, [1, 1, 0, 0])
+
+    send.requests = 99  # Snapshots are copies
+    assert metrics.snapshot()["send", "POST"].requests == 2
+
+
+def test_snapshot_reset_and_validation() -> None:
+    metrics = MetricsRegistry()
+    metrics(_stats("https://api.mailjet.com/v3/REST/contact"))
+    assert len(metrics.snapshot(reset=True)) == 1
+    assert metrics.snapshot() == {}
+
+    metrics(_stats("https://api.mailjet.com/v3/REST/contact"))
+    metrics.reset()
+    assert metrics.snapshot() == {}
+
+    with pytest.raises(ValueError, match="strictly increasing"):
+        MetricsRegistry(buckets=(1.0, 0.5))
+    with pytest.raises(ValueError, match="strictly increasing"):
+        MetricsRegistry(buckets=())
+
+
+def test_prometheus_exporter_renders_counters_and_cumulative_buckets() -> None:
+    metrics = MetricsRegistry(buckets=(0.1, 1))
+    metrics(_stats("https://api.mailjet.com/v3.1/send", "POST", 0.05, status=200, bytes_out=120))
+    metrics(_stats("https://api.mailjet.com/v3.1/send", "POST", 0.5, status=400))
+    text = metrics.export()
+
+    assert text.endswith("\n")
+    assert "# TYPE mailjet_requests_total counter" in text
+    assert 'mailjet_requests_total{endpoint="send",method="POST"} 2' in text
+    assert 'mailjet_request_bytes_total{endpoint="send",method="POST"} 120' in text
+    assert 'mailjet_pool_wait_seconds_total{endpoint="send",method="POST"} 0.0' in text
+    assert 'mailjet_responses_total{endpoint="send",method="POST",status_class="4xx"} 1' in text
+    assert "# TYPE mailjet_request_duration_seconds histogram" in text
+    assert 'mailjet_request_duration_seconds_bucket{endpoint="send",method="POST",le="0.1"} 1' in text
+    assert 'mailjet_request_duration_seconds_bucket{endpoint="send",method="POST",le="1.0"} 2' in text
+    assert 'mailjet_request_duration_seconds_bucket{endpoint="send",method="POST",le="+Inf"} 2' in text
+    assert 'mailjet_request_duration_seconds_count{endpoint="send",method="POST"} 2' in text
+
+    snapshot: MetricsSnapshot = {('we"ird\\', "GET"): metrics.snapshot()["send", "POST"]}
+    assert 'app_requests_total{endpoint="we\\"ird\\\\",method="GET"} 2' in PrometheusExporter("app").export(snapshot)
+
+
+def test_custom_exporters_receive_snapshots() -> None:
+    class Summary:
+        def export(self, snapshot: MetricsSnapshot, gauges: GaugeSnapshot | None = None) -> str:
+            return ", ".join(f"{endpoint} {method}: {m.requests}" for (endpoint, method), m in snapshot.items())
+
+    metrics = MetricsRegistry()
+    metrics(_stats("https://api.mailjet.com/v3/REST/contact"))
+    assert metrics.export(Summary()) == "contact GET: 1"
+
+
+def test_breaker_and_limiter_state_is_exported_as_gauges() -> None:
+    breaker = CircuitBreaker(minimum_calls=1, window=1, reset_timeout=60)
+    limiter = AdaptiveConcurrencyLimiter(initial=6, max_limit=8)
+    metrics = MetricsRegistry()
+    metrics.track_circuit_breaker(breaker)
+    metrics.track_circuit_breaker(breaker)
+    metrics.track_concurrency_limiter(limiter, "bulk")
+
+    _trip(breaker, "send")
+    with pytest.raises(ApiError):
+        breaker.call("send", lambda: None)
+    breaker.call("contact", lambda: None)
+    gauges = metrics.gauges()
+    assert gauges.circuits == {
+        "send": {"state": OPEN, "opened": 1, "rejected": 1},
+        "contact": {"state": CLOSED, "opened": 0, "rejected": 0},
+    }
+    assert gauges.concurrency["bulk"]["limit"] == 6
+
+    text = metrics.export()
+    assert "# TYPE mailjet_circuit_state gauge" in text
+    assert 'mailjet_circuit_state{route="send",state="open"} 1' in text
+    assert 'mailjet_circuit_state{route="send",state="closed"} 0' in text
+    assert 'mailjet_circuit_state{route="contact",state="closed"} 1' in text
+    assert "# TYPE mailjet_circuit_opens_total counter" in text
+    assert 'mailjet_circuit_opens_total{route="send"} 1' in text
+    assert "# TYPE mailjet_circuit_rejections_total counter" in text
+    assert 'mailjet_circuit_rejections_total{route="send"} 1' in text
+    assert "# TYPE mailjet_concurrency_limit gauge" in text
+    assert 'mailjet_concurrency_limit{limiter="bulk"} 6' in text
+    assert 'mailjet_concurrency_in_flight{limiter="bulk"} 0' in text
+
+    # A route tracked by several breakers reports the worst state and the summed counts
+    other = CircuitBreaker(minimum_calls=1, window=1)
+    other.call("send", lambda: None)
+    _trip(other, "contact")
+    metrics.track_circuit_breaker(other)
+    assert metrics.gauges().circuits["contact"] == {"state": OPEN, "opened": 1, "rejected": 0}
+    assert metrics.gauges().circuits["send"]["state"] == OPEN
+
+    metrics.reset()
+    assert metrics.gauges().concurrency["bulk"]["limit"] == 6
+    assert "circuit_state" not in MetricsRegistry().export()
+
+
+def test_client_tracks_its_circuit_breaker() -> None:
+    breaker = CircuitBreaker(minimum_calls=1, window=1)
+    metrics = MetricsRegistry()
+    Client(auth=("pub", "priv"), config=Config(metrics=metrics, circuit_breaker=breaker))
+    Client(auth=("pub", "priv"), config=Config(metrics=metrics, circuit_breaker=breaker))
+    _trip(breaker, "send")
+    assert metrics.gauges().circuits == {"send": {"state": OPEN, "opened": 1, "rejected": 0}}
+
+
+def test_client_feeds_its_metrics(local_client: Callable[..., Client], monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(JitterRetry, "get_backoff_time", lambda self: 0.0)
+    metrics = MetricsRegistry()
+    client = local_client(metrics=metrics)
+    assert client.metrics is metrics
+    assert metrics in client.hooks
+
+    _Scripted.statuses = [429, 200]
+    client.contact.create(data={"Email": "a@example.com"})
+    _Scripted.statuses = [503] * 4
+    with pytest.raises(ApiError):
+        client.contact_getcontactslists.get(id=7)
+
+    snapshot = metrics.snapshot()
+    created = snapshot["contact", "POST"]
+    assert (created.requests, created.retries, created.throttled) == (1, 1, 1)
+    assert created.status_classes == {"2xx": 1}
+    assert created.bytes_out > 0
+    assert created.bytes_in == len(b'{"Count": 0}')
+    failed = snapshot["contact_getcontactslists", "GET"]
+    assert (failed.retries, failed.status_classes) == (3, {"5xx": 1})
+
+    assert Client(auth=("pub", "priv"), config=Config()).metrics is None
@@ -0,0 +1,88 @@
+"""Unit tests for keyset stream pagination."""
+
+import pytest
+
+from mailjet_rest.pagination import AdaptivePageSizer, StreamCursor
+
+
+def test_token_round_trip() -> None:
+    cursor = StreamCursor(after=4242, field="ContactID", bound_filter="FromContactID")
+    token = cursor.token
+
+    assert "=" not in token
+    assert StreamCursor.from_token(token) == cursor
+    assert StreamCursor.from_token(StreamCursor().token) == StreamCursor()
+
+
+@pytest.mark.parametrize(
+    ("token", "match"),
+    [
+        ("not base64 at all!", "Malformed"),
+        ("", "Malformed"),
+        ("eyJ2IjoyfQ", "Unsupported"),  # {"v":2}
+        ("eyJhIjoiMSIsImIiOiJGcm9tSUQiLCJmIjoiSUQiLCJ2IjoxfQ", "Malformed"),  # after is a string
+    ],
+)
+def test_from_token_rejects_bad_tokens(token: str, match: str) -> None:
+    with pytest.raises(ValueError, match=match):
+        StreamCursor.from_token(token)
+
+
+def test_page_filters_sort_and_bound() -> None:
+    cursor = StreamCursor()
+    seeded = {"Limit": 100, "Offset": 0, "ContactsList": 7}
+
+    assert cursor.page_filters(seeded) == {"Limit": 100, "ContactsList": 7, "Sort": "ID"}
+    cursor.after = 99
+    assert cursor.page_filters(seeded) == {"Limit": 100, "ContactsList": 7, "Sort": "ID", "FromID": 99}
+    assert seeded == {"Limit": 100, "Offset": 0, "ContactsList": 7}
+
+    with pytest.raises(ValueError, match="cannot be combined with an 'Offset'"):
+        cursor.page_filters({"Limit": 100, "Offset": 200})
+
+
+def test_accepts_rows_after_cursor_and_detects_ignored_bound() -> None:
+    cursor = StreamCursor()
+    assert cursor.accepts({"ID": 0})
+
+    cursor.after = 2
+    assert [row["ID"] for row in ({"ID": 2}, {"ID": 3}, {"ID": 4}) if cursor.accepts(row)] == [3, 4]
+
+    cursor.ensure_progress(None)
+    with pytest.raises(ValueError, match="ignored the 'FromID' cursor filter"):
+        cursor.ensure_progress(2)
+
+
+def test_page_sizer_grows_twofold_when_under_budget() -> None:
+    sizer = AdaptivePageSizer()
+
+    assert sizer.limit_for("contact", 50) == 50
+    assert sizer.observe("contact", limit=50, count=50, elapsed=0.01, size=1_000) == 100
+    assert sizer.limit_for("contact", 50) == 100
+    assert sizer.observe("contact", limit=800, count=800, elapsed=0.01, size=1_000) == 1000  # Mailjet's ceiling
+    assert sizer.limit_for("listrecipient", 5000) == 1000
+
+
+def test_page_sizer_shrinks_to_latency_and_memory_budgets() -> None:
+    sizer = AdaptivePageSizer(target_latency=1.0, max_page_bytes=100_000)
+
+    # 1000 objects took 4s: 250 fit in the latency budget.
+    assert sizer.observe("messageinformation", limit=1000, count=1000, elapsed=4.0, size=50_000) == 250
+    # 250 objects weighed 500KB: only 50 fit in the memory budget.
+    assert sizer.observe("contactdata", limit=250, count=250, elapsed=0.1, size=500_000) == 50
+    # Never below the floor.
+    assert sizer.observe("contactdata", limit=50, count=50, elapsed=0.1, size=50_000_000) == 10
+    assert sizer.limit_for("messageinformation", 1000) == 250
+
+
+def test_page_sizer_ignores_short_pages_and_validates_bounds() -> None:
+    sizer = AdaptivePageSizer()
+    sizer.observe("contact", limit=100, count=100, elapsed=0.01, size=100)
+
+    assert sizer.observe("contact", limit=200, count=3, elapsed=5.0, size=100) == 200
+    assert sizer.limit_for("contact", 1) == 200
+
+    with pytest.raises(ValueError, match="min_size <= max_size"):
+        AdaptivePageSizer(min_size=500, max_size=100)
+    with pytest.raises(ValueError, match="strictly positive"):
+        AdaptivePageSizer(target_latency=0)
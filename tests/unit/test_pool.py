@@ -0,0 +1,244 @@
+"""Unit tests for connection pool settings and process-wide pool sharing."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from collections.abc import Callable
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+import pytest
+
+from mailjet_rest.client import Client, Config
+from mailjet_rest.errors import CriticalApiError
+from mailjet_rest.utils.cache import ResponseCache
+from mailjet_rest.utils.pool import PoolConfig, PooledHTTPAdapter, get_adapter
+from mailjet_rest.utils.ratelimit import RateLimit
+
+
+class _KeepAlive(BaseHTTPRequestHandler):
+    """Answers GETs with an empty JSON list (and warmup HEAD probes with a 404) over a persistent connection."""
+
+    protocol_version = "HTTP/1.1"
+    peers: set[int] = set()  # Client ports of every accepted connection
+
+    def setup(self) -> None:
+        super().setup()
+        self.peers.add(self.client_address[1])
+
+    def do_GET(self) -> None:
+        body = b"[]"
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_HEAD(self) -> None:
+        self.send_response(404)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+
+@pytest.fixture
+def handler() -> type[BaseHTTPRequestHandler]:
+    _KeepAlive.peers = set()
+    return _KeepAlive
+
+
+def test_pool_config_defaults_and_validation() -> None:
+    assert Config().pool == PoolConfig(connections=100, maxsize=100, block=False, idle_timeout=None, shared=False)
+    with pytest.raises(ValueError, match="maxsize must be strictly positive"):
+        PoolConfig(maxsize=0)
+    with pytest.raises(ValueError, match="idle_timeout"):
+        PoolConfig(idle_timeout=0)
+
+
+def test_client_sizes_its_pool_from_config() -> None:
+    client = Client(auth=("pub", "priv"), pool=PoolConfig(connections=2, maxsize=5, block=True))
+    adapter = client.session.adapters["https://"]
+
+    assert isinstance(adapter, PooledHTTPAdapter)
+    assert adapter.poolmanager.pools._maxsize == 2
+    assert adapter.poolmanager.connection_pool_kw["maxsize"] == 5
+    assert adapter.poolmanager.connection_pool_kw["block"] is True
+    assert adapter.max_retries is Client._RETRY_STRATEGY
+    assert adapter.poolmanager.connection_pool_kw["ssl_context"].minimum_version.name == "TLSv1_2"
+
+
+def test_idle_connections_are_reused_until_they_expire(local_client: Callable[..., Client]) -> None:
+    with local_client(pool=PoolConfig()) as client:
+        client.contact.get()
+        time.sleep(0.1)
+        client.contact.get()
+    assert len(_KeepAlive.peers) == 1
+
+    _KeepAlive.peers.clear()
+    with local_client(pool=PoolConfig(idle_timeout=0.05)) as client:
+        client.contact.get()
+        client.contact.get()  # Reused: idle for less than 50ms
+        assert len(_KeepAlive.peers) == 1
+        time.sleep(0.1)
+        client.contact.get()  # Expired, so reconnected
+    assert len(_KeepAlive.peers) == 2
+
+
+def test_clients_share_one_pool_per_settings(local_client: Callable[..., Client]) -> None:
+    shared = PoolConfig(maxsize=4, shared=True)
+    first = local_client(pool=shared)
+    second = local_client(pool=PoolConfig(maxsize=4, shared=True))
+
+    assert first.session.adapters["https://"] is second.session.adapters["https://"]
+    assert get_adapter(shared, Client._RETRY_STRATEGY) is first.session.adapters["https://"]
+    assert get_adapter(PoolConfig(maxsize=5, shared=True)) is not first.session.adapters["https://"]
+    assert Client(auth=("pub", "priv")).session.adapters["https://"] is not first.session.adapters["https://"]
+
+    first.contact.get()
+    first.close()  # Must leave the shared pool open for the other client
+    second.contact.get()
+    second.close()
+    assert len(_KeepAlive.peers) == 1
+
+
+def test_async_client_applies_pool_limits() -> None:
+    pytest.importorskip("httpx")
+    from mailjet_rest.async_client import AsyncClient
+
+    async def run() -> None:
+        async with AsyncClient(auth=("pub", "priv"), pool=PoolConfig(maxsize=3, idle_timeout=7)) as client:
+            pool = client.session._transport._pool
+            assert (pool._max_connections, pool._max_keepalive_connections, pool._keepalive_expiry) == (3, 3, 7)
+
+    asyncio.run(run())
+
+
+def test_warmup_opens_connections_the_next_calls_reuse(local_client: Callable[..., Client]) -> None:
+    with local_client(pool=PoolConfig(maxsize=3)) as client:
+        report = client.warmup(connections=5)  # Capped at maxsize
+        assert report.connections == 3
+        assert report.elapsed > 0
+        assert len(_KeepAlive.peers) == 3
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            list(executor.map(lambda _: client.contact.get(), range(6)))
+        assert client.warmup(connections=3).connections == 3  # Already warm: nothing new to open
+    assert len(_KeepAlive.peers) == 3
+
+    with pytest.raises(ValueError, match="at least one connection"):
+        client.warmup(connections=0)
+
+
+def test_warmup_reports_connection_failures(server: ThreadingHTTPServer, local_client: Callable[..., Client]) -> None:
+    client = local_client(pool=PoolConfig())
+    server.shutdown()
+    server.server_close()
+
+    with pytest.raises(CriticalApiError, match="failed during warmup"):
+        client.warmup()
+
+
+def test_async_warmup_probes_the_api_host() -> None:
+    httpx = pytest.importorskip("httpx")
+    from mailjet_rest.async_client import AsyncClient
+
+    probes: list[str] = []
+
+    def handler(request: Any) -> Any:
+        probes.append(f"{request.method} {request.url}")
+        return httpx.Response(404)
+
+    async def run() -> None:
+        async with AsyncClient(auth=("pub", "priv"), pool=PoolConfig(maxsize=2)) as client:
+            client.session._transport = httpx.MockTransport(handler)
+            report = await client.warmup(connections=4)
+            assert report.connections == 2
+
+    asyncio.run(run())
+    assert probes == ["HEAD https://api.mailjet.com/"] * 2
+
+
+def _local_ports(adapter: PooledHTTPAdapter) -> set[int]:
+    """Return the local ports of the idle connections pooled by an adapter."""
+    ports = set()
+    for key in adapter.poolmanager.pools.keys():
+        pool = adapter.poolmanager.pools[key]
+        for conn in list(pool.pool.queue):
+            if conn is not None and conn.sock is not None:
+                ports.add(conn.sock.getsockname()[1])
+    return ports
+
+
+def _run_forked_child(client: Client, inherited: set[int]) -> None:
+    """Exercise the client in a forked child, then exit with 0 only if everything was reset."""
+    code = 1
+    try:
+        adapter = client.session.adapters["https://"]
+        assert isinstance(adapter, PooledHTTPAdapter)
+        assert not _local_ports(adapter)  # Inherited connections dropped
+        assert client.config.response_cache is not None
+        assert len(client.config.response_cache) == 0
+        assert client.rate_limiter is not None
+        assert not client.rate_limiter._backend._buckets
+        assert client.session.auth == ("pub", "priv")
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(lambda _: client.contact.get().json(), range(8)))
+        assert results == [[]] * 8
+        assert _local_ports(adapter).isdisjoint(inherited)
+        code = 0
+    finally:
+        os._exit(code)
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+@pytest.mark.filterwarnings("ignore:.*fork.*:DeprecationWarning")
+def test_forked_child_starts_with_fresh_pools_and_state(local_client: Callable[..., Client]) -> None:
+    cache = ResponseCache(ttl=60)
+    client = local_client(response_cache=cache, rate_limits={"rest": RateLimit(rate=1000, burst=100)})
+    adapter = client.session.adapters["https://"]
+    assert isinstance(adapter, PooledHTTPAdapter)
+
+    client.contact.get()
+    inherited = _local_ports(adapter)
+    assert len(inherited) == 1
+    assert len(cache) == 1
+    assert client.rate_limiter is not None
+    assert client.rate_limiter._backend._buckets
+
+    # A lock held by another thread at fork time would deadlock the child forever.
+    with cache._lock:
+        pid = os.fork()
+    if pid == 0:  # pragma: no cover - runs in the child
+        _run_forked_child(client, inherited)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(lambda _: client.contact.get(), range(8)))
+    _, status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(status) == 0
+
+    # The parent keeps its cached response and its connection, which the child left open.
+    assert len(cache) == 1
+    cache.clear()
+    client.contact.get()
+    assert _local_ports(adapter) == inherited
+    assert len(_KeepAlive.peers) > 1  # The child opened connections of its own
+    client.close()
+
+
+def test_async_client_replaces_its_session_after_fork() -> None:
+    pytest.importorskip("httpx")
+    from mailjet_rest.async_client import AsyncClient
+
+    client = AsyncClient(auth=("pub", "priv"), pool=PoolConfig(maxsize=3))
+    inherited = client.session
+    client._reset_after_fork()
+
+    assert client.session is not inherited
+    assert client.session.auth is not None
+    assert client.session._transport._pool._max_connections == 3
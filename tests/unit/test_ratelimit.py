@@ -0,0 +1,232 @@
+"""Unit tests for client-side rate limiting."""
+
+from __future__ import annotations
+
+import json
+import multiprocessing
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from mailjet_rest.client import Client, Config, JitterRetry
+from mailjet_rest.errors import ApiRateLimitError
+from mailjet_rest.utils.ratelimit import (
+    FileLockBackend,
+    MemoryBackend,
+    RateLimit,
+    RateLimiter,
+    SQLiteBackend,
+    TokenBucket,
+    _StoredBuckets,
+)
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    now = [1000.0]
+    monkeypatch.setattr("mailjet_rest.utils.ratelimit.time.monotonic", lambda: now[0])
+    return now
+
+
+def test_rate_limit_validation() -> None:
+    with pytest.raises(ValueError, match="strictly positive rate"):
+        RateLimit(rate=0)
+    with pytest.raises(ValueError, match="burst of at least 1"):
+        RateLimit(rate=1, burst=0)
+    with pytest.raises(ValueError, match="Unknown rate limit group"):
+        RateLimiter({"sms": RateLimit(rate=1)})
+
+
+def test_token_bucket_reservations(clock: list[float]) -> None:
+    bucket = TokenBucket(rate=10, burst=2)
+    assert [bucket.reserve() for _ in range(4)] == pytest.approx([0, 0, 0.1, 0.2])
+
+    clock[0] += 1.0  # Refills up to the burst, not beyond.
+    assert [bucket.reserve() for _ in range(3)] == pytest.approx([0, 0, 0.1])
+
+    clock[0] += 10.0
+    bucket.pause(2.0)
+    assert bucket.reserve() == pytest.approx(2.1)
+
+
+@pytest.mark.parametrize(
+    ("url", "group"),
+    [
+        ("https://api.mailjet.com/v3.1/send", "send"),
+        ("https://api.mailjet.com/v3/send", "send"),
+        ("https://api.mailjet.com/v3/REST/statcounters", "statistics"),
+        ("https://api.mailjet.com/v3/REST/statistics/link-click", "statistics"),
+        ("https://api.mailjet.com/v3/REST/campaignstatistics", "statistics"),
+        ("https://api.mailjet.com/v3/REST/contact/7", "rest"),
+        ("https://api.mailjet.com/v1/templates", "rest"),
+    ],
+)
+def test_group_of(url: str, group: str) -> None:
+    assert RateLimiter.group_of(url) == group
+
+
+@pytest.mark.parametrize(
+    ("status", "headers", "delay"),
+    [
+        (429, {"Retry-After": "3"}, 3.01),
+        (200, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "5"}, 5.01),
+        (200, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "epoch+30"}, 30.01),
+        (200, {"X-RateLimit-Remaining": "4", "X-RateLimit-Reset": "5"}, 0.0),
+        (429, {}, RateLimiter.DEFAULT_PENALTY + 0.01),
+        (429, {"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}, RateLimiter.DEFAULT_PENALTY + 0.01),
+        (429, {"Retry-After": "inf"}, RateLimiter.DEFAULT_PENALTY + 0.01),
+        (429, {"Retry-After": "nan"}, RateLimiter.DEFAULT_PENALTY + 0.01),
+        (200, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1e400"}, 0.0),
+        (429, {"Retry-After": "1e9"}, RateLimiter.MAX_PAUSE + 0.01),
+        (200, {}, 0.0),
+    ],
+)
+def test_observe_pauses_the_group(clock: list[float], status: int, headers: dict[str, str], delay: float) -> None:
+    limiter = RateLimiter({"rest": RateLimit(rate=100, burst=1)})
+    url = "https://api.mailjet.com/v3/REST/contact"
+    if headers.get("X-RateLimit-Reset") == "epoch+30":
+        headers = {**headers, "X-RateLimit-Reset": str(int(time.time()) + 30)}
+    limiter.observe(url, status, CaseInsensitiveDict(headers))
+    assert limiter.reserve(url) == pytest.approx(delay, abs=1.0)
+    # Other groups are unaffected and unpaced.
+    assert limiter.reserve("https://api.mailjet.com/v3.1/send") == 0.0
+    limiter.observe("https://api.mailjet.com/v3.1/send", 429, {})
+
+
+def _client(monkeypatch: pytest.MonkeyPatch, statuses: list[int], **limits: RateLimit) -> tuple[Client, list[float]]:
+    client = Client(auth=("pub", "priv"), config=Config(rate_limits=limits))
+    sleeps: list[float] = []
+    monkeypatch.setattr("mailjet_rest.client.time.sleep", sleeps.append)
+
+    def mock_req(method: str, url: str, **kwargs: Any) -> requests.Response:
+        resp = requests.Response()
+        resp.status_code = statuses.pop(0) if statuses else 200
+        if resp.status_code == 429:
+            resp.headers["Retry-After"] = "2"
+        resp._content = b"{}"
+        return resp
+
+    monkeypatch.setattr(client.session, "request", mock_req)
+    return client, sleeps
+
+
+def test_client_paces_configured_groups(monkeypatch: pytest.MonkeyPatch) -> None:
+    client, sleeps = _client(monkeypatch, [], rest=RateLimit(rate=10))
+
+    for _ in range(3):
+        client.contact.get()
+    client.send.create(data={"Messages": []})
+    assert sleeps == pytest.approx([0.1, 0.2], abs=0.05)
+    assert client.rate_limiter is not None
+    assert Client(auth=("pub", "priv")).rate_limiter is None
+
+
+def test_client_learns_from_rate_limit_errors(monkeypatch: pytest.MonkeyPatch) -> None:
+    client, sleeps = _client(monkeypatch, [429], rest=RateLimit(rate=100, burst=5))
+
+    with pytest.raises(ApiRateLimitError):
+        client.contact.get()
+    client.contact.get()
+    assert sleeps == pytest.approx([2.0], abs=0.05)
+
+
+@pytest.mark.parametrize("final_status", [200, 429])
+def test_client_learns_from_every_retried_attempt(
+    final_status: int, handler: Any, local_client: Callable[..., Client], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(JitterRetry, "get_backoff_time", lambda self: 0.0)
+    exhausted = {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "45"}
+    handler.script = [(429, exhausted)] * 3
+    handler.status = final_status  # The 4th and last attempt: a success, or a bare 429 once retries run out
+    client = local_client(rate_limits={"rest": RateLimit(rate=100, burst=5)})
+
+    if final_status == 200:
+        client.contact.get()
+    else:
+        with pytest.raises(ApiRateLimitError):
+            client.contact.get()
+
+    assert handler.received == 4
+    assert client.rate_limiter is not None
+    assert client.rate_limiter.reserve(client.contact._build_url()) == pytest.approx(45, abs=1)
+
+
+# --- Shared backends ---
+
+
+@pytest.fixture(params=["memory", "file", "sqlite"])
+def backend(request: pytest.FixtureRequest, tmp_path: Path) -> Any:
+    if request.param == "file":
+        return FileLockBackend(tmp_path / "limits.json")
+    if request.param == "sqlite":
+        return SQLiteBackend(tmp_path / "limits.db")
+    return MemoryBackend()
+
+
+def test_backends_share_the_bucket_arithmetic(monkeypatch: pytest.MonkeyPatch, backend: Any) -> None:
+    now = [1_700_000_000.0]
+    monkeypatch.setattr("mailjet_rest.utils.ratelimit.time.time", lambda: now[0])
+    monkeypatch.setattr("mailjet_rest.utils.ratelimit.time.monotonic", lambda: now[0])
+
+    assert [backend.reserve("a:rest", 10, 2) for _ in range(4)] == pytest.approx([0, 0, 0.1, 0.2])
+    assert backend.reserve("b:rest", 10, 2) == 0  # Keys are independent buckets.
+    now[0] += 1.0
+    assert [backend.reserve("a:rest", 10, 2) for _ in range(3)] == pytest.approx([0, 0, 0.1])
+    now[0] += 10.0
+    backend.pause("a:rest", 2.0, 10, 2)
+    assert backend.reserve("a:rest", 10, 2) == pytest.approx(2.1)
+
+
+def test_stored_backends_must_implement_update() -> None:
+    class Incomplete(_StoredBuckets):
+        pass
+
+    with pytest.raises(TypeError, match="abstract"):
+        Incomplete()  # type: ignore[abstract]
+
+
+def test_file_backend_recovers_from_a_corrupt_state_file(tmp_path: Path) -> None:
+    path = tmp_path / "limits.json"
+    path.write_text("{not json")
+    backend = FileLockBackend(path)
+    assert backend.reserve("a:rest", 10, 1) == 0
+    assert json.loads(path.read_text())["a:rest"][0] == pytest.approx(0)
+
+
+def _reserve_slots(backend: Any, count: int) -> list[float]:
+    limiter = RateLimiter({"rest": RateLimit(rate=20)}, backend, namespace="acct")
+    return [time.time() + limiter.reserve("https://api.mailjet.com/v3/REST/contact") for _ in range(count)]
+
+
+@pytest.mark.parametrize("kind", ["file", "sqlite"])
+def test_processes_share_one_budget(tmp_path: Path, kind: str) -> None:
+    backend = FileLockBackend(tmp_path / "l.json") if kind == "file" else SQLiteBackend(tmp_path / "l.db")
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(4) as pool:
+        slots = sorted(slot for chunk in pool.starmap(_reserve_slots, [(backend, 5)] * 4) for slot in chunk)
+
+    # 20 reservations across 4 processes are spread over one shared 20 req/s schedule,
+    # instead of four private schedules of 5 requests each (~0.2s).
+    assert len(slots) == 20
+    assert slots[-1] - slots[0] == pytest.approx(19 / 20, abs=0.1)
+
+
+def test_client_namespaces_shared_budgets_per_account(tmp_path: Path) -> None:
+    backend = SQLiteBackend(tmp_path / "limits.db")
+    limits = {"rest": RateLimit(rate=1)}
+
+    def client(auth: Any) -> Client:
+        return Client(auth=auth, config=Config(rate_limits=limits, rate_limit_backend=backend))
+
+    alice, alice_again, bob = client(("alice", "a")), client(("alice", "rotated")), client("bearer-token")
+    assert alice.rate_limiter.namespace == alice_again.rate_limiter.namespace != bob.rate_limiter.namespace
+    assert "alice" not in alice.rate_limiter.namespace
+    url = "https://api.mailjet.com/v3/REST/contact"
+    assert alice.rate_limiter.reserve(url) == 0
+    assert alice_again.rate_limiter.reserve(url) == pytest.approx(1, abs=0.1)
+    assert bob.rate_limiter.reserve(url) == 0
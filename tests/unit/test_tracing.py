@@ -0,0 +1,192 @@
+"""Unit tests for OpenTelemetry spans and W3C trace context propagation."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+import pytest
+
+from mailjet_rest.client import Client, JitterRetry
+from mailjet_rest.errors import ApiError
+from mailjet_rest.utils import tracing
+
+
+pytest.importorskip("opentelemetry.sdk")
+
+from opentelemetry.sdk.trace import ReadableSpan, TracerProvider  # noqa: E402
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor  # noqa: E402
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter  # noqa: E402
+from opentelemetry.trace import SpanKind, StatusCode  # noqa: E402
+
+
+class _Scripted(BaseHTTPRequestHandler):
+    """Answers with the next scripted status (then 200) and records the trace context it received."""
+
+    protocol_version = "HTTP/1.1"
+    statuses: list[int] = []
+    traceparents: list[str | None] = []
+
+    def do_GET(self) -> None:
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        _Scripted.traceparents.append(self.headers.get("traceparent"))
+        status = _Scripted.statuses.pop(0) if _Scripted.statuses else 200
+        body = b'{"Count": 0}'
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_POST = do_GET
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+
+@pytest.fixture
+def handler() -> type[BaseHTTPRequestHandler]:
+    _Scripted.statuses = []
+    _Scripted.traceparents = []
+    return _Scripted
+
+
+@pytest.fixture
+def exporter() -> InMemorySpanExporter:
+    return InMemorySpanExporter()
+
+
+def _traced(client: Any, exporter: InMemorySpanExporter) -> Any:
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    client._tracer = provider.get_tracer("tests")
+    return client
+
+
+def _traceparent(span: ReadableSpan) -> str:
+    assert span.context is not None
+    return f"00-{span.context.trace_id:032x}-{span.context.span_id:016x}-{span.context.trace_flags:02x}"
+
+
+def test_spans_per_call_and_attempt_propagate_trace_context(
+    local_client: Callable[..., Client], exporter: InMemorySpanExporter, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(JitterRetry, "get_backoff_time", lambda self: 0.0)
+    client = _traced(local_client(version="v3.1"), exporter)
+
+    _Scripted.statuses = [503]
+    messages = [{"TemplateID": 7, "CustomID": "order-42"}, {"TemplateID": 7}]
+    client.send.create(data={"Messages": messages})
+
+    *attempts, call = exporter.get_finished_spans()
+    assert (call.name, call.kind) == ("POST send", SpanKind.INTERNAL)
+    assert call.attributes is not None
+    assert call.attributes["mailjet.route"] == "send"
+    assert call.attributes["mailjet.message_count"] == 2
+    assert call.attributes["mailjet.templateid"] == "7"
+    assert call.attributes["mailjet.customid"] == "order-42"
+    assert call.attributes["http.response.status_code"] == 200
+    assert call.attributes["http.request.body.size"] > 0
+    assert call.attributes["mailjet.attempts"] == 2
+    assert call.status.status_code is StatusCode.UNSET
+
+    assert [span.kind for span in attempts] == [SpanKind.CLIENT] * 2
+    assert all(span.parent is not None and span.parent.span_id == call.context.span_id for span in attempts)
+    assert [span.attributes["http.response.status_code"] for span in attempts] == [503, 200]  # type: ignore[index]
+    assert attempts[0].status.status_code is StatusCode.ERROR
+    assert attempts[1].attributes["http.request.resend_count"] == 1  # type: ignore[index]
+    assert _Scripted.traceparents == [_traceparent(span) for span in attempts]
+
+
+def test_failed_calls_mark_their_span(
+    server: ThreadingHTTPServer,
+    local_client: Callable[..., Client],
+    exporter: InMemorySpanExporter,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(JitterRetry, "get_backoff_time", lambda self: 0.0)
+    client = _traced(local_client(), exporter)
+
+    _Scripted.statuses = [503] * 4
+    with pytest.raises(ApiError):
+        client.contact_getcontactslists.get(id=7)
+    call = exporter.get_finished_spans()[-1]
+    assert call.name == "GET contact_getcontactslists"
+    assert call.status.status_code is StatusCode.ERROR
+    assert call.attributes is not None
+    assert (call.attributes["error.type"], call.attributes["mailjet.attempts"]) == ("503", 4)
+
+    exporter.clear()
+    port = server.server_port
+    server.shutdown()
+    server.server_close()
+    client = _traced(local_client(api_url=f"http://127.0.0.1:{port}/"), exporter)
+    with pytest.raises(ApiError) as raised:
+        client.contact.get()
+    call = exporter.get_finished_spans()[-1]
+    assert call.attributes is not None
+    assert call.attributes["error.type"] == type(raised.value).__qualname__
+    assert "http.response.status_code" not in call.attributes
+
+
+def test_untraced_clients_send_no_trace_context(server: ThreadingHTTPServer, exporter: InMemorySpanExporter) -> None:
+    client = Client(auth=("pub", "priv"), api_url=f"http://127.0.0.1:{server.server_port}/", tracing=False)
+    assert client._tracer is None
+    client.contact.get()
+    assert _Scripted.traceparents == [None]
+
+
+def test_calls_are_not_traced_until_a_tracer_provider_is_set(
+    server: ThreadingHTTPServer, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    client = Client(auth=("pub", "priv"), api_url=f"http://127.0.0.1:{server.server_port}/")
+    assert client._tracer is tracing.get_tracer() is not None
+    monkeypatch.setattr(client, "_call_stats", lambda *args: pytest.fail("must not be instrumented"))
+    client.contact.get()
+    assert _Scripted.traceparents == [None]
+
+    monkeypatch.setattr("opentelemetry.trace.get_tracer_provider", TracerProvider)
+    assert tracing.recording_tracer(client._tracer) is client._tracer
+    other = TracerProvider().get_tracer("tests")
+    assert tracing.recording_tracer(other) is other
+    assert tracing.recording_tracer(None) is None
+
+
+def test_get_tracer_is_none_without_opentelemetry(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(tracing.importlib.util, "find_spec", lambda name: None)
+    tracing.get_tracer.cache_clear()
+    try:
+        assert tracing.get_tracer() is None
+        assert Client(auth=("pub", "priv"))._tracer is None
+    finally:
+        tracing.get_tracer.cache_clear()
+
+
+def test_async_client_traces_every_attempt(exporter: InMemorySpanExporter, monkeypatch: pytest.MonkeyPatch) -> None:
+    httpx = pytest.importorskip("httpx")
+    from mailjet_rest.async_client import AsyncClient
+
+    monkeypatch.setattr(JitterRetry, "get_backoff_time", lambda self: 0.0)
+    statuses = iter([429, 200])
+    traceparents: list[str | None] = []
+
+    def handler(request: Any) -> Any:
+        traceparents.append(request.headers.get("traceparent"))
+        return httpx.Response(next(statuses), json={"Count": 1})
+
+    async def run() -> None:
+        async with AsyncClient(auth=("pub", "priv")) as client:
+            client.session._transport = httpx.MockTransport(handler)
+            _traced(client, exporter)
+            await client.contact.get(id=5)
+
+    asyncio.run(run())
+    *attempts, call = exporter.get_finished_spans()
+    assert call.name == "GET contact"
+    assert call.attributes is not None
+    assert call.attributes["http.response.status_code"] == 200
+    assert [span.attributes["http.response.status_code"] for span in attempts] == [429, 200]  # type: ignore[index]
+    assert attempts[0].attributes["server.address"] == "api.mailjet.com"  # type: ignore[index]
+    assert traceparents == [_traceparent(span) for span in attempts]